@@ -0,0 +1,22 @@
+"""
+Throughput benchmarks for Astronomical Watch hot paths (MIT licensed).
+
+Run from the repository root:
+
+    python -m benchmarks            # measure and compare with baseline.json
+    python -m benchmarks --save     # measure and store a new baseline
+
+Correctness lives in tests/; this suite only measures speed and flags
+statistically significant slowdowns against the stored baseline.
+"""
+import os
+import sys
+
+# Same in-tree import setup as web/: the package (astronomical_watch.*) and its
+# service layer, which uses top-level imports (solar.*, astro.*, offline.*).
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_src_dir = os.path.join(_project_root, "src")
+_package_dir = os.path.join(_src_dir, "astronomical_watch")
+for _path in (_package_dir, _src_dir):
+    if os.path.isdir(_path) and _path not in sys.path:
+        sys.path.insert(0, _path)
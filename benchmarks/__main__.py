@@ -0,0 +1,95 @@
+"""
+Command line entry point: python -m benchmarks [--save] [options]
+
+Exit status is 1 if any benchmark regressed against the baseline.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+
+from . import cases  # noqa: F401  (registers the benchmarks)
+from .harness import (
+    DEFAULT_ALPHA, DEFAULT_MIN_TIME, DEFAULT_PROCESSES, DEFAULT_REPEATS, DEFAULT_THRESHOLD,
+    compare, environment, format_comparison, load_baseline, registered, run, run_in_process,
+    save_baseline
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--save", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("-k", "--filter", default=None, help="Only benchmarks containing this text")
+    parser.add_argument("--processes", type=int, default=DEFAULT_PROCESSES,
+                        help="Worker processes per benchmark (0: measure in this process)")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Samples per process")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="Minimum seconds per sample")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative median slowdown tolerated (0.25 = 25%%)")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                        help="Significance level for the Mann-Whitney U test")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    parser.add_argument("--worker", metavar="NAME", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return _worker(args.worker, args.repeats, args.min_time)
+
+    benchmarks = registered(args.filter)
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.group:<8} {bench.name}")
+        return 0
+
+    print(f"Running {len(benchmarks)} benchmarks "
+          f"({max(args.processes, 1)} process(es) x {args.repeats} x ≥{args.min_time}s)")
+    outcome = run(benchmarks, args.repeats, args.min_time, report=print, processes=args.processes)
+    results = outcome["results"]
+
+    if args.save:
+        save_baseline(args.baseline, results, args.repeats, args.min_time, args.processes)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save to create one")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline["environment"] != environment():
+        print("⚠️  Baseline was recorded in a different environment:")
+        print(f"    {baseline['environment']}")
+    base_results = baseline["benchmarks"]
+    if args.filter:
+        base_results = {name: r for name, r in base_results.items() if args.filter in name}
+
+    comparisons = compare(base_results, results, args.threshold, args.alpha, outcome["skipped"])
+    print()
+    print(format_comparison(comparisons))
+    regressions = [c.name for c in comparisons if c.status == "regression"]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("\n✅ No significant regressions")
+    return 0
+
+
+def _worker(name: str, repeats: int, min_time: float) -> int:
+    """Measure one benchmark and print its samples as JSON (used by run_in_workers)."""
+    bench = {b.name: b for b in registered()}[name]
+    try:
+        result = run_in_process(bench, repeats, min_time)
+    except ImportError as e:
+        print(json.dumps({"skipped": str(e)}))
+        return 0
+    print(json.dumps({"loops": result.loops, "samples": result.samples}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Benchmarks of the core hot paths.
+
+Inputs are fixed so results are comparable between runs; imports happen in
+the setup functions so a missing optional module skips one benchmark only.
+"""
+from __future__ import annotations
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+from .harness import benchmark
+
+YEAR = 2025
+INSTANT = datetime(2025, 8, 14, 17, 3, 21, 456789, tzinfo=timezone.utc)
+JD_TT = 2460902.2115  # INSTANT in TT, roughly
+
+
+# ---------------------- Equinox solvers ---------------------- #
+
+@benchmark("equinox.compute_vernal_equinox", group="equinox")
+def _compute_vernal_equinox():
+    from astronomical_watch.core.equinox import compute_vernal_equinox
+    return lambda: compute_vernal_equinox(YEAR)
+
+
+@benchmark("equinox.precise[brent]", group="equinox")
+def _precise_brent():
+    from solar.equinox_precise import compute_vernal_equinox_precise
+    return lambda: compute_vernal_equinox_precise(YEAR, method="brent")
+
+
+@benchmark("equinox.precise[bisection]", group="equinox")
+def _precise_bisection():
+    from solar.equinox_precise import compute_vernal_equinox_precise
+    return lambda: compute_vernal_equinox_precise(YEAR, method="bisection")
+
+
+# ---------------------- Time core ---------------------- #
+
+@benchmark("core.AstroYear.reading", group="core")
+def _astro_year_reading():
+    from astronomical_watch.core.astro_time_core import AstroYear
+    astro_year = AstroYear(
+        datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc),
+        datetime(2026, 3, 20, 14, 46, 0, tzinfo=timezone.utc),
+    )
+    return lambda: astro_year.reading(INSTANT)
+
+
+@benchmark("core.timescales_from_datetime", group="core")
+def _core_timescales():
+    from astronomical_watch.core.timebase import timescales_from_datetime
+    return lambda: timescales_from_datetime(INSTANT)
+
+
+@benchmark("astro.timescales_from_datetime", group="core")
+def _astro_timescales():
+    from astro.timescales import timescales_from_datetime
+    return lambda: timescales_from_datetime(INSTANT)
+
+
+@benchmark("core.apparent_solar_longitude", group="core")
+def _apparent_solar_longitude():
+    from astronomical_watch.core.solar import apparent_solar_longitude
+    return lambda: apparent_solar_longitude(JD_TT)
+
+
+# ---------------------- UI ---------------------- #
+
+@benchmark("ui.get_sky_theme", group="ui")
+def _sky_theme():
+    from astronomical_watch.ui.gradient import get_sky_theme
+    return lambda: get_sky_theme(INSTANT)
+
+
+# ---------------------- Offline cache ---------------------- #
+
+_cache_env = {}
+
+
+def _use_temp_cache_dir():
+    _cache_env["previous"] = os.environ.get("ASTRON_CACHE_DIR")
+    _cache_env["dir"] = tempfile.mkdtemp(prefix="awatch-bench-")
+    os.environ["ASTRON_CACHE_DIR"] = _cache_env["dir"]
+
+
+def _restore_cache_dir():
+    previous = _cache_env.pop("previous", None)
+    if previous is None:
+        os.environ.pop("ASTRON_CACHE_DIR", None)
+    else:
+        os.environ["ASTRON_CACHE_DIR"] = previous
+    shutil.rmtree(_cache_env.pop("dir"), ignore_errors=True)
+
+
+def _filled_cache():
+    from astronomical_watch.offline import cache
+    _use_temp_cache_dir()
+    base = datetime(2000, 3, 20, 7, 35, tzinfo=timezone.utc)
+    for i in range(50):
+        cache.set_cached_equinox(2000 + i, cache.create_entry(
+            base + timedelta(days=365.2422 * i), "analytic", 30.0, "benchmark"
+        ))
+    return cache
+
+
+@benchmark("offline.get_cached_equinox", group="cache", teardown=_restore_cache_dir)
+def _cache_get():
+    cache = _filled_cache()
+    return lambda: cache.get_cached_equinox(YEAR)
+
+
+@benchmark("offline.set_cached_equinox", group="cache", teardown=_restore_cache_dir)
+def _cache_set():
+    cache = _filled_cache()
+    entry = cache.create_entry(datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc),
+                               "analytic", 30.0, "benchmark")
+    return lambda: cache.set_cached_equinox(YEAR, entry)
@@ -0,0 +1,334 @@
+"""
+Benchmark registry, timing, JSON baselines and statistical comparison.
+
+Each benchmark is timed in `processes` fresh worker processes, `repeats`
+samples each; a sample runs the function enough times to last at least
+`min_time` seconds and records the mean time per call. Spreading samples
+over processes captures run-to-run variation (memory layout, CPU
+frequency), which a single process hides. Two runs are compared per
+benchmark with a two-sided Mann-Whitney U test on the samples: a benchmark
+regresses only if its median slowed down by more than `threshold` AND the
+difference is significant at level `alpha`, so noise does not fail a run.
+"""
+from __future__ import annotations
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+DEFAULT_PROCESSES = 5
+DEFAULT_REPEATS = 3           # samples per process
+DEFAULT_MIN_TIME = 0.05       # seconds per sample
+DEFAULT_THRESHOLD = 0.25      # relative median slowdown tolerated (shared hosts drift)
+DEFAULT_ALPHA = 0.01          # significance level of the U test
+
+BASELINE_SCHEMA = 1
+
+
+@dataclass
+class Benchmark:
+    """
+    One registered benchmark.
+
+    `setup` returns the zero-argument callable to time (imports and fixtures
+    happen there, outside the measurement); `teardown` receives nothing and
+    undoes environment changes made by setup.
+    """
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    group: str = ""
+    teardown: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class BenchResult:
+    name: str
+    loops: int
+    samples: List[float]            # seconds per call, one per repeat
+    median: float = 0.0
+    iqr: float = 0.0
+
+    def __post_init__(self):
+        self.median = statistics.median(self.samples)
+        self.iqr = _iqr(self.samples)
+
+
+@dataclass
+class Comparison:
+    name: str
+    status: str                     # ok | regression | improvement | new | missing | skipped
+    baseline_median: Optional[float] = None
+    median: Optional[float] = None
+    ratio: Optional[float] = None
+    p_value: Optional[float] = None
+    note: str = ""
+
+
+_registry: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, group: str = "", teardown: Optional[Callable[[], None]] = None):
+    """Register a setup function (decorator) under a benchmark name."""
+    def register(setup: Callable[[], Callable[[], Any]]):
+        if name in _registry:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        _registry[name] = Benchmark(name, setup, group, teardown)
+        return setup
+    return register
+
+
+def registered(pattern: Optional[str] = None) -> List[Benchmark]:
+    """Registered benchmarks, optionally only those whose name contains pattern."""
+    return [b for b in _registry.values() if pattern is None or pattern in b.name]
+
+
+def _iqr(samples: Sequence[float]) -> float:
+    if len(samples) < 2:
+        return 0.0
+    q = statistics.quantiles(samples, n=4)
+    return q[2] - q[0]
+
+
+def calibrate(func: Callable[[], Any], min_time: float) -> int:
+    """Smallest loop count (1, 2, 5, 10, 20, ...) whose run lasts at least min_time."""
+    loops = 1
+    while True:
+        for factor in (1, 2, 5):
+            n = loops * factor
+            start = time.perf_counter()
+            for _ in range(n):
+                func()
+            if time.perf_counter() - start >= min_time:
+                return n
+        loops *= 10
+
+
+def measure(
+    func: Callable[[], Any],
+    name: str = "",
+    repeats: int = DEFAULT_REPEATS,
+    min_time: float = DEFAULT_MIN_TIME
+) -> BenchResult:
+    """Time func in `repeats` samples of a calibrated loop count."""
+    loops = calibrate(func, min_time)
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(repeats):
+        start = perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((perf_counter() - start) / loops)
+    return BenchResult(name, loops, samples)
+
+
+def run_in_process(bench: Benchmark, repeats: int, min_time: float) -> BenchResult:
+    """Set up and measure one benchmark in the current process."""
+    func = bench.setup()
+    try:
+        return measure(func, bench.name, repeats, min_time)
+    finally:
+        if bench.teardown is not None:
+            bench.teardown()
+
+
+def run_in_workers(bench: Benchmark, processes: int, repeats: int, min_time: float) -> BenchResult:
+    """Measure one benchmark in `processes` fresh interpreters (python -m benchmarks --worker)."""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    loops, samples = 0, []
+    for _ in range(processes):
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks", "--worker", bench.name,
+             "--repeats", str(repeats), "--min-time", str(min_time)],
+            cwd=project_root, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1:] or ["worker failed"]
+            raise RuntimeError(f"{bench.name}: {error[0]}")
+        output = json.loads(completed.stdout.strip().splitlines()[-1])
+        if "skipped" in output:
+            raise ImportError(output["skipped"])
+        loops = max(loops, output["loops"])
+        samples.extend(output["samples"])
+    return BenchResult(bench.name, loops, samples)
+
+
+def run(
+    benchmarks: Iterable[Benchmark],
+    repeats: int = DEFAULT_REPEATS,
+    min_time: float = DEFAULT_MIN_TIME,
+    report: Optional[Callable[[str], None]] = None,
+    processes: int = DEFAULT_PROCESSES
+) -> Dict[str, Any]:
+    """
+    Run benchmarks; returns {name: BenchResult} plus {name: reason} for skipped ones.
+
+    processes=0 measures in this process (quick, but blind to run-to-run noise).
+    """
+    results: Dict[str, BenchResult] = {}
+    skipped: Dict[str, str] = {}
+    for bench in benchmarks:
+        try:
+            if processes > 0:
+                result = run_in_workers(bench, processes, repeats, min_time)
+            else:
+                result = run_in_process(bench, repeats, min_time)
+        except ImportError as e:
+            skipped[bench.name] = f"unavailable: {e}"
+            if report:
+                report(f"  {bench.name:<44} skipped ({e})")
+            continue
+        results[bench.name] = result
+        if report:
+            report(f"  {bench.name:<44} {format_time(result.median):>10} "
+                   f"± {format_time(result.iqr / 2)} ({result.loops} loops)")
+    return {"results": results, "skipped": skipped}
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def save_baseline(
+    path: str,
+    results: Dict[str, BenchResult],
+    repeats: int,
+    min_time: float,
+    processes: int = DEFAULT_PROCESSES
+) -> None:
+    data = {
+        "schema": BASELINE_SCHEMA,
+        "created": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "environment": environment(),
+        "settings": {"processes": processes, "repeats": repeats, "min_time": min_time},
+        "benchmarks": {name: asdict(result) for name, result in sorted(results.items())},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("schema") != BASELINE_SCHEMA:
+        raise ValueError(f"Unsupported baseline schema {data.get('schema')!r} in {path}")
+    data["benchmarks"] = {
+        name: BenchResult(name, entry["loops"], entry["samples"])
+        for name, entry in data["benchmarks"].items()
+    }
+    return data
+
+
+def mann_whitney_u(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Two-sided p-value of the Mann-Whitney U test (normal approximation with
+    tie correction; adequate for the 10+ samples per side used here).
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    combined = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2.0 + 1.0
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum_a = sum(rank for rank, (_, side) in zip(ranks, combined) if side == 0)
+    u = rank_sum_a - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2.0) - 0.5) / math.sqrt(variance)
+    return min(1.0, 2.0 * (1.0 - statistics.NormalDist().cdf(max(z, 0.0))))
+
+
+def compare(
+    baseline: Dict[str, BenchResult],
+    current: Dict[str, BenchResult],
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+    skipped: Optional[Dict[str, str]] = None
+) -> List[Comparison]:
+    """Classify every benchmark in either run."""
+    comparisons: List[Comparison] = []
+    skipped = skipped or {}
+    for name in sorted(set(baseline) | set(current) | set(skipped)):
+        if name in skipped:
+            comparisons.append(Comparison(name, "skipped", note=skipped[name]))
+            continue
+        base, new = baseline.get(name), current.get(name)
+        if base is None:
+            comparisons.append(Comparison(name, "new", median=new.median))
+            continue
+        if new is None:
+            comparisons.append(Comparison(name, "missing", baseline_median=base.median))
+            continue
+        ratio = new.median / base.median if base.median > 0 else math.inf
+        p_value = mann_whitney_u(base.samples, new.samples)
+        status = "ok"
+        if p_value < alpha:
+            if ratio > 1.0 + threshold:
+                status = "regression"
+            elif ratio < 1.0 / (1.0 + threshold):
+                status = "improvement"
+        comparisons.append(Comparison(name, status, base.median, new.median, ratio, p_value))
+    return comparisons
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def format_comparison(comparisons: Sequence[Comparison]) -> str:
+    lines = [f"  {'benchmark':<44} {'baseline':>10} {'current':>10} {'ratio':>7} {'p':>8}  status"]
+    for c in comparisons:
+        base = format_time(c.baseline_median) if c.baseline_median is not None else "-"
+        new = format_time(c.median) if c.median is not None else "-"
+        ratio = f"{c.ratio:.2f}x" if c.ratio is not None else "-"
+        p_value = f"{c.p_value:.2g}" if c.p_value is not None else "-"
+        status = c.status.upper() if c.status == "regression" else c.status
+        lines.append(f"  {c.name:<44} {base:>10} {new:>10} {ratio:>7} {p_value:>8}  {status}")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "Benchmark",
+    "BenchResult",
+    "Comparison",
+    "benchmark",
+    "registered",
+    "calibrate",
+    "measure",
+    "run",
+    "run_in_process",
+    "save_baseline",
+    "load_baseline",
+    "mann_whitney_u",
+    "compare",
+    "format_comparison",
+]
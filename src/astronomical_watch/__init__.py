@@ -9,8 +9,19 @@ Public API (initial, unstable):
     compute_vernal_equinox(year)
     astronomical_time(dt) -> (dies, miliDies)
 """
-from .core.equinox import compute_vernal_equinox  # noqa: F401
-from .core.timeframe import astronomical_time  # noqa: F401
+
+
+def __getattr__(name):
+    # Resolved on first use so light submodules (e.g. net.clock_page) can be
+    # imported without loading the VSOP87 tables
+    if name == "compute_vernal_equinox":
+        from .core.equinox import compute_vernal_equinox
+        return compute_vernal_equinox
+    if name == "astronomical_time":
+        from .core.timeframe import astronomical_time
+        return astronomical_time
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "compute_vernal_equinox",
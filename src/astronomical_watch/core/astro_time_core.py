@@ -16,7 +16,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 # ---------------------- Constants (frozen interface) ---------------------- #
 LONGITUDE_REF_DEG: float = -168.975  # 168°58'30" W
@@ -49,6 +49,15 @@ __all__ = [
     "MIKRODIES_PER_MILIDES",
     "MIKRODIES_PER_DAY",
     "SECONDS_PER_MIKRODIES",
+    "NS_PER_SECOND",
+    "DAY_NS",
+    "NOON_NS",
+    "MILIDIES_NS",
+    "MIKRODIES_NS",
+    "datetime_to_ns",
+    "first_noon_ns",
+    "reading_at",
+    "next_boundary_ns",
 ]
 
 # ---------------------- Data Classes ---------------------- #
@@ -246,6 +255,42 @@ class AstroYear:
         return target_noon + timedelta(seconds=miliDies * SECONDS_PER_MILIDES)
 
 
+# ---------------------- Integer nanosecond helpers ---------------------- #
+# The same readings as AstroYear in plain integer arithmetic on Unix ns, for
+# hot paths (tick loops, beacons, calendars) that avoid datetime objects.
+
+NS_PER_SECOND: int = 1_000_000_000
+DAY_NS: int = SECONDS_PER_DAY * NS_PER_SECOND
+NOON_NS: int = NOON_UTC_SECONDS * NS_PER_SECOND
+MILIDIES_NS: int = DAY_NS // MILIDES_PER_DAY
+MIKRODIES_NS: int = MILIDIES_NS // MIKRODIES_PER_MILIDES
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def datetime_to_ns(dt: datetime) -> int:
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * NS_PER_SECOND + delta.microseconds * 1000
+
+
+def first_noon_ns(equinox_ns: int) -> int:
+    """First reference noon at or after the equinox (where dies 1 begins)."""
+    return equinox_ns + (NOON_NS - equinox_ns) % DAY_NS
+
+
+def reading_at(t_ns: int, equinox_ns: int) -> Tuple[int, int, int]:
+    """(dies, miliDies, mikroDies) at t_ns, in integer arithmetic (matches AstroYear)."""
+    since_noon = (t_ns - NOON_NS) % DAY_NS
+    noon = first_noon_ns(equinox_ns)
+    dies = 0 if t_ns < noon else 1 + (t_ns - noon) // DAY_NS
+    return dies, since_noon // MILIDIES_NS, since_noon % MILIDIES_NS // MIKRODIES_NS
+
+
+def next_boundary_ns(t_ns: int, period_ns: int = MILIDIES_NS) -> int:
+    """First boundary strictly after t_ns (boundaries are aligned to the reference noon)."""
+    return t_ns - (t_ns - NOON_NS) % period_ns + period_ns
+
+
 # End of astro_time_core.py
 # Legacy compatibility constants (aliases – keep until full migration).
 # These reference the corrected constants defined at the top of the file
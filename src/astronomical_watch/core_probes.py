@@ -0,0 +1,108 @@
+"""
+Observation-only metrics for the protected Core (see LICENSE.CORE).
+
+The Core files are never modified. install() rebinds the module-level names
+through which Core modules call each other (core.solar ->
+earth_heliocentric_position, core.equinox -> apparent_solar_longitude,
+core.vsop87_earth -> its coefficient file helpers) to thin wrappers that
+count and time each call and return the original result unchanged;
+uninstall() puts the originals back. Nothing is wrapped until metrics are
+enabled, so a default run executes the Core exactly as shipped.
+"""
+from __future__ import annotations
+import functools
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from astronomical_watch import metrics as _metrics
+
+VSOP87_EVALUATIONS = _metrics.counter(
+    "awatch_vsop87_evaluations", "Earth heliocentric position (L, B, R) evaluations"
+)
+VSOP87_SECONDS = _metrics.histogram(
+    "awatch_vsop87_evaluation_seconds", "Time per Earth heliocentric position evaluation"
+)
+VSOP87_COEFFICIENT_SCANS = _metrics.counter(
+    "awatch_vsop87_coefficient_scans", "Scans of the generated VSOP87 coefficient directory"
+)
+VSOP87_COEFFICIENT_LOADS = _metrics.counter(
+    "awatch_vsop87_coefficient_loads", "Generated VSOP87 coefficient file lookups", ["result"]
+)
+OBJECTIVE_EVALUATIONS = _metrics.counter(
+    "awatch_equinox_objective_evaluations", "Equinox solver objective evaluations", ["solver"]
+)
+
+# (module, attribute) -> original callable, while installed
+_originals: Dict[Tuple[Any, str], Callable] = {}
+
+
+def _rebind(module: Any, name: str, make_wrapper: Callable[[Callable], Callable]) -> None:
+    original = getattr(module, name)
+    wrapper = functools.wraps(original)(make_wrapper(original))
+    _originals[(module, name)] = original
+    setattr(module, name, wrapper)
+
+
+def _timed_position(original: Callable) -> Callable:
+    def earth_heliocentric_position(*args, **kwargs):
+        if not _metrics.enabled:
+            return original(*args, **kwargs)
+        start = time.perf_counter()
+        result = original(*args, **kwargs)
+        VSOP87_SECONDS.observe(time.perf_counter() - start)
+        VSOP87_EVALUATIONS.inc()
+        return result
+    return earth_heliocentric_position
+
+
+def _counted_objective(original: Callable) -> Callable:
+    evaluations = OBJECTIVE_EVALUATIONS.labels(solver="core")
+
+    def apparent_solar_longitude(*args, **kwargs):
+        evaluations.inc()
+        return original(*args, **kwargs)
+    return apparent_solar_longitude
+
+
+def _counted_scan(original: Callable) -> Callable:
+    def find_coefficient_file(*args, **kwargs):
+        VSOP87_COEFFICIENT_SCANS.inc()
+        return original(*args, **kwargs)
+    return find_coefficient_file
+
+
+def _counted_load(original: Callable, cache: Dict[str, Any]) -> Callable:
+    def load_coefficient_file(file_path, *args, **kwargs):
+        result = "hit" if str(file_path) in cache else "miss"
+        VSOP87_COEFFICIENT_LOADS.labels(result=result).inc()
+        return original(file_path, *args, **kwargs)
+    return load_coefficient_file
+
+
+def install() -> None:
+    """Wrap the Core call paths (idempotent). Counters only move while metrics are enabled."""
+    if _originals:
+        return
+    from .core import equinox, solar, vsop87_earth
+
+    _rebind(solar, "earth_heliocentric_position", _timed_position)
+    _rebind(equinox, "apparent_solar_longitude", _counted_objective)
+    _rebind(vsop87_earth, "_find_coefficient_file", _counted_scan)
+    _rebind(
+        vsop87_earth, "_load_coefficient_file",
+        lambda original: _counted_load(original, vsop87_earth._coefficient_cache)
+    )
+
+
+def uninstall() -> None:
+    """Restore the original Core functions."""
+    while _originals:
+        (module, name), original = _originals.popitem()
+        setattr(module, name, original)
+
+
+def installed() -> bool:
+    return bool(_originals)
+
+
+__all__ = ["install", "uninstall", "installed"]
@@ -0,0 +1,373 @@
+"""
+Lightweight in-process metrics: counters, gauges and fixed-bucket histograms.
+
+Metrics are disabled by default (set ASTRON_METRICS=1 or call enable()).
+Instrumented hot paths test the module-level `enabled` flag before doing
+any work, so a disabled build pays one attribute lookup per call site and
+never reads the clock or takes a lock. Instruments are created once at
+import with the get-or-create factories below, so a module imported under
+two names (e.g. `offline.cache` and `astronomical_watch.offline.cache`)
+shares the same series.
+
+Exported in the Prometheus text format (render_prometheus) for the web
+service's /metrics and `awatch stats`.
+"""
+from __future__ import annotations
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Environment variable enabling metrics at import
+METRICS_ENV = "ASTRON_METRICS"
+
+# Default histogram buckets
+LATENCY_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0
+)
+COUNT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+enabled: bool = os.environ.get(METRICS_ENV, "").lower() not in ("", "0", "false", "no")
+
+_registry_lock = threading.Lock()
+_registry: Dict[str, "_Metric"] = {}
+
+
+def enable(flag: bool = True) -> None:
+    """Turn collection on or off for the whole process."""
+    global enabled
+    enabled = flag
+
+
+def is_enabled() -> bool:
+    return enabled
+
+
+class _Metric:
+    """Base class: a named family of series keyed by label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+        self._lock = threading.Lock()
+        self._labelvalues: Tuple[str, ...] = ()
+
+    def labels(self, *values, **kwargs) -> "_Metric":
+        """Series for one combination of label values (created on first use)."""
+        if kwargs:
+            if set(kwargs) != set(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    child._labelvalues = values
+                    self._children[values] = child
+        return child
+
+    def _new_child(self) -> "_Metric":
+        raise NotImplementedError
+
+    def _series(self) -> List["_Metric"]:
+        if self.labelnames:
+            return list(self._children.values())
+        return [self]
+
+    def _label_text(self, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, self._labelvalues))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def _reset(self) -> None:
+        # Zero in place: call sites may hold bound children (e.g. labels(...) at import)
+        for child in self._children.values():
+            child._reset()
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.value = 0.0
+
+    def _new_child(self) -> "Counter":
+        return Counter(self.name, self.documentation, self.labelnames)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if not enabled:
+            return
+        with self._lock:
+            self.value += amount
+
+    def _samples(self) -> Iterator[Tuple[str, str, float]]:
+        for series in self._series():
+            yield self.name + "_total", series._label_text(), series.value
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.value = 0.0
+
+
+class Gauge(_Metric):
+    """Value that goes up and down; optionally computed at export time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def _new_child(self) -> "Gauge":
+        return Gauge(self.name, self.documentation, self.labelnames)
+
+    def set(self, value: float) -> None:
+        if not enabled:
+            return
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if not enabled:
+            return
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value when exported (e.g. a queue length)."""
+        self._function = function
+
+    def current(self) -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception:
+                return math.nan
+        return self.value
+
+    def _samples(self) -> Iterator[Tuple[str, str, float]]:
+        for series in self._series():
+            yield self.name, series._label_text(), series.current()
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.value = 0.0
+
+
+class Histogram(_Metric):
+    """Distribution over fixed, cumulative-exported buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last: +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, self.labelnames, self.buckets)
+
+    def observe(self, value: float) -> None:
+        if not enabled:
+            return
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of a with-block (seconds)."""
+        if not enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def quantile(self, q: float) -> float:
+        """Bucket-interpolated quantile estimate (NaN when empty)."""
+        if self.count == 0:
+            return math.nan
+        rank = q * self.count
+        cumulative, lower = 0, 0.0
+        for bound, n in zip(self.buckets + (math.inf,), self.counts):
+            if n and cumulative + n >= rank:
+                if math.isinf(bound):
+                    return lower
+                return lower + (bound - lower) * (rank - cumulative) / n
+            cumulative += n
+            lower = bound if not math.isinf(bound) else lower
+        return lower
+
+    def _samples(self) -> Iterator[Tuple[str, str, float]]:
+        for series in self._series():
+            cumulative = 0
+            for bound, n in zip(series.buckets + (math.inf,), series.counts):
+                cumulative += n
+                le = "+Inf" if math.isinf(bound) else _format_value(bound)
+                yield self.name + "_bucket", series._label_text(("le", le)), cumulative
+            yield self.name + "_sum", series._label_text(), series.sum
+            yield self.name + "_count", series._label_text(), series.count
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+def _get_or_create(cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = cls(name, documentation, labelnames, **kwargs)
+            _registry[name] = metric
+        elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered with a different type or labels")
+        return metric
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return _get_or_create(Counter, name, documentation, labelnames)
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return _get_or_create(Gauge, name, documentation, labelnames)
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = LATENCY_BUCKETS
+) -> Histogram:
+    return _get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+
+def registered() -> List[_Metric]:
+    with _registry_lock:
+        return sorted(_registry.values(), key=lambda m: m.name)
+
+
+def reset() -> None:
+    """Zero every series, keeping label children and gauge functions."""
+    for metric in registered():
+        with metric._lock:
+            metric._reset()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+    return repr(value)
+
+
+def render_prometheus() -> str:
+    """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    for metric in registered():
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for sample_name, labels, value in metric._samples():
+            lines.append(f"{sample_name}{labels} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def render_text() -> str:
+    """Compact human-readable summary (used by `awatch stats`)."""
+    lines = []
+    for metric in registered():
+        for series in metric._series():
+            label = metric.name + series._label_text()
+            if isinstance(series, Histogram):
+                if series.count == 0:
+                    continue
+                mean = series.sum / series.count
+                lines.append(
+                    f"{label:<64} n={series.count:<8} mean={_format_seconds(mean, metric.name)} "
+                    f"p50≈{_format_seconds(series.quantile(0.5), metric.name)} "
+                    f"p99≈{_format_seconds(series.quantile(0.99), metric.name)}"
+                )
+            elif isinstance(series, Gauge):
+                lines.append(f"{label:<64} {_format_value(series.current())}")
+            elif series.value:
+                lines.append(f"{label:<64} {_format_value(series.value)}")
+    return "\n".join(lines) if lines else "(no samples recorded)"
+
+
+def _format_seconds(value: float, name: str) -> str:
+    if not name.endswith("_seconds") or math.isnan(value):
+        return f"{value:.3g}"
+    if value >= 1:
+        return f"{value:.3g}s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.3g}ms"
+    return f"{value * 1e6:.3g}µs"
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+__all__ = [
+    "METRICS_ENV",
+    "PROMETHEUS_CONTENT_TYPE",
+    "LATENCY_BUCKETS",
+    "COUNT_BUCKETS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "counter",
+    "gauge",
+    "histogram",
+    "enable",
+    "is_enabled",
+    "registered",
+    "reset",
+    "render_prometheus",
+    "render_text",
+]
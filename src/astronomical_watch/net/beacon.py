@@ -0,0 +1,433 @@
+"""
+Local time beacon: one machine computes, the LAN displays.
+
+A beacon server (`awatch beacon`) multicasts a compact binary packet at
+every miliDies boundary (and a short heartbeat in between so new clients
+attach quickly). The packet carries the year epoch, the reading and the
+server's synchronized UTC timestamp, so thin clients need neither NTP nor
+the equinox model: they extrapolate the last packet with their monotonic
+clock and plain integer arithmetic.
+
+Packet layout (network byte order, 42 bytes):
+    0   4s  magic b"AWBC"
+    4   B   protocol version
+    5   B   flags (bit 0: server clock NTP-synchronized)
+    6   H   frame year (year of the current vernal equinox)
+    8   I   sequence number (per server run)
+    12  q   equinox_ns       - start of the astronomical year (Unix ns)
+    20  q   next_equinox_ns  - end of the astronomical year (Unix ns)
+    28  q   server_ns        - instant of the reading (Unix ns)
+    36  H   dies
+    38  H   miliDies
+    40  H   mikroDies
+"""
+from __future__ import annotations
+import ipaddress
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional, Tuple
+
+from ..core.astro_time_core import (
+    DAY_NS, MIKRODIES_NS, MILIDIES_NS, NOON_NS, NS_PER_SECOND, datetime_to_ns,
+    next_boundary_ns, reading_at
+)
+
+# Network defaults: organization-local multicast scope, TTL 1 keeps it on the LAN
+BEACON_GROUP = "239.255.86.40"
+BEACON_PORT = 8640
+BEACON_TTL = 1
+
+# Heartbeat between boundaries so a client started mid-miliDies attaches quickly
+BEACON_HEARTBEAT_S = 10.0
+
+# A client reports itself stale after missing this many miliDies boundaries
+STALE_AFTER_BOUNDARIES = 3
+
+MAGIC = b"AWBC"
+PROTOCOL_VERSION = 1
+FLAG_SYNCHRONIZED = 0x01
+
+PACKET = struct.Struct("!4sBBHIqqqHHH")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+EquinoxSource = Callable[[int], datetime]
+
+
+class BeaconError(Exception):
+    """Malformed or incompatible beacon packet."""
+    pass
+
+
+@dataclass(frozen=True)
+class BeaconPacket:
+    """Decoded beacon packet."""
+    frame_year: int
+    seq: int
+    equinox_ns: int
+    next_equinox_ns: int
+    server_ns: int
+    dies: int
+    miliDies: int
+    mikroDies: int
+    synchronized: bool = False
+
+    def encode(self) -> bytes:
+        flags = FLAG_SYNCHRONIZED if self.synchronized else 0
+        return PACKET.pack(
+            MAGIC, PROTOCOL_VERSION, flags, self.frame_year, self.seq & 0xFFFFFFFF,
+            self.equinox_ns, self.next_equinox_ns, self.server_ns,
+            self.dies, self.miliDies, self.mikroDies
+        )
+
+    @classmethod
+    def decode(cls, data: bytes) -> "BeaconPacket":
+        if len(data) != PACKET.size:
+            raise BeaconError(f"Beacon packet must be {PACKET.size} bytes, got {len(data)}")
+        (magic, version, flags, frame_year, seq, equinox_ns, next_equinox_ns,
+         server_ns, dies, miliDies, mikroDies) = PACKET.unpack(data)
+        if magic != MAGIC:
+            raise BeaconError("Not a beacon packet")
+        if version != PROTOCOL_VERSION:
+            raise BeaconError(f"Unsupported beacon protocol version {version}")
+        if not equinox_ns <= server_ns < next_equinox_ns:
+            raise BeaconError("Beacon timestamp outside its year frame")
+        return cls(
+            frame_year=frame_year, seq=seq, equinox_ns=equinox_ns,
+            next_equinox_ns=next_equinox_ns, server_ns=server_ns, dies=dies,
+            miliDies=miliDies, mikroDies=mikroDies,
+            synchronized=bool(flags & FLAG_SYNCHRONIZED)
+        )
+
+
+@dataclass(frozen=True)
+class BeaconReading:
+    """Reading extrapolated by a client from the last packet."""
+    frame_year: int
+    dies: int
+    miliDies: int
+    mikroDies: int
+    utc_ns: int
+    equinox_ns: int
+    next_equinox_ns: int
+    stale: bool = False
+
+    @property
+    def utc(self) -> datetime:
+        return _EPOCH + timedelta(microseconds=self.utc_ns // 1000)
+
+    @property
+    def year_length_dies(self) -> int:
+        return (self.next_equinox_ns - self.equinox_ns) // DAY_NS
+
+    def timestamp_full(self) -> str:
+        """Return DDD.mmm.µµµ format."""
+        return f"{self.dies:03d}.{self.miliDies:03d}.{self.mikroDies:03d}"
+
+
+def _is_multicast(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_multicast
+    except ValueError:
+        return False
+
+
+def _default_equinox_source() -> EquinoxSource:
+    from ..core.equinox import compute_vernal_equinox
+    solved: Dict[int, datetime] = {}
+
+    def source(year: int) -> datetime:
+        if year not in solved:
+            solved[year] = compute_vernal_equinox(year)
+        return solved[year]
+    return source
+
+
+def _default_clock() -> Tuple[Callable[[], int], Callable[[], bool]]:
+    from . import time_sync
+
+    return time_sync.now_ns, lambda: time_sync.get_clock_snapshot() is not None
+
+
+class BeaconServer:
+    """
+    Multicasts beacon packets at every miliDies boundary.
+
+    Args:
+        group: Destination address (multicast group, or a unicast host for tests)
+        port: Destination UDP port
+        ttl: Multicast TTL (1 = local subnet)
+        interface: Local interface address for outgoing multicast (default: routing table)
+        heartbeat_s: Extra packets between boundaries (0 disables)
+        equinox_source: Function returning the vernal equinox datetime of a year
+        clock_ns: Function returning synchronized UTC in ns (default: time_sync.now_ns)
+    """
+
+    def __init__(
+        self,
+        group: str = BEACON_GROUP,
+        port: int = BEACON_PORT,
+        ttl: int = BEACON_TTL,
+        interface: Optional[str] = None,
+        heartbeat_s: float = BEACON_HEARTBEAT_S,
+        equinox_source: Optional[EquinoxSource] = None,
+        clock_ns: Optional[Callable[[], int]] = None
+    ):
+        self.address = (group, port)
+        self.heartbeat_s = heartbeat_s
+        self.equinox_source = equinox_source or _default_equinox_source()
+        if clock_ns is None:
+            self.clock_ns, self._synchronized = _default_clock()
+        else:
+            self.clock_ns, self._synchronized = clock_ns, lambda: False
+        self._frame: Optional[Tuple[int, int, int]] = None
+        self._seq = 0
+        self.packets_sent = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if _is_multicast(group):
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+            # Displays on the beacon host itself receive the packets too
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            if interface:
+                self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF,
+                                     socket.inet_aton(interface))
+
+    def _frame_at(self, t_ns: int) -> Tuple[int, int, int]:
+        """(frame_year, equinox_ns, next_equinox_ns) containing t_ns; solved once per year."""
+        frame = self._frame
+        if frame is not None and frame[1] <= t_ns < frame[2]:
+            return frame
+        year = (_EPOCH + timedelta(microseconds=t_ns // 1000)).year
+        equinox_ns = datetime_to_ns(self.equinox_source(year))
+        if t_ns < equinox_ns:
+            year -= 1
+            equinox_ns = datetime_to_ns(self.equinox_source(year))
+        frame = (year, equinox_ns, datetime_to_ns(self.equinox_source(year + 1)))
+        self._frame = frame
+        return frame
+
+    def packet_at(self, t_ns: int) -> BeaconPacket:
+        frame_year, equinox_ns, next_equinox_ns = self._frame_at(t_ns)
+        dies, miliDies, mikroDies = reading_at(t_ns, equinox_ns)
+        self._seq += 1
+        return BeaconPacket(
+            frame_year=frame_year, seq=self._seq, equinox_ns=equinox_ns,
+            next_equinox_ns=next_equinox_ns, server_ns=t_ns, dies=dies,
+            miliDies=miliDies, mikroDies=mikroDies, synchronized=self._synchronized()
+        )
+
+    def send(self, t_ns: Optional[int] = None) -> BeaconPacket:
+        """Send one packet for t_ns (default: now)."""
+        packet = self.packet_at(self.clock_ns() if t_ns is None else t_ns)
+        self.sock.sendto(packet.encode(), self.address)
+        self.packets_sent += 1
+        return packet
+
+    def serve_forever(self) -> None:
+        """Send now, then at every boundary (plus heartbeats) until stop()."""
+        self.send()
+        boundary = next_boundary_ns(self.clock_ns())
+        while not self._stop.is_set():
+            now = self.clock_ns()
+            if now >= boundary:
+                self.send(boundary)
+                boundary = next_boundary_ns(max(now, boundary))
+                continue
+            delay = (boundary - now) / NS_PER_SECOND
+            if self.heartbeat_s > 0 and delay > self.heartbeat_s:
+                if self._stop.wait(self.heartbeat_s):
+                    break
+                self.send()
+            elif self._stop.wait(delay):
+                break
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True, name="Time-Beacon")
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self.sock.close()
+
+
+class BeaconClient:
+    """
+    Receives beacon packets and extrapolates readings locally.
+
+    No NTP, no equinox model: the last packet plus monotonic time is enough.
+
+    Args:
+        group: Multicast group to join, or a unicast address to bind (tests)
+        port: UDP port (0 picks a free port, see `port` attribute)
+        interface: Local interface address for the multicast membership
+        monotonic_ns: Clock used for extrapolation (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        group: str = BEACON_GROUP,
+        port: int = BEACON_PORT,
+        interface: Optional[str] = None,
+        monotonic_ns: Callable[[], int] = time.monotonic_ns
+    ):
+        self.group = group
+        self.monotonic_ns = monotonic_ns
+        self._last: Optional[Tuple[BeaconPacket, int]] = None
+        self.packets_received = 0
+        self.packets_rejected = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            # Several displays on one host share the port
+            try:
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        if _is_multicast(group):
+            self.sock.bind(("", port))
+            membership = socket.inet_aton(group) + socket.inet_aton(interface or "0.0.0.0")
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+        else:
+            self.sock.bind((group, port))
+        self.port = self.sock.getsockname()[1]
+        self.sock.settimeout(1.0)
+
+    def handle(self, data: bytes) -> Optional[BeaconPacket]:
+        """Accept one datagram; returns the packet if it became the current one."""
+        try:
+            packet = BeaconPacket.decode(data)
+        except BeaconError:
+            self.packets_rejected += 1
+            return None
+        last = self._last
+        if last is not None and packet.server_ns < last[0].server_ns:
+            # Reordered or from a lagging second beacon
+            self.packets_rejected += 1
+            return None
+        self._last = (packet, self.monotonic_ns())
+        self.packets_received += 1
+        return packet
+
+    def receive_once(self, timeout: Optional[float] = None) -> Optional[BeaconPacket]:
+        """Block for one datagram (None on timeout or rejection)."""
+        if timeout is not None:
+            self.sock.settimeout(timeout)
+        try:
+            data, _ = self.sock.recvfrom(PACKET.size + 1)
+        except socket.timeout:
+            return None
+        return self.handle(data)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.receive_once()
+            except OSError:
+                if self._stop.is_set():
+                    return
+                time.sleep(1.0)
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self._run, daemon=True, name="Beacon-Client")
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self.sock.close()
+
+    @property
+    def last_packet(self) -> Optional[BeaconPacket]:
+        last = self._last
+        return None if last is None else last[0]
+
+    def reading(self) -> Optional[BeaconReading]:
+        """Current reading extrapolated from the last packet (None before the first one)."""
+        last = self._last
+        if last is None:
+            return None
+        packet, received_mono = last
+        elapsed = max(0, self.monotonic_ns() - received_mono)
+        t_ns = packet.server_ns + elapsed
+        stale = elapsed > STALE_AFTER_BOUNDARIES * MILIDIES_NS
+
+        since_noon = (t_ns - NOON_NS) % DAY_NS
+        if t_ns >= packet.next_equinox_ns:
+            # Year rolled over before the next packet arrived
+            frame_year, equinox_ns = packet.frame_year + 1, packet.next_equinox_ns
+            dies = reading_at(t_ns, equinox_ns)[0]
+            next_equinox_ns = equinox_ns + (packet.next_equinox_ns - packet.equinox_ns)
+        else:
+            frame_year, equinox_ns, next_equinox_ns = (
+                packet.frame_year, packet.equinox_ns, packet.next_equinox_ns
+            )
+            # Noons crossed since the packet
+            dies = packet.dies + (t_ns - NOON_NS) // DAY_NS - (packet.server_ns - NOON_NS) // DAY_NS
+        return BeaconReading(
+            frame_year=frame_year, dies=dies, miliDies=since_noon // MILIDIES_NS,
+            mikroDies=since_noon % MILIDIES_NS // MIKRODIES_NS, utc_ns=t_ns,
+            equinox_ns=equinox_ns, next_equinox_ns=next_equinox_ns, stale=stale
+        )
+
+    def status(self) -> Dict:
+        packet = self.last_packet
+        reading = self.reading()
+        return {
+            "group": self.group,
+            "port": self.port,
+            "packets_received": self.packets_received,
+            "packets_rejected": self.packets_rejected,
+            "last_seq": None if packet is None else packet.seq,
+            "server_synchronized": None if packet is None else packet.synchronized,
+            "stale": None if reading is None else reading.stale,
+        }
+
+
+def run_beacon(
+    group: str = BEACON_GROUP,
+    port: int = BEACON_PORT,
+    ttl: int = BEACON_TTL,
+    interface: Optional[str] = None,
+    heartbeat_s: float = BEACON_HEARTBEAT_S,
+    equinox_source: Optional[EquinoxSource] = None
+) -> None:
+    """Run a beacon server in the foreground until interrupted."""
+    server = BeaconServer(group, port, ttl, interface, heartbeat_s, equinox_source)
+    print(f"📡 Time beacon on {group}:{port} (TTL {ttl}), every miliDies")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Beacon stopped")
+    finally:
+        server.stop()
+
+
+__all__ = [
+    "BEACON_GROUP",
+    "BEACON_PORT",
+    "BEACON_TTL",
+    "BEACON_HEARTBEAT_S",
+    "BeaconClient",
+    "BeaconError",
+    "BeaconPacket",
+    "BeaconReading",
+    "BeaconServer",
+    "next_boundary_ns",
+    "reading_at",
+    "run_beacon",
+]
@@ -0,0 +1,327 @@
+"""
+Shared clock page: Dies for local processes without the astronomy stack.
+
+A daemon (`awatch clock-page`) keeps the synchronized clock offset and the
+current year frame in a small memory-mapped file. Short-lived scripts,
+loggers and dashboards on the same host map the page and compute the
+reading with a few integer operations, like a vDSO clock. This module
+imports only the standard library at load time; the writer's equinox and
+NTP dependencies are imported lazily by the daemon.
+
+Page layout (little-endian, PAGE_SIZE bytes):
+    0   4s  magic b"AWCP"
+    4   I   layout version
+    8   Q   seqlock counter (odd while the daemon is writing)
+    16  body: frame_year (i), flags (I), offset_ns (q), published_ns (q),
+        equinox_ns, next_equinox_ns, following_equinox_ns (3 x q)
+
+offset_ns is added to time.time_ns() to obtain synchronized UTC. Three
+equinoxes are published so readers stay correct across one year rollover
+even if the daemon is late to republish.
+"""
+from __future__ import annotations
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional
+
+MAGIC = b"AWCP"
+LAYOUT_VERSION = 1
+PAGE_SIZE = 4096
+
+# Environment variable overriding the page location
+CLOCK_PAGE_ENV = "ASTRON_CLOCK_PAGE"
+PAGE_FILENAME = "astronomical_watch_clock.page"
+
+# Daemon republish interval (offset follows drift and slew corrections)
+REFRESH_S = 1.0
+
+# Readers report the page stale if the daemon has not written for this long
+STALE_AFTER_S = 10.0
+
+FLAG_SYNCHRONIZED = 0x01
+
+_PREAMBLE = struct.Struct("<4sIQ")
+_SEQ = struct.Struct("<Q")
+_SEQ_OFFSET = 8
+_BODY = struct.Struct("<iIqqqqq")
+_BODY_OFFSET = _PREAMBLE.size
+
+# Kept in sync with core.astro_time_core (not imported to keep readers light)
+NS_PER_SECOND = 1_000_000_000
+DAY_NS = 86400 * NS_PER_SECOND
+NOON_NS = 2646 * NS_PER_SECOND  # 00:44:06 UTC
+MILIDIES_NS = DAY_NS // 1000
+MIKRODIES_NS = MILIDIES_NS // 1000
+
+_SPIN_LIMIT = 100
+# A write still in progress after this long means the publisher died mid-write
+_READ_TIMEOUT_S = 0.005
+
+
+class ClockPageError(RuntimeError):
+    """Page missing, foreign or not published yet."""
+
+
+class PageState(NamedTuple):
+    """Consistent copy of the page body."""
+    seq: int
+    frame_year: int
+    synchronized: bool
+    offset_ns: int
+    published_ns: int
+    equinox_ns: int
+    next_equinox_ns: int
+    following_equinox_ns: int
+
+
+class PageReading(NamedTuple):
+    """Reading computed from the page."""
+    frame_year: int
+    dies: int
+    miliDies: int
+    mikroDies: int
+    utc_ns: int
+    stale: bool
+
+    def timestamp_full(self) -> str:
+        """Return DDD.mmm.µµµ format."""
+        return f"{self.dies:03d}.{self.miliDies:03d}.{self.mikroDies:03d}"
+
+
+def default_page_path() -> str:
+    path = os.environ.get(CLOCK_PAGE_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        import tempfile
+        runtime_dir = tempfile.gettempdir()
+    return os.path.join(runtime_dir, PAGE_FILENAME)
+
+
+def reading_from_state(state: PageState, t_ns: int, stale: bool = False) -> PageReading:
+    """Reading at synchronized UTC t_ns from a page state."""
+    if t_ns >= state.next_equinox_ns:
+        frame_year, equinox_ns = state.frame_year + 1, state.next_equinox_ns
+    else:
+        frame_year, equinox_ns = state.frame_year, state.equinox_ns
+    since_noon = (t_ns - NOON_NS) % DAY_NS
+    first_noon = equinox_ns + (NOON_NS - equinox_ns) % DAY_NS
+    dies = 0 if t_ns < first_noon else 1 + (t_ns - first_noon) // DAY_NS
+    return PageReading(
+        frame_year, dies, since_noon // MILIDIES_NS,
+        since_noon % MILIDIES_NS // MIKRODIES_NS, t_ns, stale
+    )
+
+
+class ClockPage:
+    """
+    Reader side: maps the page read-only.
+
+    Args:
+        path: Page file (default: default_page_path())
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_page_path()
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), PAGE_SIZE, access=mmap.ACCESS_READ)
+        magic, layout, _ = _PREAMBLE.unpack_from(self._map, 0)
+        if magic != MAGIC or layout != LAYOUT_VERSION:
+            self._map.close()
+            raise ClockPageError(f"{self.path} is not a clock page (layout {layout})")
+        self.retries = 0
+
+    def state(self) -> PageState:
+        """Consistent copy of the page body (seqlock read)."""
+        spins = 0
+        deadline = None
+        while True:
+            before = _SEQ.unpack_from(self._map, _SEQ_OFFSET)[0]
+            if before & 1 == 0:
+                body = _BODY.unpack_from(self._map, _BODY_OFFSET)
+                if _SEQ.unpack_from(self._map, _SEQ_OFFSET)[0] == before:
+                    if before == 0:
+                        raise ClockPageError("Clock page not published yet")
+                    frame_year, flags = body[0], body[1]
+                    return PageState(before, frame_year, bool(flags & FLAG_SYNCHRONIZED), *body[2:])
+            self.retries += 1
+            spins += 1
+            if spins > _SPIN_LIMIT:
+                if deadline is None:
+                    deadline = time.monotonic() + _READ_TIMEOUT_S
+                elif time.monotonic() > deadline:
+                    raise ClockPageError(f"{self.path}: write in progress never completed")
+                time.sleep(0.0001)
+
+    def now_ns(self) -> int:
+        """Synchronized UTC in ns since the Unix epoch."""
+        return time.time_ns() + self.state().offset_ns
+
+    def reading(self) -> PageReading:
+        """Current reading."""
+        state = self.state()
+        system_ns = time.time_ns()
+        stale = system_ns - state.published_ns > STALE_AFTER_S * NS_PER_SECOND
+        return reading_from_state(state, system_ns + state.offset_ns, stale)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "ClockPage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_page: Optional[ClockPage] = None
+
+
+def reading(path: Optional[str] = None) -> PageReading:
+    """Current reading from the (cached) default page."""
+    global _page
+    if path is not None:
+        with ClockPage(path) as page:
+            return page.reading()
+    if _page is None:
+        _page = ClockPage()
+    return _page.reading()
+
+
+def _datetime_to_ns(dt) -> int:
+    from datetime import datetime, timezone  # writer only
+    delta = dt - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * NS_PER_SECOND + delta.microseconds * 1000
+
+
+class ClockPagePublisher:
+    """
+    Daemon side: creates the page and is its only writer.
+
+    Args:
+        path: Page file (default: default_page_path())
+        equinox_source: Function returning the vernal equinox datetime of a year
+        clock_ns: Synchronized UTC in ns (default: time_sync.now_ns)
+        synchronized: Function telling whether clock_ns is NTP-synchronized
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        equinox_source: Optional[Callable] = None,
+        clock_ns: Optional[Callable[[], int]] = None,
+        synchronized: Optional[Callable[[], bool]] = None
+    ):
+        if equinox_source is None:
+            from ..core.equinox import compute_vernal_equinox
+            equinox_source = compute_vernal_equinox
+        if clock_ns is None:
+            from . import time_sync
+            clock_ns = time_sync.now_ns
+            if synchronized is None:
+                def synchronized() -> bool:
+                    return time_sync.get_clock_snapshot() is not None
+        self.path = path or default_page_path()
+        self.equinox_source = equinox_source
+        self.clock_ns = clock_ns
+        self.synchronized = synchronized or (lambda: False)
+        self._equinoxes: Dict[int, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, PAGE_SIZE)
+            self._map = mmap.mmap(fd, PAGE_SIZE)
+        finally:
+            os.close(fd)
+        # Restart the counter; a reader mapped to a previous run retries until publish()
+        _PREAMBLE.pack_into(self._map, 0, MAGIC, LAYOUT_VERSION, 0)
+
+    def _equinox_ns(self, year: int) -> int:
+        ns = self._equinoxes.get(year)
+        if ns is None:
+            ns = _datetime_to_ns(self.equinox_source(year))
+            self._equinoxes[year] = ns
+        return ns
+
+    def publish(self) -> int:
+        """Write the current offset and frame. Returns the new counter value."""
+        system_ns = time.time_ns()
+        t_ns = self.clock_ns()
+        year = time.gmtime(t_ns // NS_PER_SECOND).tm_year
+        if t_ns < self._equinox_ns(year):
+            year -= 1
+        flags = FLAG_SYNCHRONIZED if self.synchronized() else 0
+        body = _BODY.pack(
+            year, flags, t_ns - system_ns, system_ns,
+            self._equinox_ns(year), self._equinox_ns(year + 1), self._equinox_ns(year + 2)
+        )
+        seq = _SEQ.unpack_from(self._map, _SEQ_OFFSET)[0]
+        _SEQ.pack_into(self._map, _SEQ_OFFSET, seq + 1)  # odd: write in progress
+        self._map[_BODY_OFFSET:_BODY_OFFSET + len(body)] = body
+        _SEQ.pack_into(self._map, _SEQ_OFFSET, seq + 2)
+        return seq + 2
+
+    def serve_forever(self, refresh_s: float = REFRESH_S) -> None:
+        """Republish every refresh_s seconds until stop()."""
+        while True:
+            self.publish()
+            if self._stop.wait(refresh_s):
+                return
+
+    def start(self, refresh_s: float = REFRESH_S) -> threading.Thread:
+        self._thread = threading.Thread(
+            target=self.serve_forever, args=(refresh_s,), daemon=True, name="Clock-Page"
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self, unlink: bool = True) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self._map.close()
+        if unlink:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def run_clock_page(
+    path: Optional[str] = None,
+    refresh_s: float = REFRESH_S,
+    equinox_source: Optional[Callable] = None
+) -> None:
+    """Run the clock page daemon in the foreground until interrupted."""
+    publisher = ClockPagePublisher(path, equinox_source)
+    print(f"🕐 Clock page at {publisher.path}, refreshed every {refresh_s:g}s")
+    try:
+        publisher.serve_forever(refresh_s)
+    except KeyboardInterrupt:
+        print("\n👋 Clock page stopped")
+    finally:
+        publisher.stop()
+
+
+__all__ = [
+    "CLOCK_PAGE_ENV",
+    "ClockPage",
+    "ClockPageError",
+    "ClockPagePublisher",
+    "PageReading",
+    "PageState",
+    "default_page_path",
+    "reading",
+    "reading_from_state",
+    "run_clock_page",
+]
+
+
+if __name__ == "__main__":
+    print(reading().timestamp_full())
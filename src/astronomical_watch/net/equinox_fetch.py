@@ -5,8 +5,10 @@ Provides optional retrieval from ASTRON_EQUINOX_URL environment variable.
 from __future__ import annotations
 import json
 import os
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple
 from urllib.request import urlopen
 from urllib.parse import urlparse
 from urllib.error import URLError, HTTPError
@@ -17,6 +19,139 @@ DEFAULT_TIMEOUT_SECONDS = 10.0
 MARCH_DAY_MIN = 18
 MARCH_DAY_MAX = 22
 
+# Circuit breaker configuration
+BREAKER_FAILURE_THRESHOLD = 2       # Consecutive failures before opening
+BREAKER_BASE_BACKOFF_SECONDS = 30.0  # First open period
+BREAKER_MAX_BACKOFF_SECONDS = 3600.0  # Cap for exponential backoff
+
+# Negative cache: how long a per-year miss is remembered
+NEGATIVE_CACHE_TTL_SECONDS = 6 * 3600.0
+
+# Breaker states
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker with exponential backoff.
+    
+    While closed, requests pass through and consecutive transport failures are
+    counted. Reaching the threshold opens the breaker, rejecting requests
+    instantly until the backoff period expires. The breaker then goes half-open
+    and lets a single probe through: success closes it, failure re-opens it with
+    double the previous backoff (capped).
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_backoff_s: float = BREAKER_BASE_BACKOFF_SECONDS,
+        max_backoff_s: float = BREAKER_MAX_BACKOFF_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Return the breaker to the closed state and forget all failures."""
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._open_count = 0
+            self._opened_at: Optional[float] = None
+            self._backoff_s = 0.0
+            self._probe_in_flight = False
+    
+    def _refresh_locked(self) -> None:
+        """Move from open to half-open once the backoff has elapsed."""
+        if self._state == STATE_OPEN and self._opened_at is not None:
+            if self._clock() - self._opened_at >= self._backoff_s:
+                self._state = STATE_HALF_OPEN
+                self._probe_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        """Current breaker state ("closed", "open" or "half_open")."""
+        with self._lock:
+            self._refresh_locked()
+            return self._state
+    
+    def is_open(self) -> bool:
+        """True if requests would currently be rejected without a probe slot."""
+        with self._lock:
+            self._refresh_locked()
+            if self._state == STATE_OPEN:
+                return True
+            return self._state == STATE_HALF_OPEN and self._probe_in_flight
+    
+    def allow_request(self) -> bool:
+        """
+        Ask permission to perform a request.
+        
+        Returns:
+            True if the caller may contact the remote source. In half-open
+            state only the first caller gets True until it reports back.
+        """
+        with self._lock:
+            self._refresh_locked()
+            if self._state == STATE_CLOSED:
+                return True
+            if self._state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        """Report a successful transport round-trip."""
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._open_count = 0
+            self._opened_at = None
+            self._backoff_s = 0.0
+            self._probe_in_flight = False
+    
+    def record_failure(self) -> None:
+        """Report a transport failure (timeout, DNS, connection, HTTP error)."""
+        with self._lock:
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open_count += 1
+                self._backoff_s = min(
+                    self.base_backoff_s * (2 ** (self._open_count - 1)),
+                    self.max_backoff_s
+                )
+                self._state = STATE_OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+    
+    def status(self) -> Dict[str, Any]:
+        """Snapshot of breaker state for status reporting."""
+        with self._lock:
+            self._refresh_locked()
+            retry_in = None
+            if self._state == STATE_OPEN and self._opened_at is not None:
+                retry_in = max(0.0, self._backoff_s - (self._clock() - self._opened_at))
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "open_count": self._open_count,
+                "backoff_s": self._backoff_s,
+                "retry_in_s": retry_in,
+            }
+
+
+# Shared breaker and negative cache for the configured remote source
+_breaker = CircuitBreaker()
+_negative_cache: Dict[Tuple[str, int], float] = {}
+_negative_cache_lock = threading.Lock()
+
 
 def get_equinox_fetch_url() -> Optional[str]:
     """
@@ -119,21 +254,12 @@ def parse_equinox_json(json_text: str, year: int) -> Optional[str]:
         return None
 
 
-def fetch_equinox_from_url(
-    url: str, 
-    year: int, 
-    timeout: float = DEFAULT_TIMEOUT_SECONDS
-) -> Optional[str]:
+def _request_json_text(url: str, timeout: float) -> Optional[str]:
     """
-    Fetch equinox timestamp from remote URL.
-    
-    Args:
-        url: URL to fetch from
-        year: Target year
-        timeout: Request timeout in seconds
+    Perform the HTTP request and return the decoded body.
     
     Returns:
-        ISO timestamp string if successful, None on any failure
+        Response text, or None on any transport-level failure
     """
     try:
         # Basic URL validation
@@ -151,8 +277,7 @@ def fetch_equinox_from_url(
                 # Still try to parse as JSON - some servers don't set proper content-type
                 pass
             
-            json_text = response.read().decode('utf-8')
-            return parse_equinox_json(json_text, year)
+            return response.read().decode('utf-8')
             
     except (URLError, HTTPError, socket.timeout, UnicodeDecodeError):
         return None
@@ -161,10 +286,71 @@ def fetch_equinox_from_url(
         return None
 
 
+def fetch_equinox_from_url(
+    url: str, 
+    year: int, 
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+) -> Optional[str]:
+    """
+    Fetch equinox timestamp from remote URL.
+    
+    Args:
+        url: URL to fetch from
+        year: Target year
+        timeout: Request timeout in seconds
+    
+    Returns:
+        ISO timestamp string if successful, None on any failure
+    """
+    json_text = _request_json_text(url, timeout)
+    if json_text is None:
+        return None
+    return parse_equinox_json(json_text, year)
+
+
+def _is_negative_cached(url: str, year: int) -> bool:
+    """Check whether a recent lookup for this year came back empty."""
+    key = (url, year)
+    with _negative_cache_lock:
+        expires_at = _negative_cache.get(key)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            del _negative_cache[key]
+            return False
+        return True
+
+
+def _remember_miss(url: str, year: int) -> None:
+    """Record a per-year miss so it is not re-requested until the TTL expires."""
+    with _negative_cache_lock:
+        _negative_cache[(url, year)] = time.monotonic() + NEGATIVE_CACHE_TTL_SECONDS
+
+
+def is_fetch_suppressed(year: Optional[int] = None) -> bool:
+    """
+    Check whether the breaker or negative cache would short-circuit a lookup.
+    
+    Args:
+        year: Optional target year to also check against the negative cache
+    
+    Returns:
+        True if the breaker is open or the year is a remembered miss
+    """
+    if _breaker.is_open():
+        return True
+    url = get_equinox_fetch_url()
+    return bool(url) and year is not None and _is_negative_cached(url, year)
+
+
 def fetch_equinox_remote(year: int, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> Optional[str]:
     """
     Fetch equinox timestamp from configured remote source.
     
+    Lookups go through the shared circuit breaker and the per-year negative
+    cache, so an unreachable source costs one timeout per backoff period
+    instead of one per call.
+    
     Args:
         year: Target year
         timeout: Request timeout in seconds
@@ -176,7 +362,23 @@ def fetch_equinox_remote(year: int, timeout: float = DEFAULT_TIMEOUT_SECONDS) ->
     if not url:
         return None
     
-    return fetch_equinox_from_url(url, year, timeout)
+    if _is_negative_cached(url, year):
+        return None
+    
+    if not _breaker.allow_request():
+        return None
+    
+    json_text = _request_json_text(url, timeout)
+    if json_text is None:
+        _breaker.record_failure()
+        return None
+    
+    _breaker.record_success()
+    
+    timestamp = parse_equinox_json(json_text, year)
+    if timestamp is None:
+        _remember_miss(url, year)
+    return timestamp
 
 
 def parse_remote_timestamp(timestamp_iso: str) -> datetime:
@@ -233,6 +435,18 @@ def is_fetch_configured() -> bool:
     return get_equinox_fetch_url() is not None
 
 
+def get_breaker_status() -> Dict[str, Any]:
+    """Get the circuit breaker state for the remote source."""
+    return _breaker.status()
+
+
+def reset_fetch_state() -> None:
+    """Close the circuit breaker and clear the negative cache."""
+    _breaker.reset()
+    with _negative_cache_lock:
+        _negative_cache.clear()
+
+
 def get_fetch_status() -> Dict[str, Any]:
     """
     Get status information about fetch configuration.
@@ -241,8 +455,16 @@ def get_fetch_status() -> Dict[str, Any]:
         Dictionary with configuration and status info
     """
     url = get_equinox_fetch_url()
+    now = time.monotonic()
+    with _negative_cache_lock:
+        negative_years = sorted(
+            year for (cached_url, year), expires_at in _negative_cache.items()
+            if cached_url == url and expires_at > now
+        )
     return {
         "configured": url is not None,
         "url": url,
-        "env_var": "ASTRON_EQUINOX_URL"
-  }
+        "env_var": "ASTRON_EQUINOX_URL",
+        "breaker": get_breaker_status(),
+        "negative_cache_years": negative_years
+    }
@@ -5,26 +5,116 @@ Provides optional network time synchronization to ensure maximum accuracy
 when system time might be slightly off.
 """
 from __future__ import annotations
+import selectors
 import socket
+import statistics
 import struct
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import threading
 
+from astronomical_watch import metrics as _metrics
+
 # NTP server configuration
 DEFAULT_NTP_SERVER = "pool.ntp.org"
+DEFAULT_NTP_SERVERS = (
+    "0.pool.ntp.org",
+    "1.pool.ntp.org",
+    "2.pool.ntp.org",
+    "3.pool.ntp.org",
+)
 NTP_PORT = 123
 NTP_TIMEOUT = 5.0  # seconds
+NTP_SAMPLES_PER_SERVER = 4
+NTP_REQUEST_SPACING = 0.25  # seconds between requests to the same server
+NTP_RESOLVE_POLL = 0.01  # seconds between checks for finished DNS lookups
 
 # NTP packet format constants
 NTP_PACKET_FORMAT = "!12I"
 NTP_DELTA = 2208988800  # Seconds between 1900 and 1970
+NTP_FRACTION = 2**32
+
+# Metrics
+NTP_SYNCS = _metrics.counter("awatch_ntp_syncs", "NTP synchronization attempts", ["result"])
+NTP_SYNC_SECONDS = _metrics.histogram(
+    "awatch_ntp_sync_seconds", "Duration of a (multi-server) NTP synchronization"
+)
+NTP_OFFSET_SECONDS = _metrics.gauge(
+    "awatch_ntp_offset_seconds", "Last NTP clock offset (positive: system clock behind)"
+)
+NTP_DELAY_SECONDS = _metrics.gauge(
+    "awatch_ntp_delay_seconds", "Round-trip delay of the best sample in the last NTP sync"
+)
+
+# Outlier rejection: servers whose offset deviates from the median by more than
+# max(NTP_OUTLIER_FLOOR, NTP_OUTLIER_MADS * scaled MAD) are discarded
+NTP_OUTLIER_FLOOR = 0.025  # seconds
+NTP_OUTLIER_MADS = 3.0
+
+# A server address is either a hostname or a (hostname, port) pair
+NtpServer = Union[str, Tuple[str, int]]
+
+# Drift model: only re-estimate frequency over intervals at least this long,
+# and never beyond the clamp (typical quartz oscillators are within ±100 ppm)
+DRIFT_MIN_INTERVAL_S = 60.0
+DRIFT_MAX_PPM = 500.0
+
+# Clock discipline (slew mode): corrections are amortized at most at this rate,
+# offsets larger than the step threshold are applied as a step instead
+DISCIPLINE_MAX_SLEW_PPM = 500.0
+DISCIPLINE_STEP_THRESHOLD_S = 0.128
+DISCIPLINE_FREQ_GAIN = 0.5       # Fraction of measured frequency error applied per sample
+DISCIPLINE_JITTER_WEIGHT = 0.25  # EWMA weight for jitter
 
 # Cache for synchronized time
 _time_offset: Optional[float] = None
 _last_sync: Optional[datetime] = None
-_sync_lock = threading.Lock()
+_last_estimate: Optional["NtpEstimate"] = None
+_sync_lock = threading.Lock()  # Serializes writers only; readers never take it
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class ClockSnapshot:
+    """
+    Immutable model of the synchronized clock.
+    
+    UTC at monotonic reading m is
+        utc_anchor_ns + (m - mono_anchor_ns) * (1 + drift_ppm * 1e-6)
+    plus, until slew_end_ns, an extra slew_ppm rate that amortizes a pending
+    correction. A new snapshot is published after every sync by swapping one
+    reference, so readers need no lock. `generation` changes only when the
+    clock is stepped, so schedulers can keep boundary timers across slews.
+    """
+    mono_anchor_ns: int
+    utc_anchor_ns: int
+    drift_ppm: float = 0.0
+    slew_ppm: float = 0.0
+    slew_end_ns: int = 0
+    generation: int = 0
+    
+    def utc_ns_at(self, mono_ns: int) -> int:
+        """Predicted UTC (ns since Unix epoch) at a monotonic_ns() reading."""
+        elapsed = mono_ns - self.mono_anchor_ns
+        utc_ns = self.utc_anchor_ns + elapsed + int(elapsed * self.drift_ppm * 1e-6)
+        if self.slew_ppm:
+            slewed = min(mono_ns, self.slew_end_ns) - self.mono_anchor_ns
+            if slewed > 0:
+                utc_ns += int(slewed * self.slew_ppm * 1e-6)
+        return utc_ns
+    
+    def slew_remaining_ns(self, mono_ns: int) -> int:
+        """Part of the pending correction not yet applied at mono_ns (signed)."""
+        if not self.slew_ppm or mono_ns >= self.slew_end_ns:
+            return 0
+        return int((self.slew_end_ns - max(mono_ns, self.mono_anchor_ns)) * self.slew_ppm * 1e-6)
+
+
+# Published snapshot (None until the first successful sync)
+_clock_snapshot: Optional[ClockSnapshot] = None
 
 
 class TimeSyncError(Exception):
@@ -32,13 +122,84 @@ class TimeSyncError(Exception):
     pass
 
 
-def _create_ntp_packet() -> bytes:
-    """Create an NTP request packet."""
+@dataclass(frozen=True)
+class NtpSample:
+    """One client/server exchange with the four NTP timestamps (Unix seconds)."""
+    server: str
+    t1: float  # client transmit
+    t2: float  # server receive
+    t3: float  # server transmit
+    t4: float  # client receive
+    
+    @property
+    def offset(self) -> float:
+        """Clock offset (positive = system clock is behind the server)."""
+        return ((self.t2 - self.t1) + (self.t3 - self.t4)) / 2.0
+    
+    @property
+    def delay(self) -> float:
+        """Round-trip network delay excluding server processing time."""
+        return (self.t4 - self.t1) - (self.t3 - self.t2)
+
+
+@dataclass(frozen=True)
+class NtpEstimate:
+    """Combined offset estimate from several servers."""
+    offset: float
+    delay: float
+    servers_used: Tuple[str, ...]
+    servers_rejected: Tuple[str, ...]
+    samples: int
+
+
+def _to_ntp_raw(unix_time: float) -> int:
+    """Convert Unix time to a 64-bit NTP timestamp (32.32 fixed point)."""
+    return int((unix_time + NTP_DELTA) * NTP_FRACTION)
+
+
+def _from_ntp_raw(seconds: int, fraction: int) -> float:
+    """Convert NTP seconds/fraction fields to Unix time."""
+    return seconds - NTP_DELTA + float(fraction) / NTP_FRACTION
+
+
+def _create_ntp_packet(transmit_raw: int = 0) -> bytes:
+    """
+    Create an NTP request packet.
+    
+    Args:
+        transmit_raw: Optional 64-bit NTP transmit timestamp. Servers echo it
+            back as the originate timestamp, which pairs replies with requests.
+    """
     # LI = 0, VN = 3, Mode = 3 (client)
-    msg = b'\x1b' + 47 * b'\0'
+    msg = b'\x1b' + 39 * b'\0' + struct.pack("!Q", transmit_raw)
     return msg
 
 
+def _parse_ntp_timestamps(data: bytes) -> Tuple[int, float, float]:
+    """
+    Extract originate, receive and transmit timestamps from an NTP reply.
+    
+    Returns:
+        Tuple of (originate_raw, receive_unix, transmit_unix)
+    
+    Raises:
+        TimeSyncError: If packet is invalid or the server is unsynchronized
+    """
+    if len(data) < 48:
+        raise TimeSyncError(f"Invalid NTP packet size: {len(data)}")
+    
+    unpacked = struct.unpack(NTP_PACKET_FORMAT, data[0:48])
+    leap = data[0] >> 6
+    stratum = data[1]
+    if leap == 3 or stratum == 0:
+        raise TimeSyncError("NTP server is unsynchronized")
+    
+    originate_raw = (unpacked[6] << 32) | unpacked[7]
+    receive = _from_ntp_raw(unpacked[8], unpacked[9])
+    transmit = _from_ntp_raw(unpacked[10], unpacked[11])
+    return originate_raw, receive, transmit
+
+
 def _parse_ntp_response(data: bytes) -> float:
     """
     Parse NTP response and extract server time.
@@ -68,12 +229,229 @@ def _parse_ntp_response(data: bytes) -> float:
     return unix_timestamp
 
 
-def sync_time_ntp(server: str = DEFAULT_NTP_SERVER, timeout: float = NTP_TIMEOUT) -> Tuple[float, float]:
+def _server_address(server: NtpServer) -> Tuple[str, int]:
+    """Normalize a server spec to (host, port)."""
+    if isinstance(server, tuple):
+        return server[0], int(server[1])
+    return server, NTP_PORT
+
+
+def _server_label(server: NtpServer) -> str:
+    host, port = _server_address(server)
+    return host if port == NTP_PORT else f"{host}:{port}"
+
+
+def _resolve_in_background(servers: Sequence[NtpServer]) -> Dict[int, object]:
+    """
+    Start resolving every server on its own daemon thread.
+    
+    Returns a dictionary that fills in as lookups finish: server index ->
+    (family, sockaddr), or the exception the lookup raised.
+    """
+    results: Dict[int, object] = {}
+    
+    def resolve(index: int, host: str, port: int) -> None:
+        try:
+            family, _, _, _, sockaddr = socket.getaddrinfo(host, port, type=socket.SOCK_DGRAM)[0]
+            results[index] = (family, sockaddr)
+        except OSError as e:
+            results[index] = e
+    
+    for index, server in enumerate(servers):
+        host, port = _server_address(server)
+        threading.Thread(
+            target=resolve, args=(index, host, port), daemon=True, name="NTP-Resolve"
+        ).start()
+    return results
+
+
+def sample_ntp_servers(
+    servers: Sequence[NtpServer] = DEFAULT_NTP_SERVERS,
+    samples_per_server: int = NTP_SAMPLES_PER_SERVER,
+    timeout: float = NTP_TIMEOUT
+) -> List[NtpSample]:
+    """
+    Query several NTP servers concurrently, several samples each.
+    
+    Servers are resolved in parallel and each is queried as soon as its
+    address is known, over non-blocking UDP sockets whose replies are
+    collected by a selector. Requests to one server are NTP_REQUEST_SPACING
+    apart, since public pools answer bursts with rate-limit (KoD) replies.
+    Resolution, requests and replies share one deadline, so the call never
+    takes longer than `timeout` regardless of how many servers are queried
+    or how slow DNS is.
+    
+    Args:
+        servers: Hostnames or (host, port) pairs
+        samples_per_server: Requests sent to each server
+        timeout: Overall deadline in seconds
+    
+    Returns:
+        List of completed samples (possibly empty)
+    
+    Raises:
+        TimeSyncError: If no server could be resolved
+    """
+    deadline = time.monotonic() + timeout
+    selector = selectors.DefaultSelector()
+    # (socket) -> {originate_raw: t1}
+    pending: Dict[socket.socket, Dict[int, float]] = {}
+    # (socket) -> [requests left to send, monotonic time of the next one]
+    schedule: Dict[socket.socket, List] = {}
+    addresses: Dict[socket.socket, tuple] = {}
+    labels: Dict[socket.socket, str] = {}
+    resolve_errors: List[str] = []
+    samples: List[NtpSample] = []
+    
+    def send(sock: socket.socket, now: float) -> None:
+        state = schedule[sock]
+        state[0] -= 1
+        state[1] = now + NTP_REQUEST_SPACING
+        sent = pending[sock]
+        t1 = time.time()
+        raw = _to_ntp_raw(t1)
+        while raw in sent:
+            raw += 1  # Keep originate timestamps unique per socket
+        try:
+            sock.sendto(_create_ntp_packet(raw), addresses[sock])
+        except OSError:
+            return
+        sent[raw] = t1
+    
+    resolved = _resolve_in_background(servers)
+    unresolved = set(range(len(servers)))
+    try:
+        while True:
+            for index in [i for i in unresolved if i in resolved]:
+                unresolved.discard(index)
+                result = resolved[index]
+                if isinstance(result, Exception):
+                    host = _server_address(servers[index])[0]
+                    resolve_errors.append(f"Could not resolve NTP server {host}: {result}")
+                    continue
+                family, sockaddr = result
+                sock = socket.socket(family, socket.SOCK_DGRAM)
+                sock.setblocking(False)
+                pending[sock] = {}
+                schedule[sock] = [samples_per_server, 0.0]
+                addresses[sock] = sockaddr
+                labels[sock] = _server_label(servers[index])
+                selector.register(sock, selectors.EVENT_READ)
+            
+            now = time.monotonic()
+            remaining = deadline - now
+            if remaining <= 0:
+                break
+            for sock, state in schedule.items():
+                if state[0] > 0 and now >= state[1]:
+                    send(sock, now)
+            waiting = [state[1] for state in schedule.values() if state[0] > 0]
+            if not unresolved and not waiting and not any(pending.values()):
+                break
+            if waiting:
+                remaining = min(remaining, max(0.0, min(waiting) - now))
+            if unresolved:
+                remaining = min(remaining, NTP_RESOLVE_POLL)
+            if not schedule:
+                time.sleep(remaining)  # Nothing to select on until a lookup finishes
+                continue
+            for key, _ in selector.select(remaining):
+                sock = key.fileobj
+                try:
+                    data, _ = sock.recvfrom(1024)
+                except OSError:
+                    # ICMP unreachable etc. - stop waiting on this server
+                    pending[sock].clear()
+                    schedule[sock][0] = 0
+                    selector.unregister(sock)
+                    continue
+                t4 = time.time()
+                try:
+                    originate_raw, t2, t3 = _parse_ntp_timestamps(data)
+                except TimeSyncError:
+                    continue
+                t1 = pending[sock].pop(originate_raw, None)
+                if t1 is None:
+                    continue  # Stale or spoofed reply
+                samples.append(NtpSample(labels[sock], t1, t2, t3, t4))
+    finally:
+        selector.close()
+        for sock in pending:
+            sock.close()
+    
+    if not labels:
+        for index in sorted(unresolved):
+            resolve_errors.append(
+                f"Timed out resolving NTP server {_server_address(servers[index])[0]}"
+            )
+        if resolve_errors:
+            raise TimeSyncError("; ".join(resolve_errors))
+    return samples
+
+
+def select_best_offset(samples: Sequence[NtpSample]) -> NtpEstimate:
+    """
+    Combine samples into one offset estimate.
+    
+    For each server the minimum-delay sample is kept (it has the least
+    queueing error). Servers whose offset is an outlier relative to the median
+    are rejected, and the median offset of the survivors is returned.
+    
+    Raises:
+        TimeSyncError: If there are no usable samples
+    """
+    best: Dict[str, NtpSample] = {}
+    for sample in samples:
+        if sample.delay < 0:
+            continue
+        current = best.get(sample.server)
+        if current is None or sample.delay < current.delay:
+            best[sample.server] = sample
+    
+    if not best:
+        raise TimeSyncError("No usable NTP samples")
+    
+    offsets = [s.offset for s in best.values()]
+    median = statistics.median(offsets)
+    mad = statistics.median(abs(o - median) for o in offsets) * 1.4826
+    threshold = max(NTP_OUTLIER_FLOOR, NTP_OUTLIER_MADS * mad)
+    
+    kept = [s for s in best.values() if abs(s.offset - median) <= threshold]
+    rejected = tuple(sorted(s.server for s in best.values() if s not in kept))
+    
+    return NtpEstimate(
+        offset=statistics.median(s.offset for s in kept),
+        delay=min(s.delay for s in kept),
+        servers_used=tuple(sorted(s.server for s in kept)),
+        servers_rejected=rejected,
+        samples=len(samples)
+    )
+
+
+def sync_time_multi(
+    servers: Sequence[NtpServer] = DEFAULT_NTP_SERVERS,
+    samples_per_server: int = NTP_SAMPLES_PER_SERVER,
+    timeout: float = NTP_TIMEOUT
+) -> NtpEstimate:
+    """
+    Sample several NTP servers in parallel and return the filtered estimate.
+    
+    Raises:
+        TimeSyncError: If no server answered within the timeout
+    """
+    samples = sample_ntp_servers(servers, samples_per_server, timeout)
+    if not samples:
+        names = ", ".join(_server_label(s) for s in servers)
+        raise TimeSyncError(f"NTP request to {names} timed out after {timeout}s")
+    return select_best_offset(samples)
+
+
+def sync_time_ntp(server: NtpServer = DEFAULT_NTP_SERVER, timeout: float = NTP_TIMEOUT) -> Tuple[float, float]:
     """
     Synchronize time with NTP server and calculate offset.
     
     Args:
-        server: NTP server hostname
+        server: NTP server hostname (or (host, port) pair)
         timeout: Connection timeout in seconds
     
     Returns:
@@ -85,79 +463,196 @@ def sync_time_ntp(server: str = DEFAULT_NTP_SERVER, timeout: float = NTP_TIMEOUT
         TimeSyncError: If synchronization fails
     """
     try:
-        # Record time before request
-        t1 = time.time()
+        samples = sample_ntp_servers([server], samples_per_server=1, timeout=timeout)
+    except TimeSyncError:
+        raise
+    except socket.error as e:
+        raise TimeSyncError(f"Network error contacting {_server_label(server)}: {e}")
+    except Exception as e:
+        raise TimeSyncError(f"Unexpected error during NTP sync: {e}")
+    
+    if not samples:
+        raise TimeSyncError(f"NTP request to {_server_label(server)} timed out after {timeout}s")
+    
+    sample = samples[0]
+    return sample.t3, sample.offset
+
+
+def now_ns() -> int:
+    """
+    Current synchronized UTC time in integer nanoseconds since the Unix epoch.
+    
+    Lock-free: one monotonic_ns() call plus arithmetic on the published
+    snapshot. Falls back to time.time_ns() until the first sync.
+    """
+    snapshot = _clock_snapshot
+    if snapshot is None:
+        return time.time_ns()
+    return snapshot.utc_ns_at(time.monotonic_ns())
+
+
+def now() -> datetime:
+    """Current synchronized UTC time as a timezone-aware datetime."""
+    return _UNIX_EPOCH + timedelta(microseconds=now_ns() // 1000)
+
+
+def _build_snapshot(offset: float, previous: Optional[ClockSnapshot]) -> ClockSnapshot:
+    """
+    Anchor a new snapshot at the current instant and update the drift estimate.
+    
+    The prediction error of the previous snapshot over the elapsed monotonic
+    interval gives the frequency error of the local oscillator.
+    """
+    mono_ns = time.monotonic_ns()
+    utc_ns = time.time_ns() + int(offset * 1e9)
+    
+    drift_ppm = 0.0
+    if previous is not None:
+        drift_ppm = previous.drift_ppm
+        elapsed_ns = mono_ns - previous.mono_anchor_ns
+        if elapsed_ns >= DRIFT_MIN_INTERVAL_S * 1e9:
+            error_ns = utc_ns - previous.utc_ns_at(mono_ns)
+            drift_ppm += error_ns / elapsed_ns * 1e6
+            drift_ppm = max(-DRIFT_MAX_PPM, min(DRIFT_MAX_PPM, drift_ppm))
+    
+    generation = previous.generation + 1 if previous is not None else 0
+    return ClockSnapshot(
+        mono_anchor_ns=mono_ns, utc_anchor_ns=utc_ns, drift_ppm=drift_ppm,
+        generation=generation
+    )
+
+
+class ClockDiscipline:
+    """
+    Offset + frequency estimator that slews the published clock.
+    
+    Each sample measures the phase error between the true time and what the
+    current snapshot publishes. Small errors are not stepped: the new snapshot
+    continues exactly from the published reading and amortizes the error at
+    up to max_slew_ppm, so readings never jump or run backwards. The part of
+    the error not explained by a still-pending slew updates the frequency
+    (drift) estimate, FLL-style, and a running RMS of it is reported as jitter.
+    Errors beyond step_threshold_s are stepped.
+    """
+    
+    def __init__(
+        self,
+        max_slew_ppm: float = DISCIPLINE_MAX_SLEW_PPM,
+        step_threshold_s: float = DISCIPLINE_STEP_THRESHOLD_S,
+        freq_gain: float = DISCIPLINE_FREQ_GAIN
+    ):
+        self.max_slew_ppm = max_slew_ppm
+        self.step_threshold_s = step_threshold_s
+        self.freq_gain = freq_gain
+        self.jitter_s: Optional[float] = None
+        self.last_phase_error_s: Optional[float] = None
+        self.samples = 0
+        self.steps = 0
+    
+    def update(self, offset: float, previous: Optional[ClockSnapshot]) -> ClockSnapshot:
+        """Feed one offset sample and return the snapshot to publish."""
+        mono_ns = time.monotonic_ns()
+        true_ns = time.time_ns() + int(offset * 1e9)
+        self.samples += 1
         
-        # Create socket and send request
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-            sock.settimeout(timeout)
-            
-            # Send NTP request
-            packet = _create_ntp_packet()
-            sock.sendto(packet, (server, NTP_PORT))
-            
-            # Receive response
-            data, address = sock.recvfrom(1024)
+        if previous is None:
+            self.steps += 1
+            return ClockSnapshot(mono_anchor_ns=mono_ns, utc_anchor_ns=true_ns)
         
-        # Record time after response
-        t4 = time.time()
+        published_ns = previous.utc_ns_at(mono_ns)
+        phase_ns = true_ns - published_ns
+        self.last_phase_error_s = phase_ns / 1e9
         
-        # Parse NTP response
-        ntp_time = _parse_ntp_response(data)
+        # Error not accounted for by the correction still being slewed in
+        residual_ns = phase_ns - previous.slew_remaining_ns(mono_ns)
+        residual_s = residual_ns / 1e9
+        if self.jitter_s is None:
+            self.jitter_s = abs(residual_s)
+        else:
+            w = DISCIPLINE_JITTER_WEIGHT
+            self.jitter_s = ((1 - w) * self.jitter_s ** 2 + w * residual_s ** 2) ** 0.5
         
-        # Calculate round-trip time and offset
-        # Simple approximation: assume symmetric delay
-        round_trip = t4 - t1
-        ntp_time_at_receive = ntp_time + round_trip / 2
+        drift_ppm = previous.drift_ppm
+        elapsed_ns = mono_ns - previous.mono_anchor_ns
+        if elapsed_ns >= DRIFT_MIN_INTERVAL_S * 1e9:
+            drift_ppm += self.freq_gain * residual_ns / elapsed_ns * 1e6
+            drift_ppm = max(-DRIFT_MAX_PPM, min(DRIFT_MAX_PPM, drift_ppm))
         
-        # Calculate offset (positive = system is behind NTP)
-        offset = ntp_time_at_receive - t4
+        if abs(phase_ns) > self.step_threshold_s * 1e9:
+            self.steps += 1
+            return ClockSnapshot(
+                mono_anchor_ns=mono_ns, utc_anchor_ns=true_ns, drift_ppm=drift_ppm,
+                generation=previous.generation + 1
+            )
         
-        return ntp_time, offset
+        slew_ppm = 0.0
+        slew_end_ns = mono_ns
+        if phase_ns:
+            slew_ppm = self.max_slew_ppm if phase_ns > 0 else -self.max_slew_ppm
+            slew_end_ns = mono_ns + int(abs(phase_ns) / (self.max_slew_ppm * 1e-6))
         
-    except socket.timeout:
-        raise TimeSyncError(f"NTP request to {server} timed out after {timeout}s")
-    except socket.gaierror as e:
-        raise TimeSyncError(f"Could not resolve NTP server {server}: {e}")
-    except socket.error as e:
-        raise TimeSyncError(f"Network error contacting {server}: {e}")
-    except Exception as e:
-        raise TimeSyncError(f"Unexpected error during NTP sync: {e}")
+        return ClockSnapshot(
+            mono_anchor_ns=mono_ns, utc_anchor_ns=published_ns, drift_ppm=drift_ppm,
+            slew_ppm=slew_ppm, slew_end_ns=slew_end_ns, generation=previous.generation
+        )
+
+
+# Active discipline loop (None = step mode)
+_discipline: Optional[ClockDiscipline] = None
+
+
+def enable_clock_discipline(enabled: bool = True, **kwargs) -> Optional[ClockDiscipline]:
+    """
+    Switch between slewed (disciplined) and stepped offset correction.
+    
+    Args:
+        enabled: True to slew corrections, False to step them (default mode)
+        **kwargs: Passed to ClockDiscipline (max_slew_ppm, step_threshold_s, freq_gain)
+    
+    Returns:
+        The active ClockDiscipline, or None in step mode
+    """
+    global _discipline
+    with _sync_lock:
+        if enabled:
+            if _discipline is None or kwargs:
+                _discipline = ClockDiscipline(**kwargs)
+        else:
+            _discipline = None
+        return _discipline
+
+
+def get_clock_snapshot() -> Optional[ClockSnapshot]:
+    """Get the currently published clock snapshot (None before first sync)."""
+    return _clock_snapshot
 
 
 def get_synchronized_time() -> datetime:
     """
     Get current UTC time, optionally adjusted by NTP offset.
     
-    If time has been synchronized via sync_time_ntp(), returns system time
-    adjusted by the calculated offset. Otherwise returns raw system time.
+    If time has been synchronized, returns the time predicted by the published
+    clock snapshot (monotonic anchor + drift model). Otherwise returns raw
+    system time. Never blocks on a running sync.
     
     Returns:
         Current UTC datetime, potentially adjusted for clock offset
     """
-    with _sync_lock:
-        if _time_offset is None:
-            # No sync available, use system time
-            return datetime.now(timezone.utc)
-        
-        # Apply offset to system time
-        system_time = time.time()
-        adjusted_time = system_time + _time_offset
-        return datetime.fromtimestamp(adjusted_time, tz=timezone.utc)
+    return now()
 
 
-def update_time_sync(server: str = DEFAULT_NTP_SERVER, force: bool = False) -> bool:
+def update_time_sync(server: Optional[NtpServer] = None, force: bool = False) -> bool:
     """
     Update time synchronization with NTP server.
     
     Args:
-        server: NTP server to use
+        server: NTP server to use (default: sample all DEFAULT_NTP_SERVERS in parallel)
         force: Force sync even if recently synchronized
     
     Returns:
         True if sync was successful, False otherwise
     """
-    global _time_offset, _last_sync
+    global _time_offset, _last_sync, _last_estimate, _clock_snapshot
     
     with _sync_lock:
         # Check if we need to sync
@@ -166,21 +661,38 @@ def update_time_sync(server: str = DEFAULT_NTP_SERVER, force: bool = False) -> b
             if time_since_sync < timedelta(minutes=10):
                 # Recently synced, skip
                 return True
-        
-        try:
-            # Perform sync
-            ntp_time, offset = sync_time_ntp(server)
-            
-            # Update cache
-            _time_offset = offset
-            _last_sync = datetime.now(timezone.utc)
-            
-            print(f"✅ NTP sync successful: offset = {offset*1000:.1f}ms")
-            return True
-            
-        except TimeSyncError as e:
-            print(f"⚠️  NTP sync failed: {e}")
-            return False
+    
+    # Network exchange runs without the lock so status readers never wait on it
+    start = time.perf_counter()
+    try:
+        servers = DEFAULT_NTP_SERVERS if server is None else [server]
+        estimate = sync_time_multi(servers)
+    except TimeSyncError as e:
+        if _metrics.enabled:
+            NTP_SYNC_SECONDS.observe(time.perf_counter() - start)
+            NTP_SYNCS.labels(result="error").inc()
+        print(f"⚠️  NTP sync failed: {e}")
+        return False
+    
+    if _metrics.enabled:
+        NTP_SYNC_SECONDS.observe(time.perf_counter() - start)
+        NTP_SYNCS.labels(result="ok").inc()
+        NTP_OFFSET_SECONDS.set(estimate.offset)
+        NTP_DELAY_SECONDS.set(estimate.delay)
+    
+    offset = estimate.offset
+    with _sync_lock:
+        # Update cache and publish the new snapshot atomically
+        _time_offset = offset
+        _last_sync = datetime.now(timezone.utc)
+        _last_estimate = estimate
+        if _discipline is not None:
+            _clock_snapshot = _discipline.update(offset, _clock_snapshot)
+        else:
+            _clock_snapshot = _build_snapshot(offset, _clock_snapshot)
+    
+    print(f"✅ NTP sync successful: offset = {offset*1000:.1f}ms")
+    return True
 
 
 def get_sync_status() -> dict:
@@ -193,6 +705,13 @@ def get_sync_status() -> dict:
         - offset_ms: float - current offset in milliseconds (if synced)
         - last_sync: datetime - when last sync occurred (if synced)
         - age_seconds: float - seconds since last sync (if synced)
+        - delay_ms: float - round-trip delay of the best sample (if synced)
+        - servers: list - servers that contributed to the estimate (if synced)
+        - drift_ppm: float - estimated local clock frequency error (if synced)
+        - disciplined: bool - whether corrections are slewed instead of stepped
+        - jitter_ms: float - RMS of unexplained offset residuals (discipline mode)
+        - slew_remaining_ms: float - correction still being slewed in
+        - clock_generation: int - incremented on every clock step
     """
     with _sync_lock:
         if _time_offset is None or _last_sync is None:
@@ -200,7 +719,14 @@ def get_sync_status() -> dict:
                 "synced": False,
                 "offset_ms": None,
                 "last_sync": None,
-                "age_seconds": None
+                "age_seconds": None,
+                "delay_ms": None,
+                "servers": [],
+                "drift_ppm": None,
+                "disciplined": _discipline is not None,
+                "jitter_ms": None,
+                "slew_remaining_ms": None,
+                "clock_generation": None
             }
         
         age = (datetime.now(timezone.utc) - _last_sync).total_seconds()
@@ -209,18 +735,39 @@ def get_sync_status() -> dict:
             "synced": True,
             "offset_ms": _time_offset * 1000,
             "last_sync": _last_sync,
-            "age_seconds": age
+            "age_seconds": age,
+            "delay_ms": _last_estimate.delay * 1000 if _last_estimate else None,
+            "servers": list(_last_estimate.servers_used) if _last_estimate else [],
+            "drift_ppm": _clock_snapshot.drift_ppm if _clock_snapshot else 0.0,
+            "disciplined": _discipline is not None,
+            "jitter_ms": (
+                _discipline.jitter_s * 1000
+                if _discipline is not None and _discipline.jitter_s is not None else None
+            ),
+            "slew_remaining_ms": (
+                _clock_snapshot.slew_remaining_ns(time.monotonic_ns()) / 1e6
+                if _clock_snapshot else 0.0
+            ),
+            "clock_generation": _clock_snapshot.generation if _clock_snapshot else None
         }
 
 
-def start_periodic_sync(interval_minutes: int = 60, server: str = DEFAULT_NTP_SERVER):
+def start_periodic_sync(
+    interval_minutes: int = 60,
+    server: Optional[NtpServer] = None,
+    discipline: bool = False
+):
     """
     Start background thread for periodic time synchronization.
     
     Args:
         interval_minutes: Sync interval in minutes
-        server: NTP server to use
+        server: NTP server to use (default: all DEFAULT_NTP_SERVERS)
+        discipline: Slew corrections smoothly instead of stepping the clock
     """
+    if discipline:
+        enable_clock_discipline(True)
+    
     def sync_worker():
         while True:
             update_time_sync(server, force=False)
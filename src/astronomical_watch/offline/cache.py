@@ -5,12 +5,15 @@ Supports migration from schema v1 (legacy approx) to v2 (structured data).
 from __future__ import annotations
 import json
 import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, asdict
 import threading
 
+from astronomical_watch import metrics as _metrics
+
 # Cache schema versions
 CURRENT_SCHEMA_VERSION = 2
 LEGACY_SCHEMA_VERSION = 1
@@ -22,6 +25,17 @@ DEFAULT_CACHE_FILE = "equinox_cache.json"
 # Thread lock for cache operations
 _cache_lock = threading.Lock()
 
+# Metrics
+CACHE_LOOKUPS = _metrics.counter(
+    "awatch_cache_lookups", "Equinox cache lookups", ["result"]
+)
+CACHE_WRITES = _metrics.counter(
+    "awatch_cache_writes", "Equinox cache file writes"
+)
+CACHE_OPERATION_SECONDS = _metrics.histogram(
+    "awatch_cache_operation_seconds", "Equinox cache get/set duration (file I/O included)", ["op"]
+)
+
 
 @dataclass
 class EquinoxEntry:
@@ -82,6 +96,8 @@ def save_cache(cache_data: Dict[str, Any]) -> None:
     ensure_cache_dir()
     cache_file = get_cache_file_path()
     
+    if _metrics.enabled:
+        CACHE_WRITES.inc()
     try:
         with open(cache_file, 'w', encoding='utf-8') as f:
             json.dump(cache_data, f, indent=2, ensure_ascii=False)
@@ -160,6 +176,16 @@ def get_cached_equinox(year: int) -> Optional[EquinoxEntry]:
     Returns:
         EquinoxEntry if found, None otherwise
     """
+    if not _metrics.enabled:
+        return _get_cached_equinox(year)
+    start = time.perf_counter()
+    entry = _get_cached_equinox(year)
+    CACHE_OPERATION_SECONDS.labels(op="get").observe(time.perf_counter() - start)
+    CACHE_LOOKUPS.labels(result="miss" if entry is None else "hit").inc()
+    return entry
+
+
+def _get_cached_equinox(year: int) -> Optional[EquinoxEntry]:
     with _cache_lock:
         cache_data = load_cache()
         cache_data = migrate_cache_if_needed(cache_data)
@@ -192,6 +218,15 @@ def set_cached_equinox(year: int, entry: EquinoxEntry) -> None:
         year: Target year
         entry: EquinoxEntry to store
     """
+    if _metrics.enabled:
+        start = time.perf_counter()
+        _set_cached_equinox(year, entry)
+        CACHE_OPERATION_SECONDS.labels(op="set").observe(time.perf_counter() - start)
+    else:
+        _set_cached_equinox(year, entry)
+
+
+def _set_cached_equinox(year: int, entry: EquinoxEntry) -> None:
     with _cache_lock:
         cache_data = load_cache()
         cache_data = migrate_cache_if_needed(cache_data)
@@ -1,31 +1,104 @@
+import json
 from datetime import datetime, timezone
-from fastapi import APIRouter
-from services.equinox_service import get_vernal_equinox_datetime
+from fastapi import APIRouter, Request, Response
+from services.equinox_service import (
+    get_vernal_equinox_progressive, get_settled_precision, get_model_version
+)
+from routes.http_cache import (
+    equinox_cache_headers, equinox_etag, if_none_match, is_settled,
+    next_equinox_cache_headers, next_equinox_etag
+)
+from routes.response_cache import ResponseBytesCache
 
 router = APIRouter()
 
-def _next_vernal_equinox(now_utc: datetime) -> datetime:
+JSON_MEDIA_TYPE = "application/json"
+
+# Encoded bodies of settled values, keyed by (endpoint, params, model version):
+# - ("year", year, version)  -> (body bytes, precision)
+# - ("next", year, version)  -> (target datetime, precision, head, tail) template
+#   around the countdown fields that change every request
+_responses = ResponseBytesCache()
+
+def _iso_z(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00","Z")
+
+def _next_vernal_equinox(now_utc: datetime) -> dict:
     year = now_utc.year
-    candidate = get_vernal_equinox_datetime(year)
-    if candidate <= now_utc:
-        candidate = get_vernal_equinox_datetime(year + 1)
+    candidate = get_vernal_equinox_progressive(year)
+    if candidate["datetime"] <= now_utc:
+        candidate = get_vernal_equinox_progressive(year + 1)
     return candidate
 
+def _cached_next_template(now_utc: datetime):
+    version = get_model_version()
+    for year in (now_utc.year, now_utc.year + 1):
+        template = _responses.get(("next", year, version))
+        if template is not None and template[0] > now_utc:
+            return year, template
+    return None
+
+def _next_template(target: datetime, precision: str, uncertainty_s: float):
+    head = f'{{"utc":"{_iso_z(target)}","seconds_until":'.encode()
+    tail = (
+        ',"precision":' + json.dumps(precision) + ',"uncertainty_s":' + json.dumps(uncertainty_s) + "}"
+    ).encode()
+    return target, precision, head, tail
+
+def _render_next(template, now_utc: datetime) -> bytes:
+    target, _, head, tail = template
+    diff = (target - now_utc).total_seconds()
+    return head + f'{int(diff)},"days_until":{diff / 86400.0!r}'.encode() + tail
+
 @router.get("/equinox/next")
-def next_equinox():
+def next_equinox(request: Request):
     now = datetime.now(timezone.utc)
-    target = _next_vernal_equinox(now)
-    diff = target - now
-    return {
-        "utc": target.isoformat().replace("+00:00","Z"),
-        "seconds_until": int(diff.total_seconds()),
-        "days_until": diff.total_seconds() / 86400.0
-    }
+    cached = _cached_next_template(now)
+    if cached is not None:
+        year, template = cached
+        target, precision = template[0], template[1]
+        seconds_until = int((target - now).total_seconds())
+        headers = next_equinox_cache_headers(year, precision, seconds_until)
+        if if_none_match(request.headers.get("if-none-match"), next_equinox_etag(year, precision)):
+            return Response(status_code=304, headers=headers)
+        return Response(content=_render_next(template, now), media_type=JSON_MEDIA_TYPE,
+                        headers=headers)
+
+    result = _next_vernal_equinox(now)
+    target = result["datetime"]
+    template = _next_template(target, result["precision"], result["uncertainty_s"])
+    if is_settled(result["precision"]):
+        _responses.put(("next", target.year, get_model_version()), template)
+    seconds_until = int((target - now).total_seconds())
+    return Response(
+        content=_render_next(template, now), media_type=JSON_MEDIA_TYPE,
+        headers=next_equinox_cache_headers(target.year, result["precision"], seconds_until)
+    )
 
 @router.get("/equinox/{year}")
-def equinox_year(year: int):
-    dt = get_vernal_equinox_datetime(year)
-    return {
-        "year": year,
-        "utc": dt.isoformat().replace("+00:00","Z")
-    }
+def equinox_year(year: int, request: Request):
+    now = datetime.now(timezone.utc)
+    settled = get_settled_precision()
+    if if_none_match(request.headers.get("if-none-match"), equinox_etag(year, settled)):
+        return Response(status_code=304, headers=equinox_cache_headers(year, settled, now))
+
+    key = ("year", year, get_model_version())
+    cached = _responses.get(key)
+    if cached is None:
+        result = get_vernal_equinox_progressive(year)
+        body = json.dumps({
+            "year": year,
+            "utc": _iso_z(result["datetime"]),
+            "precision": result["precision"],
+            "uncertainty_s": result["uncertainty_s"]
+        }, separators=(",", ":")).encode()
+        cached = (body, result["precision"])
+        if is_settled(result["precision"]):
+            _responses.put(key, cached)
+    body, precision = cached
+    return Response(content=body, media_type=JSON_MEDIA_TYPE,
+                    headers=equinox_cache_headers(year, precision, now))
+
+def get_response_cache_stats() -> dict:
+    """Hit/miss statistics of the pre-serialized response cache."""
+    return _responses.stats()
@@ -0,0 +1,85 @@
+"""
+HTTP caching helpers for the equinox endpoints.
+
+Validators are derived from the equinox model version, so an ETag stays
+valid for as long as the computed value cannot change. Only settled values
+(at the most precise tier this configuration can produce) are given
+validators and long lifetimes; values that may still be refined in the
+background are sent with `no-cache`.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+
+from services.equinox_service import get_model_version, get_settled_precision
+
+# Lifetimes (seconds)
+IMMUTABLE_MAX_AGE = 31536000      # One year, for past equinoxes
+CURRENT_YEAR_MAX_AGE = 86400      # Current and future years
+NEXT_EQUINOX_MAX_AGE_CAP = 86400  # /equinox/next is revalidated at least daily
+
+
+def equinox_etag(year: int, precision: str) -> str:
+    """Strong ETag for one year's equinox at a precision tier."""
+    return f'"eq-{get_model_version()}-{year}-{precision}"'
+
+
+def next_equinox_etag(year: int, precision: str) -> str:
+    """Weak ETag for /equinox/next (the countdown fields differ byte-wise)."""
+    return f'W/"next-{get_model_version()}-{year}-{precision}"'
+
+
+def if_none_match(header: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag (weak comparison, RFC 9110).
+
+    Returns:
+        True if the client's copy is current and 304 should be sent
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def is_settled(precision: str) -> bool:
+    return precision == get_settled_precision()
+
+
+def equinox_cache_headers(year: int, precision: str, now: datetime) -> Dict[str, str]:
+    """ETag and Cache-Control headers for /equinox/{year}."""
+    if not is_settled(precision):
+        return {"Cache-Control": "no-cache"}
+    if year < now.year:
+        cache_control = f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    else:
+        cache_control = f"public, max-age={CURRENT_YEAR_MAX_AGE}"
+    return {"ETag": equinox_etag(year, precision), "Cache-Control": cache_control}
+
+
+def next_equinox_cache_headers(year: int, precision: str, seconds_until: int) -> Dict[str, str]:
+    """ETag and Cache-Control headers for /equinox/next."""
+    if not is_settled(precision):
+        return {"Cache-Control": "no-cache"}
+    max_age = max(0, min(int(seconds_until), NEXT_EQUINOX_MAX_AGE_CAP))
+    return {
+        "ETag": next_equinox_etag(year, precision),
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+
+
+__all__ = [
+    "equinox_etag",
+    "next_equinox_etag",
+    "if_none_match",
+    "is_settled",
+    "equinox_cache_headers",
+    "next_equinox_cache_headers",
+]
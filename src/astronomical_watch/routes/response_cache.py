@@ -0,0 +1,70 @@
+"""
+Bounded LRU of pre-serialized response bodies.
+
+Entries are keyed by (endpoint, params, model version) and hold the final
+encoded bytes (or a small template around the fields that change), so a hit
+skips result dictionaries, ISO formatting and the JSON encoder entirely.
+Callers only store values that can no longer change for that key.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+DEFAULT_MAXSIZE = 1024
+
+
+class ResponseBytesCache:
+    """Thread-safe LRU mapping a hashable key to an encoded response."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Look up without touching LRU order or statistics."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop entries whose key matches predicate (all if None). Returns count dropped."""
+        with self._lock:
+            if predicate is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+__all__ = ["ResponseBytesCache", "DEFAULT_MAXSIZE"]
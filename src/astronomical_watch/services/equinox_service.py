@@ -4,16 +4,30 @@ Coordinates internet fetch, analytic calculation, and approximation methods.
 """
 from __future__ import annotations
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import hashlib
+import os
+import queue
+import threading
+import time
 import traceback
 
-from solar.equinox_precise import compute_vernal_equinox_precise, validate_equinox_solution
-from net.equinox_fetch import fetch_equinox_datetime, is_fetch_configured
+from solar.equinox_precise import (
+    compute_vernal_equinox_precise, validate_equinox_solution, EQUINOX_SOLVES, EQUINOX_SOLVE_SECONDS
+)
+from net.equinox_fetch import (
+    fetch_equinox_datetime, is_fetch_configured, is_fetch_suppressed, get_breaker_status,
+    get_equinox_fetch_url, BREAKER_BASE_BACKOFF_SECONDS, BREAKER_MAX_BACKOFF_SECONDS
+)
 from offline.cache import (
     get_cached_equinox, set_cached_equinox, create_entry, 
     parse_cached_datetime, EquinoxEntry
 )
 from astronomical_watch import compute_vernal_equinox  # Legacy approximation
+from astronomical_watch import core_probes, metrics as _metrics
+
+if _metrics.enabled:
+    core_probes.install()
 
 # Default precision ordering
 DEFAULT_PREFER_ORDER = ("internet", "analytic", "approx")
@@ -26,6 +40,50 @@ UNCERTAINTY_APPROX = 10800.0    # 3 hours for legacy approximation
 # Network timeout for internet fetch
 INTERNET_FETCH_TIMEOUT = 10.0
 
+# Years either side of the current year populated by the cache warmer
+DEFAULT_WARM_RADIUS = 1
+
+# Local methods tried for the immediate answer in progressive mode
+PROGRESSIVE_FAST_ORDER = ("analytic", "approx")
+
+METHOD_UNCERTAINTY = {
+    "internet": UNCERTAINTY_INTERNET,
+    "analytic": UNCERTAINTY_ANALYTIC,
+    "approx": UNCERTAINTY_APPROX
+}
+
+# Source files (relative to the package) whose content defines computed equinoxes
+MODEL_SOURCE_FILES = (
+    "solar/solar_longitude_light.py",
+    "solar/equinox_precise.py",
+    "astro/timescales.py",
+    "core/equinox.py",
+    "core/solar.py",
+    "core/vsop87_earth.py",
+)
+
+_model_digest: Optional[str] = None
+
+# In-process tier in front of the JSON cache (year -> result dict)
+_memory_cache: Dict[int, Dict[str, Any]] = {}
+_memory_lock = threading.Lock()
+
+# Subscribers notified when a more precise value replaces a cached one
+_update_subscribers: List[Callable[[int, Dict[str, Any]], None]] = []
+_subscribers_lock = threading.Lock()
+
+# Background refinement state
+_refine_queue: "queue.Queue[Tuple[int, Tuple[str, ...]]]" = queue.Queue()
+_refine_pending: set = set()
+_refined_years: set = set()  # years that reached the best tier of their prefer_order
+# Years whose refinement fell short (e.g. offline): year -> (attempts, monotonic retry time).
+# They may be queued again after the same exponential backoff the fetch breaker uses.
+_refine_retry: Dict[int, Tuple[int, float]] = {}
+_refine_lock = threading.Lock()
+_refine_idle = threading.Event()
+_refine_idle.set()
+_refine_thread: Optional[threading.Thread] = None
+
 
 def get_vernal_equinox(
     year: int, 
@@ -47,12 +105,17 @@ def get_vernal_equinox(
         - cached: Whether result came from cache
         - retrieved_at: ISO timestamp when computed/fetched
     """
+    # Check in-memory tier first (no disk I/O)
+    memory_result = _get_memory_result(year)
+    if memory_result is not None:
+        return memory_result
+    
     # Check cache first
     cached_entry = get_cached_equinox(year)
     if cached_entry:
         try:
             dt = parse_cached_datetime(cached_entry)
-            return {
+            result = {
                 "utc": cached_entry.utc,
                 "precision": cached_entry.precision,
                 "uncertainty_s": cached_entry.uncertainty_s,
@@ -61,6 +124,8 @@ def get_vernal_equinox(
                 "retrieved_at": cached_entry.retrieved_at,
                 "datetime": dt
             }
+            _remember_result(year, result)
+            return result
         except ValueError:
             # Cache entry is corrupted, continue with calculation
             pass
@@ -105,6 +170,10 @@ def _try_internet_method(year: int) -> Optional[Dict[str, Any]]:
     if not is_fetch_configured():
         return None
     
+    # Skip instantly while the breaker is open or the year is a known miss
+    if is_fetch_suppressed(year):
+        return None
+    
     try:
         dt = fetch_equinox_datetime(year, timeout=INTERNET_FETCH_TIMEOUT)
         if dt is None:
@@ -158,7 +227,11 @@ def _try_analytic_method(year: int) -> Optional[Dict[str, Any]]:
 def _try_approx_method(year: int) -> Optional[Dict[str, Any]]:
     """Try to get equinox using legacy approximation."""
     try:
+        start = time.perf_counter()
         dt = compute_vernal_equinox(year)
+        if _metrics.enabled:
+            EQUINOX_SOLVES.labels(solver="core").inc()
+            EQUINOX_SOLVE_SECONDS.labels(solver="core").observe(time.perf_counter() - start)
         
         utc_iso = dt.isoformat().replace('+00:00', 'Z')
         retrieved_at = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
@@ -176,8 +249,33 @@ def _try_approx_method(year: int) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _run_method(method: str, year: int) -> Optional[Dict[str, Any]]:
+    """Run a single precision tier by name."""
+    if method == "internet":
+        return _try_internet_method(year)
+    elif method == "analytic":
+        return _try_analytic_method(year)
+    elif method == "approx":
+        return _try_approx_method(year)
+    return None
+
+
+def _get_memory_result(year: int) -> Optional[Dict[str, Any]]:
+    """Return a copy of the in-memory result for a year, if any."""
+    with _memory_lock:
+        result = _memory_cache.get(year)
+        return dict(result) if result is not None else None
+
+
+def _remember_result(year: int, result: Dict[str, Any]) -> None:
+    """Store a result in the in-memory tier (served as cached from then on)."""
+    with _memory_lock:
+        _memory_cache[year] = dict(result, cached=True)
+
+
 def _cache_result(year: int, result: Dict[str, Any]) -> None:
     """Cache the equinox result."""
+    _remember_result(year, result)
     try:
         entry = create_entry(
             dt=result["datetime"],
@@ -215,9 +313,354 @@ def get_vernal_equinox_datetime(
 def clear_cache() -> None:
     """Clear the equinox cache."""
     from offline.cache import clear_cache as _clear_cache
+    with _memory_lock:
+        _memory_cache.clear()
+    with _refine_lock:
+        _refined_years.clear()
+        _refine_retry.clear()
     _clear_cache()
 
 
+def subscribe_equinox_updates(
+    callback: Callable[[int, Dict[str, Any]], None]
+) -> Callable[[], None]:
+    """
+    Register a callback for background precision upgrades.
+    
+    The callback receives (year, result) whenever a more precise value replaces
+    the cached one. It runs on the refinement thread, so GUI subscribers must
+    hand the update over to their own thread.
+    
+    Args:
+        callback: Function called with the year and the new result dictionary
+    
+    Returns:
+        Function that removes the subscription
+    """
+    with _subscribers_lock:
+        _update_subscribers.append(callback)
+    
+    def unsubscribe() -> None:
+        with _subscribers_lock:
+            if callback in _update_subscribers:
+                _update_subscribers.remove(callback)
+    
+    return unsubscribe
+
+
+def _notify_update(year: int, result: Dict[str, Any]) -> None:
+    """Deliver a refined result to all subscribers."""
+    with _subscribers_lock:
+        subscribers = list(_update_subscribers)
+    for callback in subscribers:
+        try:
+            callback(year, dict(result))
+        except Exception:
+            traceback.print_exc()
+
+
+def _refine_year(year: int, prefer_order: Tuple[str, ...]) -> float:
+    """
+    Try every tier more precise than the current value, least precise first.
+    
+    Returns the uncertainty (seconds) of the best value held afterwards.
+    """
+    current = _get_memory_result(year)
+    best_uncertainty = current["uncertainty_s"] if current else float("inf")
+    
+    candidates = [
+        m for m in prefer_order
+        if METHOD_UNCERTAINTY.get(m, float("inf")) < best_uncertainty
+    ]
+    candidates.sort(key=lambda m: METHOD_UNCERTAINTY[m], reverse=True)
+    
+    for method in candidates:
+        try:
+            result = _run_method(method, year)
+        except Exception:
+            result = None
+        if result and result["uncertainty_s"] < best_uncertainty:
+            _cache_result(year, result)
+            best_uncertainty = result["uncertainty_s"]
+            result["cached"] = False
+            _notify_update(year, result)
+    return best_uncertainty
+
+
+def _best_possible_uncertainty(prefer_order: Tuple[str, ...]) -> float:
+    """Uncertainty of the most precise tier in prefer_order this configuration can run."""
+    settled = METHOD_UNCERTAINTY[get_settled_precision()]
+    return min(
+        (METHOD_UNCERTAINTY.get(m, float("inf")) for m in prefer_order
+         if METHOD_UNCERTAINTY.get(m, float("inf")) >= settled),
+        default=float("inf"),
+    )
+
+
+def _refinement_worker() -> None:
+    """Daemon loop draining the refinement queue."""
+    while True:
+        year, prefer_order = _refine_queue.get()
+        reached = float("inf")
+        try:
+            reached = _refine_year(year, prefer_order)
+        finally:
+            best_possible = _best_possible_uncertainty(prefer_order)
+            with _refine_lock:
+                _refine_pending.discard(year)
+                if reached <= best_possible:
+                    _refined_years.add(year)
+                    _refine_retry.pop(year, None)
+                else:
+                    attempts = _refine_retry.get(year, (0, 0.0))[0] + 1
+                    backoff = min(BREAKER_BASE_BACKOFF_SECONDS * 2 ** (attempts - 1),
+                                  BREAKER_MAX_BACKOFF_SECONDS)
+                    _refine_retry[year] = (attempts, time.monotonic() + backoff)
+                if not _refine_pending:
+                    _refine_idle.set()
+            _refine_queue.task_done()
+
+
+def _schedule_refinement(year: int, prefer_order: Tuple[str, ...]) -> bool:
+    """
+    Queue a background refinement for a year.
+    
+    Once per process when it reaches the best tier; a year that fell short
+    is queued again only after its backoff expired.
+    """
+    global _refine_thread
+    with _refine_lock:
+        if year in _refine_pending or year in _refined_years:
+            return False
+        retry = _refine_retry.get(year)
+        if retry is not None and time.monotonic() < retry[1]:
+            return False
+        _refine_pending.add(year)
+        _refine_idle.clear()
+        if _refine_thread is None:
+            _refine_thread = threading.Thread(
+                target=_refinement_worker, daemon=True, name="Equinox-Refine"
+            )
+            _refine_thread.start()
+    _refine_queue.put((year, tuple(prefer_order)))
+    return True
+
+
+def wait_for_refinement(timeout: Optional[float] = None) -> bool:
+    """Block until all scheduled refinements have finished (or timeout)."""
+    return _refine_idle.wait(timeout)
+
+
+def get_vernal_equinox_progressive(
+    year: int,
+    prefer_order: Tuple[str, ...] = DEFAULT_PREFER_ORDER,
+    fast_order: Tuple[str, ...] = PROGRESSIVE_FAST_ORDER
+) -> Dict[str, Any]:
+    """
+    Get a vernal equinox immediately and refine it in the background.
+    
+    The first answer comes from the cache or the cheapest local method in
+    `fast_order`. If a more precise tier in `prefer_order` exists, it is run on
+    the refinement thread; when it succeeds the cache is updated and
+    subscribers registered with subscribe_equinox_updates() are notified.
+    
+    Args:
+        year: Target year
+        prefer_order: Tiers eligible for refinement
+        fast_order: Local tiers used for the immediate answer
+    
+    Returns:
+        Same dictionary as get_vernal_equinox(), plus `refining` (bool)
+    """
+    fast = tuple(m for m in fast_order if m in prefer_order) or tuple(prefer_order)
+    result = get_vernal_equinox(year, fast)
+    
+    best_possible = _best_possible_uncertainty(prefer_order)
+    refining = False
+    if result["uncertainty_s"] > best_possible:
+        refining = _schedule_refinement(year, prefer_order)
+        with _refine_lock:
+            refining = refining or year in _refine_pending
+    
+    result["refining"] = refining
+    return result
+
+
+def warm_priority_years(center_year: int, radius: int = DEFAULT_WARM_RADIUS) -> List[int]:
+    """
+    Years to warm in priority order, nearest to the center year first.
+    
+    Args:
+        center_year: Year the caller is about to display
+        radius: Number of years on each side
+    
+    Returns:
+        [center, center+1, center-1, center+2, center-2, ...]
+    """
+    years = [center_year]
+    for offset in range(1, radius + 1):
+        years.extend([center_year + offset, center_year - offset])
+    return years
+
+
+class CacheWarmer:
+    """
+    Populates the equinox cache for neighbouring years on a daemon thread.
+    
+    Years are resolved in the given order, so the current astronomical year is
+    available first. The `ready` event is set once every year has been
+    attempted; readers can then take values from `get_equinox()` without
+    touching the disk cache or the solvers.
+    """
+    
+    def __init__(
+        self,
+        years: List[int],
+        prefer_order: Tuple[str, ...] = DEFAULT_PREFER_ORDER,
+        progressive: bool = True
+    ):
+        self.years = list(years)
+        self.prefer_order = tuple(prefer_order)
+        self.progressive = progressive
+        self.ready = threading.Event()
+        self._results: Dict[int, datetime] = {}
+        self._errors: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> "CacheWarmer":
+        """Start warming in the background (idempotent)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.run, daemon=True, name="Equinox-Warmer"
+            )
+            self._thread.start()
+        return self
+    
+    def run(self) -> None:
+        """Resolve every year in priority order, then mark the warmer ready."""
+        try:
+            for year in self.years:
+                try:
+                    if self.progressive:
+                        dt = get_vernal_equinox_progressive(year, self.prefer_order)["datetime"]
+                    else:
+                        dt = get_vernal_equinox_datetime(year, self.prefer_order)
+                    with self._lock:
+                        self._results[year] = dt
+                except Exception as e:
+                    with self._lock:
+                        self._errors[year] = str(e)
+        finally:
+            self.ready.set()
+    
+    def get_equinox(self, year: int) -> Optional[datetime]:
+        """Warmed equinox datetime for a year, or None if not (yet) available."""
+        with self._lock:
+            warmed = self._results.get(year)
+        if warmed is None:
+            return None
+        # Background refinements land in the memory tier
+        refined = _get_memory_result(year)
+        return refined["datetime"] if refined is not None else warmed
+    
+    def is_ready(self) -> bool:
+        """True once all years have been attempted."""
+        return self.ready.is_set()
+    
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until warming finishes or the timeout expires."""
+        return self.ready.wait(timeout)
+    
+    def status(self) -> Dict[str, Any]:
+        """Progress snapshot for status reporting."""
+        with self._lock:
+            return {
+                "ready": self.ready.is_set(),
+                "years": list(self.years),
+                "warmed_years": sorted(self._results),
+                "errors": dict(self._errors)
+            }
+
+
+_warmer: Optional[CacheWarmer] = None
+_warmer_lock = threading.Lock()
+
+
+def start_cache_warmer(
+    radius: int = DEFAULT_WARM_RADIUS,
+    center_year: Optional[int] = None,
+    prefer_order: Tuple[str, ...] = DEFAULT_PREFER_ORDER
+) -> CacheWarmer:
+    """
+    Start the shared background cache warmer if it is not already running.
+    
+    Args:
+        radius: Number of years on each side of the center year to warm
+        center_year: Year to center on (defaults to the current UTC year)
+        prefer_order: Method preference order used for each year
+    
+    Returns:
+        The shared CacheWarmer instance
+    """
+    global _warmer
+    with _warmer_lock:
+        if _warmer is None:
+            if center_year is None:
+                center_year = datetime.now(timezone.utc).year
+            years = warm_priority_years(center_year, radius)
+            _warmer = CacheWarmer(years, prefer_order).start()
+        return _warmer
+
+
+def get_cache_warmer() -> Optional[CacheWarmer]:
+    """Get the shared cache warmer, or None if it was never started."""
+    return _warmer
+
+
+def _compute_model_digest() -> str:
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha256()
+    paths = [os.path.join(package_dir, rel) for rel in MODEL_SOURCE_FILES]
+    coeff_dir = os.path.join(package_dir, "scripts", "vsop87_coefficients")
+    if os.path.isdir(coeff_dir):
+        paths += sorted(
+            os.path.join(coeff_dir, name) for name in os.listdir(coeff_dir)
+            if name.startswith("vsop87d_earth_") and name.endswith(".py")
+        )
+    for path in paths:
+        digest.update(os.path.relpath(path, package_dir).encode())
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def get_model_version() -> str:
+    """
+    Short identifier of the equinox models and data sources in use.
+    
+    Derived from the solver and coefficient sources (hashed once per process)
+    and the configured remote URL, so it changes whenever a computed or
+    fetched equinox could change. Used for HTTP validators.
+    
+    Returns:
+        16 hex digit version string
+    """
+    global _model_digest
+    if _model_digest is None:
+        _model_digest = _compute_model_digest()
+    url = get_equinox_fetch_url() or ""
+    return hashlib.sha256(f"{_model_digest}|{url}".encode()).hexdigest()[:16]
+
+
+def get_settled_precision() -> str:
+    """Most precise tier this configuration can produce (values at it never refine)."""
+    return "internet" if is_fetch_configured() else "analytic"
+
+
 def get_service_status() -> Dict[str, Any]:
     """
     Get status information about the equinox service.
@@ -233,6 +676,9 @@ def get_service_status() -> Dict[str, Any]:
         "default_prefer_order": list(DEFAULT_PREFER_ORDER),
         "cache_status": get_cache_stats(),
         "internet_status": get_fetch_status(),
+        "internet_breaker": get_breaker_status(),
+        "warmer": _warmer.status() if _warmer is not None else None,
+        "model_version": get_model_version(),
         "uncertainty_estimates": {
             "internet": UNCERTAINTY_INTERNET,
             "analytic": UNCERTAINTY_ANALYTIC,
@@ -259,13 +705,15 @@ def check_all_methods(year: int) -> Dict[str, Any]:
         results["internet"] = {
             "success": internet_result is not None,
             "result": internet_result,
-            "configured": is_fetch_configured()
+            "configured": is_fetch_configured(),
+            "breaker": get_breaker_status()["state"]
         }
     except Exception as e:
         results["internet"] = {
             "success": False,
             "error": str(e),
-            "configured": is_fetch_configured()
+            "configured": is_fetch_configured(),
+            "breaker": get_breaker_status()["state"]
         }
     
     # Test analytic method
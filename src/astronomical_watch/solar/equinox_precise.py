@@ -4,10 +4,12 @@ Uses bracket and binary search or Brent's method over March window.
 """
 from __future__ import annotations
 import math
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Tuple, Optional, Callable
 from solar.solar_longitude_light import solar_longitude_from_datetime, vernal_equinox_solar_longitude_target
 from astro.timescales import ensure_utc
+from astronomical_watch import metrics as _metrics
 
 # Constants
 SECONDS_PER_DAY = 86400.0
@@ -16,6 +18,21 @@ CONVERGENCE_TOLERANCE_SECONDS = 1.0  # Target accuracy in seconds
 PI = math.pi
 TAU = 2.0 * PI
 
+# Metrics (shared with the services layer, which times the Core solver)
+EQUINOX_SOLVES = _metrics.counter(
+    "awatch_equinox_solves", "Vernal equinox solves", ["solver"]
+)
+EQUINOX_SOLVE_SECONDS = _metrics.histogram(
+    "awatch_equinox_solve_seconds", "Time per vernal equinox solve", ["solver"]
+)
+EQUINOX_SOLVE_EVALUATIONS = _metrics.histogram(
+    "awatch_equinox_solve_evaluations", "Objective evaluations per precise solve (after bracketing)",
+    ["solver"], buckets=_metrics.COUNT_BUCKETS
+)
+OBJECTIVE_EVALUATIONS = _metrics.counter(
+    "awatch_equinox_objective_evaluations", "Equinox solver objective evaluations", ["solver"]
+)
+
 
 def angle_difference(a: float, b: float) -> float:
     """
@@ -248,6 +265,9 @@ def compute_vernal_equinox_precise(
     if method not in ["brent", "bisection"]:
         raise ValueError(f"Invalid method: {method}. Must be 'brent' or 'bisection'")
     
+    if _metrics.enabled:
+        return _observed_solve(year, method, tolerance_sec, max_iter)
+    
     # Find bracketing interval
     dt_a, dt_b = find_march_bracket(year)
     
@@ -260,6 +280,28 @@ def compute_vernal_equinox_precise(
     return ensure_utc(result)
 
 
+def _observed_solve(year: int, method: str, tolerance_sec: float, max_iter: int) -> datetime:
+    """compute_vernal_equinox_precise with evaluation counts and timing recorded."""
+    evaluations = 0
+    
+    def counting_objective(dt: datetime) -> float:
+        nonlocal evaluations
+        evaluations += 1
+        return solar_longitude_objective(dt)
+    
+    start = time.perf_counter()
+    dt_a, dt_b = find_march_bracket(year)
+    solve = brent_solve if method == "brent" else bisection_solve
+    result = solve(counting_objective, dt_a, dt_b, tolerance_sec, max_iter)
+    elapsed = time.perf_counter() - start
+    
+    EQUINOX_SOLVES.labels(solver=method).inc()
+    EQUINOX_SOLVE_SECONDS.labels(solver=method).observe(elapsed)
+    EQUINOX_SOLVE_EVALUATIONS.labels(solver=method).observe(evaluations)
+    OBJECTIVE_EVALUATIONS.labels(solver=method).inc(evaluations)
+    return ensure_utc(result)
+
+
 def validate_equinox_solution(dt: datetime, tolerance_deg: float = 0.01) -> bool:
     """
     Validate that a datetime is close to the vernal equinox.
@@ -0,0 +1,76 @@
+"""
+Month model for the comparison card calendar.
+
+A MonthModel holds the Gregorian week grid of a month and the Dies of every
+day (taken at 12:00 UTC, like the calendar has always shown). It is built
+from one year context - the two vernal equinoxes that can apply to the
+month - with integer nanosecond arithmetic per day (astro_time_core.reading_at)
+instead of a solve and an AstroYear per cell.
+
+Models are memoized per (year, month, equinoxes), so flipping back and
+forth between months is a dictionary lookup, and a refined equinox from
+the service simply produces a new key.
+"""
+from __future__ import annotations
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+from ..core.astro_time_core import DAY_NS, datetime_to_ns, reading_at
+from .equinox_provider import get_equinox
+
+EquinoxSource = Callable[[int], datetime]
+
+# Local months kept; covers a few years of browsing back and forth
+CACHED_MONTHS = 48
+
+
+@dataclass(frozen=True)
+class MonthModel:
+    """Week grid and per-day Dies of one month."""
+    year: int
+    month: int
+    weeks: Tuple[Tuple[int, ...], ...]   # calendar.monthcalendar(), 0 = outside the month
+    dies: Tuple[Optional[int], ...]      # dies[day - 1]; None if unavailable
+
+    def dies_for(self, day: int) -> Optional[int]:
+        return self.dies[day - 1]
+
+
+@lru_cache(maxsize=CACHED_MONTHS)
+def _build(year: int, month: int, previous_equinox_ns: int, equinox_ns: int) -> MonthModel:
+    first_noon_ns = datetime_to_ns(datetime(year, month, 1, 12, 0, tzinfo=timezone.utc))
+    days = calendar.monthrange(year, month)[1]
+    dies = []
+    for index in range(days):
+        t_ns = first_noon_ns + index * DAY_NS
+        year_start_ns = equinox_ns if t_ns >= equinox_ns else previous_equinox_ns
+        dies.append(reading_at(t_ns, year_start_ns)[0])
+    weeks = tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+    return MonthModel(year, month, weeks, tuple(dies))
+
+
+def month_model(year: int, month: int, equinox_source: EquinoxSource = get_equinox) -> MonthModel:
+    """Model of a month; Dies are None when the equinoxes cannot be computed."""
+    try:
+        previous_equinox_ns = datetime_to_ns(equinox_source(year - 1))
+        equinox_ns = datetime_to_ns(equinox_source(year))
+    except Exception as e:
+        print(f"⚠️ Calendar Dies unavailable for {year}-{month:02d}: {e}")
+        days = calendar.monthrange(year, month)[1]
+        weeks = tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+        return MonthModel(year, month, weeks, (None,) * days)
+    return _build(year, month, previous_equinox_ns, equinox_ns)
+
+
+def cache_info():
+    return _build.cache_info()
+
+
+def cache_clear() -> None:
+    _build.cache_clear()
+
+
+__all__ = ['MonthModel', 'month_model', 'cache_info', 'cache_clear']
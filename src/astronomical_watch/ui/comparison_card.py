@@ -1,13 +1,114 @@
 from tkinter import Toplevel, Label, Frame, Entry, Button, Canvas, Scrollbar
 from datetime import datetime, timezone, timedelta
 import time
-import calendar as cal_module
-from ..core.astro_time_core import AstroYear
-from ..core.equinox import compute_vernal_equinox
+from ..core.astro_time_core import datetime_to_ns, reading_at
+from .calendar_model import month_model
+from .compute_worker import get_worker
+from .equinox_provider import get_equinox
 from .translations import tr
 from .gradient import get_sky_theme, create_gradient_colors
 from .theme_manager import get_shared_theme
 
+MONTH_NAMES = {
+    "en": ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"],
+    "sr": ["Januar", "Februar", "Mart", "April", "Maj", "Jun", "Jul", "Avgust", "Septembar", "Oktobar", "Novembar", "Decembar"],
+    "es": ["Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio", "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"],
+    "zh": ["一月", "二月", "三月", "四月", "五月", "六月", "七月", "八月", "九月", "十月", "十一月", "十二月"],
+    "ar": ["يناير", "فبراير", "مارس", "أبريل", "مايو", "يونيو", "يوليو", "أغسطس", "سبتمبر", "أكتوبر", "نوفمبر", "ديسمبر"],
+    "pt": ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"],
+    "fr": ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin", "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"],
+    "de": ["Januar", "Februar", "März", "April", "Mai", "Juni", "Juli", "August", "September", "Oktober", "November", "Dezember"],
+    "ru": ["Январь", "Февраль", "Март", "Апрель", "Май", "Июнь", "Июль", "Август", "Сентябрь", "Октябрь", "Ноябрь", "Декабрь"],
+    "ja": ["1月", "2月", "3月", "4月", "5月", "6月", "7月", "8月", "9月", "10月", "11月", "12月"],
+    "hi": ["जनवरी", "फ़रवरी", "मार्च", "अप्रैल", "मई", "जून", "जुलाई", "अगस्त", "सितंबर", "अक्टूबर", "नवंबर", "दिसंबर"],
+    "fa": ["ژانویه", "فوریه", "مارس", "آوریل", "مه", "ژوئن", "ژوئیه", "اوت", "سپتامبر", "اکتبر", "نوامبر", "دسامبر"],
+    "id": ["Januari", "Februari", "Maret", "April", "Mei", "Juni", "Juli", "Agustus", "September", "Oktober", "November", "Desember"],
+    "sw": ["Januari", "Februari", "Machi", "Aprili", "Mei", "Juni", "Julai", "Agosti", "Septemba", "Oktoba", "Novemba", "Desemba"],
+    "ha": ["Janairu", "Faburairu", "Maris", "Afirilu", "Mayu", "Yuni", "Yuli", "Agusta", "Satumba", "Oktoba", "Nuwamba", "Disamba"],
+    "tr": ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"],
+    "el": ["Ιανουάριος", "Φεβρουάριος", "Μάρτιος", "Απρίλιος", "Μάιος", "Ιούνιος", "Ιούλιος", "Αύγουστος", "Σεπτέμβριος", "Οκτώβριος", "Νοέμβριος", "Δεκέμβριος"],
+    "pl": ["Styczeń", "Luty", "Marzec", "Kwiecień", "Maj", "Czerwiec", "Lipiec", "Sierpień", "Wrzesień", "Październik", "Listopad", "Grudzień"],
+    "it": ["Gennaio", "Febbraio", "Marzo", "Aprile", "Maggio", "Giugno", "Luglio", "Agosto", "Settembre", "Ottobre", "Novembre", "Dicembre"],
+    "nl": ["Januari", "Februari", "Maart", "April", "Mei", "Juni", "Juli", "Augustus", "September", "Oktober", "November", "December"],
+    "ro": ["Ianuarie", "Februarie", "Martie", "Aprilie", "Mai", "Iunie", "Iulie", "August", "Septembrie", "Octombrie", "Noiembrie", "Decembrie"],
+    "he": ["ינואר", "פברואר", "מרץ", "אפריל", "מאי", "יוני", "יולי", "אוגוסט", "ספטמבר", "אוקטובר", "נובמבר", "דצמבר"],
+    "bn": ["জানুয়ারি", "ফেব্রুয়ারি", "মার্চ", "এপ্রিল", "মে", "জুন", "জুলাই", "আগস্ট", "সেপ্টেম্বর", "অক্টোবর", "নভেম্বর", "ডিসেম্বর"],
+    "ku": ["Çile", "Sibat", "Adar", "Nîsan", "Gulan", "Hezîran", "Tîrmeh", "Tebax", "Îlon", "Çiriya Pêşîn", "Çiriya Paşîn", "Kanûn"],
+    "zu": ["Januwari", "Februwari", "Mashi", "Ephreli", "Meyi", "Juni", "Julayi", "Agasti", "Septhemba", "Okthoba", "Novemba", "Disemba"],
+    "vi": ["Tháng 1", "Tháng 2", "Tháng 3", "Tháng 4", "Tháng 5", "Tháng 6", "Tháng 7", "Tháng 8", "Tháng 9", "Tháng 10", "Tháng 11", "Tháng 12"],
+    "ko": ["1월", "2월", "3월", "4월", "5월", "6월", "7월", "8월", "9월", "10월", "11월", "12월"],
+    "ur": ["جنوری", "فروری", "مارچ", "اپریل", "مئی", "جون", "جولائی", "اگست", "ستمبر", "اکتوبر", "نومبر", "دسمبر"]
+}
+
+DAY_NAMES = {
+    "en": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+    "sr": ["Pon", "Uto", "Sre", "Čet", "Pet", "Sub", "Ned"],
+    "es": ["Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom"],
+    "zh": ["一", "二", "三", "四", "五", "六", "日"],
+    "ar": ["الإثنين", "الثلاثاء", "الأربعاء", "الخميس", "الجمعة", "السبت", "الأحد"],
+    "pt": ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"],
+    "fr": ["Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim"],
+    "de": ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"],
+    "ru": ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"],
+    "ja": ["月", "火", "水", "木", "金", "土", "日"],
+    "hi": ["सोम", "मंगल", "बुध", "गुरु", "शुक्र", "शनि", "रवि"],
+    "fa": ["دوشنبه", "سه‌شنبه", "چهارشنبه", "پنجشنبه", "جمعه", "شنبه", "یکشنبه"],
+    "id": ["Sen", "Sel", "Rab", "Kam", "Jum", "Sab", "Min"],
+    "sw": ["Jtn", "Jnn", "Jnm", "Alh", "Iju", "Jmo", "Jpi"],
+    "ha": ["Lit", "Tal", "Lar", "Alh", "Jum", "Asa", "Lah"],
+    "tr": ["Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz"],
+    "el": ["Δευ", "Τρί", "Τετ", "Πέμ", "Παρ", "Σάβ", "Κυρ"],
+    "pl": ["Pon", "Wt", "Śr", "Czw", "Pt", "Sob", "Nd"],
+    "it": ["Lun", "Mar", "Mer", "Gio", "Ven", "Sab", "Dom"],
+    "nl": ["Ma", "Di", "Wo", "Do", "Vr", "Za", "Zo"],
+    "ro": ["Lun", "Mar", "Mie", "Joi", "Vin", "Sâm", "Dum"],
+    "he": ["ב׳", "ג׳", "ד׳", "ה׳", "ו׳", "ש׳", "א׳"],
+    "bn": ["সোম", "মঙ্গল", "বুধ", "বৃহ", "শুক্র", "শনি", "রবি"],
+    "ku": ["Dş", "Sş", "Çş", "Pş", "În", "Şe", "Yek"],
+    "zu": ["Mso", "Lwe", "Lsi", "Lsi", "Lsi", "Mgo", "Son"],
+    "vi": ["T2", "T3", "T4", "T5", "T6", "T7", "CN"],
+    "ko": ["월", "화", "수", "목", "금", "토", "일"],
+    "ur": ["پیر", "منگل", "بدھ", "جمعرات", "جمعہ", "ہفتہ", "اتوار"]
+}
+
+# Rows of day cells in the pool; the longest months span six weeks
+CALENDAR_WEEKS = 6
+
+
+class _DayCell:
+    """One pooled calendar cell (frame with day and Dies labels), updated in place."""
+
+    def __init__(self, parent, row, column):
+        self.frame = Frame(parent, bg="#ffffff", relief="solid", borderwidth=1)
+        self.frame.grid(row=row, column=column, padx=1, pady=1, sticky="nsew")
+        self.day_label = Label(self.frame, text="", font=("Arial", 14, "bold"),
+                               bg="#ffffff", fg="#000000")
+        self.day_label.pack(expand=True)
+        self.dies_label = Label(self.frame, text="", font=("Arial", 12),
+                                bg="#ffffff", fg="#1565c0")
+        self.dies_label.pack(expand=True)
+        self._state = None
+        self._visible = True
+
+    def show(self, state):
+        """state: (day text, Dies text, background, day color, Dies color, relief)."""
+        if not self._visible:
+            self.frame.grid()
+            self._visible = True
+        if state == self._state:
+            return
+        day_text, dies_text, bg, day_fg, dies_fg, relief = state
+        self.frame.config(bg=bg, relief=relief)
+        self.day_label.config(text=day_text, bg=bg, fg=day_fg)
+        self.dies_label.config(text=dies_text, bg=bg, fg=dies_fg)
+        self._state = state
+
+    def hide(self):
+        if self._visible:
+            self.frame.grid_remove()
+            self._visible = False
+
+
 def milidies_to_hm(milidies):
     total_seconds = milidies * 86.4  # 1 milidies = 86.4 sekunde
     h = int(total_seconds // 3600)
@@ -20,6 +121,13 @@ def hm_to_milidies(h, m, s=0):
     milidies = int(round(seconds / 86.4))
     return milidies
 
+def date_reading(dt_utc):
+    """(dies, miliDies, mikroDies) at a UTC instant, in the astronomical year containing it"""
+    equinox = get_equinox(dt_utc.year)
+    if dt_utc < equinox:
+        equinox = get_equinox(dt_utc.year - 1)
+    return reading_at(datetime_to_ns(dt_utc), datetime_to_ns(equinox))
+
 class ComparisonCard(Toplevel):
     def __init__(self, master=None, lang="en"):
         super().__init__(master)
@@ -152,136 +260,81 @@ class ComparisonCard(Toplevel):
             self.current_cal_year += 1
         self._update_calendar()
     
-    def _update_calendar(self):
-        """Update calendar display with Dies for each day - read-only"""
-        # Clear existing calendar
-        for widget in self.calendar_grid.winfo_children():
-            widget.destroy()
-        
-        # Get theme colors
+    def _create_calendar_cells(self):
+        """Create the weekday headers and the fixed pool of day cells (once)."""
         text_color = self.theme.text_color
         frame_bg = self.theme.top_color
+        self._day_headers = []
+        for i in range(7):
+            header = Label(self.calendar_grid, text="", font=("Arial", 9, "bold"),
+                           bg=frame_bg, fg=text_color, width=7, height=1)
+            header.grid(row=0, column=i, padx=1, pady=1, sticky="nsew")
+            self._day_headers.append(header)
+        self._day_cells = [
+            [_DayCell(self.calendar_grid, week_num + 1, day_num) for day_num in range(7)]
+            for week_num in range(CALENDAR_WEEKS)
+        ]
+
+    def _update_calendar(self):
+        """Update calendar display with Dies for each day - read-only"""
+        year, month = self.current_cal_year, self.current_cal_month
         
         # Update month/year label
-        month_names = {
-            "en": ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"],
-            "sr": ["Januar", "Februar", "Mart", "April", "Maj", "Jun", "Jul", "Avgust", "Septembar", "Oktobar", "Novembar", "Decembar"],
-            "es": ["Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio", "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"],
-            "zh": ["一月", "二月", "三月", "四月", "五月", "六月", "七月", "八月", "九月", "十月", "十一月", "十二月"],
-            "ar": ["يناير", "فبراير", "مارس", "أبريل", "مايو", "يونيو", "يوليو", "أغسطس", "سبتمبر", "أكتوبر", "نوفمبر", "ديسمبر"],
-            "pt": ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"],
-            "fr": ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin", "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"],
-            "de": ["Januar", "Februar", "März", "April", "Mai", "Juni", "Juli", "August", "September", "Oktober", "November", "Dezember"],
-            "ru": ["Январь", "Февраль", "Март", "Апрель", "Май", "Июнь", "Июль", "Август", "Сентябрь", "Октябрь", "Ноябрь", "Декабрь"],
-            "ja": ["1月", "2月", "3月", "4月", "5月", "6月", "7月", "8月", "9月", "10月", "11月", "12月"],
-            "hi": ["जनवरी", "फ़रवरी", "मार्च", "अप्रैल", "मई", "जून", "जुलाई", "अगस्त", "सितंबर", "अक्टूबर", "नवंबर", "दिसंबर"],
-            "fa": ["ژانویه", "فوریه", "مارس", "آوریل", "مه", "ژوئن", "ژوئیه", "اوت", "سپتامبر", "اکتبر", "نوامبر", "دسامبر"],
-            "id": ["Januari", "Februari", "Maret", "April", "Mei", "Juni", "Juli", "Agustus", "September", "Oktober", "November", "Desember"],
-            "sw": ["Januari", "Februari", "Machi", "Aprili", "Mei", "Juni", "Julai", "Agosti", "Septemba", "Oktoba", "Novemba", "Desemba"],
-            "ha": ["Janairu", "Faburairu", "Maris", "Afirilu", "Mayu", "Yuni", "Yuli", "Agusta", "Satumba", "Oktoba", "Nuwamba", "Disamba"],
-            "tr": ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"],
-            "el": ["Ιανουάριος", "Φεβρουάριος", "Μάρτιος", "Απρίλιος", "Μάιος", "Ιούνιος", "Ιούλιος", "Αύγουστος", "Σεπτέμβριος", "Οκτώβριος", "Νοέμβριος", "Δεκέμβριος"],
-            "pl": ["Styczeń", "Luty", "Marzec", "Kwiecień", "Maj", "Czerwiec", "Lipiec", "Sierpień", "Wrzesień", "Październik", "Listopad", "Grudzień"],
-            "it": ["Gennaio", "Febbraio", "Marzo", "Aprile", "Maggio", "Giugno", "Luglio", "Agosto", "Settembre", "Ottobre", "Novembre", "Dicembre"],
-            "nl": ["Januari", "Februari", "Maart", "April", "Mei", "Juni", "Juli", "Augustus", "September", "Oktober", "November", "December"],
-            "ro": ["Ianuarie", "Februarie", "Martie", "Aprilie", "Mai", "Iunie", "Iulie", "August", "Septembrie", "Octombrie", "Noiembrie", "Decembrie"],
-            "he": ["ינואר", "פברואר", "מרץ", "אפריל", "מאי", "יוני", "יולי", "אוגוסט", "ספטמבר", "אוקטובר", "נובמבר", "דצמבר"],
-            "bn": ["জানুয়ারি", "ফেব্রুয়ারি", "মার্চ", "এপ্রিল", "মে", "জুন", "জুলাই", "আগস্ট", "সেপ্টেম্বর", "অক্টোবর", "নভেম্বর", "ডিসেম্বর"],
-            "ku": ["Çile", "Sibat", "Adar", "Nîsan", "Gulan", "Hezîran", "Tîrmeh", "Tebax", "Îlon", "Çiriya Pêşîn", "Çiriya Paşîn", "Kanûn"],
-            "zu": ["Januwari", "Februwari", "Mashi", "Ephreli", "Meyi", "Juni", "Julayi", "Agasti", "Septhemba", "Okthoba", "Novemba", "Disemba"],
-            "vi": ["Tháng 1", "Tháng 2", "Tháng 3", "Tháng 4", "Tháng 5", "Tháng 6", "Tháng 7", "Tháng 8", "Tháng 9", "Tháng 10", "Tháng 11", "Tháng 12"],
-            "ko": ["1월", "2월", "3월", "4월", "5월", "6월", "7월", "8월", "9월", "10월", "11월", "12월"],
-            "ur": ["جنوری", "فروری", "مارچ", "اپریل", "مئی", "جون", "جولائی", "اگست", "ستمبر", "اکتوبر", "نومبر", "دسمبر"]
-        }
-        lang_months = month_names.get(self.lang, month_names["en"])
+        lang_months = MONTH_NAMES.get(self.lang, MONTH_NAMES["en"])
         self.month_year_label.config(text=f"{lang_months[self.current_cal_month-1]} {self.current_cal_year}")
         
         # Day headers
-        day_names = {
-            "en": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
-            "sr": ["Pon", "Uto", "Sre", "Čet", "Pet", "Sub", "Ned"],
-            "es": ["Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom"],
-            "zh": ["一", "二", "三", "四", "五", "六", "日"],
-            "ar": ["الإثنين", "الثلاثاء", "الأربعاء", "الخميس", "الجمعة", "السبت", "الأحد"],
-            "pt": ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"],
-            "fr": ["Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim"],
-            "de": ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"],
-            "ru": ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"],
-            "ja": ["月", "火", "水", "木", "金", "土", "日"],
-            "hi": ["सोम", "मंगल", "बुध", "गुरु", "शुक्र", "शनि", "रवि"],
-            "fa": ["دوشنبه", "سه‌شنبه", "چهارشنبه", "پنجشنبه", "جمعه", "شنبه", "یکشنبه"],
-            "id": ["Sen", "Sel", "Rab", "Kam", "Jum", "Sab", "Min"],
-            "sw": ["Jtn", "Jnn", "Jnm", "Alh", "Iju", "Jmo", "Jpi"],
-            "ha": ["Lit", "Tal", "Lar", "Alh", "Jum", "Asa", "Lah"],
-            "tr": ["Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz"],
-            "el": ["Δευ", "Τρί", "Τετ", "Πέμ", "Παρ", "Σάβ", "Κυρ"],
-            "pl": ["Pon", "Wt", "Śr", "Czw", "Pt", "Sob", "Nd"],
-            "it": ["Lun", "Mar", "Mer", "Gio", "Ven", "Sab", "Dom"],
-            "nl": ["Ma", "Di", "Wo", "Do", "Vr", "Za", "Zo"],
-            "ro": ["Lun", "Mar", "Mie", "Joi", "Vin", "Sâm", "Dum"],
-            "he": ["ב׳", "ג׳", "ד׳", "ה׳", "ו׳", "ש׳", "א׳"],
-            "bn": ["সোম", "মঙ্গল", "বুধ", "বৃহ", "শুক্র", "শনি", "রবি"],
-            "ku": ["Dş", "Sş", "Çş", "Pş", "În", "Şe", "Yek"],
-            "zu": ["Mso", "Lwe", "Lsi", "Lsi", "Lsi", "Mgo", "Son"],
-            "vi": ["T2", "T3", "T4", "T5", "T6", "T7", "CN"],
-            "ko": ["월", "화", "수", "목", "금", "토", "일"],
-            "ur": ["پیر", "منگل", "بدھ", "جمعرات", "جمعہ", "ہفتہ", "اتوار"]
-        }
-        lang_days = day_names.get(self.lang, day_names["en"])
-        
-        for i, day_name in enumerate(lang_days):
-            Label(self.calendar_grid, text=day_name, font=("Arial", 9, "bold"), 
-                  bg=frame_bg, fg=text_color, width=7, height=1).grid(row=0, column=i, padx=1, pady=1, sticky="nsew")
+        lang_days = DAY_NAMES.get(self.lang, DAY_NAMES["en"])
+        for header, day_name in zip(self._day_headers, lang_days):
+            if header.cget("text") != day_name:
+                header.config(text=day_name)
+        
+        worker = get_worker()
+        if worker is None:
+            self._show_month(month_model(year, month))
+            return
+        # Month models (equinox lookups) are computed on the worker thread;
+        # neighbouring months are prefetched so the next flip is a cache hit
+        worker.submit(month_model, year, month, callback=self._show_month, key="calendar-month")
+        for offset in (-1, 1):
+            index = year * 12 + month - 1 + offset
+            worker.submit(month_model, index // 12, index % 12 + 1, key=f"calendar-prefetch{offset}")
+    
+    def _show_month(self, model):
+        """Fill the day cells from a MonthModel (ignored if the card moved on)."""
+        if (model.year, model.month) != (self.current_cal_year, self.current_cal_month):
+            return
         
-        # Get calendar for month
-        cal = cal_module.monthcalendar(self.current_cal_year, self.current_cal_month)
+        # Get theme colors
+        text_color = self.theme.text_color
+        frame_bg = self.theme.top_color
         
-        # Create labels for each day (read-only, no interaction)
-        for week_num, week in enumerate(cal):
-            for day_num, day in enumerate(week):
+        today = datetime.now()
+        is_current_month = (self.current_cal_month == today.month
+                            and self.current_cal_year == today.year)
+        
+        # Fill the pooled cells in place; weeks the month does not have are hidden
+        for week_num, row in enumerate(self._day_cells):
+            week = model.weeks[week_num] if week_num < len(model.weeks) else None
+            for day_num, cell in enumerate(row):
+                if week is None:
+                    cell.hide()
+                    continue
+                day = week[day_num]
                 if day == 0:
                     # Empty cell
-                    Label(self.calendar_grid, text="", bg=frame_bg, width=7, height=3).grid(
-                        row=week_num+1, column=day_num, padx=1, pady=1, sticky="nsew")
+                    cell.show(("", "", frame_bg, text_color, text_color, "flat"))
+                    continue
+                dies = model.dies_for(day)
+                if dies is None:
+                    # Dies unavailable (equinox could not be computed)
+                    cell.show((f"{day}", "---", "#ffcccc", text_color, text_color, "solid"))
+                elif is_current_month and day == today.day:
+                    # Highlight today with theme color
+                    cell.show((f"{day}", f"{dies:03d}", self.theme.top_color, "#ffffff", "#ffffff", "solid"))
                 else:
-                    # Calculate Dies for this day (at noon)
-                    try:
-                        day_dt = datetime(self.current_cal_year, self.current_cal_month, day, 12, 0, tzinfo=timezone.utc)
-                        
-                        # Get correct equinox for THIS SPECIFIC DAY
-                        equinox = compute_vernal_equinox(self.current_cal_year)
-                        if day_dt < equinox:
-                            equinox = compute_vernal_equinox(self.current_cal_year - 1)
-                        
-                        astro_year = AstroYear(equinox)
-                        reading = astro_year.reading(day_dt)
-                        dies = reading.dies
-                        
-                        # Create label with day and Dies - use lighter shade of theme
-                        day_frame = Frame(self.calendar_grid, bg="#ffffff", relief="solid", borderwidth=1)
-                        day_frame.grid(row=week_num+1, column=day_num, padx=1, pady=1, sticky="nsew")
-                        
-                        # Standard calendar day - black, larger
-                        Label(day_frame, text=f"{day}", font=("Arial", 14, "bold"), 
-                              bg="#ffffff", fg="#000000").pack(expand=True)
-                        
-                        # Dies number - blue, larger  
-                        Label(day_frame, text=f"{dies:03d}", font=("Arial", 12), 
-                              bg="#ffffff", fg="#1565c0").pack(expand=True)
-                        
-                        # Highlight today with theme color
-                        today = datetime.now()
-                        if (day == today.day and self.current_cal_month == today.month 
-                            and self.current_cal_year == today.year):
-                            day_frame.config(bg=self.theme.top_color)
-                            for child in day_frame.winfo_children():
-                                child.config(bg=self.theme.top_color, fg="#ffffff")
-                            
-                    except Exception as e:
-                        # Fallback for errors
-                        Label(self.calendar_grid, text=f"{day}\n---", font=("Arial", 10),
-                              bg="#ffcccc", fg=text_color, width=7, height=3).grid(row=week_num+1, column=day_num, 
-                                                                     padx=1, pady=1, sticky="nsew")
+                    # Standard calendar day black, Dies number blue
+                    cell.show((f"{day}", f"{dies:03d}", "#ffffff", "#000000", "#1565c0", "solid"))
     
     def _select_date(self, day, dies):
         """Handle date selection from calendar"""
@@ -297,16 +350,21 @@ class ComparisonCard(Toplevel):
         dt_local = self.selected_date.replace(tzinfo=self.local_tz)
         dt_utc = dt_local.astimezone(timezone.utc)
         
-        # Get correct equinox for THIS SPECIFIC DATE
-        equinox = compute_vernal_equinox(self.current_cal_year)
-        if dt_utc < equinox:
-            equinox = compute_vernal_equinox(self.current_cal_year - 1)
-        
-        astro_year = AstroYear(equinox)
-        reading = astro_year.reading(dt_utc)
-        
+        # Equinox lookups run on the worker; the Tk thread only shows the result
+        worker = get_worker()
+        if worker is None:
+            self._show_date_reading(dt_utc, date_reading(dt_utc))
+            return
+        worker.submit(date_reading, dt_utc, key="calendar-select",
+                      callback=lambda reading: self._show_date_reading(dt_utc, reading))
+    
+    def _show_date_reading(self, dt_utc, reading):
+        """Show the reading of a selected date (ignored if another date was picked)"""
+        if self.selected_date.replace(tzinfo=self.local_tz).astimezone(timezone.utc) != dt_utc:
+            return
+        dies, miliDies, _ = reading
         self.std_result.config(
-            text=tr("astro_result", self.lang, day=reading.dies, milidies=reading.miliDies)
+            text=tr("astro_result", self.lang, day=dies, milidies=miliDies)
         )
 
     def _make_widgets(self):
@@ -417,6 +475,7 @@ class ComparisonCard(Toplevel):
         self.calendar_grid.pack(pady=(0, 3), padx=4)
         
         # Initialize calendar
+        self._create_calendar_cells()
         self._update_calendar()
 
         # MiliDies Time Table - 2 rows x 5 columns grid layout
@@ -0,0 +1,216 @@
+"""
+Background compute worker for the Tk UI.
+
+Tk runs everything on one thread, so any slow step there freezes dragging
+and input. Equinox lookups for the tick frame, the equinox cache warmer and
+calendar months are therefore submitted to one worker thread, which owns
+that work and the caches behind it. Blocking network I/O (the NTP sync) gets
+its own thread instead, so short computations never queue behind a timeout.
+
+Results come back through a thread-safe queue that the Tk thread drains
+itself: the drain is armed with after_idle when work is submitted and
+re-armed every POLL_INTERVAL_MS while results are outstanding, so callbacks
+always run on the Tk thread and the UI never waits on a computation.
+
+A request submitted with a key replaces a pending request with the same key
+that has not started yet, so flipping quickly through calendar months only
+computes the month that ends up on screen.
+
+submit() and deliver() are called from the Tk thread.
+"""
+from __future__ import annotations
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import tkinter as tk
+
+POLL_INTERVAL_MS = 15
+
+ResultCallback = Callable[[Any], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+class _Request:
+    __slots__ = ("fn", "args", "callback", "error_callback", "key", "cancelled")
+
+    def __init__(self, fn, args, callback, error_callback, key):
+        self.fn = fn
+        self.args = args
+        self.callback = callback
+        self.error_callback = error_callback
+        self.key = key
+        self.cancelled = False
+
+    @property
+    def wants_result(self) -> bool:
+        return self.callback is not None or self.error_callback is not None
+
+
+class ComputeWorker:
+    """
+    One background thread running submitted functions in order.
+
+    Args:
+        master: Tk widget whose event loop receives the results (can be
+            attached later; work submitted before that still runs)
+        name: Thread name
+    """
+
+    def __init__(self, master: Optional[tk.Misc] = None, name: str = "awatch-compute"):
+        self.master: Optional[tk.Misc] = None
+        self._requests: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._results: "queue.Queue[tuple]" = queue.Queue()
+        self._pending_keys: Dict[str, _Request] = {}
+        self._lock = threading.Lock()
+        self._outstanding = 0  # submitted requests whose callback has not run yet
+        self._poll_job = None
+        self._thread = threading.Thread(target=self._serve, name=name, daemon=True)
+        self._thread.start()
+        if master is not None:
+            self.attach(master)
+
+    # ---------------------- Tk side ---------------------- #
+
+    def attach(self, master: tk.Misc) -> None:
+        """Deliver results through master's Tk root."""
+        self.master = master.nametowidget(".")
+        if self._outstanding:
+            self._arm(idle=True)
+
+    def submit(self, fn: Callable, *args, callback: Optional[ResultCallback] = None,
+               error_callback: Optional[ErrorCallback] = None, key: Optional[str] = None) -> None:
+        """
+        Run fn(*args) on the worker thread.
+
+        callback(result) or error_callback(exception) then run on the Tk
+        thread; without either, errors are only printed.
+        """
+        request = _Request(fn, args, callback, error_callback, key)
+        if key is not None:
+            with self._lock:
+                previous = self._pending_keys.get(key)
+                if previous is not None:
+                    previous.cancelled = True
+                    if previous.wants_result:
+                        self._outstanding -= 1
+                self._pending_keys[key] = request
+        if request.wants_result:
+            self._outstanding += 1
+            self._arm(idle=True)
+        self._requests.put(request)
+
+    def deliver(self) -> int:
+        """Run the callbacks of finished requests; returns how many were delivered."""
+        delivered = 0
+        while True:
+            try:
+                request, result, error = self._results.get_nowait()
+            except queue.Empty:
+                return delivered
+            self._outstanding -= 1
+            delivered += 1
+            try:
+                if error is None:
+                    if request.callback is not None:
+                        request.callback(result)
+                elif request.error_callback is not None:
+                    request.error_callback(error)
+                else:
+                    print(f"⚠️ Background task failed: {error}")
+            except tk.TclError:
+                pass  # window destroyed while the work was running
+            except Exception as e:
+                print(f"⚠️ Background result handler error: {e}")
+
+    @property
+    def outstanding(self) -> int:
+        return self._outstanding
+
+    def _arm(self, idle: bool = False) -> None:
+        if self._poll_job is not None or self.master is None:
+            return
+        try:
+            if idle:
+                self._poll_job = self.master.after_idle(self._poll)
+            else:
+                self._poll_job = self.master.after(POLL_INTERVAL_MS, self._poll)
+        except tk.TclError:
+            self._poll_job = None  # root destroyed
+
+    def _poll(self) -> None:
+        self._poll_job = None
+        self.deliver()
+        if self._outstanding:
+            self._arm()
+
+    # ---------------------- Worker side ---------------------- #
+
+    def _serve(self) -> None:
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            if request.key is not None:
+                with self._lock:
+                    if request.cancelled:
+                        continue
+                    if self._pending_keys.get(request.key) is request:
+                        del self._pending_keys[request.key]
+            try:
+                result, error = request.fn(*request.args), None
+            except Exception as e:
+                result, error = None, e
+            if request.wants_result:
+                self._results.put((request, result, error))
+            elif error is not None:
+                print(f"⚠️ Background task failed: {error}")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Finish the current task, drop the rest and end the thread."""
+        if self._poll_job is not None:
+            try:
+                self.master.after_cancel(self._poll_job)
+            except tk.TclError:
+                pass
+            self._poll_job = None
+        self._requests.put(None)
+        self._thread.join(timeout)
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+
+_worker: Optional[ComputeWorker] = None
+
+
+def start_worker(master: Optional[tk.Misc] = None) -> ComputeWorker:
+    """Start the shared worker (idempotent); attaches master if given."""
+    global _worker
+    if _worker is None or not _worker.alive:
+        _worker = ComputeWorker()
+    if master is not None:
+        _worker.attach(master)
+    return _worker
+
+
+def get_worker() -> Optional[ComputeWorker]:
+    """The shared worker, or None (callers then compute on their own thread)."""
+    return _worker
+
+
+def stop_worker() -> None:
+    global _worker
+    if _worker is not None:
+        _worker.stop()
+        _worker = None
+
+
+__all__ = [
+    'POLL_INTERVAL_MS',
+    'ComputeWorker',
+    'start_worker',
+    'get_worker',
+    'stop_worker',
+]
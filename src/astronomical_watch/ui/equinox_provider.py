@@ -0,0 +1,91 @@
+"""
+Shared equinox lookup for all UI windows.
+Backed by the background cache warmer from the equinox service, so the first
+UI tick reads a warmed value instead of running a solve on the Tk main thread.
+"""
+from __future__ import annotations
+import os
+import sys
+from datetime import datetime
+from typing import Dict
+
+from ..core.equinox import compute_vernal_equinox
+
+# Years either side of the current year warmed at startup
+WARM_RADIUS = 1
+
+# How long the UI waits for warming before its first draw (seconds)
+WARM_WAIT_TIMEOUT = 3.0
+
+_warmer = None
+_fallback_equinoxes: Dict[int, datetime] = {}
+
+
+def start_equinox_warmer(radius: int = WARM_RADIUS):
+    """
+    Start the service cache warmer for the current year ± radius.
+
+    Returns:
+        CacheWarmer instance, or None if the service layer is unavailable
+    """
+    global _warmer
+    if _warmer is not None:
+        return _warmer
+    try:
+        # Service modules use package-relative top-level imports (services.*, solar.*)
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        if package_dir not in sys.path:
+            sys.path.insert(0, package_dir)
+        from services.equinox_service import start_cache_warmer, subscribe_equinox_updates
+        _warmer = start_cache_warmer(radius=radius)
+        subscribe_equinox_updates(_on_equinox_refined)
+    except Exception as e:
+        print(f"⚠️  Equinox cache warmer not available: {e}")
+        _warmer = None
+    return _warmer
+
+
+def _on_equinox_refined(year: int, result: dict) -> None:
+    """Called from the refinement thread when a more precise value lands."""
+    # Warmer reads pick up the refined value; drop any core-model fallback
+    _fallback_equinoxes.pop(year, None)
+    print(f"🔭 Equinox {year} refined: {result['utc']} "
+          f"({result['precision']}, ±{result['uncertainty_s']:.0f}s)")
+
+
+def wait_until_warm(timeout: float = WARM_WAIT_TIMEOUT) -> bool:
+    """Block until the warmer finished (or timeout). True if fully warmed."""
+    if _warmer is None:
+        return False
+    return _warmer.wait_until_ready(timeout)
+
+
+def get_equinox(year: int) -> datetime:
+    """
+    Vernal equinox for a year as used by the UI.
+
+    Prefers the warmed service value; otherwise computes once with the core
+    model and memoizes it so later ticks do not repeat the solve.
+    """
+    if _warmer is not None:
+        warmed = _warmer.get_equinox(year)
+        if warmed is not None:
+            return warmed
+    cached = _fallback_equinoxes.get(year)
+    if cached is None:
+        cached = compute_vernal_equinox(year)
+        _fallback_equinoxes[year] = cached
+    return cached
+
+
+def get_warmer():
+    """Get the running cache warmer, or None."""
+    return _warmer
+
+
+__all__ = [
+    'start_equinox_warmer',
+    'wait_until_warm',
+    'get_equinox',
+    'get_warmer',
+]
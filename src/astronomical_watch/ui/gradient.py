@@ -3,10 +3,17 @@ Shared gradient helper for sky-based themes.
 Computes dynamic sky gradients based on astronomical data (solar position, time, etc.)
 """
 from __future__ import annotations
-import math
-from datetime import datetime, timezone
-from typing import Tuple
-from ..core.solar import solar_longitude_from_datetime
+import json
+import os
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+from .solar_position import solar_altitude
+
+LOCATION_ENV = "ASTRON_LOCATION"  # "latitude,longitude" in degrees (east positive)
+DEFAULT_LATITUDE = 45.0
+
+_default_location: Optional[Tuple[float, float]] = None
 
 
 class SkyTheme:
@@ -19,46 +26,70 @@ class SkyTheme:
         self.text_hex = text_color  # Alias for consistency with problem statement
 
 
-def get_solar_altitude_approximation(dt: datetime) -> float:
-    """
-    Approximate solar altitude for theme computation.
-    This is a simplified calculation for UI purposes.
-    Returns altitude in degrees (negative = below horizon).
+def default_location() -> Tuple[float, float]:
     """
-    # Get solar longitude (position in orbit)
-    solar_lon = solar_longitude_from_datetime(dt)
-    
-    # Convert solar longitude to seasonal factor for declination
-    # Solar longitude 0 = vernal equinox, π/2 = summer solstice, π = autumnal equinox, 3π/2 = winter solstice
-    # Declination varies from +23.5° (summer) to -23.5° (winter)
-    declination = 23.5 * math.sin(solar_lon + math.pi/2)  # Peak at summer solstice
-    
-    # Get hour of day (0-24)
-    hour = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
-    
-    # Hour angle: 0 at solar noon, ±π at midnight
-    hour_angle = (hour - 12) * 15 * math.pi / 180  # Convert hours to radians
+    Observer (latitude, longitude) in degrees for the desktop themes.
     
-    # Simplified altitude calculation (assume latitude = 45°N for demo)
-    latitude = 45.0 * math.pi / 180  # 45°N in radians
-    declination_rad = declination * math.pi / 180
-    
-    # Solar altitude formula: sin(altitude) = sin(lat) * sin(dec) + cos(lat) * cos(dec) * cos(hour_angle)
-    sin_altitude = (math.sin(latitude) * math.sin(declination_rad) + 
-                   math.cos(latitude) * math.cos(declination_rad) * math.cos(hour_angle))
-    
-    # Clamp to avoid domain errors
-    sin_altitude = max(-1.0, min(1.0, sin_altitude))
-    altitude_rad = math.asin(sin_altitude)
-    altitude_degrees = altitude_rad * 180 / math.pi
+    Taken from ASTRON_LOCATION, else from "location" in the config file
+    ({"latitude": ..., "longitude": ...}), else 45°N at the longitude whose
+    mean solar noon matches the local time zone's standard UTC offset.
+    """
+    global _default_location
+    if _default_location is None:
+        _default_location = _load_location()
+    return _default_location
+
+
+def set_default_location(latitude: float, longitude: float) -> None:
+    global _default_location
+    _default_location = (float(latitude), float(longitude))
+
+
+def _load_location() -> Tuple[float, float]:
+    value = os.environ.get(LOCATION_ENV)
+    if value:
+        try:
+            latitude, longitude = (float(part) for part in value.split(","))
+            return latitude, longitude
+        except ValueError:
+            print(f"⚠️ Ignoring {LOCATION_ENV}={value!r} (expected 'latitude,longitude')")
+    config_path = os.path.expanduser("~/.astronomical_watch_config.json")
+    try:
+        with open(config_path, 'r') as f:
+            location = json.load(f).get("location") or {}
+        return float(location["latitude"]), float(location["longitude"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    # Standard (non-DST) offset: the zone's meridian, stable across the year
+    return DEFAULT_LATITUDE, -time.timezone / 3600.0 * 15.0
+
+
+def get_solar_altitude_approximation(dt: datetime, latitude: Optional[float] = None,
+                                     longitude: Optional[float] = None) -> float:
+    """
+    Solar altitude for theme computation, in degrees (negative = below horizon).
     
-    return altitude_degrees
+    Naive datetimes are local time. The observer defaults to default_location().
+    Declination and equation of time come from the solar ephemeris, the hour
+    angle from apparent solar time at the observer's longitude.
+    """
+    if latitude is None or longitude is None:
+        default_latitude, default_longitude = default_location()
+        latitude = default_latitude if latitude is None else latitude
+        longitude = default_longitude if longitude is None else longitude
+    return solar_altitude(dt, latitude, longitude)
 
 
-def get_sky_theme(dt: datetime = None) -> SkyTheme:
+# Solar altitudes (degrees) at which the sky theme switches colors
+ALTITUDE_THRESHOLDS = (50.0, 20.0, 0.0, -10.0)
+
+
+def get_sky_theme(dt: datetime = None, latitude: Optional[float] = None,
+                  longitude: Optional[float] = None) -> SkyTheme:
     """
     Get current sky theme based on astronomical data.
-    Uses local system time to calculate sun position.
+    Uses local system time (default: now) and the observer location
+    (default: default_location()) to calculate sun position.
     Returns a SkyTheme with appropriate gradient and text colors.
     """
     if dt is None:
@@ -68,8 +99,11 @@ def get_sky_theme(dt: datetime = None) -> SkyTheme:
         # If dt has timezone info, convert to local time
         dt = dt.astimezone()
     
-    altitude = get_solar_altitude_approximation(dt)
-    
+    return theme_for_altitude(get_solar_altitude_approximation(dt, latitude, longitude))
+
+
+def theme_for_altitude(altitude: float) -> SkyTheme:
+    """Sky theme for a solar altitude in degrees (changes only at ALTITUDE_THRESHOLDS)."""
     # Define theme colors based on solar altitude
     if altitude > 50:  # High sun - bright blue sky
         return SkyTheme(
@@ -0,0 +1,131 @@
+"""
+Sky themes for arbitrary observer locations, memoized and in batches.
+
+theme_at() quantizes the location to LOCATION_STEP_DEG and the instant to
+TIME_STEP_S and memoizes the altitude band per (latitude, longitude, time)
+cell, so a server answering many clients at nearby places solves the solar
+ephemeris once per minute and the altitude once per cell. The quantization
+moves the sun by well under a degree, far less than the gaps between
+gradient.ALTITUDE_THRESHOLDS.
+
+themes_for_grid() evaluates the ephemeris once for the instant and uses the
+separable form of the altitude formula
+
+    sin h = sin φ sin δ + cos φ cos δ cos H(λ)
+
+so an N × M grid costs N + M trigonometric evaluations plus N·M
+multiply-adds compared against the precomputed sin(threshold) values.
+
+Naive datetimes are local time, as everywhere in the UI; callers serving
+other time zones should pass aware datetimes.
+"""
+from __future__ import annotations
+import math
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+from .gradient import ALTITUDE_THRESHOLDS, SkyTheme, theme_for_altitude
+from .solar_position import DEG, SolarPosition, solar_position
+
+LOCATION_STEP_DEG = 0.25
+TIME_STEP_S = 60
+
+# One representative altitude per band (number of thresholds exceeded)
+_BAND_ALTITUDES = (-90.0, -5.0, 10.0, 35.0, 90.0)
+BAND_THEMES = tuple(theme_for_altitude(altitude) for altitude in _BAND_ALTITUDES)
+_SIN_THRESHOLDS = tuple(math.sin(threshold * DEG) for threshold in ALTITUDE_THRESHOLDS)
+
+
+def _check_location(latitude: float, longitude: float) -> None:
+    if not -90.0 <= latitude <= 90.0:
+        raise ValueError(f"latitude must be within [-90, 90], got {latitude}")
+    if not -180.0 <= longitude <= 180.0:
+        raise ValueError(f"longitude must be within [-180, 180], got {longitude}")
+
+
+def _time_index(dt: Optional[datetime]) -> int:
+    if dt is None:
+        dt = datetime.now(timezone.utc)
+    return round(dt.timestamp() / TIME_STEP_S)
+
+
+def _band(sin_altitude: float) -> int:
+    return sum(1 for threshold in _SIN_THRESHOLDS if sin_altitude > threshold)
+
+
+@lru_cache(maxsize=256)
+def _position(time_index: int) -> SolarPosition:
+    return solar_position(datetime.fromtimestamp(time_index * TIME_STEP_S, tz=timezone.utc))
+
+
+@lru_cache(maxsize=65536)
+def _cell_band(lat_index: int, lon_index: int, time_index: int) -> int:
+    position = _position(time_index)
+    phi = lat_index * LOCATION_STEP_DEG * DEG
+    hour_angle = position.hour_angle(lon_index * LOCATION_STEP_DEG)
+    return _band(math.sin(phi) * math.sin(position.declination)
+                 + math.cos(phi) * math.cos(position.declination) * math.cos(hour_angle))
+
+
+def band_at(latitude: float, longitude: float, dt: Optional[datetime] = None) -> int:
+    """Altitude band (0 = night ... 4 = high sun) at the quantized location and time."""
+    _check_location(latitude, longitude)
+    return _cell_band(round(latitude / LOCATION_STEP_DEG), round(longitude / LOCATION_STEP_DEG),
+                      _time_index(dt))
+
+
+def theme_at(latitude: float, longitude: float, dt: Optional[datetime] = None) -> SkyTheme:
+    """Sky theme at (latitude, longitude) degrees at dt (default: now)."""
+    return BAND_THEMES[band_at(latitude, longitude, dt)]
+
+
+def themes_for_grid(latitudes: Sequence[float], longitudes: Sequence[float],
+                    dt: Optional[datetime] = None) -> List[List[int]]:
+    """
+    Altitude bands for every (latitude, longitude) pair of the grid.
+
+    Returns one row per latitude with one band per longitude; BAND_THEMES
+    maps a band to its SkyTheme. Locations are used as given, the time is
+    quantized like theme_at().
+    """
+    for latitude in latitudes:
+        _check_location(latitude, 0.0)
+    for longitude in longitudes:
+        _check_location(0.0, longitude)
+    position = _position(_time_index(dt))
+    sin_dec, cos_dec = math.sin(position.declination), math.cos(position.declination)
+    cos_hour_angles = [math.cos(position.hour_angle(longitude)) for longitude in longitudes]
+    low, high = _SIN_THRESHOLDS[-1], _SIN_THRESHOLDS[0]
+    grid = []
+    for latitude in latitudes:
+        phi = latitude * DEG
+        a, b = math.sin(phi) * sin_dec, math.cos(phi) * cos_dec
+        if a + b <= low or a - b > high:
+            # The sun stays in one band all day at this latitude
+            grid.append([_band(a)] * len(longitudes))
+            continue
+        grid.append([_band(a + b * cos_h) for cos_h in cos_hour_angles])
+    return grid
+
+
+def cache_info() -> Dict[str, object]:
+    """Hit/miss statistics of the ephemeris and band caches."""
+    return {"positions": _position.cache_info(), "bands": _cell_band.cache_info()}
+
+
+def cache_clear() -> None:
+    _position.cache_clear()
+    _cell_band.cache_clear()
+
+
+__all__ = [
+    "LOCATION_STEP_DEG",
+    "TIME_STEP_S",
+    "BAND_THEMES",
+    "band_at",
+    "theme_at",
+    "themes_for_grid",
+    "cache_info",
+    "cache_clear",
+]
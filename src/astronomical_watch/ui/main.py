@@ -3,31 +3,55 @@ Main application demonstrating Widget and Normal Mode integration.
 Shows full click activation and consistent gradient backgrounds.
 """
 from __future__ import annotations
+import argparse
 import tkinter as tk
 import os
+import threading
+from typing import List, Optional
 from .widget import create_widget
 from .normal_mode import create_normal_mode
-from .theme_manager import update_shared_theme
+from .theme_manager import update_shared_theme, use_fixed_theme
+from .equinox_provider import start_equinox_warmer, wait_until_warm
+from .tick_scheduler import TickScheduler
+from .compute_worker import start_worker, stop_worker
 
 
 class AstronomicalWatchApp:
     """Main application managing Widget and Normal Mode windows."""
     
-    def __init__(self, enable_ntp_sync: bool = True):
-        # Initialize shared theme immediately
-        update_shared_theme()
+    def __init__(self, enable_ntp_sync: bool = True, beacon_client=None):
+        # Thin client: the time beacon supplies readings, so skip equinox and NTP work
+        self.beacon_client = beacon_client
         
-        # Start NTP time synchronization (optional, runs in background)
-        if enable_ntp_sync:
-            self._start_time_sync()
+        # Astronomy, caches and network work run here, never on the Tk thread
+        self.worker = start_worker()
+        
+        # Warm equinox cache for neighbouring years in the background
+        if beacon_client is None:
+            self.worker.submit(start_equinox_warmer)
+        
+        # Initialize shared theme immediately; thin clients do no astronomy
+        # locally, so they keep a fixed theme instead of solving the sky
+        if beacon_client is None:
+            update_shared_theme()
+        else:
+            use_fixed_theme()
+        
+        # NTP time synchronization (optional) blocks on the network, so the
+        # one-shot initial sync gets its own thread rather than the worker
+        if enable_ntp_sync and beacon_client is None:
+            threading.Thread(target=self._start_time_sync, name="awatch-ntp-init",
+                             daemon=True).start()
         
         self.widget_root = None
         self.normal_root = None
         self.widget = None
         self.normal_mode = None
+        self.scheduler = None  # one mikroDies tick loop shared by all windows
         self.current_language = "en"
     
-    def _start_time_sync(self):
+    @staticmethod
+    def _start_time_sync():
         """Initialize NTP time synchronization."""
         try:
             from astronomical_watch.net.time_sync import update_time_sync, start_periodic_sync
@@ -35,12 +59,13 @@ class AstronomicalWatchApp:
             # Do initial sync
             print("🕐 Initializing NTP time synchronization...")
             if update_time_sync(force=True):
-                # Start periodic sync every 60 minutes
-                start_periodic_sync(interval_minutes=60)
+                # Start periodic sync every 60 minutes; slew corrections so the
+                # displayed time never jumps backwards
+                start_periodic_sync(interval_minutes=60, discipline=True)
             else:
                 print("⚠️  Initial NTP sync failed, will retry automatically")
                 # Still start periodic sync - it will retry
-                start_periodic_sync(interval_minutes=60)
+                start_periodic_sync(interval_minutes=60, discipline=True)
         except ImportError:
             print("⚠️  NTP sync module not available")
         except Exception as e:
@@ -78,8 +103,14 @@ class AstronomicalWatchApp:
             # Set icon
             self._set_icon(self.widget_root)
             
+            self.worker.attach(self.widget_root)
+            self.scheduler = TickScheduler(self.widget_root, beacon_client=self.beacon_client,
+                                           worker=self.worker)
+            
             # Create widget with click handler to open normal mode
-            self.widget = create_widget(self.widget_root, self.open_normal_mode)
+            self.widget = create_widget(self.widget_root, self.open_normal_mode,
+                                        beacon_client=self.beacon_client,
+                                        scheduler=self.scheduler)
             self.widget.start_updates()
             
             print("✅ Widget started")
@@ -103,7 +134,8 @@ class AstronomicalWatchApp:
                 self.normal_root, 
                 on_back=self.close_normal_mode,
                 on_language=self.on_language_change,
-                widget_ref=self.widget  # Pass widget reference
+                widget_ref=self.widget,  # Pass widget reference
+                scheduler=self.scheduler
             )
             self.normal_mode.start_updates()
             
@@ -127,6 +159,8 @@ class AstronomicalWatchApp:
     def close_normal_mode(self):
         """Close normal mode and return to widget."""
         if self.normal_root:
+            if self.normal_mode:
+                self.normal_mode.stop_updates()
             self.normal_root.destroy()
             self.normal_root = None
             self.normal_mode = None
@@ -143,6 +177,9 @@ class AstronomicalWatchApp:
         """Handle widget window close."""
         if self.widget:
             self.widget.stop_updates()
+        
+        if self.beacon_client is not None:
+            self.beacon_client.stop()
             
         if self.normal_root:
             self.normal_root.destroy()
@@ -152,6 +189,7 @@ class AstronomicalWatchApp:
         self.widget_root.destroy()
         self.widget_root = None
         self.widget = None
+        stop_worker()
         print("👋 Application closed")
     
     def on_normal_close(self):
@@ -183,11 +221,146 @@ class AstronomicalWatchApp:
                 self.on_widget_close()
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    from astronomical_watch.net.beacon import (
+        BEACON_GROUP, BEACON_PORT, BEACON_TTL, BEACON_HEARTBEAT_S
+    )
+    from astronomical_watch.net.clock_page import REFRESH_S
+    parser = argparse.ArgumentParser(prog="awatch", description="Astronomical Watch")
+    commands = parser.add_subparsers(dest="command")
+    
+    beacon = commands.add_parser("beacon", help="Multicast Dies time to displays on the LAN")
+    beacon.add_argument("--ttl", type=int, default=BEACON_TTL, help="Multicast TTL")
+    beacon.add_argument("--heartbeat", type=float, default=BEACON_HEARTBEAT_S,
+                        help="Seconds between packets inside a miliDies (0: boundaries only)")
+    beacon.add_argument("--no-ntp", action="store_true", help="Use the system clock as is")
+    
+    client = commands.add_parser("client", help="Widget that displays a beacon's time")
+    
+    clock_page = commands.add_parser("clock-page", help="Publish Dies time to local processes")
+    clock_page.add_argument("--path", default=None, help="Page file (default: runtime dir)")
+    clock_page.add_argument("--refresh", type=float, default=REFRESH_S, help="Seconds between updates")
+    clock_page.add_argument("--no-ntp", action="store_true", help="Use the system clock as is")
+    
+    stats = commands.add_parser("stats", help="Print hot-path metrics")
+    stats.add_argument("--url", default=os.environ.get("ASTRON_METRICS_URL", DEFAULT_METRICS_URL),
+                       help="Metrics endpoint of a running API server")
+    stats.add_argument("--local", action="store_true",
+                       help="Measure a representative workload in this process instead")
+    
+    for sub in (beacon, client):
+        sub.add_argument("--group", default=BEACON_GROUP, help="Multicast group (or unicast address)")
+        sub.add_argument("--port", type=int, default=BEACON_PORT, help="UDP port")
+        sub.add_argument("--interface", default=None, help="Local interface address")
+    return parser
+
+
+DEFAULT_METRICS_URL = "http://127.0.0.1:8000/metrics"
+
+
+def run_stats_command(args: argparse.Namespace) -> None:
+    """`awatch stats`: dump a server's /metrics, or metrics of a local workload."""
+    if not args.local:
+        from urllib.request import urlopen
+        
+        with urlopen(args.url, timeout=10) as response:
+            print(response.read().decode("utf-8"), end="")
+        return
+    
+    import tempfile
+    from astronomical_watch import core_probes, metrics
+    
+    metrics.enable()
+    core_probes.install()
+    # Private cache directory: measure cold and warm lookups without touching the user's cache
+    with tempfile.TemporaryDirectory(prefix="awatch-stats-") as cache_dir:
+        previous = os.environ.get("ASTRON_CACHE_DIR")
+        os.environ["ASTRON_CACHE_DIR"] = cache_dir
+        try:
+            _stats_workload()
+        finally:
+            if previous is None:
+                os.environ.pop("ASTRON_CACHE_DIR", None)
+            else:
+                os.environ["ASTRON_CACHE_DIR"] = previous
+    print(metrics.render_text())
+
+
+def _stats_workload() -> None:
+    """Equinox solves through every offline tier, plus cold and warm cache lookups."""
+    import sys
+    from datetime import datetime, timezone
+    
+    # Service modules use package-relative top-level imports (services.*, solar.*)
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if package_dir not in sys.path:
+        sys.path.insert(0, package_dir)
+    from offline.cache import get_cached_equinox
+    from services import equinox_service
+    from solar.equinox_precise import compute_vernal_equinox_precise
+    
+    year = datetime.now(timezone.utc).year
+    equinox_service.get_vernal_equinox(year, prefer_order=("analytic", "approx"))
+    equinox_service.get_vernal_equinox(year + 1, prefer_order=("approx",))
+    compute_vernal_equinox_precise(year, method="bisection")
+    for _ in range(10):
+        get_cached_equinox(year)
+    get_cached_equinox(year + 2)
+
+
+def _start_publisher_sources(no_ntp: bool):
+    """Warmed equinoxes and (unless disabled) the NTP-disciplined clock for daemons."""
+    from .equinox_provider import get_equinox
+    
+    start_equinox_warmer()
+    if not no_ntp:
+        AstronomicalWatchApp._start_time_sync()
+    wait_until_warm()
+    return get_equinox
+
+
+def run_beacon_command(args: argparse.Namespace) -> None:
+    """`awatch beacon`: NTP-disciplined clock and warmed equinoxes, multicast to the LAN."""
+    from astronomical_watch.net.beacon import run_beacon
+    
+    equinox_source = _start_publisher_sources(args.no_ntp)
+    run_beacon(args.group, args.port, args.ttl, args.interface, args.heartbeat,
+               equinox_source=equinox_source)
+
+
+def run_clock_page_command(args: argparse.Namespace) -> None:
+    """`awatch clock-page`: memory-mapped clock page for processes on this host."""
+    from astronomical_watch.net.clock_page import run_clock_page
+    
+    equinox_source = _start_publisher_sources(args.no_ntp)
+    run_clock_page(args.path, args.refresh, equinox_source=equinox_source)
+
+
+def run_client_command(args: argparse.Namespace) -> None:
+    """`awatch client`: widget rendering from beacon packets only."""
+    from astronomical_watch.net.beacon import BeaconClient
+    
+    client = BeaconClient(args.group, args.port, args.interface)
+    client.start()
+    print(f"📡 Listening for time beacon on {args.group}:{args.port}")
+    AstronomicalWatchApp(enable_ntp_sync=False, beacon_client=client).run()
+
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point."""
+    args = _build_parser().parse_args(argv)
     try:
-        app = AstronomicalWatchApp()
-        app.run()
+        if args.command == "beacon":
+            run_beacon_command(args)
+        elif args.command == "client":
+            run_client_command(args)
+        elif args.command == "clock-page":
+            run_clock_page_command(args)
+        elif args.command == "stats":
+            run_stats_command(args)
+        else:
+            app = AstronomicalWatchApp()
+            app.run()
     except Exception as e:
         print(f"❌ Application error: {e}")
         import traceback
@@ -12,13 +12,15 @@ import math
 import json
 import os
 import random
-from datetime import datetime, timezone
-from ..core.astro_time_core import AstroYear
-from .gradient import get_sky_theme, create_gradient_colors
-from .theme_manager import get_shared_theme
+from datetime import datetime
+from .gradient import create_gradient_colors
+from . import theme_manager
 from .translations import TRANSLATIONS
 from .comparison_card import create_comparison_card
 from .settings_card import create_settings_card
+from . import tick_trace
+from .tick_scheduler import TickScheduler, countdown
+from ..core.astro_time_core import MIKRODIES_NS
 
 # Detect available monospace font
 def get_monospace_font(size=14):
@@ -83,7 +85,7 @@ def tr(key: str, lang: str = "en") -> str:
 
 class ModernNormalMode:
     """Modern Normal Mode without window decorations."""
-    def __init__(self, parent, on_back=None, on_language=None, widget_ref=None):
+    def __init__(self, parent, on_back=None, on_language=None, widget_ref=None, scheduler=None):
         print("🚀 ModernNormalMode.__init__ starting...")
         self.master = parent
         self.on_back = on_back
@@ -106,8 +108,14 @@ class ModernNormalMode:
         self.gradient_canvas = None
         self.shared_theme_func = None  # Function to get shared theme from widget
 
-        # Update timer
-        self._update_job = None
+        # Shared tick scheduler (the widget's, or created by start_updates)
+        self.scheduler = scheduler
+        # mikroDies and seconds are always shown, so the only saving is pausing
+        # while the window is minimized or fully covered
+        self._visible = True
+        self.master.bind("<Map>", self._on_visibility_change, add="+")
+        self.master.bind("<Unmap>", self._on_visibility_change, add="+")
+        self.master.bind("<Visibility>", self._on_visibility_change, add="+")
 
         # Fireworks state
         self.fireworks_active = False
@@ -256,7 +264,7 @@ class ModernNormalMode:
         
     def _get_current_theme(self):
         """Get current theme - uses shared theme for consistency."""
-        return get_shared_theme()
+        return theme_manager.get_shared_theme()
         
     def _create_ui(self):
         """Create the modern UI layout."""
@@ -1168,10 +1176,8 @@ class ModernNormalMode:
     def _apply_theme(self):
         """Apply the astronomical theme based on current local time."""
         try:
-            # Get theme using local system time
-            from datetime import datetime
-            now_local = datetime.now()
-            theme = get_sky_theme(now_local)
+            # Shared theme (computed from local system time)
+            theme = theme_manager.get_shared_theme()
             
             if not theme:
                 # Fallback to default theme
@@ -1310,48 +1316,47 @@ class ModernNormalMode:
         return brightness < 128
         
     def start_updates(self):
-        """Start the periodic update cycle."""
-        self._update_display()
+        """Render every mikroDies tick of the shared scheduler (own scheduler if none given)."""
+        if self.scheduler is None:
+            self.scheduler = getattr(self.widget_ref, "scheduler", None) or TickScheduler(self.master)
+        self.scheduler.subscribe(self._on_tick, "normal", MIKRODIES_NS if self._visible else None)
+        self._on_theme(theme_manager.subscribe(self._on_theme))
+        theme_manager.start(self.master)
+        
+    def _on_visibility_change(self, event):
+        """Pause ticks while unmapped or fully obscured, resume (and render at once) when seen."""
+        if event.widget is not self.master:
+            return
+        if event.type == tk.EventType.Unmap:
+            self._visible = False
+        elif event.type == tk.EventType.Visibility:
+            self._visible = event.state != "VisibilityFullyObscured"
+        else:
+            self._visible = True
+        if self.scheduler is not None:
+            self.scheduler.set_period(self._on_tick, MIKRODIES_NS if self._visible else None)
         
     def stop_updates(self):
         """Stop the periodic update cycle."""
-        if self._update_job:
-            self.master.after_cancel(self._update_job)
-            self._update_job = None
+        if self.scheduler is not None:
+            self.scheduler.unsubscribe(self._on_tick)
+        theme_manager.unsubscribe(self._on_theme)
             
     def _update_display(self):
-        """Update the astronomical time display."""
-        try:
-            from ..core.equinox import compute_vernal_equinox
-            
-            now_utc = datetime.now(timezone.utc)
-            current_year = now_utc.year
-            equinox = compute_vernal_equinox(current_year)
-            next_equinox = compute_vernal_equinox(current_year + 1)
-            
-            # Check if we need next year's equinox
-            if now_utc < equinox:
-                equinox = compute_vernal_equinox(current_year - 1)
-                next_equinox = compute_vernal_equinox(current_year)
-                
-            astro_year = AstroYear(equinox)
-            reading = astro_year.reading(now_utc)
+        """Re-render the latest reading (e.g. after a language change)."""
+        if self.scheduler is not None and self.scheduler.latest is not None:
+            self._on_tick(self.scheduler.latest)
             
+    def _on_tick(self, reading):
+        """Render one reading published by the tick scheduler."""
+        try:
             # Update astronomical time values
             self.dies = reading.dies
             self.miliDies = reading.miliDies
             mikroDies = reading.mikroDies
             
             # Calculate countdown to next equinox
-            year_length_seconds = (next_equinox - equinox).total_seconds()
-            year_length_dies = int(year_length_seconds / 86400.0)
-            
-            remaining_dies = year_length_dies - self.dies
-            remaining_milidies = 1000 - self.miliDies
-            
-            if remaining_milidies == 1000:
-                remaining_milidies = 0
-                remaining_dies += 1
+            remaining_dies, remaining_milidies = countdown(reading)
             
             # Update display labels (with error checking)
             try:
@@ -1370,6 +1375,8 @@ class ModernNormalMode:
                         self.countdown_label.config(text=countdown_text)
                     else:
                         self.countdown_label.config(text="")
+            except tk.TclError:
+                raise  # window destroyed; the scheduler drops this subscriber
             except Exception as e:
                 print(f"⚠️ Could not update time labels: {e}")
             
@@ -1406,12 +1413,7 @@ class ModernNormalMode:
                     self.std_time_label.config(text=std_time)
             except Exception as e:
                 print(f"⚠️ Could not update standard time: {e}")
-            
-            # Update gradient theme (every few minutes to track sky changes)
-            try:
-                self._update_gradient_theme(now_utc)
-            except Exception as e:
-                print(f"⚠️ Could not update gradient theme: {e}")
+            tick_trace.mark("normal.labels")
             
             # Check for equinox moment (Dies 000, miliDies 000-005)
             if self.dies == 0 and self.miliDies < 5 and not self.fireworks_active:
@@ -1419,7 +1421,10 @@ class ModernNormalMode:
             elif self.dies > 0 and self.fireworks_active:
                 self._stop_fireworks()
             
+        except tk.TclError:
+            raise
         except Exception as e:
+            tick_trace.fail(e)
             print(f"❌ Update error: {e}")
             # Fallback values - only update labels that exist
             try:
@@ -1431,21 +1436,9 @@ class ModernNormalMode:
                     self.mikrodies_label.config(text="ERR")
             except:
                 pass  # Ignore errors in error handling
-            
-        finally:
-            # Always schedule next update if master still exists
-            try:
-                if self.master and hasattr(self.master, 'after'):
-                    self._update_job = self.master.after(86, self._update_display)  # ~86ms = 1 mikroDies
-            except:
-                print("⚠️ Could not schedule next update")
-        
-    def _update_gradient_theme(self, current_time):
-        """Update gradient theme based on current time (called periodically)."""
-        # Get fresh theme from theme manager (Widget updates it every 86ms)
-        from .theme_manager import get_shared_theme
-        new_theme = get_shared_theme()
         
+    def _on_theme(self, new_theme):
+        """Theme bus callback: recolor when the shared sky theme changes."""
         # Check if theme has changed significantly
         theme_changed = (self.current_theme is None or 
                         new_theme.top_color != self.current_theme.top_color or
@@ -1549,6 +1542,6 @@ class ModernNormalMode:
         self.fireworks_job = self.master.after(50, self._animate_fireworks)  # ~20 FPS
 
 
-def create_normal_mode(parent, on_back=None, on_language=None, widget_ref=None):
+def create_normal_mode(parent, on_back=None, on_language=None, widget_ref=None, scheduler=None):
     """Factory function to create normal mode instance."""
-    return ModernNormalMode(parent, on_back, on_language, widget_ref)
\ No newline at end of file
+    return ModernNormalMode(parent, on_back, on_language, widget_ref, scheduler)
\ No newline at end of file
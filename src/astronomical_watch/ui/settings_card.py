@@ -12,7 +12,7 @@ import sys
 import platform
 from datetime import datetime, timezone
 from .gradient import get_sky_theme, create_gradient_colors
-from .theme_manager import get_shared_theme
+from . import theme_manager
 from .translations import TRANSLATIONS
 
 def tr(key: str, lang: str = "en") -> str:
@@ -36,7 +36,7 @@ class SettingsCard(tk.Toplevel):
         self.overrideredirect(True)
         
         # Get sky theme for gradient
-        self.theme = get_shared_theme()
+        self.theme = theme_manager.get_shared_theme()
         
         # Create canvas for gradient background
         self.canvas = tk.Canvas(self, width=400, height=700, highlightthickness=0)
@@ -56,17 +56,17 @@ class SettingsCard(tk.Toplevel):
         # Setup drag functionality
         self._setup_dragging()
         
-        # Start theme update loop
-        self._schedule_theme_update()
+        # Follow sky theme changes
+        theme_manager.subscribe(self._update_theme)
+        theme_manager.start(self)
+        self.bind("<Destroy>", self._on_destroy, add="+")
     
-    def _schedule_theme_update(self):
-        """Schedule periodic theme updates."""
-        self._update_theme()
-        self.after(86, self._schedule_theme_update)  # Update every 86ms (1 mikroDies)
+    def _on_destroy(self, event):
+        if event.widget is self:
+            theme_manager.unsubscribe(self._update_theme)
     
-    def _update_theme(self):
-        """Update theme colors."""
-        new_theme = get_shared_theme()
+    def _update_theme(self, new_theme):
+        """Theme bus callback: update theme colors."""
         
         # Check if theme changed
         if (new_theme.top_color != self.theme.top_color or 
@@ -168,6 +168,7 @@ class SettingsCard(tk.Toplevel):
             "always_on_top": False,
             "load_on_startup": True,
             "transparent_background": False,
+            "show_mikrodies": True,
             "language": "en"
         }
         
@@ -317,6 +318,23 @@ class SettingsCard(tk.Toplevel):
             # Linux/macOS: Feature not available
             self.transparent_var = tk.BooleanVar(value=False)
         
+        # mikroDies progress bar checkbox (hidden: widget updates once per miliDies)
+        self.show_mikrodies_var = tk.BooleanVar(value=self.settings.get("show_mikrodies", True))
+        self.show_mikrodies_cb = tk.Checkbutton(
+            widget_frame,
+            text=tr("show_mikrodies", self.lang),
+            variable=self.show_mikrodies_var,
+            bg=self.bg_color,
+            fg=self.text_color,
+            activeforeground=self.text_color,
+            selectcolor="#808080",
+            activebackground=self.bg_color,
+            font=("Arial", 10)
+        )
+        self.show_mikrodies_cb.pack(anchor="w", pady=5)
+        self.show_mikrodies_cb.bind("<Enter>", lambda e: e.widget.config(font=("Arial", 10, "underline")))
+        self.show_mikrodies_cb.bind("<Leave>", lambda e: e.widget.config(font=("Arial", 10)))
+        
         # === Info Section ===
         self._create_section(main_frame, tr("app_info", self.lang))
         
@@ -473,6 +491,7 @@ class SettingsCard(tk.Toplevel):
                 "always_on_top": False,
                 "load_on_startup": False,
                 "transparent_background": False,
+                "show_mikrodies": True,
                 "language": "en"
             }
             
@@ -480,6 +499,7 @@ class SettingsCard(tk.Toplevel):
             self.always_on_top_var.set(False)
             self.load_on_startup_var.set(False)
             self.transparent_var.set(False)
+            self.show_mikrodies_var.set(True)
             
             messagebox.showinfo("Reset Complete", "Settings have been reset to defaults.")
     
@@ -489,6 +509,7 @@ class SettingsCard(tk.Toplevel):
         self.settings["always_on_top"] = self.always_on_top_var.get()
         self.settings["load_on_startup"] = self.load_on_startup_var.get()
         self.settings["transparent_background"] = self.transparent_var.get()
+        self.settings["show_mikrodies"] = self.show_mikrodies_var.get()
         
         # Save to file
         if self._save_settings():
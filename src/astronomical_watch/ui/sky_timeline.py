@@ -0,0 +1,169 @@
+"""
+Daily sky-theme timeline with exact transition times.
+
+The sky theme only changes where the solar altitude crosses one of the
+gradient.ALTITUDE_THRESHOLDS. Once per local day this module samples the
+altitude every SAMPLE_STEP, brackets each threshold crossing and bisects it
+to RESOLUTION, and keeps the result as a sorted (time, SkyTheme) timeline.
+theme_at(t) is then a bisect, and next_change_after(t) tells the theme
+manager exactly when to wake up next, so nothing is evaluated in between.
+
+Times are naive local datetimes, like get_sky_theme(), and timelines are
+cached per (day, observer location). Excursions across a
+threshold shorter than SAMPLE_STEP (a sun that barely touches a threshold at
+its highest point) are not resolved.
+"""
+from __future__ import annotations
+from bisect import bisect_right
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .gradient import (
+    ALTITUDE_THRESHOLDS, SkyTheme, default_location, get_solar_altitude_approximation,
+    theme_for_altitude
+)
+
+SAMPLE_STEP = timedelta(minutes=5)   # the sun moves at most 1.25° per step
+RESOLUTION = timedelta(seconds=1)
+LOOKAHEAD_DAYS = 2                   # further days searched for the next change (polar day/night)
+CACHED_DAYS = LOOKAHEAD_DAYS + 1
+
+AltitudeFunction = Callable[[datetime], float]
+Location = Tuple[float, float]  # (latitude, longitude) in degrees
+
+
+def altitude_band(altitude: float) -> int:
+    """Number of thresholds the altitude is above; the theme is a function of this."""
+    return sum(1 for threshold in ALTITUDE_THRESHOLDS if altitude > threshold)
+
+
+class SkyTimeline:
+    """Theme transitions of one local day [00:00, next 00:00) at one location."""
+
+    def __init__(self, day: date, altitude_fn: Optional[AltitudeFunction] = None,
+                 location: Optional[Location] = None):
+        if altitude_fn is None:
+            latitude, longitude = location or default_location()
+            altitude_fn = lambda t: get_solar_altitude_approximation(t, latitude, longitude)
+        self.day = day
+        self.location = location
+        self.start = datetime.combine(day, dt_time())
+        self.end = self.start + timedelta(days=1)
+        self._altitude_fn = altitude_fn
+        self.evaluations = 0
+
+        first_altitude = self._altitude(self.start)
+        self.times: List[datetime] = [self.start]
+        self.bands: List[int] = [altitude_band(first_altitude)]
+        self.themes: List[SkyTheme] = [theme_for_altitude(first_altitude)]
+        self._solve()
+
+    def _altitude(self, t: datetime) -> float:
+        self.evaluations += 1
+        return self._altitude_fn(t)
+
+    def _solve(self) -> None:
+        previous_t, previous_band = self.start, self.bands[0]
+        t = self.start
+        while t < self.end:
+            t = min(t + SAMPLE_STEP, self.end)
+            altitude = self._altitude(t)
+            band = altitude_band(altitude)
+            if band != previous_band:
+                self.times.append(self._bisect(previous_t, t, band))
+                self.bands.append(band)
+                self.themes.append(theme_for_altitude(altitude))
+            previous_t, previous_band = t, band
+
+    def _bisect(self, low: datetime, high: datetime, band: int) -> datetime:
+        """Earliest instant in (low, high] already in band (to RESOLUTION)."""
+        while high - low > RESOLUTION:
+            mid = low + (high - low) / 2
+            if altitude_band(self._altitude(mid)) == band:
+                high = mid
+            else:
+                low = mid
+        return high
+
+    @property
+    def transitions(self) -> List[Tuple[datetime, SkyTheme]]:
+        """(start time, theme) pairs; the first starts at local midnight."""
+        return list(zip(self.times, self.themes))
+
+    def index_at(self, t: datetime) -> int:
+        if not self.start <= t < self.end:
+            raise ValueError(f"{t} is outside the timeline of {self.day}")
+        return bisect_right(self.times, t) - 1
+
+    def theme_at(self, t: datetime) -> SkyTheme:
+        return self.themes[self.index_at(t)]
+
+    def band_at(self, t: datetime) -> int:
+        return self.bands[self.index_at(t)]
+
+
+_timelines: Dict[Tuple[date, Location], SkyTimeline] = {}
+
+
+def timeline_for(day: date, location: Optional[Location] = None) -> SkyTimeline:
+    """
+    Timeline of a local day at location (default: gradient.default_location()).
+    Solved on first use; the last CACHED_DAYS days are kept per location.
+    """
+    location = location or default_location()
+    key = (day, location)
+    timeline = _timelines.get(key)
+    if timeline is None:
+        timeline = _timelines[key] = SkyTimeline(day, location=location)
+        days = sorted(d for d, loc in _timelines if loc == location)
+        for old in days[:-CACHED_DAYS]:
+            del _timelines[(old, location)]
+    return timeline
+
+
+def _local(t: Optional[datetime]) -> datetime:
+    if t is None:
+        return datetime.now()
+    if t.tzinfo is not None:
+        return t.astimezone().replace(tzinfo=None)
+    return t
+
+
+def theme_at(t: Optional[datetime] = None, location: Optional[Location] = None) -> SkyTheme:
+    """Sky theme at local time t (default: now), by bisecting the day's timeline."""
+    t = _local(t)
+    return timeline_for(t.date(), location).theme_at(t)
+
+
+def next_change_after(t: Optional[datetime] = None,
+                      location: Optional[Location] = None) -> datetime:
+    """
+    Instant the theme next differs from the one at t.
+
+    Looks up to LOOKAHEAD_DAYS ahead; without a change in that window the
+    first midnight after it is returned, so the caller simply checks again.
+    """
+    t = _local(t)
+    timeline = timeline_for(t.date(), location)
+    band = timeline.band_at(t)
+    index = timeline.index_at(t) + 1
+    for offset in range(LOOKAHEAD_DAYS + 1):
+        for when, other in zip(timeline.times[index:], timeline.bands[index:]):
+            if other != band:
+                return when
+        if offset == LOOKAHEAD_DAYS:
+            break
+        timeline = timeline_for(timeline.end.date(), location)
+        index = 0
+    return timeline.end
+
+
+__all__ = [
+    "SAMPLE_STEP",
+    "RESOLUTION",
+    "SkyTimeline",
+    "altitude_band",
+    "timeline_for",
+    "theme_at",
+    "next_change_after",
+]
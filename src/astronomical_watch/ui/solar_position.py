@@ -0,0 +1,81 @@
+"""
+Topocentric solar position for sky themes.
+
+Declination and right ascension come from the project's solar ephemeris
+(core.solar apparent longitude, ecliptic latitude taken as zero), the
+equation of time from Meeus (28.3), and the local hour angle from apparent
+solar time at the observer's longitude:
+
+    H = (UTC + longitude / 15° + EoT - 12 h) * 15°/h
+    sin(altitude) = sin φ sin δ + cos φ cos δ cos H
+
+Refraction and parallax are ignored; both are far below the resolution of
+the theme thresholds.
+"""
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from ..core.frames import ecliptic_to_equatorial
+from ..core.nutation import nutation_simple
+from ..core.solar import solar_longitude_from_datetime
+from ..core.timebase import J2000, timescales_from_datetime
+
+DEG = math.pi / 180.0
+
+
+@dataclass(frozen=True)
+class SolarPosition:
+    """Sun's apparent equatorial position at one instant."""
+    utc: datetime
+    declination: float        # radians
+    right_ascension: float    # radians
+    equation_of_time: float   # minutes (apparent minus mean solar time)
+
+    def hour_angle(self, longitude: float) -> float:
+        """Local hour angle in radians at longitude (degrees, east positive)."""
+        utc_hours = (self.utc.hour + self.utc.minute / 60.0
+                     + (self.utc.second + self.utc.microsecond / 1e6) / 3600.0)
+        solar_time = utc_hours + longitude / 15.0 + self.equation_of_time / 60.0
+        return (solar_time - 12.0) * 15.0 * DEG
+
+    def altitude(self, latitude: float, longitude: float) -> float:
+        """Solar altitude in degrees for an observer at (latitude, longitude) degrees."""
+        phi = latitude * DEG
+        sin_alt = (math.sin(phi) * math.sin(self.declination)
+                   + math.cos(phi) * math.cos(self.declination) * math.cos(self.hour_angle(longitude)))
+        return math.degrees(math.asin(max(-1.0, min(1.0, sin_alt))))
+
+
+def _to_utc(dt: datetime) -> datetime:
+    # Naive datetimes are local time, as everywhere in the UI
+    return dt.astimezone(timezone.utc)
+
+
+def mean_solar_longitude(jd_tt: float) -> float:
+    """Sun's mean longitude L0 in degrees (Meeus 28.2)."""
+    tau = (jd_tt - J2000) / 365250.0
+    return (280.4664567 + 360007.6982779 * tau + 0.03032028 * tau ** 2
+            + tau ** 3 / 49931.0 - tau ** 4 / 15300.0 - tau ** 5 / 2000000.0) % 360.0
+
+
+def solar_position(dt: datetime) -> SolarPosition:
+    """Apparent declination, right ascension and equation of time at dt."""
+    utc = _to_utc(dt)
+    jd_tt = timescales_from_datetime(utc).jd_tt
+    longitude = solar_longitude_from_datetime(utc)
+    right_ascension, declination = ecliptic_to_equatorial(longitude, 0.0, jd_tt)
+    nutation = nutation_simple(jd_tt)
+    eot_deg = (mean_solar_longitude(jd_tt) - 0.0057183 - math.degrees(right_ascension)
+               + math.degrees(nutation.dpsi) * math.cos(nutation.eps))
+    eot_deg = (eot_deg + 180.0) % 360.0 - 180.0
+    return SolarPosition(utc, declination, right_ascension, eot_deg * 4.0)
+
+
+def solar_altitude(dt: datetime, latitude: float, longitude: float) -> float:
+    """Solar altitude in degrees at dt for an observer at (latitude, longitude)."""
+    return solar_position(dt).altitude(latitude, longitude)
+
+
+__all__ = ["SolarPosition", "mean_solar_longitude", "solar_position", "solar_altitude"]
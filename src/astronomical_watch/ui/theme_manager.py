@@ -1,22 +1,53 @@
 """
 Centralized theme management to ensure consistent colors across all windows.
 All UI components should use get_shared_theme() instead of calling get_sky_theme() directly.
+
+The shared theme is an observer bus: windows subscribe() a callback and are
+called with the new SkyTheme when it changes, instead of polling. Themes
+and the exact instant of the next change come from the daily sky timeline
+(sky_timeline.py); start() arms a single Tk timer for that instant, and
+get_shared_theme() also moves on lazily once it has passed.
+
+use_fixed_theme() pins the theme instead (thin beacon clients, which do no
+astronomy locally): nothing is computed and no timer is armed.
 """
 from datetime import datetime
-from .gradient import get_sky_theme, SkyTheme
+from typing import Callable, List, Optional
+import tkinter as tk
+from .gradient import SkyTheme, theme_for_altitude
+from . import sky_timeline
+
+ThemeListener = Callable[[SkyTheme], None]
+
+# Longest single timer wait; the wait is re-armed, so wall-clock jumps (DST,
+# manual changes) delay a transition by at most this long
+MAX_TIMER_SECONDS = 3600
+
+# Theme of displays that do not compute the sky (the night palette)
+FIXED_THEME = theme_for_altitude(-90.0)
 
 # Global shared theme state
 _shared_theme: SkyTheme = None
 _shared_theme_time: datetime = None
-_theme_update_interval = 60  # Update theme every 60 seconds
+_next_change_time: Optional[datetime] = None  # local time of the next theme change
+_listeners: List[ThemeListener] = []
+_timer_root: Optional[tk.Misc] = None
+_timer_job = None
+_fixed = False
 
 
 def update_shared_theme():
-    """Update the shared theme based on local system time."""
-    global _shared_theme, _shared_theme_time
+    """Recompute the shared theme from local system time and notify subscribers if it changed."""
+    global _shared_theme, _shared_theme_time, _next_change_time
+    if _fixed:
+        return _shared_theme
     now = datetime.now()  # Use local time
+    previous = _shared_theme
     _shared_theme_time = now
-    _shared_theme = get_sky_theme(now)
+    _shared_theme = sky_timeline.theme_at(now)
+    _next_change_time = sky_timeline.next_change_after(now)
+    if previous is not None and _theme_key(previous) != _theme_key(_shared_theme):
+        _notify(_shared_theme)
     return _shared_theme
 
 
@@ -26,8 +57,9 @@ def get_shared_theme() -> SkyTheme:
     All UI components should use this instead of get_sky_theme() directly
     to ensure consistent colors across all windows.
     """
-    global _shared_theme
-    if _shared_theme is None:
+    if _fixed:
+        return _shared_theme
+    if _shared_theme is None or datetime.now() >= _next_change_time:
         update_shared_theme()
     return _shared_theme
 
@@ -36,3 +68,78 @@ def get_shared_theme_time() -> datetime:
     """Get the timestamp when the shared theme was last updated."""
     global _shared_theme_time
     return _shared_theme_time
+
+
+def use_fixed_theme(theme: SkyTheme = FIXED_THEME) -> None:
+    """Pin the shared theme: no sky computation, no timer, subscribers notified once."""
+    global _shared_theme, _shared_theme_time, _next_change_time, _fixed
+    stop()
+    previous = _shared_theme
+    _fixed = True
+    _shared_theme = theme
+    _shared_theme_time = datetime.now()
+    _next_change_time = None
+    if previous is not None and _theme_key(previous) != _theme_key(theme):
+        _notify(theme)
+
+
+def subscribe(callback: ThemeListener) -> SkyTheme:
+    """Call callback(theme) whenever the shared theme changes; returns the current theme."""
+    if callback not in _listeners:
+        _listeners.append(callback)
+    return get_shared_theme()
+
+
+def unsubscribe(callback: ThemeListener) -> None:
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def start(master: tk.Misc) -> None:
+    """Arm the change timer on master's Tk root (idempotent)."""
+    global _timer_root
+    if _timer_job is None and not _fixed:
+        _timer_root = master.nametowidget(".")
+        get_shared_theme()
+        _arm_timer()
+
+
+def stop() -> None:
+    global _timer_job
+    if _timer_job is not None:
+        try:
+            _timer_root.after_cancel(_timer_job)
+        except tk.TclError:
+            pass
+        _timer_job = None
+
+
+def _arm_timer() -> None:
+    global _timer_job
+    delay_s = min((_next_change_time - datetime.now()).total_seconds(), MAX_TIMER_SECONDS)
+    try:
+        _timer_job = _timer_root.after(max(1, int(delay_s * 1000) + 1), _on_timer)
+    except tk.TclError:
+        _timer_job = None  # root destroyed
+
+
+def _on_timer() -> None:
+    global _timer_job
+    _timer_job = None
+    get_shared_theme()  # recomputes (and notifies) only if the change instant passed
+    _arm_timer()
+
+
+def _theme_key(theme: SkyTheme):
+    return theme.top_color, theme.bottom_color, theme.text_color
+
+
+def _notify(theme: SkyTheme) -> None:
+    for callback in list(_listeners):
+        try:
+            callback(theme)
+        except tk.TclError:
+            # Window destroyed without unsubscribing
+            unsubscribe(callback)
+        except Exception as e:
+            print(f"⚠️ Theme listener error: {e}")
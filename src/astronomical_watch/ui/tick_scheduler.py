@@ -0,0 +1,312 @@
+"""
+One tick loop for all windows, aligned to real mikroDies boundaries.
+
+The scheduler reads the synchronized clock once per tick, computes one
+reading and hands it to every subscribed window, which only renders it.
+The next tick is scheduled for the next mikroDies boundary of that clock
+(86.4 ms apart, aligned to the reference noon like the readings
+themselves), so ticks neither drift against the real mikroDies nor repeat
+or skip a displayed value the way free-running after(86) loops do.
+
+Each window subscribes with the finest unit it currently shows: mikroDies
+while mikroDies digits or the progress bar are on screen, miliDies (86.4 s)
+otherwise, or None while it is not visible at all. The loop sleeps until the
+next boundary of the finest unit any window needs, calls each window only
+when its own unit changes, and stops completely while every window is
+paused, so an always-on display showing DDD.mmm wakes once per miliDies.
+
+Readings are net.beacon.BeaconReading values, the same type a thin client
+gets from a time beacon; with a beacon client the scheduler publishes the
+client's extrapolated readings instead of computing its own.
+
+With a compute worker the equinox frame is loaded on the worker thread:
+ticks keep using the current frame while a refreshed one is loaded, and
+only skip (keeping the display) until the first frame of a year arrives.
+"""
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import tkinter as tk
+
+from .. import metrics as _metrics
+from ..core.astro_time_core import (
+    MIKRODIES_NS, MILIDIES_NS, NOON_NS, NS_PER_SECOND, datetime_to_ns, next_boundary_ns,
+    reading_at
+)
+from ..net.beacon import BeaconReading
+from . import tick_trace
+
+NS_PER_MS = 1_000_000
+
+UI_TICK_SECONDS = _metrics.histogram(
+    "awatch_ui_tick_seconds", "Duration of one UI display update", ["window"]
+)
+UI_TICK_LATENESS_SECONDS = _metrics.histogram(
+    "awatch_ui_tick_lateness_seconds", "Delay between a mikroDies boundary and its UI tick"
+)
+
+TickCallback = Callable[[BeaconReading], None]
+
+
+@dataclass
+class _Subscription:
+    name: str
+    callback: TickCallback
+    period_ns: Optional[int]           # finest unit shown; None while hidden
+    last_index: Optional[int] = None   # boundary index of the last rendered reading
+
+
+def countdown(reading: BeaconReading) -> Tuple[int, int]:
+    """(dies, miliDies) remaining until the next vernal equinox."""
+    remaining_dies = reading.year_length_dies - reading.dies
+    remaining_milidies = 1000 - reading.miliDies
+    if remaining_milidies == 1000:
+        remaining_milidies = 0
+        remaining_dies += 1
+    return remaining_dies, remaining_milidies
+
+
+class TickScheduler:
+    """
+    Publishes one reading per mikroDies to subscribed windows.
+
+    Args:
+        master: Tk widget whose event loop runs the ticks
+        equinox_source: Function returning the vernal equinox datetime of a
+            year (default: the UI's warmed equinox provider)
+        clock_ns: Function returning synchronized UTC in ns (default: time_sync.now_ns)
+        beacon_client: Publish readings from this BeaconClient instead
+        period_ns: Retry period while no reading is available (one mikroDies)
+        worker: ComputeWorker that loads equinox frames off the Tk thread
+    """
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        equinox_source: Optional[Callable] = None,
+        clock_ns: Optional[Callable[[], int]] = None,
+        beacon_client=None,
+        period_ns: int = MIKRODIES_NS,
+        worker=None
+    ):
+        if equinox_source is None:
+            from .equinox_provider import get_equinox as equinox_source
+        if clock_ns is None:
+            from ..net.time_sync import now_ns as clock_ns
+        self.master = master
+        self.equinox_source = equinox_source
+        self.clock_ns = clock_ns
+        self.beacon_client = beacon_client
+        self.period_ns = period_ns
+        self.worker = worker
+        self.latest: Optional[BeaconReading] = None
+        self._subscribers: List[_Subscription] = []
+        self._job = None
+        # (frame_year, equinox_ns, next_equinox_ns, reload_at_ns)
+        self._frame: Optional[Tuple[int, int, int, int]] = None
+        self._frame_requested = False
+        if worker is not None and beacon_client is None:
+            self._request_frame(self.clock_ns())  # ready before the first tick
+
+    # ---------------------- Subscriptions ---------------------- #
+
+    def subscribe(self, callback: TickCallback, name: str = "window",
+                  period_ns: Optional[int] = MIKRODIES_NS) -> None:
+        """
+        Render callback at every boundary of period_ns (idempotent).
+
+        A repeated subscribe only updates the period; the loop starts on first use.
+        """
+        subscription = self._find(callback)
+        if subscription is None:
+            self._subscribers.append(_Subscription(name, callback, period_ns))
+            self._reschedule()
+        else:
+            self.set_period(callback, period_ns)
+
+    def unsubscribe(self, callback: TickCallback) -> None:
+        self._subscribers = [s for s in self._subscribers if s.callback != callback]
+
+    def set_period(self, callback: TickCallback, period_ns: Optional[int]) -> None:
+        """Change the unit a subscriber shows (None pauses it until set again)."""
+        subscription = self._find(callback)
+        if subscription is None or subscription.period_ns == period_ns:
+            return
+        subscription.period_ns = period_ns
+        subscription.last_index = None  # render the next reading right away
+        self._reschedule()
+
+    def _find(self, callback: TickCallback) -> Optional[_Subscription]:
+        for subscription in self._subscribers:
+            if subscription.callback == callback:
+                return subscription
+        return None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def cadence_ns(self) -> Optional[int]:
+        """Finest period any subscriber currently needs (None if all are paused)."""
+        periods = [s.period_ns for s in self._subscribers if s.period_ns is not None]
+        return min(periods) if periods else None
+
+    # ---------------------- Readings ---------------------- #
+
+    def _load_frame(self, t_ns: int) -> Tuple[int, int, int, int]:
+        year = time.gmtime(t_ns // NS_PER_SECOND).tm_year
+        equinox_ns = datetime_to_ns(self.equinox_source(year))
+        if t_ns < equinox_ns:
+            year -= 1
+            equinox_ns = datetime_to_ns(self.equinox_source(year))
+        next_equinox_ns = datetime_to_ns(self.equinox_source(year + 1))
+        # Re-read once per miliDies so background refinements are picked up
+        return year, equinox_ns, next_equinox_ns, next_boundary_ns(t_ns, MILIDIES_NS)
+
+    def _request_frame(self, t_ns: int) -> None:
+        if not self._frame_requested:
+            self._frame_requested = True
+            self.worker.submit(self._load_frame, t_ns, callback=self._on_frame,
+                               error_callback=self._on_frame_error)
+
+    def _on_frame(self, frame: Tuple[int, int, int, int]) -> None:
+        self._frame_requested = False
+        self._frame = frame
+
+    def _on_frame_error(self, error: Exception) -> None:
+        self._frame_requested = False
+        print(f"⚠️ Equinox frame unavailable: {error}")
+
+    def reading_at(self, t_ns: int) -> Optional[BeaconReading]:
+        """
+        Reading at synchronized UTC t_ns (equinoxes looked up once per miliDies).
+
+        With a worker, None while the frame for t_ns is still being loaded.
+        """
+        frame = self._frame
+        if frame is None or not frame[1] <= t_ns < frame[2]:
+            if self.worker is not None:
+                self._request_frame(t_ns)
+                return None
+            frame = self._frame = self._load_frame(t_ns)
+        elif t_ns >= frame[3]:
+            if self.worker is not None:
+                self._request_frame(t_ns)  # keep using the current frame meanwhile
+            else:
+                frame = self._frame = self._load_frame(t_ns)
+        frame_year, equinox_ns, next_equinox_ns, _ = frame
+        dies, miliDies, mikroDies = reading_at(t_ns, equinox_ns)
+        return BeaconReading(
+            frame_year=frame_year, dies=dies, miliDies=miliDies, mikroDies=mikroDies,
+            utc_ns=t_ns, equinox_ns=equinox_ns, next_equinox_ns=next_equinox_ns
+        )
+
+    def delay_ms(self, now_ns: int, period_ns: Optional[int] = None) -> int:
+        """Milliseconds from now_ns until just after the next period boundary."""
+        period_ns = period_ns or self.cadence_ns or self.period_ns
+        return (next_boundary_ns(now_ns, period_ns) - now_ns) // NS_PER_MS + 1
+
+    # ---------------------- Loop ---------------------- #
+
+    def tick(self) -> Optional[BeaconReading]:
+        """Compute the current reading and publish it to every subscriber."""
+        tick_trace.begin("tick")
+        try:
+            if self.beacon_client is not None:
+                reading = self.beacon_client.reading()
+                tick_trace.mark("clock")
+                if reading is None:
+                    # No beacon packet yet; windows keep their current display
+                    return None
+            else:
+                t_ns = self.clock_ns()
+                tick_trace.mark("clock")
+                reading = self.reading_at(t_ns)
+                tick_trace.mark("reading")
+                if reading is None:
+                    return None  # frame still loading on the worker
+            if _metrics.enabled:
+                since_boundary = (reading.utc_ns - NOON_NS) % (self.cadence_ns or self.period_ns)
+                UI_TICK_LATENESS_SECONDS.observe(since_boundary / 1e9)
+            self.latest = reading
+            self._publish(reading)
+            return reading
+        except Exception as e:
+            tick_trace.fail(e)
+            print(f"⚠️ Tick error: {e}")
+            return None
+        finally:
+            tick_trace.end()
+
+    def _publish(self, reading: BeaconReading) -> None:
+        for subscription in list(self._subscribers):
+            if subscription.period_ns is None:
+                continue
+            index = (reading.utc_ns - NOON_NS) // subscription.period_ns
+            if index == subscription.last_index:
+                continue  # this window's unit has not changed
+            subscription.last_index = index
+            name, callback = subscription.name, subscription.callback
+            start = time.perf_counter() if _metrics.enabled else 0.0
+            try:
+                callback(reading)
+            except tk.TclError:
+                # Window destroyed without unsubscribing
+                self.unsubscribe(callback)
+            except Exception as e:
+                tick_trace.fail(e)
+                print(f"⚠️ {name} update error: {e}")
+            tick_trace.mark(name)
+            if start:
+                UI_TICK_SECONDS.labels(window=name).observe(time.perf_counter() - start)
+
+    def _run(self) -> None:
+        self._job = None
+        if self.cadence_ns is None:
+            return  # nothing visible; set_period/subscribe restart the loop
+        mono_start = time.monotonic_ns()
+        reading = self.tick()
+        cadence_ns = self.cadence_ns
+        if cadence_ns is None:
+            return
+        if reading is None:
+            delay = self.period_ns // NS_PER_MS
+        else:
+            now_ns = reading.utc_ns + (time.monotonic_ns() - mono_start)
+            delay = self.delay_ms(now_ns, cadence_ns)
+        try:
+            self._job = self.master.after(delay, self._run)
+        except tk.TclError:
+            self._job = None  # master destroyed
+
+    def _reschedule(self) -> None:
+        """Tick now so a shorter cadence or a newly shown window takes effect at once."""
+        self.stop()
+        if self.cadence_ns is not None:
+            self.start()
+
+    def start(self) -> None:
+        """Start ticking (idempotent); the first tick runs from the event loop."""
+        if self._job is None:
+            try:
+                self._job = self.master.after_idle(self._run)
+            except tk.TclError:
+                self._job = None  # master destroyed
+
+    def stop(self) -> None:
+        if self._job is not None:
+            try:
+                self.master.after_cancel(self._job)
+            except tk.TclError:
+                pass
+            self._job = None
+
+    @property
+    def running(self) -> bool:
+        return self._job is not None
+
+
+__all__ = ["TickScheduler", "TickCallback", "countdown"]
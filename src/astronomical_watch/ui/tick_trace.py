@@ -0,0 +1,271 @@
+"""
+Opt-in per-phase tracing of the UI update ticks.
+
+Set ASTRON_TICK_TRACE=1 to record, for every tick of the shared scheduler,
+how long each phase took (clock read, reading, then each window's render,
+e.g. widget.redraw, normal.labels) into a bounded ring buffer. Ticks longer
+than one mikroDies (86.4 ms) are counted and reported as overruns. The buffer is written as Chrome trace JSON
+(chrome://tracing or https://ui.perfetto.dev) on exit, on SIGUSR1 where the
+platform has it, or by calling dump().
+
+Update loops call the module functions below; with tracing off they return
+immediately, so the hooks cost one global lookup per call site.
+
+    tick_trace.begin("widget")
+    now = read_clock()
+    tick_trace.mark("clock")       # time since begin() is the "clock" phase
+    ...
+    tick_trace.end()
+"""
+from __future__ import annotations
+import atexit
+import json
+import os
+import signal
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+TRACE_ENV = "ASTRON_TICK_TRACE"
+TRACE_FILE_ENV = "ASTRON_TICK_TRACE_FILE"
+
+TICK_BUDGET_S = 0.0864          # one mikroDies
+DEFAULT_CAPACITY = 4096         # ticks kept (about 6 minutes at one tick per mikroDies)
+REPORT_INTERVAL_S = 5.0         # minimum time between overrun messages
+
+
+@dataclass
+class TickRecord:
+    """Timings of one tick (perf_counter nanoseconds)."""
+    window: str
+    start_ns: int
+    end_ns: int = 0
+    phases: List[Tuple[str, int, int]] = field(default_factory=list)  # (name, start, end)
+    error: Optional[str] = None
+
+    @property
+    def duration_s(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def slowest_phase(self) -> Optional[Tuple[str, float]]:
+        if not self.phases:
+            return None
+        name, start, end = max(self.phases, key=lambda p: p[2] - p[1])
+        return name, (end - start) / 1e9
+
+
+class TickTracer:
+    """Ring buffer of TickRecords with overrun detection and Chrome trace export."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        budget_s: float = TICK_BUDGET_S,
+        clock_ns: Callable[[], int] = time.perf_counter_ns,
+        report: Optional[Callable[[str], None]] = print
+    ):
+        self.budget_ns = int(budget_s * 1e9)
+        self.ticks: Deque[TickRecord] = deque(maxlen=capacity)
+        self.overruns: Dict[str, int] = {}
+        self._clock_ns = clock_ns
+        self._report = report
+        self._current: Optional[TickRecord] = None
+        self._last_mark_ns = 0
+        self._last_report_ns: Optional[int] = None
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def begin(self, window: str) -> None:
+        now = self._clock_ns()
+        self._current = TickRecord(window, now)
+        self._last_mark_ns = now
+
+    def mark(self, phase: str) -> None:
+        """Close the phase that started at the previous mark (or begin)."""
+        tick = self._current
+        if tick is None:
+            return
+        now = self._clock_ns()
+        tick.phases.append((phase, self._last_mark_ns, now))
+        self._last_mark_ns = now
+
+    def fail(self, error: BaseException) -> None:
+        if self._current is not None:
+            self._current.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> Optional[TickRecord]:
+        tick = self._current
+        if tick is None:
+            return None
+        self._current = None
+        tick.end_ns = self._clock_ns()
+        with self._lock:
+            self.ticks.append(tick)
+        if tick.end_ns - tick.start_ns > self.budget_ns:
+            self.overruns[tick.window] = self.overruns.get(tick.window, 0) + 1
+            self._report_overrun(tick)
+        return tick
+
+    def _report_overrun(self, tick: TickRecord) -> None:
+        if self._report is None:
+            return
+        interval_ns = int(REPORT_INTERVAL_S * 1e9)
+        if self._last_report_ns is not None and tick.end_ns - self._last_report_ns < interval_ns:
+            self._suppressed += 1
+            return
+        slowest = tick.slowest_phase()
+        detail = f", {slowest[0]} {slowest[1] * 1e3:.1f} ms" if slowest else ""
+        more = f" (+{self._suppressed} more since last report)" if self._suppressed else ""
+        self._report(
+            f"⚠️  {tick.window} tick overran: {tick.duration_s * 1e3:.1f} ms"
+            f" > {self.budget_ns / 1e6:.1f} ms{detail}{more}"
+        )
+        self._last_report_ns = tick.end_ns
+        self._suppressed = 0
+
+    def snapshot(self) -> List[TickRecord]:
+        with self._lock:
+            return list(self.ticks)
+
+    def chrome_trace(self) -> dict:
+        """Recorded ticks as a Chrome trace ("X" events, one thread per window)."""
+        pid = os.getpid()
+        threads: Dict[str, int] = {}
+        events: List[dict] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "Astronomical Watch UI"}}
+        ]
+        for tick in self.snapshot():
+            tid = threads.get(tick.window)
+            if tid is None:
+                tid = threads[tick.window] = len(threads) + 1
+                events.append({
+                    "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                    "args": {"name": tick.window},
+                })
+            overrun = tick.end_ns - tick.start_ns > self.budget_ns
+            args = {"overrun": overrun}
+            if tick.error:
+                args["error"] = tick.error
+            events.append({
+                "name": "tick", "cat": tick.window, "ph": "X", "pid": pid, "tid": tid,
+                "ts": tick.start_ns / 1e3, "dur": (tick.end_ns - tick.start_ns) / 1e3,
+                "args": args,
+            })
+            for name, start, end in tick.phases:
+                events.append({
+                    "name": name, "cat": tick.window, "ph": "X", "pid": pid, "tid": tid,
+                    "ts": start / 1e3, "dur": (end - start) / 1e3,
+                })
+            if overrun:
+                events.append({
+                    "name": "overrun", "cat": tick.window, "ph": "i", "s": "t",
+                    "pid": pid, "tid": tid, "ts": tick.end_ns / 1e3,
+                })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "budget_ms": self.budget_ns / 1e6,
+                "overruns": dict(self.overruns),
+            },
+        }
+
+    def dump(self, path: Optional[str] = None) -> str:
+        path = path or default_trace_path()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+
+def default_trace_path() -> str:
+    return os.environ.get(TRACE_FILE_ENV) or os.path.join(
+        tempfile.gettempdir(), f"awatch-tick-trace-{os.getpid()}.json"
+    )
+
+
+# ---------------------- Process-wide tracer ---------------------- #
+
+_tracer: Optional[TickTracer] = None
+
+
+def enable(**kwargs) -> TickTracer:
+    """Start tracing (idempotent); dumps on exit and, where available, on SIGUSR1."""
+    global _tracer
+    if _tracer is None:
+        _tracer = TickTracer(**kwargs)
+        atexit.register(_dump_at_exit)
+        if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, lambda signum, frame: _dump_on_signal())
+    return _tracer
+
+
+def disable() -> None:
+    global _tracer
+    _tracer = None
+
+
+def get_tracer() -> Optional[TickTracer]:
+    return _tracer
+
+
+def begin(window: str) -> None:
+    if _tracer is not None:
+        _tracer.begin(window)
+
+
+def mark(phase: str) -> None:
+    if _tracer is not None:
+        _tracer.mark(phase)
+
+
+def fail(error: BaseException) -> None:
+    if _tracer is not None:
+        _tracer.fail(error)
+
+
+def end() -> None:
+    if _tracer is not None:
+        _tracer.end()
+
+
+def dump(path: Optional[str] = None) -> Optional[str]:
+    """Write the Chrome trace; returns its path (None if tracing is off)."""
+    if _tracer is None:
+        return None
+    return _tracer.dump(path)
+
+
+def _dump_on_signal() -> None:
+    path = dump()
+    if path:
+        print(f"🧭 Tick trace written to {path}")
+
+
+def _dump_at_exit() -> None:
+    if _tracer is not None and _tracer.ticks:
+        _dump_on_signal()
+
+
+if os.environ.get(TRACE_ENV, "").lower() not in ("", "0", "false", "no"):
+    enable()
+
+
+__all__ = [
+    "TRACE_ENV",
+    "TRACE_FILE_ENV",
+    "TICK_BUDGET_S",
+    "TickRecord",
+    "TickTracer",
+    "enable",
+    "disable",
+    "get_tracer",
+    "begin",
+    "mark",
+    "fail",
+    "end",
+    "dump",
+    "default_trace_path",
+]
@@ -60,6 +60,7 @@ TRANSLATIONS = {
         "always_on_top": "Keep widget always on top",
         "load_on_startup": "Load widget on system startup",
         "transparent_bg": "Transparent background (hover to show)",
+        "show_mikrodies": "Show mikroDies progress bar",
         "app_info": "Application Info",
         "version": "Version:",
         "python": "Python:",
@@ -131,6 +132,7 @@ TRANSLATIONS = {
             "always_on_top": "Drži widget uvek na vrhu",
             "load_on_startup": "Učitaj widget pri pokretanju sistema",
             "transparent_bg": "Transparentna pozadina (hover za prikaz)",
+            "show_mikrodies": "Prikaži traku mikroDies",
             "app_info": "Informacije o aplikaciji",
             "version": "Verzija:",
             "python": "Python:",
@@ -4,36 +4,22 @@ Astronomical Watch Widget - Small corner display
 from __future__ import annotations
 import os
 import tkinter as tk
-from datetime import datetime, timezone
 from typing import Optional, Callable
 import random
 import math
-from .gradient import get_sky_theme
-from .theme_manager import update_shared_theme, get_shared_theme
+from . import theme_manager
 from .translations import tr
+from . import tick_trace
+from .tick_scheduler import TickScheduler, countdown
+from ..core.astro_time_core import MIKRODIES_NS, MILIDIES_NS
 
-from astronomical_watch.core.astro_time_core import AstroYear
+# Black outline: the text drawn at the 8 surrounding one-pixel offsets
+_OUTLINE_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
 
 
-def _get_current_utc_time() -> datetime:
-    """
-    Get current UTC time with optional NTP synchronization.
-    
-    Returns:
-        Current UTC datetime, adjusted by NTP offset if available
-    """
-    try:
-        from astronomical_watch.net.time_sync import now_utc
-        return now_utc(use_ntp=True)
-    except ImportError:
-        # Fallback to system time if time_sync module not available
-        return datetime.now(timezone.utc)
-    except Exception:
-        # Any other error, fallback to system time
-        return datetime.now(timezone.utc)
-
 class AstronomicalWidgetMode:
-    def __init__(self, master: tk.Widget = None, on_click_callback: Optional[Callable] = None):
+    def __init__(self, master: tk.Widget = None, on_click_callback: Optional[Callable] = None,
+                 beacon_client=None, scheduler=None):
         self.master = master or tk.Tk()
         self.master.title("Astronomical Watch - Widget")
         self.master.geometry("140x70")
@@ -84,6 +70,9 @@ class AstronomicalWidgetMode:
         # Store callback for click events
         self.on_click_callback = on_click_callback
         
+        # Thin-client mode: readings come from a time beacon, nothing computed here
+        self.beacon_client = beacon_client
+        
         # Current time values
         self.dies = 0
         self.miliDies = 0
@@ -95,13 +84,17 @@ class AstronomicalWidgetMode:
         # Theme time caching for consistency across windows
         self._last_theme_time = None
         
-        # Update job reference
-        self.update_job = None
+        # Shared tick scheduler (created by start_updates if not given)
+        self.scheduler = scheduler
         
         # Transparency mode state
         self._transparent_mode = False
         self._is_hovered = False
         
+        # What is on screen decides the update cadence (see _visible_period)
+        self._show_mikrodies = True
+        self._mapped = True
+        
         # Fireworks state
         self.fireworks_active = False
         self.fireworks_particles = []
@@ -116,6 +109,10 @@ class AstronomicalWidgetMode:
         # Bind click event to entire widget
         self._bind_click_events()
         
+        # Pause updates while minimized / withdrawn
+        self.master.bind("<Map>", self._on_map_change, add="+")
+        self.master.bind("<Unmap>", self._on_map_change, add="+")
+        
     def _create_widgets(self):
         """Create minimalistic UI elements - only numbers and progress bar."""
         # Main frame with minimal padding
@@ -136,6 +133,10 @@ class AstronomicalWidgetMode:
         # Store original background for theme switching
         self._original_bg = None
         
+        # Canvas items are created once; this is what they currently show
+        self._drawn_state = None
+        self._particle_items = []
+        
         # Create context menu
         self._create_context_menu()
         
@@ -276,6 +277,7 @@ class AstronomicalWidgetMode:
                     self.master.attributes('-alpha', 1.0)
                 except:
                     pass
+            self._update_cadence()
             self._apply_theme_temporary()
     
     def _on_mouse_leave(self, event):
@@ -284,15 +286,13 @@ class AstronomicalWidgetMode:
         print(f"🖱️ Mouse LEAVE, transparent_mode={self._transparent_mode}")
         if self._transparent_mode:
             # Return to transparent mode
+            self._update_cadence()
             self._make_transparent()
             
-    def _apply_theme(self):
-        """Apply solid color theme based on current time."""
-        # Always update shared theme for all windows (even in transparent mode)
-        from .theme_manager import update_shared_theme
-        theme = update_shared_theme()
-        now_local = datetime.now()
-        self._last_theme_time = now_local  # Cache for consistency across windows
+    def _apply_theme(self, theme=None):
+        """Apply solid color theme (theme bus callback; default: the current shared theme)."""
+        theme = theme or theme_manager.get_shared_theme()
+        self._last_theme_time = theme_manager.get_shared_theme_time()
         
         # In transparent mode: only update time display, skip background rendering
         if self._transparent_mode and not self._is_hovered:
@@ -315,8 +315,7 @@ class AstronomicalWidgetMode:
         except:
             pass
             
-        now_utc = _get_current_utc_time()
-        theme = get_sky_theme(now_utc)
+        theme = theme_manager.get_shared_theme()
         bg_color = theme.top_color
         
         self.master.configure(bg=bg_color)
@@ -328,7 +327,6 @@ class AstronomicalWidgetMode:
     def _make_transparent(self):
         """Make widget background transparent - cross-platform implementation."""
         import platform
-        from datetime import datetime, timezone
         
         system = platform.system()
         print(f"🔍 _make_transparent called, platform: {system}")
@@ -348,8 +346,7 @@ class AstronomicalWidgetMode:
             # Linux/macOS: Use semi-transparent sky theme
             try:
                 # Get current sky theme
-                now_utc = _get_current_utc_time()
-                theme = get_sky_theme(now_utc)
+                theme = theme_manager.get_shared_theme()
                 
                 # Apply sky gradient background
                 self.master.configure(bg=theme.top_color)
@@ -369,6 +366,7 @@ class AstronomicalWidgetMode:
         """Enable or disable transparent background mode - cross-platform."""
         import platform
         self._transparent_mode = enabled
+        self._update_cadence()
         
         print(f"🎨 set_transparent_mode: enabled={enabled}, hovered={self._is_hovered}, platform={platform.system()}")
         
@@ -395,8 +393,7 @@ class AstronomicalWidgetMode:
                     pass
             
             # Force theme update
-            now_utc = _get_current_utc_time()
-            theme = get_sky_theme(now_utc)
+            theme = theme_manager.get_shared_theme()
             bg_color = theme.top_color
             self.master.configure(bg=bg_color)
             self.frame.configure(bg=bg_color)
@@ -404,11 +401,8 @@ class AstronomicalWidgetMode:
             self._draw_time_display()
         
     def _draw_time_display(self):
-        """Draw time text with black outline on canvas for better visibility."""
+        """Update the persistent canvas items; nothing is touched if no visible value changed."""
         try:
-            # Clear canvas
-            self.canvas.delete("all")
-            
             # Get canvas dimensions
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
@@ -420,139 +414,105 @@ class AstronomicalWidgetMode:
             # Current time text
             time_str = f"{self.dies:03d}.{self.miliDies:03d}"
             
-            # Font configuration for smaller widget
-            try:
-                font_spec = ("DejaVu Sans Mono", 16, "bold")
-            except:
-                font_spec = ("Courier New", 16, "bold")
-            
-            # Position for time text (upper part of canvas)
-            x_center = canvas_width // 2
-            y_time = 20  # Upper position for time
-            
-            # Draw black outline (multiple offset positions)
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:  # Skip center
-                        self.canvas.create_text(
-                            x_center + dx, y_time + dy,
-                            text=time_str,
-                            font=font_spec,
-                            fill="black",
-                            anchor="center"
-                        )
-            
-            # Draw white text on top
-            self.canvas.create_text(
-                x_center, y_time,
-                text=time_str,
-                font=font_spec,
-                fill="white",
-                anchor="center"
-            )
-            
             # Show countdown if < 11 dies remaining
+            countdown_str = None
             if hasattr(self, 'remaining_dies') and self.remaining_dies < 11:
                 countdown_str = tr("countdown_label", self.current_language, 
                                   dies=self.remaining_dies, milidies=self.remaining_milidies)
-                countdown_font = ("Arial", 8)
-                y_countdown = 38
-                
-                # Draw countdown with outline
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx != 0 or dy != 0:
-                            self.canvas.create_text(
-                                x_center + dx, y_countdown + dy,
-                                text=countdown_str,
-                                font=countdown_font,
-                                fill="black",
-                                anchor="center"
-                            )
-                
-                self.canvas.create_text(
-                    x_center, y_countdown,
-                    text=countdown_str,
-                    font=countdown_font,
-                    fill="#FFD700",  # Gold color for countdown
-                    anchor="center"
-                )
             
-            # Draw progress bar in lower part
-            self._draw_progress_bar()
+            # Progress bar in lower part (None while hidden)
+            progress_width = None
+            if self._mikrodies_visible():
+                progress_width = int((canvas_width - 20) * self.mikroDies / 999.0)
+            
+            state = (canvas_width, canvas_height, time_str, countdown_str, progress_width)
+            drawn = self._drawn_state
+            if state == drawn:
+                return
+            if drawn is None:
+                self._create_display_items()
+                drawn = (None,) * len(state)
+            
+            if (canvas_width, canvas_height) != drawn[:2]:
+                self._layout_display_items(canvas_width, canvas_height)
+            if time_str != drawn[2]:
+                self.canvas.itemconfigure("time", text=time_str)
+            if countdown_str != drawn[3]:
+                if countdown_str is None:
+                    self.canvas.itemconfigure("countdown", state="hidden")
+                else:
+                    self.canvas.itemconfigure("countdown", text=countdown_str, state="normal")
+            if progress_width != drawn[4] or (canvas_width, canvas_height) != drawn[:2]:
+                self._draw_progress_bar(progress_width)
+            self._drawn_state = state
             
         except Exception as e:
             print(f"Time display drawing error: {e}")
             
-    def _draw_progress_bar(self):
-        """Draw mikroDies progress bar on canvas."""
-        try:
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            # Progress bar dimensions
-            bar_width = canvas_width - 20  # 10px margins
-            bar_height = 8
-            bar_x = 10
-            bar_y = canvas_height - 20  # Near bottom
-            
-            # Calculate progress (0-999 mikroDies)
-            progress = self.mikroDies / 999.0
-            
-            # Draw background bar (dark gray)
-            self.canvas.create_rectangle(
-                bar_x, bar_y, bar_x + bar_width, bar_y + bar_height,
-                fill="gray20", outline="gray40"
-            )
-            
-            # Draw progress bar (YellowGreen)
-            progress_width = int(bar_width * progress)
-            if progress_width > 0:
-                self.canvas.create_rectangle(
-                    bar_x, bar_y, bar_x + progress_width, bar_y + bar_height,
-                    fill="#9ACD32", outline=""
-                )
-                
-        except Exception as e:
-            print(f"Progress bar drawing error: {e}")
+    def _create_display_items(self):
+        """Create the time, countdown and progress bar items once (laid out later)."""
+        # Font configuration for smaller widget
+        font_spec = ("DejaVu Sans Mono", 16, "bold")
+        countdown_font = ("Arial", 8)
+        
+        # Black outline (8 offset copies) under the white / gold text
+        for tag, font_, fill in (("time", font_spec, "white"),
+                                 ("countdown", countdown_font, "#FFD700")):
+            for _ in _OUTLINE_OFFSETS:
+                self.canvas.create_text(0, 0, text="", font=font_, fill="black", anchor="center",
+                                        tags=(tag, f"{tag}_outline"))
+            self.canvas.create_text(0, 0, text="", font=font_, fill=fill, anchor="center",
+                                    tags=(tag, f"{tag}_text"))
+        self.canvas.itemconfigure("countdown", state="hidden")
+        
+        # Progress bar: background (dark gray) and fill (YellowGreen)
+        self.canvas.create_rectangle(0, 0, 0, 0, fill="gray20", outline="gray40",
+                                     tags=("bar", "bar_bg"))
+        self.canvas.create_rectangle(0, 0, 0, 0, fill="#9ACD32", outline="",
+                                     tags=("bar", "bar_fill"))
+        
+    def _layout_display_items(self, canvas_width: int, canvas_height: int):
+        """Position the persistent items for the current canvas size."""
+        x_center = canvas_width // 2
+        for tag, y in (("time", 20), ("countdown", 38)):  # upper part of canvas
+            outline = self.canvas.find_withtag(f"{tag}_outline")
+            for item, (dx, dy) in zip(outline, _OUTLINE_OFFSETS):
+                self.canvas.coords(item, x_center + dx, y + dy)
+            self.canvas.coords(f"{tag}_text", x_center, y)
+        
+        # Progress bar dimensions (10px margins, near bottom)
+        bar_x, bar_y = 10, canvas_height - 20
+        self.canvas.coords("bar_bg", bar_x, bar_y, canvas_width - 10, bar_y + 8)
+            
+    def _draw_progress_bar(self, progress_width: Optional[int]):
+        """Show the mikroDies progress bar with the given fill width (None hides it)."""
+        if progress_width is None:
+            self.canvas.itemconfigure("bar", state="hidden")
+            return
+        
+        bar_x, bar_y = 10, self.canvas.winfo_height() - 20
+        self.canvas.itemconfigure("bar_bg", state="normal")
+        if progress_width > 0:
+            self.canvas.coords("bar_fill", bar_x, bar_y, bar_x + progress_width, bar_y + 8)
+            self.canvas.itemconfigure("bar_fill", state="normal")
+        else:
+            self.canvas.itemconfigure("bar_fill", state="hidden")
         
     def _update_display(self):
-        """Update the astronomical time display."""
+        """Re-render the latest reading (e.g. after a language change)."""
+        if self.scheduler is not None and self.scheduler.latest is not None:
+            self._on_tick(self.scheduler.latest)
+    
+    def _on_tick(self, reading):
+        """Render one reading published by the tick scheduler."""
         try:
-            from ..core.equinox import compute_vernal_equinox
-            
-            # Get current time (with NTP sync if available)
-            now_utc = _get_current_utc_time()
-            
-            # Use computed equinox values
-            current_year = now_utc.year
-            current_equinox = compute_vernal_equinox(current_year)
-            next_equinox = compute_vernal_equinox(current_year + 1)
-            
-            # Check if we're before this year's equinox
-            if now_utc < current_equinox:
-                current_equinox = compute_vernal_equinox(current_year - 1)
-                next_equinox = compute_vernal_equinox(current_year)
-            
-            # Create AstroYear and get reading
-            astro_year = AstroYear(current_equinox, next_equinox)
-            reading = astro_year.reading(now_utc)
-            
             # Update display values
             self.dies = reading.dies
             self.miliDies = reading.miliDies
             self.mikroDies = reading.mikroDies
             
             # Calculate countdown to next equinox
-            year_length_seconds = (next_equinox - current_equinox).total_seconds()
-            year_length_dies = int(year_length_seconds / 86400.0)
-            
-            self.remaining_dies = year_length_dies - self.dies
-            self.remaining_milidies = 1000 - self.miliDies
-            
-            if self.remaining_milidies == 1000:
-                self.remaining_milidies = 0
-                self.remaining_dies += 1
+            self.remaining_dies, self.remaining_milidies = countdown(reading)
             
             # Check for equinox moment (Dies 000, miliDies 000-005)
             if self.dies == 0 and self.miliDies < 5 and not self.fireworks_active:
@@ -560,10 +520,14 @@ class AstronomicalWidgetMode:
             elif self.dies > 0 and self.fireworks_active:
                 self._stop_fireworks()
             
-            # Update theme (this will redraw time display)
-            self._apply_theme()
+            # Theme changes arrive from the theme bus; only the values are redrawn here
+            self._draw_time_display()
+            tick_trace.mark("widget.redraw")
             
+        except tk.TclError:
+            raise
         except Exception as e:
+            tick_trace.fail(e)
             print(f"Widget update error: {e}")
             # Fallback display
             self.dies = 0
@@ -587,6 +551,26 @@ class AstronomicalWidgetMode:
             self.fireworks_job = None
         self.fireworks_active = False
         self.fireworks_particles = []
+        self._draw_particles()
+    
+    def _draw_particles(self):
+        """Move pooled oval items onto the particles; spare ovals are hidden."""
+        while len(self._particle_items) < len(self.fireworks_particles):
+            self._particle_items.append(
+                self.canvas.create_oval(0, 0, 0, 0, outline="", tags=("fireworks",))
+            )
+        self.canvas.tag_raise("fireworks")
+        for item, particle in zip(self._particle_items, self.fireworks_particles):
+            alpha = particle['life'] / 30.0
+            size = max(1, int(particle['size'] * alpha))
+            self.canvas.coords(
+                item,
+                particle['x'] - size, particle['y'] - size,
+                particle['x'] + size, particle['y'] + size
+            )
+            self.canvas.itemconfigure(item, fill=particle['color'], state="normal")
+        for item in self._particle_items[len(self.fireworks_particles):]:
+            self.canvas.itemconfigure(item, state="hidden")
     
     def _create_firework(self):
         """Create a new firework burst"""
@@ -643,19 +627,8 @@ class AstronomicalWidgetMode:
             if particle['life'] <= 0 or particle['y'] > canvas_height:
                 self.fireworks_particles.remove(particle)
         
-        # Redraw display with particles
-        self._draw_time_display()
-        
         # Draw fireworks particles on top
-        for particle in self.fireworks_particles:
-            alpha = particle['life'] / 30.0
-            size = max(1, int(particle['size'] * alpha))
-            self.canvas.create_oval(
-                particle['x'] - size, particle['y'] - size,
-                particle['x'] + size, particle['y'] + size,
-                fill=particle['color'],
-                outline=""
-            )
+        self._draw_particles()
         
         # Schedule next frame
         self.fireworks_job = self.master.after(50, self._animate_fireworks)  # ~20 FPS
@@ -691,6 +664,12 @@ class AstronomicalWidgetMode:
         if "transparent_background" in settings:
             self.set_transparent_mode(settings["transparent_background"])
         
+        # mikroDies progress bar (hidden: update once per miliDies)
+        if "show_mikrodies" in settings:
+            self._show_mikrodies = bool(settings["show_mikrodies"])
+            self._update_cadence()
+            self._draw_time_display()
+        
         # Position
         if "widget_position" in settings:
             pos = settings["widget_position"]
@@ -724,10 +703,31 @@ class AstronomicalWidgetMode:
             print(f"⚠️ Failed to save widget position: {e}")
             
     def start_updates(self):
-        """Start the periodic update cycle."""
-        self._update_display()
-        # Schedule next update in 86.4 ms (one mikroDies duration)
-        self.update_job = self.master.after(86, self.start_updates)  # 86.4ms ≈ 86ms
+        """Render ticks of the shared scheduler (own scheduler if none given)."""
+        if self.scheduler is None:
+            self.scheduler = TickScheduler(self.master, beacon_client=self.beacon_client)
+        self.scheduler.subscribe(self._on_tick, "widget", self._visible_period())
+        theme_manager.subscribe(self._apply_theme)
+        theme_manager.start(self.master)
+        
+    def _mikrodies_visible(self) -> bool:
+        """The progress bar is the only mikroDies display; transparent mode hides it until hover."""
+        return self._show_mikrodies and not (self._transparent_mode and not self._is_hovered)
+        
+    def _visible_period(self) -> Optional[int]:
+        """Finest unit on screen: mikroDies, miliDies (DDD.mmm only) or None while unmapped."""
+        if not self._mapped:
+            return None
+        return MIKRODIES_NS if self._mikrodies_visible() else MILIDIES_NS
+        
+    def _update_cadence(self):
+        if self.scheduler is not None:
+            self.scheduler.set_period(self._on_tick, self._visible_period())
+            
+    def _on_map_change(self, event):
+        if event.widget is self.master:
+            self._mapped = event.type == tk.EventType.Map
+            self._update_cadence()
         
     def _ensure_visibility(self):
         """Ensure widget remains in proper state (only if always_on_top is enabled)."""
@@ -742,13 +742,17 @@ class AstronomicalWidgetMode:
         
     def stop_updates(self):
         """Stop the periodic updates."""
-        if self.update_job:
-            self.master.after_cancel(self.update_job)
-            self.update_job = None
+        if self.scheduler is not None:
+            self.scheduler.unsubscribe(self._on_tick)
+        theme_manager.unsubscribe(self._apply_theme)
 
-def create_widget(master: tk.Widget = None, on_click_callback: Optional[Callable] = None) -> AstronomicalWidgetMode:
-    """Factory function to create widget instance."""
-    return AstronomicalWidgetMode(master, on_click_callback)
+def create_widget(master: tk.Widget = None, on_click_callback: Optional[Callable] = None,
+                  beacon_client=None, scheduler=None) -> AstronomicalWidgetMode:
+    """
+    Factory function to create widget instance (beacon_client: optional BeaconClient,
+    scheduler: shared TickScheduler).
+    """
+    return AstronomicalWidgetMode(master, on_click_callback, beacon_client, scheduler)
 
 if __name__ == "__main__":
     # Test the widget
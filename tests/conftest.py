@@ -0,0 +1,17 @@
+"""
+Shared fixtures for the test suite.
+"""
+import pytest
+
+from astronomical_watch.core.equinox import compute_vernal_equinox
+
+
+def _core_source(year):
+    return {"datetime": compute_vernal_equinox(year), "precision": "approx",
+            "uncertainty_s": 10800.0}
+
+
+@pytest.fixture
+def core_source():
+    """Equinox source (service result format) backed by the core solver."""
+    return _core_source
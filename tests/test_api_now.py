@@ -1,4 +1,5 @@
 import re
+import struct
 from fastapi.testclient import TestClient
 
 from web.app import app
@@ -20,7 +21,10 @@ def test_api_now_basic():
         assert key in data, f"Missing key {key}"
     assert data["utc_iso"].endswith("Z")
     assert 0 <= data["miliDies"] <= 999
-    assert re.match(r"^\d{4}eq:000\.\d{3}$", data["timestamp_proposed"])
+    assert re.match(r"^\d{4}eq:\d{3}\.\d{3}$", data["timestamp_proposed"])
+    assert data["timestamp_proposed"] == (
+        f"{data['frame_year']}eq:{data['day_index']:03d}.{data['miliDies']:03d}"
+    )
 
 
 def test_api_now_with_longitude():
@@ -40,3 +44,42 @@ def test_api_equinox_not_implemented_or_ok():
         assert "equinox_utc" in data
     else:
         assert r.status_code in (501, 500)
+
+
+def test_api_convert_json_and_reverse_roundtrip():
+    r = client.post("/api/convert", json=["2025-06-01T12:00:00Z", 1_750_000_000_000_000_000])
+    assert r.status_code == 200
+    data = r.json()
+    assert data["fields"] == ["frame_year", "dies", "miliDies", "mikroDies"]
+    assert len(data["rows"]) == 2
+
+    frame_year, dies, miliDies, _ = data["rows"][0]
+    r = client.post("/api/convert/reverse", json=[[frame_year, dies, miliDies]])
+    assert r.status_code == 200
+    utc_ns, utc_iso = r.json()["rows"][0]
+    assert utc_iso.startswith("2025-06-01T")
+
+
+def test_api_convert_binary():
+    body = struct.pack("<3q", 1_700_000_000_000_000_000, 1_710_000_000_000_000_000, 0)
+    r = client.post(
+        "/api/convert", content=body,
+        headers={"Content-Type": "application/octet-stream", "Accept": "application/octet-stream"},
+    )
+    assert r.status_code == 200
+    rows = struct.unpack("<12i", r.content)
+    assert rows[0] == 2023 and rows[8] == 1969
+
+
+def test_api_convert_rejects_bad_input():
+    assert client.post("/api/convert", content=b"{}").status_code == 400
+    assert client.post("/api/convert/reverse", json=[[2025, -1, 0]]).status_code == 422
+
+
+def test_api_ws_streams_readings():
+    with client.websocket_connect("/api/ws?resolution=mikroDies") as ws:
+        first = ws.receive_json()
+        second = ws.receive_json()
+    for data in (first, second):
+        assert 0 <= data["mikroDies"] <= 999
+        assert re.match(r"^\d{4}eq:\d{3}\.\d{3}$", data["timestamp_proposed"])
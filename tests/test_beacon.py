@@ -0,0 +1,180 @@
+"""
+Tests for the LAN time beacon (packet format, extrapolation, loopback delivery).
+"""
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from astronomical_watch.core.astro_time_core import AstroYear
+from astronomical_watch.net.beacon import (
+    DAY_NS,
+    MILIDIES_NS,
+    PACKET,
+    BeaconClient,
+    BeaconError,
+    BeaconPacket,
+    BeaconServer,
+    datetime_to_ns,
+    next_boundary_ns,
+    reading_at,
+)
+
+EQ_2025 = datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc)
+EQ_2026 = datetime(2026, 3, 20, 14, 46, 0, tzinfo=timezone.utc)
+EQUINOXES = {
+    2024: datetime(2024, 3, 20, 3, 6, 0, tzinfo=timezone.utc),
+    2025: EQ_2025,
+    2026: EQ_2026,
+    2027: datetime(2027, 3, 20, 20, 24, 0, tzinfo=timezone.utc),
+}
+
+
+class FakeMonotonic:
+    def __init__(self):
+        self.t = 1_000_000_000
+
+    def __call__(self):
+        return self.t
+
+
+def _server(t_ns, **kwargs):
+    return BeaconServer(
+        "127.0.0.1", 9, equinox_source=EQUINOXES.__getitem__, clock_ns=lambda: t_ns, **kwargs
+    )
+
+
+def test_packet_round_trip():
+    packet = BeaconPacket(
+        frame_year=2025, seq=7, equinox_ns=datetime_to_ns(EQ_2025),
+        next_equinox_ns=datetime_to_ns(EQ_2026), server_ns=datetime_to_ns(EQ_2025) + 10,
+        dies=0, miliDies=345, mikroDies=12, synchronized=True
+    )
+    data = packet.encode()
+    assert len(data) == PACKET.size == 42
+    assert BeaconPacket.decode(data) == packet
+
+
+@pytest.mark.parametrize("data", [b"", b"XXXX" + bytes(38), b"AWBC\x09" + bytes(37)])
+def test_decode_rejects_foreign_packets(data):
+    with pytest.raises(BeaconError):
+        BeaconPacket.decode(data)
+
+
+@pytest.mark.parametrize("offset", [timedelta(hours=1), timedelta(days=3, seconds=1234.5678),
+                                    timedelta(days=200, hours=23, minutes=59)])
+def test_reading_matches_astro_year(offset):
+    t = EQ_2025 + offset
+    expected = AstroYear(EQ_2025, EQ_2026).reading(t)
+    assert reading_at(datetime_to_ns(t), datetime_to_ns(EQ_2025)) == (
+        expected.dies, expected.miliDies, expected.mikroDies
+    )
+
+
+def test_server_packet_at_boundary():
+    t_ns = next_boundary_ns(datetime_to_ns(EQ_2025 + timedelta(days=10)))
+    server = _server(t_ns)
+    try:
+        packet = server.packet_at(t_ns)
+    finally:
+        server.stop()
+    assert packet.frame_year == 2025
+    assert packet.mikroDies == 0
+    assert packet.equinox_ns == datetime_to_ns(EQ_2025)
+    assert packet.next_equinox_ns == datetime_to_ns(EQ_2026)
+
+
+def test_server_uses_previous_year_before_equinox():
+    t_ns = datetime_to_ns(EQ_2025 - timedelta(days=1))
+    server = _server(t_ns)
+    try:
+        assert server.packet_at(t_ns).frame_year == 2024
+    finally:
+        server.stop()
+
+
+def test_client_extrapolates_across_noon_and_equinox():
+    mono = FakeMonotonic()
+    client = BeaconClient("127.0.0.1", 0, monotonic_ns=mono)
+    try:
+        assert client.reading() is None
+        start = datetime_to_ns(EQ_2026) - DAY_NS - 3 * MILIDIES_NS
+        server = _server(start)
+        client.handle(server.packet_at(start).encode())
+        server.stop()
+        received = mono.t
+
+        reading = client.reading()
+        assert (reading.dies, reading.miliDies, reading.mikroDies) == reading_at(
+            start, datetime_to_ns(EQ_2025))
+        assert not reading.stale
+
+        # Across a noon inside the same year
+        mono.t = received + DAY_NS
+        reading = client.reading()
+        assert reading.dies == reading_at(start + DAY_NS, datetime_to_ns(EQ_2025))[0]
+        assert reading.stale
+
+        # Past the next equinox: dies restarts without any equinox solve
+        mono.t = received + DAY_NS + 4 * MILIDIES_NS
+        reading = client.reading()
+        assert reading.frame_year == 2026
+        assert reading.dies == 0
+        assert reading.equinox_ns == datetime_to_ns(EQ_2026)
+    finally:
+        client.stop()
+
+
+def test_client_ignores_older_and_foreign_packets():
+    client = BeaconClient("127.0.0.1", 0)
+    t_ns = datetime_to_ns(EQ_2025 + timedelta(days=5))
+    server = _server(t_ns)
+    try:
+        newer = server.packet_at(t_ns)
+        older = server.packet_at(t_ns - MILIDIES_NS)
+        assert client.handle(newer.encode()) == newer
+        assert client.handle(older.encode()) is None
+        assert client.handle(b"junk") is None
+        assert client.last_packet == newer
+        assert client.packets_rejected == 2
+    finally:
+        server.stop()
+        client.stop()
+
+
+def test_unicast_loopback_delivery():
+    client = BeaconClient("127.0.0.1", 0)
+    t_ns = datetime_to_ns(EQ_2025 + timedelta(days=42))
+    server = BeaconServer("127.0.0.1", client.port, equinox_source=EQUINOXES.__getitem__,
+                          clock_ns=lambda: t_ns)
+    try:
+        sent = server.send()
+        received = client.receive_once(timeout=2.0)
+        assert received == sent
+        assert client.reading().timestamp_full() == (
+            f"{sent.dies:03d}.{sent.miliDies:03d}.{sent.mikroDies:03d}"
+        )
+    finally:
+        server.stop()
+        client.stop()
+
+
+def test_multicast_loopback_delivery():
+    group = "239.255.86.41"
+    try:
+        client = BeaconClient(group, 0, interface="127.0.0.1")
+    except OSError as e:
+        pytest.skip(f"Multicast unavailable: {e}")
+    server = BeaconServer(group, client.port, interface="127.0.0.1",
+                          equinox_source=EQUINOXES.__getitem__, clock_ns=time.time_ns)
+    try:
+        thread = server.start()
+        received = client.receive_once(timeout=2.0)
+        if received is None:
+            pytest.skip("Multicast loopback not delivered on this host")
+        assert received.seq == 1
+        assert client.reading().frame_year == received.frame_year
+    finally:
+        server.stop()
+        client.stop()
+    assert not thread.is_alive()
@@ -0,0 +1,84 @@
+"""
+Tests for the benchmark harness (statistics, baselines, worker runs).
+The benchmarks themselves are run with `python -m benchmarks`.
+"""
+import random
+
+import pytest
+
+from benchmarks import cases  # noqa: F401
+from benchmarks.harness import (
+    BenchResult,
+    compare,
+    load_baseline,
+    mann_whitney_u,
+    measure,
+    registered,
+    run,
+    save_baseline,
+)
+
+
+def _samples(center, spread=0.02, n=15, seed=1):
+    rng = random.Random(seed)
+    return [center * (1 + rng.uniform(-spread, spread)) for _ in range(n)]
+
+
+def test_mann_whitney_separates_shifted_samples():
+    base = _samples(1.0, seed=1)
+    assert mann_whitney_u(base, _samples(1.0, seed=2)) > 0.05
+    assert mann_whitney_u(base, _samples(1.5, seed=3)) < 1e-4
+    assert mann_whitney_u([1.0] * 10, [1.0] * 10) == 1.0
+
+
+def test_compare_classifies_runs():
+    baseline = {
+        "same": BenchResult("same", 10, _samples(1.0, seed=1)),
+        "slower": BenchResult("slower", 10, _samples(1.0, seed=2)),
+        "faster": BenchResult("faster", 10, _samples(1.0, seed=3)),
+        "noisy": BenchResult("noisy", 10, _samples(1.0, seed=4)),
+        "gone": BenchResult("gone", 10, _samples(1.0, seed=5)),
+    }
+    current = {
+        "same": BenchResult("same", 10, _samples(1.0, seed=6)),
+        "slower": BenchResult("slower", 10, _samples(2.0, seed=7)),
+        "faster": BenchResult("faster", 10, _samples(0.5, seed=8)),
+        # Significant but within the tolerated slowdown
+        "noisy": BenchResult("noisy", 10, _samples(1.1, seed=9)),
+        "added": BenchResult("added", 10, _samples(1.0, seed=10)),
+    }
+    statuses = {
+        c.name: c.status
+        for c in compare(baseline, current, threshold=0.25, alpha=0.01, skipped={"ui": "no tk"})
+    }
+    assert statuses == {
+        "same": "ok", "slower": "regression", "faster": "improvement", "noisy": "ok",
+        "gone": "missing", "added": "new", "ui": "skipped",
+    }
+
+
+def test_baseline_round_trip(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    result = measure(lambda: sum(range(10)), "sum", repeats=3, min_time=0.001)
+    save_baseline(path, {"sum": result}, repeats=3, min_time=0.001, processes=0)
+    loaded = load_baseline(path)
+    assert loaded["settings"] == {"processes": 0, "repeats": 3, "min_time": 0.001}
+    assert loaded["benchmarks"]["sum"].samples == result.samples
+    assert loaded["benchmarks"]["sum"].median == result.median
+
+
+def test_registry_covers_hot_paths():
+    names = {b.name for b in registered()}
+    assert {
+        "equinox.compute_vernal_equinox", "equinox.precise[brent]", "equinox.precise[bisection]",
+        "core.AstroYear.reading", "core.timescales_from_datetime",
+        "core.apparent_solar_longitude", "ui.get_sky_theme", "offline.get_cached_equinox",
+    } <= names
+
+
+@pytest.mark.parametrize("processes", [0, 1])
+def test_run_in_process_and_worker(processes):
+    outcome = run(registered("AstroYear"), repeats=2, min_time=0.001, processes=processes)
+    result = outcome["results"]["core.AstroYear.reading"]
+    assert len(result.samples) == 2
+    assert 0 < result.median < 0.01
@@ -0,0 +1,99 @@
+"""
+Tests for the comparison card month model (per-day Dies, memoization).
+"""
+import calendar
+from datetime import datetime, timezone
+
+import pytest
+
+from astronomical_watch.core.astro_time_core import AstroYear
+from astronomical_watch.core.equinox import compute_vernal_equinox
+from astronomical_watch.ui import calendar_model
+
+
+def _expected_dies(year, month, day):
+    # What the calendar computed per cell before the month model
+    day_dt = datetime(year, month, day, 12, 0, tzinfo=timezone.utc)
+    equinox = compute_vernal_equinox(year)
+    if day_dt < equinox:
+        equinox = compute_vernal_equinox(year - 1)
+    return AstroYear(equinox).reading(day_dt).dies
+
+
+@pytest.mark.parametrize("year, month", [(2024, 2), (2025, 3), (2025, 12)])
+def test_dies_match_astro_year(year, month):
+    model = calendar_model.month_model(year, month, compute_vernal_equinox)
+    assert model.weeks == tuple(tuple(w) for w in calendar.monthcalendar(year, month))
+    for day in range(1, calendar.monthrange(year, month)[1] + 1):
+        assert model.dies_for(day) == _expected_dies(year, month, day)
+
+
+def test_models_are_memoized_per_equinox():
+    calendar_model.cache_clear()
+    solves = []
+
+    def source(year):
+        solves.append(year)
+        return compute_vernal_equinox(year)
+
+    first = calendar_model.month_model(2025, 6, source)
+    assert calendar_model.month_model(2025, 6, source) is first
+    assert calendar_model.cache_info().misses == 1
+
+    # A refined equinox produces a new model
+    def refined(year):
+        return source(year).replace(second=0, microsecond=0)
+
+    assert calendar_model.month_model(2025, 6, refined) is not first
+
+
+def test_selected_date_reading_uses_the_dates_own_year(monkeypatch):
+    from astronomical_watch.ui import comparison_card
+    monkeypatch.setattr(comparison_card, "get_equinox", compute_vernal_equinox)
+    # Early January belongs to the astronomical year of the previous March
+    for when in (datetime(2026, 1, 5, 11, tzinfo=timezone.utc),
+                 datetime(2025, 7, 1, 11, tzinfo=timezone.utc)):
+        equinox = compute_vernal_equinox(when.year)
+        if when < equinox:
+            equinox = compute_vernal_equinox(when.year - 1)
+        reading = AstroYear(equinox).reading(when)
+        assert comparison_card.date_reading(when) == (
+            reading.dies, reading.miliDies, reading.mikroDies
+        )
+
+
+def test_unavailable_equinox():
+    def failing(year):
+        raise RuntimeError("no ephemeris")
+
+    model = calendar_model.month_model(2025, 4, failing)
+    assert model.dies == (None,) * 30
+
+
+def _can_open_tk():
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+        root.destroy()
+        return True
+    except tk.TclError:
+        return False
+
+
+@pytest.mark.ui
+def test_month_navigation_reuses_cells():
+    if not _can_open_tk():
+        pytest.skip("No graphical environment (DISPLAY), skipping test.")
+    import tkinter as tk
+    from astronomical_watch.ui.comparison_card import ComparisonCard
+
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        card = ComparisonCard(root)
+        widgets = card.calendar_grid.winfo_children()
+        for _ in range(14):
+            card._next_month()
+        assert card.calendar_grid.winfo_children() == widgets
+    finally:
+        root.destroy()
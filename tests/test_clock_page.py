@@ -0,0 +1,194 @@
+"""
+Tests for the memory-mapped clock page (publisher, seqlock reader, light imports).
+"""
+import os
+import struct
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from astronomical_watch.core.astro_time_core import AstroYear
+from astronomical_watch.net.clock_page import (
+    NS_PER_SECOND,
+    ClockPage,
+    ClockPageError,
+    ClockPagePublisher,
+    reading,
+    reading_from_state,
+)
+
+EQUINOXES = {
+    2024: datetime(2024, 3, 20, 3, 6, 0, tzinfo=timezone.utc),
+    2025: datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc),
+    2026: datetime(2026, 3, 20, 14, 46, 0, tzinfo=timezone.utc),
+    2027: datetime(2027, 3, 20, 20, 24, 0, tzinfo=timezone.utc),
+    2028: datetime(2028, 3, 20, 2, 17, 0, tzinfo=timezone.utc),
+}
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def _ns(dt: datetime) -> int:
+    return int((dt - datetime(1970, 1, 1, tzinfo=timezone.utc)) / timedelta(microseconds=1)) * 1000
+
+
+@pytest.fixture
+def page_path(tmp_path):
+    return str(tmp_path / "clock.page")
+
+
+def _publisher(path, t):
+    return ClockPagePublisher(
+        path, equinox_source=EQUINOXES.__getitem__, clock_ns=lambda: _ns(t),
+        synchronized=lambda: True
+    )
+
+
+def test_reader_matches_astro_year(page_path):
+    t = datetime(2025, 11, 3, 17, 5, 42, 123456, tzinfo=timezone.utc)
+    publisher = _publisher(page_path, t)
+    try:
+        publisher.publish()
+        with ClockPage(page_path) as page:
+            state = page.state()
+            assert state.frame_year == 2025
+            assert state.synchronized
+            got = reading_from_state(state, _ns(t))
+    finally:
+        publisher.stop()
+
+    expected = AstroYear(EQUINOXES[2025], EQUINOXES[2026]).reading(t)
+    assert (got.dies, got.miliDies, got.mikroDies) == (
+        expected.dies, expected.miliDies, expected.mikroDies
+    )
+
+
+def test_offset_applies_to_system_clock(page_path):
+    offset = 250 * 1_000_000
+    publisher = ClockPagePublisher(
+        page_path, equinox_source=EQUINOXES.__getitem__,
+        clock_ns=lambda: time.time_ns() + offset
+    )
+    try:
+        publisher.publish()
+        with ClockPage(page_path) as page:
+            assert abs(page.now_ns() - time.time_ns() - offset) < 50_000_000
+            assert not page.reading().stale
+    finally:
+        publisher.stop()
+
+
+def test_reader_rolls_over_at_next_equinox(page_path):
+    before = EQUINOXES[2026] - timedelta(hours=1)
+    publisher = _publisher(page_path, before)
+    try:
+        publisher.publish()
+        with ClockPage(page_path) as page:
+            state = page.state()
+    finally:
+        publisher.stop()
+
+    after = reading_from_state(state, _ns(EQUINOXES[2026] + timedelta(minutes=5)))
+    assert after.frame_year == 2026
+    assert after.dies == 0
+
+
+def test_unpublished_and_foreign_pages(page_path, tmp_path):
+    publisher = _publisher(page_path, EQUINOXES[2025])
+    try:
+        with ClockPage(page_path) as page:
+            with pytest.raises(ClockPageError):
+                page.state()
+    finally:
+        publisher.stop()
+
+    foreign = tmp_path / "foreign.page"
+    foreign.write_bytes(b"\0" * 4096)
+    with pytest.raises(ClockPageError):
+        ClockPage(str(foreign))
+
+
+def test_reader_gives_up_on_an_interrupted_write(page_path):
+    publisher = _publisher(page_path, EQUINOXES[2025])
+    try:
+        publisher.publish()
+        # Publisher died between the odd and even counter stores
+        seq = struct.unpack_from("<Q", publisher._map, 8)[0]
+        struct.pack_into("<Q", publisher._map, 8, seq + 1)
+        with ClockPage(page_path) as page:
+            start = time.monotonic()
+            with pytest.raises(ClockPageError):
+                page.state()
+            assert time.monotonic() - start < 1.0
+    finally:
+        publisher.stop()
+
+
+def test_stale_when_daemon_stops_writing(page_path, monkeypatch):
+    publisher = _publisher(page_path, datetime(2025, 6, 1, tzinfo=timezone.utc))
+    try:
+        publisher.publish()
+        with ClockPage(page_path) as page:
+            state = page.state()
+            published = state.published_ns
+            assert reading_from_state(state, state.published_ns).stale is False
+            monkeypatch.setattr(time, "time_ns", lambda: published + 11 * NS_PER_SECOND)
+            assert page.reading().stale
+    finally:
+        publisher.stop()
+
+
+def test_counter_advances_and_serve_thread_stops(page_path):
+    publisher = ClockPagePublisher(page_path, equinox_source=EQUINOXES.__getitem__,
+                                   clock_ns=time.time_ns)
+    thread = publisher.start(refresh_s=0.01)
+    try:
+        with ClockPage(page_path) as page:
+            deadline = time.time() + 2.0
+            first = None
+            while time.time() < deadline:
+                try:
+                    first = page.state().seq
+                    break
+                except ClockPageError:
+                    time.sleep(0.005)
+            time.sleep(0.05)
+            assert page.state().seq > first
+            assert page.state().seq % 2 == 0
+    finally:
+        publisher.stop()
+    assert not thread.is_alive()
+    assert not os.path.exists(page_path)
+
+
+def test_module_reading(page_path):
+    publisher = ClockPagePublisher(page_path, equinox_source=EQUINOXES.__getitem__,
+                                   clock_ns=time.time_ns)
+    try:
+        publisher.publish()
+        assert reading(page_path).frame_year in EQUINOXES
+    finally:
+        publisher.stop()
+
+
+def test_reader_import_stays_light(page_path):
+    publisher = ClockPagePublisher(page_path, equinox_source=EQUINOXES.__getitem__,
+                                   clock_ns=time.time_ns)
+    try:
+        publisher.publish()
+        code = (
+            "import sys; from astronomical_watch.net import clock_page; "
+            f"print(clock_page.reading({page_path!r}).timestamp_full()); "
+            "print(sorted(m for m in sys.modules if m.startswith('astronomical_watch')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": SRC}
+        ).stdout.splitlines()
+    finally:
+        publisher.stop()
+    assert len(out[0]) == len("000.000.000")
+    assert out[1] == "['astronomical_watch', 'astronomical_watch.net', 'astronomical_watch.net.clock_page']"
@@ -0,0 +1,119 @@
+"""
+Tests for the background compute worker (results, coalescing, scheduler frames).
+"""
+import threading
+import time
+from datetime import datetime, timezone
+
+from astronomical_watch.net.beacon import datetime_to_ns
+from astronomical_watch.ui.compute_worker import ComputeWorker
+from astronomical_watch.ui.tick_scheduler import TickScheduler
+
+EQUINOXES = {
+    2024: datetime(2024, 3, 20, 3, 6, 0, tzinfo=timezone.utc),
+    2025: datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc),
+    2026: datetime(2026, 3, 20, 14, 46, 0, tzinfo=timezone.utc),
+    2027: datetime(2027, 3, 20, 20, 25, 0, tzinfo=timezone.utc),
+}
+
+
+class FakeMaster:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append((ms, func))
+        return f"after#{len(self.scheduled)}"
+
+    def after_idle(self, func):
+        return self.after(0, func)
+
+    def after_cancel(self, job):
+        pass
+
+    def nametowidget(self, name):
+        return self
+
+
+def _drain(worker, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while worker.outstanding and time.monotonic() < deadline:
+        worker.deliver()
+        time.sleep(0.001)
+    assert worker.outstanding == 0
+
+
+def test_callbacks_run_on_the_delivering_thread():
+    worker = ComputeWorker()
+    try:
+        results, errors, threads = [], [], []
+
+        def compute(x):
+            threads.append(threading.current_thread())
+            return x * 2
+
+        worker.submit(compute, 21, callback=results.append)
+        worker.submit(lambda: 1 / 0, error_callback=errors.append)
+        _drain(worker)
+        assert results == [42]
+        assert isinstance(errors[0], ZeroDivisionError)
+        assert threads[0] is not threading.current_thread()
+    finally:
+        worker.stop()
+
+
+def test_pending_requests_with_the_same_key_are_replaced():
+    worker = ComputeWorker()
+    try:
+        release = threading.Event()
+        worker.submit(release.wait)  # keep the worker busy
+        computed, shown = [], []
+
+        def month(n):
+            computed.append(n)
+            return n
+
+        for n in range(5):
+            worker.submit(month, n, callback=shown.append, key="month")
+        release.set()
+        _drain(worker)
+        assert computed == [4]
+        assert shown == [4]
+    finally:
+        worker.stop()
+
+
+def test_attached_master_polls_with_after_idle():
+    master = FakeMaster()
+    worker = ComputeWorker(master)
+    try:
+        worker.submit(int, "7", callback=lambda value: None)
+        assert master.scheduled[0][0] == 0
+    finally:
+        worker.stop()
+
+
+def test_scheduler_loads_frames_on_the_worker():
+    worker = ComputeWorker()
+    try:
+        t_ns = datetime_to_ns(datetime(2025, 6, 1, 12, tzinfo=timezone.utc))
+        loads = []
+
+        def source(year):
+            loads.append(threading.current_thread())
+            return EQUINOXES[year]
+
+        scheduler = TickScheduler(FakeMaster(), equinox_source=source,
+                                  clock_ns=lambda: t_ns, worker=worker)
+        _drain(worker)  # frame requested at construction
+        reading = scheduler.reading_at(t_ns)
+        assert reading is not None and reading.frame_year == 2025
+        assert threading.current_thread() not in loads
+
+        # A new year's frame is loaded in the background; the tick is skipped meanwhile
+        next_year_ns = datetime_to_ns(EQUINOXES[2026]) + 1
+        assert scheduler.reading_at(next_year_ns) is None
+        _drain(worker)
+        assert scheduler.reading_at(next_year_ns).frame_year == 2026
+    finally:
+        worker.stop()
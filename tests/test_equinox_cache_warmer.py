@@ -0,0 +1,66 @@
+"""
+Tests for the background equinox cache warmer.
+"""
+import pytest
+from datetime import timezone
+
+from astronomical_watch.services import equinox_service
+from astronomical_watch.services.equinox_service import (
+    CacheWarmer,
+    clear_cache,
+    get_vernal_equinox,
+    warm_priority_years,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_priority_order_nearest_first():
+    assert warm_priority_years(2025, radius=2) == [2025, 2026, 2024, 2027, 2023]
+    assert warm_priority_years(2025, radius=0) == [2025]
+
+
+def test_warmer_populates_years_and_marks_ready(monkeypatch):
+    solved = []
+    original = equinox_service._try_analytic_method
+
+    def recording_analytic(year):
+        solved.append(year)
+        return original(year)
+
+    monkeypatch.setattr(equinox_service, "_try_analytic_method", recording_analytic)
+
+    warmer = CacheWarmer(warm_priority_years(2025), prefer_order=("analytic", "approx"))
+    warmer.start()
+    assert warmer.wait_until_ready(timeout=30.0)
+
+    assert solved == [2025, 2026, 2024]
+    for year in (2024, 2025, 2026):
+        dt = warmer.get_equinox(year)
+        assert dt is not None
+        assert dt.tzinfo == timezone.utc
+        assert dt.year == year and dt.month == 3
+
+    status = warmer.status()
+    assert status["ready"] is True
+    assert status["warmed_years"] == [2024, 2025, 2026]
+    assert status["errors"] == {}
+
+
+def test_warmed_years_served_from_memory(monkeypatch):
+    warmer = CacheWarmer([2025], prefer_order=("analytic", "approx")).start()
+    assert warmer.wait_until_ready(timeout=30.0)
+
+    def no_disk(year):
+        raise AssertionError("disk cache should not be read for warmed years")
+
+    monkeypatch.setattr(equinox_service, "get_cached_equinox", no_disk)
+    result = get_vernal_equinox(2025)
+    assert result["cached"] is True
+    assert result["precision"] == "analytic"
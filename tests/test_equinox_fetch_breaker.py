@@ -0,0 +1,109 @@
+"""
+Tests for the remote equinox fetch circuit breaker and negative cache.
+"""
+import pytest
+
+from astronomical_watch.net import equinox_fetch
+from astronomical_watch.net.equinox_fetch import (
+    CircuitBreaker,
+    fetch_equinox_remote,
+    get_fetch_status,
+    is_fetch_suppressed,
+    reset_fetch_state,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _clean_state(monkeypatch):
+    monkeypatch.setenv("ASTRON_EQUINOX_URL", "http://equinox.invalid/data.json")
+    reset_fetch_state()
+    yield
+    reset_fetch_state()
+
+
+def test_breaker_opens_after_threshold_and_backs_off():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, base_backoff_s=10.0, max_backoff_s=25.0, clock=clock)
+
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow_request()
+
+    # Backoff elapsed -> half-open with a single probe slot
+    clock.now += 10.0
+    assert breaker.state == "half_open"
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    # Failed probe re-opens with doubled backoff
+    breaker.record_failure()
+    assert breaker.status()["backoff_s"] == 20.0
+    clock.now += 19.0
+    assert breaker.state == "open"
+    clock.now += 1.0
+    assert breaker.allow_request()
+
+    # Backoff is capped
+    breaker.record_failure()
+    assert breaker.status()["backoff_s"] == 25.0
+
+
+def test_breaker_closes_on_successful_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, base_backoff_s=5.0, clock=clock)
+    breaker.record_failure()
+    clock.now += 5.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.status()["consecutive_failures"] == 0
+
+
+def test_unreachable_source_is_skipped_while_open(monkeypatch):
+    calls = []
+
+    def failing_request(url, timeout):
+        calls.append(url)
+        return None
+
+    monkeypatch.setattr(equinox_fetch, "_request_json_text", failing_request)
+
+    for _ in range(5):
+        assert fetch_equinox_remote(2024) is None
+
+    assert len(calls) == equinox_fetch.BREAKER_FAILURE_THRESHOLD
+    assert is_fetch_suppressed(2024)
+    assert get_fetch_status()["breaker"]["state"] == "open"
+
+
+def test_year_miss_is_negative_cached(monkeypatch):
+    calls = []
+
+    def partial_source(url, timeout):
+        calls.append(url)
+        return '{"2024": "2024-03-20T03:06:14Z"}'
+
+    monkeypatch.setattr(equinox_fetch, "_request_json_text", partial_source)
+
+    assert fetch_equinox_remote(2024) == "2024-03-20T03:06:14Z"
+    assert fetch_equinox_remote(2031) is None
+    assert fetch_equinox_remote(2031) is None
+
+    assert len(calls) == 2
+    assert is_fetch_suppressed(2031)
+    assert not is_fetch_suppressed(2024)
+
+    status = get_fetch_status()
+    assert status["breaker"]["state"] == "closed"
+    assert status["negative_cache_years"] == [2031]
@@ -0,0 +1,117 @@
+"""
+Tests for ETag / Cache-Control / 304 handling on the equinox endpoints.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from web.app import app as web_app  # also puts the service layer on sys.path
+from routes import equinox as equinox_routes
+from routes.http_cache import if_none_match
+from services import equinox_service
+
+router_app = FastAPI()
+router_app.include_router(equinox_routes.router, prefix="/api")
+client = TestClient(router_app)
+web_client = TestClient(web_app)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("ASTRON_EQUINOX_URL", raising=False)
+    equinox_service.clear_cache()
+    equinox_routes._responses.invalidate()
+    yield
+    equinox_service.wait_for_refinement(timeout=30.0)
+    equinox_service.clear_cache()
+
+
+def _no_service(*args, **kwargs):
+    raise AssertionError("service layer must not be called for a 304")
+
+
+def test_past_year_is_immutable_and_revalidates_without_service(monkeypatch):
+    r = client.get("/api/equinox/2020")
+    assert r.status_code == 200
+    assert r.json()["precision"] == "analytic"
+    assert "immutable" in r.headers["cache-control"]
+    etag = r.headers["etag"]
+    assert etag.startswith('"') and "2020" in etag
+
+    monkeypatch.setattr(equinox_routes, "get_vernal_equinox_progressive", _no_service)
+    r = client.get("/api/equinox/2020", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.headers["etag"] == etag
+    assert r.content == b""
+
+
+def test_future_year_gets_bounded_max_age():
+    r = client.get("/api/equinox/2100")
+    assert r.headers["cache-control"] == "public, max-age=86400"
+
+
+def test_refinable_value_is_not_cached(monkeypatch):
+    approx = equinox_service.get_vernal_equinox(2020, ("approx",))
+    monkeypatch.setattr(equinox_routes, "get_vernal_equinox_progressive",
+                        lambda year: dict(approx, refining=True))
+    r = client.get("/api/equinox/2020")
+    assert r.headers["cache-control"] == "no-cache"
+    assert "etag" not in r.headers
+
+
+def test_next_equinox_max_age_from_countdown(monkeypatch):
+    r = client.get("/api/equinox/next")
+    seconds_until = r.json()["seconds_until"]
+    max_age = int(r.headers["cache-control"].split("max-age=")[1])
+    assert 0 < max_age <= min(seconds_until, 86400)
+    etag = r.headers["etag"]
+    assert etag.startswith("W/")
+
+    monkeypatch.setattr(equinox_routes, "get_vernal_equinox_progressive", _no_service)
+    r = client.get("/api/equinox/next", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+
+
+def test_etag_follows_model_version(monkeypatch):
+    before = client.get("/api/equinox/2020").headers["etag"]
+    monkeypatch.setattr(equinox_service, "_model_digest", "other-coefficients")
+    after = client.get("/api/equinox/2020").headers["etag"]
+    assert before != after
+    r = client.get("/api/equinox/2020", headers={"If-None-Match": before})
+    assert r.status_code == 200
+
+
+def test_web_app_equinox_conditional():
+    r = web_client.get("/api/equinox/2020")
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    r = web_client.get("/api/equinox/2020", headers={"If-None-Match": f'"other", {etag}'})
+    assert r.status_code == 304
+
+
+def test_if_none_match_parsing():
+    assert if_none_match('"a", W/"b"', '"b"')
+    assert if_none_match("*", '"x"')
+    assert not if_none_match(None, '"x"')
+    assert not if_none_match('"a"', '"b"')
+
+
+def test_cached_bytes_served_without_service(monkeypatch):
+    first = client.get("/api/equinox/2019")
+    monkeypatch.setattr(equinox_routes, "get_vernal_equinox_progressive", _no_service)
+    second = client.get("/api/equinox/2019")
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert equinox_routes.get_response_cache_stats()["hits"] >= 1
+
+
+def test_next_equinox_template_patches_countdown(monkeypatch):
+    first = client.get("/api/equinox/next").json()
+    monkeypatch.setattr(equinox_routes, "get_vernal_equinox_progressive", _no_service)
+    second = client.get("/api/equinox/next").json()
+    assert second["utc"] == first["utc"]
+    assert 0 <= first["seconds_until"] - second["seconds_until"] <= 1
+    assert second["days_until"] == pytest.approx(second["seconds_until"] / 86400, abs=1e-4)
+    assert set(second) == {"utc", "seconds_until", "days_until", "precision", "uncertainty_s"}
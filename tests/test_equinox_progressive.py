@@ -0,0 +1,103 @@
+"""
+Tests for progressive-precision equinox lookups with background refinement.
+"""
+import pytest
+
+from astronomical_watch.services import equinox_service
+from astronomical_watch.services.equinox_service import (
+    UNCERTAINTY_ANALYTIC,
+    UNCERTAINTY_APPROX,
+    clear_cache,
+    get_vernal_equinox,
+    get_vernal_equinox_progressive,
+    subscribe_equinox_updates,
+    wait_for_refinement,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    clear_cache()
+    yield
+    assert wait_for_refinement(timeout=30.0)
+    clear_cache()
+
+
+def test_fast_answer_then_refined_value_notified():
+    updates = []
+    unsubscribe = subscribe_equinox_updates(lambda year, result: updates.append((year, result)))
+    try:
+        first = get_vernal_equinox_progressive(
+            2025, prefer_order=("analytic", "approx"), fast_order=("approx",)
+        )
+        assert first["precision"] == "approx"
+        assert first["uncertainty_s"] == UNCERTAINTY_APPROX
+        assert first["refining"] is True
+
+        assert wait_for_refinement(timeout=30.0)
+    finally:
+        unsubscribe()
+
+    assert len(updates) == 1
+    year, refined = updates[0]
+    assert year == 2025
+    assert refined["precision"] == "analytic"
+    assert refined["uncertainty_s"] == UNCERTAINTY_ANALYTIC
+
+    # The refined value replaced the cached one
+    cached = get_vernal_equinox(2025)
+    assert cached["cached"] is True
+    assert cached["precision"] == "analytic"
+    assert cached["datetime"] == refined["datetime"]
+
+
+def test_no_refinement_when_already_most_precise():
+    result = get_vernal_equinox_progressive(2025, prefer_order=("analytic", "approx"))
+    assert result["precision"] == "analytic"
+    assert result["refining"] is False
+
+
+def test_refinement_never_downgrades(monkeypatch):
+    monkeypatch.setattr(equinox_service, "_try_analytic_method", lambda year: None)
+    updates = []
+    unsubscribe = subscribe_equinox_updates(lambda year, result: updates.append(result))
+    try:
+        first = get_vernal_equinox_progressive(
+            2024, prefer_order=("analytic", "approx"), fast_order=("approx",)
+        )
+        assert wait_for_refinement(timeout=30.0)
+    finally:
+        unsubscribe()
+
+    assert updates == []
+    assert get_vernal_equinox(2024)["precision"] == first["precision"] == "approx"
+
+
+def test_failed_refinement_is_retried_after_backoff(monkeypatch):
+    analytic = equinox_service._try_analytic_method
+    monkeypatch.setattr(equinox_service, "_try_analytic_method", lambda year: None)
+    order = dict(prefer_order=("analytic", "approx"), fast_order=("approx",))
+    assert get_vernal_equinox_progressive(2023, **order)["refining"] is True
+    assert wait_for_refinement(timeout=30.0)
+    # Still inside the backoff: not queued again
+    assert get_vernal_equinox_progressive(2023, **order)["refining"] is False
+
+    # Backoff expired and the precise tier works again (e.g. back online)
+    attempts, _ = equinox_service._refine_retry[2023]
+    equinox_service._refine_retry[2023] = (attempts, 0.0)
+    monkeypatch.setattr(equinox_service, "_try_analytic_method", analytic)
+    assert get_vernal_equinox_progressive(2023, **order)["refining"] is True
+    assert wait_for_refinement(timeout=30.0)
+    assert get_vernal_equinox(2023)["precision"] == "analytic"
+    assert 2023 in equinox_service._refined_years
+
+
+def test_default_order_settles_at_analytic_without_fetch_url(monkeypatch):
+    monkeypatch.delenv("ASTRON_EQUINOX_URL", raising=False)
+    # The internet tier is not configured, so analytic is final: nothing to refine
+    result = get_vernal_equinox_progressive(2022)
+    assert result["precision"] == "analytic"
+    assert result["refining"] is False
+    assert wait_for_refinement(timeout=30.0)
+    assert 2022 not in equinox_service._refine_retry
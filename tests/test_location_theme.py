@@ -0,0 +1,90 @@
+"""
+Tests for location-aware sky themes (solar position, cell cache, grid batches).
+"""
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from astronomical_watch.ui import location_theme
+from astronomical_watch.ui.gradient import get_solar_altitude_approximation
+from astronomical_watch.ui.solar_position import solar_position
+from web.app import app
+
+client = TestClient(app)
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("when, minutes", [
+    (_utc(2025, 2, 11, 12), -14.2),
+    (_utc(2025, 5, 14, 12), 3.6),
+    (_utc(2025, 7, 26, 12), -6.5),
+    (_utc(2025, 11, 3, 12), 16.4),
+])
+def test_equation_of_time(when, minutes):
+    assert solar_position(when).equation_of_time == pytest.approx(minutes, abs=0.2)
+
+
+def test_altitude_depends_on_location():
+    # Belgrade, June solstice: solar noon near 10:40 UTC at about 68.6°
+    noon = _utc(2025, 6, 21, 10, 40)
+    assert get_solar_altitude_approximation(noon, 44.82, 20.46) == pytest.approx(68.6, abs=0.3)
+    assert get_solar_altitude_approximation(noon, -33.87, 151.21) < 0  # Sydney at night
+    assert get_solar_altitude_approximation(noon, 78.2, 15.6) > 0      # Svalbard midnight sun
+
+
+def test_cells_are_memoized():
+    location_theme.cache_clear()
+    when = _utc(2025, 3, 20, 9, 0, 10)
+    first = location_theme.theme_at(44.82, 20.46, when)
+    # Same 0.25° cell and minute
+    assert location_theme.theme_at(44.80, 20.50, _utc(2025, 3, 20, 8, 59, 50)) is first
+    info = location_theme.cache_info()
+    assert info["bands"].misses == 1 and info["bands"].hits == 1
+    assert info["positions"].misses == 1
+
+
+def test_grid_matches_single_points():
+    when = _utc(2025, 12, 21, 6)
+    latitudes = [-90.0, -60.0, -30.0, 0.0, 30.0, 60.0, 90.0]
+    longitudes = [float(lon) for lon in range(-180, 181, 15)]
+    grid = location_theme.themes_for_grid(latitudes, longitudes, when)
+    for latitude, row in zip(latitudes, grid):
+        assert row == [location_theme.band_at(latitude, lon, when) for lon in longitudes]
+    assert {band for row in grid for band in row} == {0, 1, 2, 3, 4}
+
+
+def test_invalid_location():
+    with pytest.raises(ValueError):
+        location_theme.theme_at(91.0, 0.0)
+
+
+def test_theme_endpoints():
+    r = client.get("/api/theme", params={"lat": 44.82, "lon": 20.46, "t": "2025-06-21T10:40:00Z"})
+    assert r.status_code == 200
+    data = r.json()
+    assert data["band"] == 4
+    assert data["theme"]["top_color"] == location_theme.BAND_THEMES[4].top_color
+
+    r = client.post("/api/themes", json={
+        "latitudes": [44.82, -33.87], "longitudes": [20.46, 151.21], "utc": "2025-06-21T10:40:00Z",
+    })
+    assert r.status_code == 200
+    data = r.json()
+    assert len(data["palette"]) == 5
+    assert data["bands"][0][0] == 4
+    assert data["bands"][1][1] == 0
+
+    assert client.get("/api/theme", params={"lat": 100, "lon": 0}).status_code == 422
+    assert client.post("/api/themes", json={"latitudes": [0.0]}).status_code == 400
+
+
+def test_fallback_location_ignores_daylight_saving(monkeypatch, tmp_path):
+    from astronomical_watch.ui import gradient
+    monkeypatch.delenv(gradient.LOCATION_ENV, raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))  # no config file
+    monkeypatch.setattr(gradient.time, "timezone", -3600)  # CET, also while CEST is in effect
+    assert gradient._load_location() == (45.0, 15.0)
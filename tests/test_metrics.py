@@ -0,0 +1,131 @@
+"""
+Tests for the metrics registry, its Prometheus export and the Core probes.
+"""
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from web.app import app as web_app  # also puts the service layer on sys.path
+from astronomical_watch import core_probes, metrics
+from astronomical_watch.core import equinox as core_equinox
+from astronomical_watch.core import solar as core_solar
+
+
+@pytest.fixture
+def enabled_metrics():
+    previous = metrics.is_enabled()
+    metrics.enable()
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+    metrics.enable(previous)
+
+
+def _sample(text, line_prefix):
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{line_prefix} not exported")
+
+
+def test_disabled_instruments_record_nothing(enabled_metrics):
+    hits = metrics.counter("test_disabled_hits", "hits")
+    seconds = metrics.histogram("test_disabled_seconds", "time")
+    metrics.enable(False)
+    hits.inc()
+    seconds.observe(0.5)
+    with seconds.time():
+        pass
+    assert hits.value == 0
+    assert seconds.count == 0
+
+
+def test_factories_are_get_or_create(enabled_metrics):
+    first = metrics.counter("test_shared_total_calls", "calls", ["kind"])
+    assert metrics.counter("test_shared_total_calls", "calls", ["kind"]) is first
+    with pytest.raises(ValueError):
+        metrics.gauge("test_shared_total_calls", "calls")
+    with pytest.raises(ValueError):
+        first.labels(kind="a", other="b")
+
+
+def test_prometheus_format(enabled_metrics):
+    lookups = metrics.counter("test_format_lookups", "Lookups", ["result"])
+    level = metrics.gauge("test_format_level", "Level")
+    latency = metrics.histogram("test_format_seconds", "Latency", buckets=(0.1, 1.0))
+    lookups.labels(result="hit").inc(3)
+    lookups.labels(result='odd"value').inc()
+    level.set(2.5)
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value)
+
+    text = metrics.render_prometheus()
+    assert "# TYPE test_format_lookups counter" in text
+    assert _sample(text, 'test_format_lookups_total{result="hit"}') == 3
+    assert _sample(text, 'test_format_lookups_total{result="odd\\"value"}') == 1
+    assert _sample(text, "test_format_level") == 2.5
+    assert _sample(text, 'test_format_seconds_bucket{le="0.1"}') == 1
+    assert _sample(text, 'test_format_seconds_bucket{le="1"}') == 2
+    assert _sample(text, 'test_format_seconds_bucket{le="+Inf"}') == 3
+    assert _sample(text, "test_format_seconds_count") == 3
+    assert _sample(text, "test_format_seconds_sum") == pytest.approx(5.55)
+
+
+def test_histogram_quantile_and_gauge_function(enabled_metrics):
+    latency = metrics.histogram("test_quantile_seconds", "Latency", buckets=(1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0):
+        latency.observe(value)
+    assert 1.0 <= latency.quantile(0.5) <= 2.0
+    queue = []
+    depth = metrics.gauge("test_queue_depth", "Depth")
+    depth.set_function(lambda: len(queue))
+    queue.extend([1, 2])
+    assert _sample(metrics.render_prometheus(), "test_queue_depth") == 2
+
+
+def test_core_probes_observe_without_changing_results(enabled_metrics):
+    was_installed = core_probes.installed()
+    core_probes.uninstall()
+    expected = core_equinox.compute_vernal_equinox(2025)
+    original = core_solar.earth_heliocentric_position
+    core_probes.install()
+    try:
+        assert core_equinox.compute_vernal_equinox(2025) == expected
+        assert core_probes.VSOP87_EVALUATIONS.value > 0
+        assert core_probes.OBJECTIVE_EVALUATIONS.labels(solver="core").value == \
+            core_probes.VSOP87_EVALUATIONS.value
+    finally:
+        core_probes.uninstall()
+    assert core_solar.earth_heliocentric_position is original
+    if was_installed:
+        core_probes.install()
+
+
+def test_cache_and_solver_instrumentation(enabled_metrics, tmp_path, monkeypatch):
+    from offline import cache
+    from solar.equinox_precise import compute_vernal_equinox_precise
+
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    entry = cache.create_entry(datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc),
+                               "analytic", 10.0, "test")
+    assert cache.get_cached_equinox(2025) is None
+    cache.set_cached_equinox(2025, entry)
+    assert cache.get_cached_equinox(2025) == entry
+    assert cache.CACHE_LOOKUPS.labels(result="miss").value == 1
+    assert cache.CACHE_LOOKUPS.labels(result="hit").value == 1
+
+    compute_vernal_equinox_precise(2025, method="bisection")
+    text = metrics.render_prometheus()
+    assert _sample(text, 'awatch_equinox_solves_total{solver="bisection"}') == 1
+    assert _sample(text, 'awatch_equinox_objective_evaluations_total{solver="bisection"}') > 10
+
+
+def test_metrics_endpoint(enabled_metrics):
+    client = TestClient(web_app)
+    client.get("/api/ping")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE awatch_stream_subscribers gauge" in response.text
+    assert _sample(response.text, 'awatch_stream_subscribers{resolution="miliDies"}') == 0
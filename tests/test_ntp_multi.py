@@ -0,0 +1,158 @@
+"""
+Tests for parallel multi-server NTP sampling against local UDP stand-in servers.
+"""
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from astronomical_watch.net import time_sync
+from astronomical_watch.net.time_sync import (
+    NTP_REQUEST_SPACING,
+    NtpSample,
+    TimeSyncError,
+    _to_ntp_raw,
+    sample_ntp_servers,
+    select_best_offset,
+    sync_time_multi,
+    sync_time_ntp,
+)
+
+
+class StandInNtpServer:
+    """Minimal NTP responder on loopback with a configurable clock offset."""
+
+    def __init__(self, offset=0.0, inbound_delay=0.0, respond=True):
+        self.offset = offset
+        self.inbound_delay = inbound_delay
+        self.respond = respond
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.1)
+        self.address = self.sock.getsockname()
+        self.requests = 0
+        self.arrivals = []
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        while self._running:
+            try:
+                data, client = self.sock.recvfrom(1024)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            self.requests += 1
+            self.arrivals.append(time.monotonic())
+            if not self.respond:
+                continue
+            time.sleep(self.inbound_delay)
+            receive = _to_ntp_raw(time.time() + self.offset)
+            originate = data[40:48]
+            header = struct.pack("!BBbb", 0x1C, 2, 6, -20) + 20 * b"\0"
+            transmit = _to_ntp_raw(time.time() + self.offset)
+            reply = header + originate + struct.pack("!QQ", receive, transmit)
+            self.sock.sendto(reply, client)
+
+    def close(self):
+        self._running = False
+        self._thread.join(timeout=1.0)
+        self.sock.close()
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(**kwargs):
+        server = StandInNtpServer(**kwargs)
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.close()
+
+
+def test_four_timestamp_offset_and_delay():
+    sample = NtpSample("s", t1=100.0, t2=102.1, t3=102.2, t4=100.5)
+    assert sample.offset == pytest.approx(1.9)
+    assert sample.delay == pytest.approx(0.4)
+
+
+def test_parallel_sampling_recovers_offset(servers):
+    a = servers(offset=0.5)
+    b = servers(offset=0.5)
+    samples = sample_ntp_servers([a.address, b.address], samples_per_server=3, timeout=2.0)
+
+    assert len(samples) == 6
+    estimate = select_best_offset(samples)
+    assert estimate.offset == pytest.approx(0.5, abs=0.02)
+    assert estimate.delay >= 0
+    assert len(estimate.servers_used) == 2
+
+
+def test_outlier_server_is_rejected(servers):
+    good = [servers(offset=0.2) for _ in range(3)]
+    liar = servers(offset=30.0)
+    estimate = sync_time_multi(
+        [s.address for s in good] + [liar.address], samples_per_server=2, timeout=2.0
+    )
+    assert estimate.offset == pytest.approx(0.2, abs=0.02)
+    assert estimate.servers_rejected == (f"127.0.0.1:{liar.address[1]}",)
+
+
+def test_silent_server_bounded_by_single_deadline(servers):
+    good = servers(offset=0.0)
+    silent = [servers(respond=False) for _ in range(3)]
+    start = time.monotonic()
+    samples = sample_ntp_servers(
+        [good.address] + [s.address for s in silent], samples_per_server=2, timeout=0.5
+    )
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.9
+    assert {s.server for s in samples} == {f"127.0.0.1:{good.address[1]}"}
+    assert all(s.requests == 2 for s in silent)
+
+
+def test_slow_dns_bounded_by_single_deadline(servers, monkeypatch):
+    good = servers(offset=0.0)
+    resolve = socket.getaddrinfo
+
+    def getaddrinfo(host, *args, **kwargs):
+        if host == "slow.invalid":
+            time.sleep(2.0)
+        return resolve(host, *args, **kwargs)
+
+    monkeypatch.setattr(time_sync.socket, "getaddrinfo", getaddrinfo)
+    start = time.monotonic()
+    samples = sample_ntp_servers(["slow.invalid", good.address], samples_per_server=1, timeout=0.5)
+    assert time.monotonic() - start < 0.9
+    assert [s.server for s in samples] == [f"127.0.0.1:{good.address[1]}"]
+
+
+def test_requests_to_one_server_are_spaced(servers):
+    server = servers(offset=0.0)
+    samples = sample_ntp_servers([server.address], samples_per_server=3, timeout=2.0)
+    assert len(samples) == 3
+    gaps = [b - a for a, b in zip(server.arrivals, server.arrivals[1:])]
+    assert all(gap >= NTP_REQUEST_SPACING * 0.9 for gap in gaps)
+
+
+def test_no_reply_raises_timeout(servers):
+    silent = servers(respond=False)
+    with pytest.raises(TimeSyncError) as exc_info:
+        sync_time_ntp(silent.address, timeout=0.3)
+    assert "timed out" in str(exc_info.value)
+
+
+def test_sync_time_ntp_uses_server_transmit_time(servers):
+    server = servers(offset=-1.0)
+    ntp_time, offset = sync_time_ntp(server.address, timeout=2.0)
+    assert offset == pytest.approx(-1.0, abs=0.02)
+    assert abs(ntp_time - (time.time() - 1.0)) < 0.5
@@ -0,0 +1,44 @@
+"""
+Tests for pre-serialized response caching (bytes LRU and /now templates).
+"""
+import json
+from datetime import datetime, timezone
+
+from astronomical_watch.core.astro_time_core import MILIDIES_NS, datetime_to_ns
+from astronomical_watch.core.equinox import compute_vernal_equinox
+from web.year_context import NowRenderer, build_year_context
+from routes.response_cache import ResponseBytesCache
+
+
+def test_lru_eviction_and_stats():
+    cache = ResponseBytesCache(maxsize=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a") == b"1"
+    cache.put("c", b"3")  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+    assert cache.stats() == {"entries": 2, "maxsize": 2, "hits": 2, "misses": 1}
+    assert cache.invalidate(lambda key: key == "a") == 1
+    assert cache.peek("a") is None
+
+
+def test_now_template_matches_full_render(core_source):
+    base = datetime_to_ns(datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc))
+    context = build_year_context(base, core_source)
+    renderer = NowRenderer()
+    instants = [base + i * 7_300_000_000 for i in range(200)]  # ~24 min span
+    for t_ns in instants:
+        rendered = renderer.render(context, t_ns, 12.5, include_longitude=True)
+        assert json.loads(rendered) == json.loads(context.now_body(t_ns, 12.5, True))
+    # One template per miliDies crossed, not one per request
+    crossed = len({(t - base) // MILIDIES_NS for t in instants}) + 1
+    assert renderer.template_builds <= crossed
+
+
+def test_now_template_handles_equinox_and_noon(core_source):
+    equinox = datetime_to_ns(compute_vernal_equinox(2025))
+    renderer = NowRenderer()
+    for t_ns in (equinox - 1, equinox, equinox + MILIDIES_NS * 10):
+        context = build_year_context(t_ns, core_source)
+        assert renderer.render(context, t_ns) == context.now_body(t_ns).encode()
@@ -0,0 +1,47 @@
+"""
+Tests for the daily sky-theme timeline (transitions, bisect lookups, next change).
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from astronomical_watch.ui import sky_timeline
+from astronomical_watch.ui.gradient import get_sky_theme
+from astronomical_watch.ui.sky_timeline import RESOLUTION, SkyTimeline
+
+
+@pytest.mark.parametrize("day", [date(2025, 3, 20), date(2025, 6, 21), date(2025, 12, 21)])
+def test_timeline_matches_direct_evaluation(day):
+    timeline = SkyTimeline(day)
+    assert timeline.times == sorted(timeline.times)
+    for seconds in range(0, 86400, 97):
+        t = timeline.start + timedelta(seconds=seconds)
+        assert timeline.theme_at(t).top_color == get_sky_theme(t).top_color
+    # Transitions are exact to the resolution
+    for when, theme in timeline.transitions[1:]:
+        assert get_sky_theme(when).top_color == theme.top_color
+        assert get_sky_theme(when - RESOLUTION).top_color != theme.top_color
+    assert timeline.evaluations < 500
+
+
+def test_next_change_after():
+    timeline = sky_timeline.timeline_for(date(2025, 6, 21))
+    first_change = timeline.times[1]
+    assert sky_timeline.next_change_after(timeline.start) == first_change
+    assert sky_timeline.next_change_after(first_change) == timeline.times[2]
+    # After the last change of the day the search continues into the next day
+    late = timeline.times[-1] + timedelta(minutes=1)
+    next_day = sky_timeline.timeline_for(date(2025, 6, 22))
+    assert sky_timeline.next_change_after(late) == next_day.times[1]
+
+
+def test_outside_the_day_is_rejected():
+    timeline = SkyTimeline(date(2025, 6, 21))
+    with pytest.raises(ValueError):
+        timeline.theme_at(timeline.end)
+
+
+def test_aware_datetimes_use_local_time():
+    aware = datetime(2025, 6, 21, 9, 30, tzinfo=timezone.utc)
+    local = aware.astimezone().replace(tzinfo=None)
+    assert sky_timeline.theme_at(aware) is sky_timeline.theme_at(local)
@@ -0,0 +1,84 @@
+"""
+Tests for the shared theme bus (lazy recompute, notifications).
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import tkinter as tk
+
+from astronomical_watch.ui import theme_manager
+from astronomical_watch.ui.gradient import SkyTheme
+
+DAY = SkyTheme("#2563eb", "#60a5fa", "#000000")
+NIGHT = SkyTheme("#0f172a", "#1e293b", "#e2e8f0")
+
+
+class FakeNow:
+    def __init__(self, start):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    clock = FakeNow(datetime(2025, 6, 21, 12, 0))
+    fake_datetime = type("FakeDatetime", (), {"now": staticmethod(clock)})
+    monkeypatch.setattr(theme_manager, "datetime", fake_datetime)
+    for name in ("_shared_theme", "_shared_theme_time", "_next_change_time"):
+        monkeypatch.setattr(theme_manager, name, None)
+    monkeypatch.setattr(theme_manager, "_listeners", [])
+    monkeypatch.setattr(theme_manager, "_fixed", False)
+    return clock
+
+
+def test_recomputes_only_at_the_next_change(bus, monkeypatch):
+    computed = []
+
+    def fake_theme(dt):
+        computed.append(dt)
+        return DAY
+
+    monkeypatch.setattr(theme_manager.sky_timeline, "theme_at", fake_theme)
+    monkeypatch.setattr(theme_manager.sky_timeline, "next_change_after",
+                        lambda dt: dt + timedelta(seconds=600))
+    theme_manager.get_shared_theme()
+    for _ in range(100):
+        bus.now += timedelta(seconds=5)
+        theme_manager.get_shared_theme()
+    assert len(computed) == 1
+    bus.now += timedelta(seconds=100)
+    theme_manager.get_shared_theme()
+    assert len(computed) == 2
+
+
+def test_subscribers_are_notified_on_change(bus, monkeypatch):
+    themes = iter([DAY, DAY, NIGHT])
+    monkeypatch.setattr(theme_manager.sky_timeline, "theme_at", lambda dt: next(themes))
+    seen = []
+
+    def destroyed(theme):
+        raise tk.TclError("invalid command name")
+
+    assert theme_manager.subscribe(seen.append) is DAY
+    theme_manager.subscribe(seen.append)
+    theme_manager.subscribe(destroyed)
+    theme_manager.update_shared_theme()
+    assert seen == []
+    theme_manager.update_shared_theme()
+    assert seen == [NIGHT]
+    assert theme_manager._listeners == [seen.append]
+
+
+def test_fixed_theme_computes_nothing(bus, monkeypatch):
+    def no_astronomy(*args):
+        raise AssertionError("sky computed in fixed-theme mode")
+
+    monkeypatch.setattr(theme_manager.sky_timeline, "theme_at", no_astronomy)
+    monkeypatch.setattr(theme_manager.sky_timeline, "next_change_after", no_astronomy)
+    theme_manager.use_fixed_theme(NIGHT)
+    assert theme_manager.subscribe(lambda theme: None) is NIGHT
+    bus.now += timedelta(days=1)
+    assert theme_manager.get_shared_theme() is NIGHT
+    assert theme_manager.update_shared_theme() is NIGHT
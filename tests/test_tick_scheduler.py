@@ -0,0 +1,173 @@
+"""
+Tests for the shared UI tick scheduler (readings, boundary alignment, fan-out).
+"""
+import tkinter as tk
+from datetime import datetime, timedelta, timezone
+
+from astronomical_watch.core.astro_time_core import AstroYear
+from astronomical_watch.net.beacon import MIKRODIES_NS, MILIDIES_NS, NOON_NS, datetime_to_ns
+from astronomical_watch.ui.tick_scheduler import TickScheduler, countdown
+
+EQUINOXES = {
+    2024: datetime(2024, 3, 20, 3, 6, 0, tzinfo=timezone.utc),
+    2025: datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc),
+    2026: datetime(2026, 3, 20, 14, 46, 0, tzinfo=timezone.utc),
+}
+
+
+class FakeMaster:
+    """Records after() calls instead of running a Tk event loop."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append((ms, func))
+        return f"after#{len(self.scheduled)}"
+
+    def after_idle(self, func):
+        return self.after(0, func)
+
+    def after_cancel(self, job):
+        pass
+
+
+class CountingSource:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, year):
+        self.calls += 1
+        return EQUINOXES[year]
+
+
+def _scheduler(clock_ns=lambda: 0, source=None):
+    return TickScheduler(FakeMaster(), equinox_source=source or EQUINOXES.__getitem__,
+                         clock_ns=clock_ns)
+
+
+def test_readings_match_astro_year():
+    scheduler = _scheduler()
+    year = AstroYear(EQUINOXES[2025], EQUINOXES[2026])
+    for dt in (datetime(2025, 3, 20, 12, 0, 0, 1, tzinfo=timezone.utc),
+               datetime(2025, 7, 14, 23, 59, 59, 999000, tzinfo=timezone.utc),
+               datetime(2026, 3, 20, 11, 30, tzinfo=timezone.utc)):
+        expected = year.reading(dt)
+        reading = scheduler.reading_at(datetime_to_ns(dt))
+        assert reading.frame_year == 2025
+        assert (reading.dies, reading.miliDies, reading.mikroDies) == \
+            (expected.dies, expected.miliDies, expected.mikroDies)
+    # Before the 2025 equinox the 2024 frame applies
+    assert scheduler.reading_at(datetime_to_ns(EQUINOXES[2025]) - 1).frame_year == 2024
+
+
+def test_equinoxes_looked_up_once_per_milidies():
+    source = CountingSource()
+    scheduler = _scheduler(source=source)
+    start = datetime_to_ns(datetime(2025, 6, 1, 12, tzinfo=timezone.utc))
+    for i in range(11):
+        scheduler.reading_at(start + i * MIKRODIES_NS)
+    first = source.calls
+    assert first > 0
+    scheduler.reading_at(start + MILIDIES_NS)
+    assert source.calls == 2 * first
+
+
+def test_delay_aligns_to_next_mikrodies_boundary():
+    scheduler = _scheduler()
+    boundary = NOON_NS + 1000 * MIKRODIES_NS
+    assert scheduler.delay_ms(boundary) == 87
+    assert scheduler.delay_ms(boundary + 80_000_000) == 7
+    assert scheduler.delay_ms(boundary + MIKRODIES_NS - 1) == 1
+
+
+def test_one_reading_is_published_to_every_subscriber():
+    now = datetime_to_ns(datetime(2025, 6, 1, 12, tzinfo=timezone.utc)) + 40_000_000
+    scheduler = _scheduler(clock_ns=lambda: now)
+    seen = {"widget": [], "normal": []}
+    widget, normal = seen["widget"].append, seen["normal"].append
+    scheduler.subscribe(widget, "widget")
+    scheduler.subscribe(widget, "widget")
+    scheduler.subscribe(normal, "normal")
+    assert scheduler.subscriber_count == 2
+    assert scheduler.master.scheduled[-1] == (0, scheduler._run)
+
+    scheduler._run()
+    assert len(seen["widget"]) == 1 and seen["widget"][0] is seen["normal"][0]
+    assert seen["widget"][0] is scheduler.latest
+    delay, func = scheduler.master.scheduled[-1]
+    assert func == scheduler._run and 0 < delay <= 47
+
+    scheduler.unsubscribe(widget)
+    scheduler.unsubscribe(normal)
+    scheduler._run()
+    assert len(seen["normal"]) == 1
+    assert not scheduler.running
+
+
+def test_cadence_follows_finest_visible_unit():
+    now = [datetime_to_ns(datetime(2025, 6, 1, 12, tzinfo=timezone.utc)) + 40_000_000]
+    scheduler = _scheduler(clock_ns=lambda: now[0])
+    calls = {"widget": 0, "settings": 0}
+
+    def widget(reading):
+        calls["widget"] += 1
+
+    def settings(reading):
+        calls["settings"] += 1
+
+    scheduler.subscribe(widget, "widget", MILIDIES_NS)
+    scheduler.subscribe(settings, "settings", MILIDIES_NS)
+    assert scheduler.cadence_ns == MILIDIES_NS
+    scheduler._run()
+    assert calls == {"widget": 1, "settings": 1}
+    delay, _ = scheduler.master.scheduled[-1]
+    # Sleeps to the next miliDies boundary (less the time the tick itself took)
+    assert 0 <= scheduler.delay_ms(now[0], MILIDIES_NS) - delay <= 1 and delay > 1000
+
+    # Progress bar shown again: mikroDies cadence, settings still once per miliDies
+    scheduler.set_period(widget, MIKRODIES_NS)
+    assert scheduler.cadence_ns == MIKRODIES_NS
+    for _ in range(5):
+        now[0] += MIKRODIES_NS
+        scheduler._run()
+    assert calls == {"widget": 6, "settings": 1}
+
+
+def test_all_windows_paused_stops_the_loop():
+    scheduler = _scheduler(clock_ns=lambda: datetime_to_ns(EQUINOXES[2025]) + 1)
+    seen = []
+    scheduler.subscribe(seen.append, "normal")
+    scheduler.set_period(seen.append, None)
+    assert not scheduler.running and scheduler.cadence_ns is None
+    scheduler._run()
+    assert seen == [] and not scheduler.running
+
+    # Shown again: ticks at once and renders even within the same mikroDies
+    scheduler.set_period(seen.append, MIKRODIES_NS)
+    assert scheduler.master.scheduled[-1] == (0, scheduler._run)
+    scheduler._run()
+    scheduler.set_period(seen.append, None)
+    scheduler.set_period(seen.append, MIKRODIES_NS)
+    scheduler._run()
+    assert len(seen) == 2
+
+
+def test_destroyed_window_is_dropped():
+    scheduler = _scheduler(clock_ns=lambda: datetime_to_ns(EQUINOXES[2025]) + 1)
+
+    def destroyed(reading):
+        raise tk.TclError('invalid command name ".!label"')
+
+    scheduler.subscribe(destroyed, "gone")
+    assert scheduler.tick() is not None
+    assert scheduler.subscriber_count == 0
+
+
+def test_countdown():
+    scheduler = _scheduler()
+    late = scheduler.reading_at(datetime_to_ns(EQUINOXES[2026] - timedelta(days=3, hours=1)))
+    remaining_dies, remaining_milidies = countdown(late)
+    assert late.dies + remaining_dies + remaining_milidies / 1000 == \
+        late.year_length_dies + (1000 - late.miliDies) / 1000
+    assert 0 <= remaining_milidies < 1000
@@ -0,0 +1,93 @@
+"""
+Tests for the opt-in UI tick tracer (ring buffer, overruns, Chrome trace).
+"""
+import json
+
+from astronomical_watch.ui import tick_trace
+from astronomical_watch.ui.tick_trace import TickTracer
+
+MS = 1_000_000
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += int(ms * MS)
+
+
+def _tick(tracer, clock, window, phases):
+    tracer.begin(window)
+    for name, ms in phases:
+        clock.advance(ms)
+        tracer.mark(name)
+    return tracer.end()
+
+
+def test_phases_and_overruns():
+    clock, messages = FakeClock(), []
+    tracer = TickTracer(clock_ns=clock, report=messages.append)
+    fast = _tick(tracer, clock, "widget", [("clock", 0.1), ("reading", 0.5), ("redraw", 3)])
+    slow = _tick(tracer, clock, "normal", [("clock", 0.1), ("labels", 1), ("redraw", 120)])
+
+    assert [p[0] for p in fast.phases] == ["clock", "reading", "redraw"]
+    assert fast.duration_s == 0.0036
+    assert slow.slowest_phase() == ("redraw", 0.12)
+    assert tracer.overruns == {"normal": 1}
+    assert len(messages) == 1 and "normal tick overran" in messages[0] and "redraw" in messages[0]
+
+
+def test_overrun_reports_are_rate_limited():
+    clock, messages = FakeClock(), []
+    tracer = TickTracer(clock_ns=clock, report=messages.append)
+    for _ in range(5):
+        _tick(tracer, clock, "widget", [("redraw", 100)])
+    clock.advance(6000)
+    _tick(tracer, clock, "widget", [("redraw", 100)])
+    assert tracer.overruns == {"widget": 6}
+    assert len(messages) == 2
+    assert "+4 more" in messages[1]
+
+
+def test_ring_buffer_keeps_latest_ticks():
+    clock = FakeClock()
+    tracer = TickTracer(capacity=3, clock_ns=clock, report=None)
+    for i in range(5):
+        _tick(tracer, clock, f"w{i}", [("clock", 1)])
+    assert [t.window for t in tracer.snapshot()] == ["w2", "w3", "w4"]
+
+
+def test_chrome_trace_dump(tmp_path):
+    clock = FakeClock()
+    tracer = TickTracer(clock_ns=clock, report=None)
+    _tick(tracer, clock, "widget", [("clock", 1), ("redraw", 2)])
+    tracer.begin("normal")
+    clock.advance(90)
+    tracer.fail(ValueError("boom"))
+    tracer.end()
+
+    path = tracer.dump(str(tmp_path / "trace.json"))
+    with open(path) as f:
+        trace = json.load(f)
+    ticks = [e for e in trace["traceEvents"] if e["name"] == "tick"]
+    assert [t["dur"] for t in ticks] == [3000.0, 90000.0]
+    assert ticks[1]["args"] == {"overrun": True, "error": "ValueError: boom"}
+    assert ticks[0]["tid"] != ticks[1]["tid"]
+    assert any(e["name"] == "overrun" and e["ph"] == "i" for e in trace["traceEvents"])
+    assert trace["otherData"]["overruns"] == {"normal": 1}
+
+
+def test_module_hooks_are_no_ops_when_disabled():
+    previous = tick_trace.get_tracer()
+    tick_trace.disable()
+    try:
+        tick_trace.begin("widget")
+        tick_trace.mark("clock")
+        tick_trace.end()
+        assert tick_trace.dump() is None
+    finally:
+        tick_trace._tracer = previous
@@ -0,0 +1,146 @@
+"""
+Tests for the lock-free synchronized clock snapshot and drift model.
+"""
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from astronomical_watch.net import time_sync
+from astronomical_watch.net.time_sync import (
+    ClockDiscipline,
+    ClockSnapshot,
+    NtpEstimate,
+    get_clock_snapshot,
+    get_sync_status,
+    get_synchronized_time,
+    enable_clock_discipline,
+    now,
+    now_ns,
+    update_time_sync,
+)
+
+
+@pytest.fixture
+def fake_sync(monkeypatch):
+    """Replace the network exchange with a fixed offset and isolate module state."""
+    for name in ("_clock_snapshot", "_time_offset", "_last_sync", "_last_estimate", "_discipline"):
+        monkeypatch.setattr(time_sync, name, getattr(time_sync, name))
+    monkeypatch.setattr(time_sync, "_clock_snapshot", None)
+
+    state = {"offset": 0.0}
+
+    def fake_multi(servers, *args, **kwargs):
+        return NtpEstimate(
+            offset=state["offset"], delay=0.01, servers_used=("stand-in",),
+            servers_rejected=(), samples=4
+        )
+
+    monkeypatch.setattr(time_sync, "sync_time_multi", fake_multi)
+    return state
+
+
+def test_snapshot_prediction_with_drift():
+    snapshot = ClockSnapshot(mono_anchor_ns=1_000, utc_anchor_ns=5_000_000_000, drift_ppm=100.0)
+    # 10 s of monotonic time at +100 ppm runs 1 ms fast
+    assert snapshot.utc_ns_at(1_000 + 10_000_000_000) == 5_000_000_000 + 10_001_000_000
+
+
+def test_unsynced_clock_follows_system_time(fake_sync):
+    assert get_clock_snapshot() is None
+    assert abs(now_ns() - time.time_ns()) < 50_000_000
+    assert now().tzinfo == timezone.utc
+
+
+def test_sync_publishes_snapshot_with_offset(fake_sync):
+    fake_sync["offset"] = 2.5
+    assert update_time_sync(force=True)
+
+    snapshot = get_clock_snapshot()
+    assert snapshot is not None
+    assert snapshot.drift_ppm == 0.0
+
+    skew = (get_synchronized_time() - datetime.now(timezone.utc)).total_seconds()
+    assert skew == pytest.approx(2.5, abs=0.05)
+    assert get_sync_status()["drift_ppm"] == 0.0
+
+
+def test_readings_are_monotonic(fake_sync):
+    assert update_time_sync(force=True)
+    readings = [now_ns() for _ in range(1000)]
+    assert readings == sorted(readings)
+
+
+def test_drift_estimated_from_prediction_error(fake_sync, monkeypatch):
+    # Previous snapshot anchored 100 s ago that under-predicts by 1 ms -> +10 ppm
+    mono = time.monotonic_ns()
+    utc = time.time_ns()
+    previous = ClockSnapshot(mono_anchor_ns=mono - 100_000_000_000,
+                             utc_anchor_ns=utc - 100_000_000_000 - 1_000_000)
+    monkeypatch.setattr(time_sync, "_clock_snapshot", previous)
+
+    assert update_time_sync(force=True)
+    assert get_clock_snapshot().drift_ppm == pytest.approx(10.0, abs=1.0)
+
+
+def test_slewing_snapshot_bounded_rate():
+    # +1 ms correction slewed at 500 ppm completes after 2 s of monotonic time
+    snapshot = ClockSnapshot(mono_anchor_ns=0, utc_anchor_ns=0, slew_ppm=500.0,
+                             slew_end_ns=2_000_000_000)
+    assert snapshot.utc_ns_at(1_000_000_000) == 1_000_500_000
+    assert snapshot.utc_ns_at(10_000_000_000) == 10_001_000_000
+    assert snapshot.slew_remaining_ns(1_000_000_000) == 500_000
+    assert snapshot.slew_remaining_ns(3_000_000_000) == 0
+
+
+def test_discipline_slews_small_offset_without_step(fake_sync):
+    enable_clock_discipline(True)
+    assert update_time_sync(force=True)
+    first = get_clock_snapshot()
+
+    fake_sync["offset"] = 0.05
+    before = now_ns()
+    assert update_time_sync(force=True)
+    after = now_ns()
+
+    snapshot = get_clock_snapshot()
+    assert snapshot.generation == first.generation
+    assert snapshot.slew_ppm > 0
+    # No jump: the reading continues from the previous prediction
+    assert 0 <= after - before < 10_000_000
+    remaining = snapshot.slew_remaining_ns(time.monotonic_ns())
+    assert remaining == pytest.approx(50_000_000, abs=5_000_000)
+
+    status = get_sync_status()
+    assert status["disciplined"] is True
+    assert status["slew_remaining_ms"] == pytest.approx(50.0, abs=5.0)
+    assert status["jitter_ms"] is not None
+
+
+def test_discipline_steps_large_offset(fake_sync):
+    enable_clock_discipline(True, step_threshold_s=0.128)
+    assert update_time_sync(force=True)
+    generation = get_clock_snapshot().generation
+
+    fake_sync["offset"] = 1.0
+    assert update_time_sync(force=True)
+    snapshot = get_clock_snapshot()
+    assert snapshot.generation == generation + 1
+    assert snapshot.slew_ppm == 0.0
+    assert (now_ns() - time.time_ns()) / 1e9 == pytest.approx(1.0, abs=0.05)
+
+
+def test_discipline_frequency_estimate_ignores_pending_slew():
+    discipline = ClockDiscipline(freq_gain=1.0)
+    mono = time.monotonic_ns()
+    utc = time.time_ns()
+    # 2 ms of correction is still being slewed in (1 ppm for another 2000 s),
+    # plus 1 ms of new unexplained error over 100 s -> +10 ppm frequency error
+    previous = ClockSnapshot(
+        mono_anchor_ns=mono - 100_000_000_000,
+        utc_anchor_ns=utc - 100_000_000_000 - 3_100_000,
+        slew_ppm=1.0, slew_end_ns=mono + 2_000_000_000_000
+    )
+    snapshot = discipline.update(0.0, previous)
+    assert snapshot.drift_ppm == pytest.approx(10.0, abs=1.0)
+    assert discipline.jitter_s == pytest.approx(0.001, abs=0.0005)
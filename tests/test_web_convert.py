@@ -0,0 +1,109 @@
+"""
+Tests for batch timestamp conversion used by /api/convert.
+"""
+import json
+import struct
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from astronomical_watch.core.astro_time_core import AstroYear, datetime_to_ns
+from astronomical_watch.core.equinox import compute_vernal_equinox
+from web.convert import (
+    ConversionError,
+    MAX_BATCH,
+    MAX_FRAMES,
+    convert_chunks,
+    parse_readings,
+    parse_timestamps,
+    prepare_forward,
+    prepare_reverse,
+    stream_forward,
+    stream_reverse,
+)
+from web.year_context import YearContextHolder
+
+
+@pytest.fixture
+def holder(core_source):
+    return YearContextHolder(core_source)
+
+
+def reading_for(dt):
+    equinox = compute_vernal_equinox(dt.year)
+    if dt < equinox:
+        equinox = compute_vernal_equinox(dt.year - 1)
+    reading = AstroYear(equinox, compute_vernal_equinox(equinox.year + 1)).reading(dt)
+    return equinox.year, reading.dies, reading.miliDies, reading.mikroDies
+
+
+def test_batch_spanning_years_matches_astro_year(holder):
+    start = datetime(2023, 11, 1, 3, 17, 41, 250000, tzinfo=timezone.utc)
+    instants = [start + timedelta(hours=37 * i, microseconds=123 * i) for i in range(400)]
+    rows = [row for chunk in convert_chunks([datetime_to_ns(dt) for dt in instants], holder)
+            for row in chunk]
+    assert rows == [reading_for(dt) for dt in instants]
+    assert {row[0] for row in rows} == {2023, 2024, 2025}
+
+
+def test_json_and_binary_inputs_agree():
+    instants = [1_700_000_000_000_000_000, 1_750_000_000_123_456_789]
+    binary = parse_timestamps(struct.pack("<2q", *instants), "application/octet-stream")
+    as_json = parse_timestamps(json.dumps(instants).encode(), "application/json")
+    iso = parse_timestamps(b'["2023-11-14T22:13:20Z"]', "application/json")
+    assert list(binary) == as_json == instants
+    assert iso == [instants[0]]
+
+
+def test_invalid_batches_rejected():
+    with pytest.raises(ConversionError) as exc_info:
+        parse_timestamps(json.dumps([0] * (MAX_BATCH + 1)).encode(), "application/json")
+    assert exc_info.value.status_code == 413
+    with pytest.raises(ConversionError) as exc_info:
+        parse_timestamps(b"\0" * 12, "application/octet-stream")
+    assert exc_info.value.status_code == 400
+    with pytest.raises(ConversionError):
+        parse_timestamps(b'["2025-01-01T00:00:00"]', "application/json")
+    with pytest.raises(ConversionError):
+        parse_readings(b"[[2025, 3, 1000]]", "application/json")
+
+
+def test_streamed_json_output(holder, monkeypatch):
+    monkeypatch.setattr("web.convert.CHUNK_SIZE", 3)
+    values = [datetime_to_ns(datetime(2025, 6, 1, h, tzinfo=timezone.utc)) for h in range(8)]
+    chunks = list(stream_forward(values, holder, binary=False))
+    assert len(chunks) == 5  # header, three row chunks, footer
+    data = json.loads(b"".join(chunks))
+    assert data["fields"] == ["frame_year", "dies", "miliDies", "mikroDies"]
+    assert len(data["rows"]) == 8
+
+
+def test_reverse_matches_approximate_utc(holder):
+    readings = parse_readings(
+        b'[[2025, 0, 500], {"frame_year": 2025, "dies": 120, "miliDies": 333}]',
+        "application/json",
+    )
+    body = b"".join(stream_reverse(readings, holder, binary=True))
+    utc_ns = struct.unpack("<2q", body)
+
+    year = AstroYear(compute_vernal_equinox(2025), compute_vernal_equinox(2026))
+    for (_, dies, miliDies), ns in zip(readings, utc_ns):
+        assert ns == datetime_to_ns(year.approximate_utc_from_day_miliDies(dies, miliDies))
+
+
+def test_batches_checked_against_their_frames(holder):
+    # Every frame the batch uses is resolved up front, up to MAX_FRAMES of them
+    def june(year):
+        return datetime_to_ns(datetime(year, 6, 1, tzinfo=timezone.utc))
+
+    prepare_forward([june(1969), june(2023)], holder)
+    with pytest.raises(ConversionError):
+        prepare_forward([june(year) for year in range(1960, 1960 + MAX_FRAMES + 1)], holder)
+
+    year = AstroYear(compute_vernal_equinox(2025), compute_vernal_equinox(2026))
+    last = year.reading(compute_vernal_equinox(2026) - timedelta(microseconds=1)).dies
+    prepare_reverse([(2025, last, 0)], holder)
+    with pytest.raises(ConversionError):
+        prepare_reverse([(2025, last + 1, 0)], holder)
+    with pytest.raises(ConversionError):
+        prepare_reverse([(2025, last, 999)], holder)
@@ -0,0 +1,133 @@
+"""
+Tests for the supervisor-published shared-memory year context.
+"""
+import multiprocessing
+import struct
+import threading
+from datetime import timedelta
+from multiprocessing import shared_memory
+
+import pytest
+
+from astronomical_watch.core.astro_time_core import datetime_to_ns
+from astronomical_watch.core.equinox import compute_vernal_equinox
+from web.shared_context import (
+    SharedContextError,
+    SharedContextPublisher,
+    SharedContextReader,
+)
+from web.year_context import YearContextHolder
+
+EQUINOX_2025 = datetime_to_ns(compute_vernal_equinox(2025))
+AROUND_ROLLOVER = [EQUINOX_2025 + delta for delta in (-86_400_000, -1, 0, 1, 86_400_000)]
+
+
+@pytest.fixture
+def publisher(core_source):
+    publisher = SharedContextPublisher(core_source, (2015, 2035), model_version="test-model")
+    publisher.publish(now_ns=EQUINOX_2025 + 1)
+    yield publisher
+    publisher.close()
+
+
+def worker_readings(name):
+    reader = SharedContextReader(name)
+    holder = YearContextHolder(reader.equinox_source, generation=reader.seq)
+    readings = [holder.get(t).reading_at(t) + (holder.get(t).frame_year,) for t in AROUND_ROLLOVER]
+    reader.close()
+    return readings
+
+
+def test_table_round_trip(publisher):
+    reader = SharedContextReader(publisher.name)
+    table = reader.table()
+    assert table.model_version == "test-model"
+    assert table.frame[0] == 2025
+    assert table.frame[1] == EQUINOX_2025
+    assert sorted(table.entries) == list(range(2015, 2036))
+
+    result = reader.equinox_source(2030)
+    assert result["precision"] == "approx"
+    assert abs(result["datetime"] - compute_vernal_equinox(2030)) < timedelta(microseconds=1)
+    with pytest.raises(SharedContextError):
+        reader.equinox_source(1990)
+    reader.close()
+
+
+def test_workers_report_identical_readings_across_rollover(publisher):
+    expected = worker_readings(publisher.name)
+    assert [r[3] for r in expected] == [2024, 2024, 2025, 2025, 2025]
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(2) as pool:
+        results = pool.map(worker_readings, [publisher.name] * 2)
+    assert results == [expected, expected]
+
+
+def test_current_context_uses_published_frame(publisher):
+    reader = SharedContextReader(publisher.name)
+    holder = YearContextHolder(reader.equinox_source, generation=reader.seq,
+                               builder=reader.year_context)
+    context = holder.get(EQUINOX_2025 + 1)
+    frame = reader.table().frame
+    assert (context.frame_year, context.equinox_ns, context.next_equinox_ns,
+            context.first_noon_ns) == frame
+    # Instants outside the published frame still get their own year
+    assert holder.get(EQUINOX_2025 - 1).frame_year == 2024
+    reader.close()
+
+
+def test_republish_bumps_generation_and_rebuilds(publisher, core_source):
+    reader = SharedContextReader(publisher.name)
+    holder = YearContextHolder(reader.equinox_source, generation=reader.seq)
+    assert holder.get(EQUINOX_2025 + 1).precision == "approx"
+
+    refined = dict(core_source(2025), precision="analytic", uncertainty_s=10.0)
+    publisher.update_year(2025, refined)
+    assert holder.get(EQUINOX_2025 + 1).precision == "analytic"
+    reader.close()
+
+
+def test_seqlock_readers_never_see_torn_tables(publisher):
+    reader = SharedContextReader(publisher.name)
+    stop = threading.Event()
+
+    def writer():
+        generation = 0
+        while not stop.is_set():
+            generation += 1
+            publisher._results = {
+                year: dict(result, uncertainty_s=float(generation))
+                for year, result in publisher._results.items()
+            }
+            with publisher._lock:
+                publisher._write(EQUINOX_2025 + 1)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(2000):
+            table = reader.table()
+            assert len({entry[1] for entry in table.entries.values()}) == 1
+    finally:
+        stop.set()
+        thread.join()
+        reader.close()
+
+
+def test_reader_gives_up_on_an_interrupted_write(publisher):
+    reader = SharedContextReader(publisher.name)
+    # Supervisor died between the odd and even counter stores
+    struct.pack_into("<Q", publisher.shm.buf, 8, reader.seq() + 1)
+    with pytest.raises(SharedContextError):
+        reader.table()
+    reader.close()
+
+
+def test_foreign_segment_rejected():
+    foreign = shared_memory.SharedMemory(create=True, size=128)
+    try:
+        with pytest.raises(SharedContextError):
+            SharedContextReader(foreign.name)
+    finally:
+        foreign.close()
+        foreign.unlink()
@@ -0,0 +1,92 @@
+"""
+Tests for the single-producer tick fan-out behind /api/stream and /api/ws.
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from astronomical_watch.core.astro_time_core import NOON_NS, next_boundary_ns
+from web.ticks import RESOLUTIONS, TickBroadcaster
+from web.year_context import YearContextHolder
+
+
+@pytest.fixture
+def make_broadcaster(core_source):
+    def make(period_ns=20_000_000, queue_size=8):
+        return TickBroadcaster(YearContextHolder(core_source), time.time_ns, period_ns, queue_size)
+    return make
+
+
+def test_boundaries_aligned_to_reference_noon():
+    period = RESOLUTIONS["miliDies"]
+    boundary = next_boundary_ns(1_750_000_000_000_000_000, period)
+    assert (boundary - NOON_NS) % period == 0
+    assert 0 < boundary - 1_750_000_000_000_000_000 <= period
+    assert next_boundary_ns(boundary, period) == boundary + period
+
+
+def test_each_tick_computed_once_for_all_subscribers(make_broadcaster):
+    async def scenario():
+        broadcaster = make_broadcaster()
+        a, b = broadcaster.subscribe(), broadcaster.subscribe()
+        received_a = [await a.get() for _ in range(3)]
+        received_b = [await b.get() for _ in range(3)]
+        broadcaster.unsubscribe(a)
+        broadcaster.unsubscribe(b)
+        return broadcaster, received_a, received_b
+
+    broadcaster, received_a, received_b = asyncio.run(scenario())
+    assert all(x is y for x, y in zip(received_a, received_b))
+    seqs = [tick.seq for tick in received_a]
+    assert seqs == sorted(seqs) and len(set(seqs)) == 3
+    assert all(tick.t_ns % 20_000_000 == NOON_NS % 20_000_000 for tick in received_a)
+    assert "miliDies" in json.loads(received_a[0].json)
+    assert received_a[0].sse.startswith(b"id: ")
+    assert broadcaster.subscriber_count == 0
+
+
+def test_slow_subscriber_dropped_without_blocking_others(make_broadcaster):
+    async def scenario():
+        broadcaster = make_broadcaster(period_ns=5_000_000, queue_size=2)
+        slow, fast = broadcaster.subscribe(), broadcaster.subscribe()
+        fast_ticks = [await fast.get() for _ in range(6)]
+        end = await slow.get()
+        broadcaster.unsubscribe(fast)
+        return broadcaster, slow, fast_ticks, end
+
+    broadcaster, slow, fast_ticks, end = asyncio.run(scenario())
+    assert len(fast_ticks) == 6
+    assert slow.dropped is True and end is None
+    assert broadcaster.dropped_total == 1
+    assert broadcaster.status()["subscribers"] == 0
+
+
+def test_producer_stops_without_subscribers(make_broadcaster):
+    async def scenario():
+        broadcaster = make_broadcaster()
+        subscription = broadcaster.subscribe()
+        await subscription.get()
+        broadcaster.unsubscribe(subscription)
+        produced = broadcaster.ticks_produced
+        await asyncio.sleep(0.1)
+        return produced, broadcaster.ticks_produced
+
+    produced, later = asyncio.run(scenario())
+    assert later == produced
+
+
+def test_producer_failure_ends_every_stream():
+    def failing(year):
+        raise RuntimeError("no ephemeris")
+
+    async def scenario():
+        broadcaster = TickBroadcaster(YearContextHolder(failing), time.time_ns, 20_000_000)
+        a, b = broadcaster.subscribe(), broadcaster.subscribe()
+        ends = [await asyncio.wait_for(s.get(), timeout=5.0) for s in (a, b)]
+        return broadcaster, ends
+
+    broadcaster, ends = asyncio.run(scenario())
+    assert ends == [None, None]
+    assert broadcaster.subscriber_count == 0
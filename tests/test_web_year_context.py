@@ -0,0 +1,76 @@
+"""
+Tests for the in-memory year context behind the web API hot paths.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from astronomical_watch.core.astro_time_core import AstroYear, datetime_to_ns
+from astronomical_watch.core.equinox import compute_vernal_equinox
+from web.year_context import YearContextHolder, build_year_context, utc_iso_from_ns
+
+
+@pytest.mark.parametrize("instant", [
+    datetime(2025, 6, 1, 12, 34, 56, 789000, tzinfo=timezone.utc),
+    datetime(2025, 1, 15, 0, 44, 6, tzinfo=timezone.utc),
+    datetime(2026, 2, 28, 23, 59, 59, 999000, tzinfo=timezone.utc),
+])
+def test_reading_matches_astro_year(instant, core_source):
+    t_ns = datetime_to_ns(instant)
+    context = build_year_context(t_ns, core_source)
+    assert context.contains(t_ns)
+
+    equinox = compute_vernal_equinox(context.frame_year)
+    reading = AstroYear(equinox, compute_vernal_equinox(context.frame_year + 1)).reading(instant)
+    dies, miliDies, mikroDies = context.reading_at(t_ns)
+    assert (dies, miliDies, mikroDies) == (reading.dies, reading.miliDies, reading.mikroDies)
+
+
+def test_frame_year_before_and_after_equinox(core_source):
+    equinox = compute_vernal_equinox(2025)
+    before = build_year_context(datetime_to_ns(equinox - timedelta(seconds=1)), core_source)
+    after = build_year_context(datetime_to_ns(equinox + timedelta(seconds=1)), core_source)
+    assert before.frame_year == 2024
+    assert after.frame_year == 2025
+    assert after.reading_at(datetime_to_ns(equinox + timedelta(seconds=1)))[0] == 0
+
+
+def test_now_body_is_valid_json(core_source):
+    t_ns = datetime_to_ns(datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc))
+    context = build_year_context(t_ns, core_source)
+    data = json.loads(context.now_body(t_ns, 71.25, include_longitude=True))
+
+    assert data["utc_iso"] == "2025-06-01T12:00:00.000Z"
+    assert data["frame_year"] == 2025
+    assert data["solar_longitude_deg"] == 71.25
+    assert data["timestamp_proposed"] == (
+        f"2025eq:{data['day_index']:03d}.{data['miliDies']:03d}"
+    )
+    assert "solar_longitude_deg" not in json.loads(context.now_body(t_ns))
+    assert json.loads(context.equinox_bodies[2025])["equinox_utc"].startswith("2025-03-")
+
+
+def test_holder_reuses_context_until_invalidated(core_source):
+    calls = []
+
+    def source(year):
+        calls.append(year)
+        return core_source(year)
+
+    holder = YearContextHolder(source)
+    t_ns = datetime_to_ns(datetime(2025, 6, 1, tzinfo=timezone.utc))
+    first = holder.get(t_ns)
+    assert holder.get(t_ns + 1_000_000_000) is first
+    solved = len(calls)
+
+    holder.invalidate(1999)
+    assert holder.get(t_ns) is first
+    holder.invalidate(2025)
+    assert holder.get(t_ns) is not first
+    assert holder.rebuilds == 2
+    assert len(calls) == 2 * solved
+
+
+def test_utc_iso_from_ns():
+    assert utc_iso_from_ns(1_700_000_000_123_456_789) == "2023-11-14T22:13:20.123Z"
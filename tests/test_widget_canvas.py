@@ -0,0 +1,65 @@
+"""
+Tests for the widget's retained-mode canvas (items created once, updated on change).
+"""
+import pytest
+import tkinter as tk
+
+from astronomical_watch.ui.widget import AstronomicalWidgetMode
+
+
+def _can_open_tk():
+    try:
+        root = tk.Tk()
+        root.destroy()
+        return True
+    except tk.TclError:
+        return False
+
+
+@pytest.fixture
+def widget(monkeypatch):
+    if not _can_open_tk():
+        pytest.skip("No graphical environment (DISPLAY), skipping test.")
+    root = tk.Tk()
+    root.withdraw()
+    widget = AstronomicalWidgetMode(root)
+    monkeypatch.setattr(widget.canvas, "winfo_width", lambda: 136)
+    monkeypatch.setattr(widget.canvas, "winfo_height", lambda: 66)
+    widget.remaining_dies, widget.remaining_milidies = 300, 0
+    yield widget
+    root.destroy()
+
+
+@pytest.mark.ui
+def test_items_are_created_once(widget):
+    widget._draw_time_display()
+    items = widget.canvas.find_all()
+    for mikroDies in range(0, 1000, 37):
+        widget.mikroDies = mikroDies
+        widget.miliDies = mikroDies // 10
+        widget._draw_time_display()
+    assert widget.canvas.find_all() == items
+    assert widget.canvas.itemcget("time_text", "text") == "000.099"
+
+
+@pytest.mark.ui
+def test_unchanged_values_touch_no_items(widget, monkeypatch):
+    widget._draw_time_display()
+    calls = []
+    monkeypatch.setattr(widget.canvas, "itemconfigure", lambda *a, **kw: calls.append(a))
+    monkeypatch.setattr(widget.canvas, "coords", lambda *a: calls.append(a))
+    widget._draw_time_display()
+    widget.mikroDies += 1  # less than one pixel of progress bar
+    widget._draw_time_display()
+    assert calls == []
+
+
+@pytest.mark.ui
+def test_countdown_and_bar_visibility(widget):
+    widget._draw_time_display()
+    assert widget.canvas.itemcget("countdown_text", "state") == "hidden"
+    widget.remaining_dies = 5
+    widget._show_mikrodies = False
+    widget._draw_time_display()
+    assert widget.canvas.itemcget("countdown_text", "state") == "normal"
+    assert widget.canvas.itemcget("bar_bg", "state") == "hidden"
@@ -0,0 +1,18 @@
+"""
+Web / PWA layer for Astronomical Watch (MIT licensed).
+
+FastAPI is only required by web.app; the year context and load-test
+script are stdlib-only so they can be used without the web extras.
+"""
+import os
+import sys
+
+# Make the in-tree sources importable without installation: the package itself
+# (astronomical_watch.*) and its service layer, which uses top-level imports
+# (services.*, solar.*, net.*, offline.*).
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_src_dir = os.path.join(_project_root, "src")
+_package_dir = os.path.join(_src_dir, "astronomical_watch")
+for _path in (_package_dir, _src_dir):
+    if os.path.isdir(_path) and _path not in sys.path:
+        sys.path.insert(0, _path)
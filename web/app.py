@@ -0,0 +1,421 @@
+"""
+FastAPI backend for the Astronomical Watch web / PWA frontend.
+
+Hot endpoints (/api/now, /api/equinox/{year}) are served from an in-memory
+YearContext: equinoxes come from the equinox service once per year (memory
+cached, refined in the background) and responses are assembled from
+pre-serialized fragments. /api/theme and /api/themes serve sky themes
+for any observer location from the memoized location_theme cells.
+/metrics exports the process metrics in the
+Prometheus text format (collection is on unless ASTRON_METRICS=0).
+
+Run:
+    python -m web.app
+    # or: uvicorn web.app:app --workers 4
+"""
+from __future__ import annotations
+import json
+import math
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
+
+from astronomical_watch import core_probes, metrics
+from astronomical_watch.core.astro_time_core import NS_PER_SECOND
+from astronomical_watch.net.time_sync import now_ns
+from astronomical_watch.ui import location_theme
+from routes.http_cache import equinox_cache_headers, equinox_etag, if_none_match, is_settled
+from routes.response_cache import ResponseBytesCache
+from services.equinox_service import (
+    get_model_version,
+    get_settled_precision,
+    get_vernal_equinox_progressive,
+    start_cache_warmer,
+    subscribe_equinox_updates,
+)
+
+from .convert import (
+    BINARY_MEDIA_TYPE,
+    ConversionError,
+    parse_readings,
+    parse_timestamps,
+    prepare_forward,
+    prepare_reverse,
+    stream_forward,
+    stream_reverse,
+)
+from .shared_context import (
+    SHARED_CONTEXT_ENV,
+    SharedContextPublisher,
+    attach_from_env,
+    table_years,
+)
+from .ticks import DEFAULT_RESOLUTION, RESOLUTIONS, TickBroadcaster
+from .year_context import YearContextHolder
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+JSON_MEDIA_TYPE = "application/json"
+MAX_THEME_GRID_POINTS = 100_000
+PING_BODY = b'{"status":"ok"}'
+
+# Workers started by main() with several processes read the supervisor's
+# shared equinox table instead of solving their own (the reader falls back
+# to a local solve only for years outside the table)
+_shared = attach_from_env(fallback_source=get_vernal_equinox_progressive)
+if _shared is not None:
+    _equinox_source = _shared.equinox_source
+    _year_context = YearContextHolder(
+        _shared.equinox_source, generation=_shared.seq, builder=_shared.year_context
+    )
+else:
+    _equinox_source = get_vernal_equinox_progressive
+    _year_context = YearContextHolder(get_vernal_equinox_progressive)
+# Encoded equinox bodies for years outside the current context (settled values only)
+_responses = ResponseBytesCache()
+# Refined equinoxes replace the context that used the fast value
+subscribe_equinox_updates(lambda year, result: _year_context.invalidate(year))
+
+# One producer per stream resolution, shared by all connections
+_broadcasters = {
+    name: TickBroadcaster(_year_context, now_ns, period_ns)
+    for name, period_ns in RESOLUTIONS.items()
+}
+
+# The service exposes /metrics, so it collects unless ASTRON_METRICS says otherwise
+if metrics.METRICS_ENV not in os.environ:
+    metrics.enable()
+if metrics.enabled:
+    core_probes.install()
+metrics.gauge(
+    "awatch_response_cache_entries", "Encoded equinox bodies held by the API"
+).set_function(lambda: _responses.stats()["entries"])
+_stream_subscribers = metrics.gauge(
+    "awatch_stream_subscribers", "Open tick stream connections", ["resolution"]
+)
+for _name, _broadcaster_for in _broadcasters.items():
+    _stream_subscribers.labels(resolution=_name).set_function(
+        lambda b=_broadcaster_for: b.subscriber_count
+    )
+
+
+def _solar_longitude_deg(t_ns: int) -> Optional[float]:
+    try:
+        from astronomical_watch.core.solar import solar_longitude_from_datetime
+        dt = datetime.fromtimestamp(t_ns / NS_PER_SECOND, tz=timezone.utc)
+        return round(math.degrees(solar_longitude_from_datetime(dt)), 6)
+    except Exception:
+        return None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Solve neighbouring equinoxes off the request path before traffic arrives
+    if _shared is None:
+        start_cache_warmer()
+    _year_context.get(now_ns())
+    yield
+
+
+app = FastAPI(title="Astronomical Watch API", version="1.0.0", lifespan=lifespan)
+
+
+@app.get("/api/ping")
+async def ping():
+    return Response(content=PING_BODY, media_type=JSON_MEDIA_TYPE)
+
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    return Response(content=metrics.render_prometheus(), media_type=metrics.PROMETHEUS_CONTENT_TYPE)
+
+
+@app.get("/api/now")
+async def api_now(include_longitude: bool = False):
+    t_ns = now_ns()
+    longitude = _solar_longitude_deg(t_ns) if include_longitude else None
+    body = _year_context.render_now(t_ns, longitude, include_longitude)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE)
+
+
+def _equinox_body(year: int):
+    """(body, precision) for a year outside the current context, via the bytes LRU."""
+    key = ("equinox", year, get_model_version())
+    cached = _responses.get(key)
+    if cached is not None:
+        return cached
+    try:
+        result = _equinox_source(year)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Equinox calculation failed: {e}")
+    cached = (
+        json.dumps({
+            "year": year,
+            "equinox_utc": result["datetime"].isoformat().replace("+00:00", "Z"),
+            "precision": result["precision"],
+            "uncertainty_s": result["uncertainty_s"],
+        }, separators=(",", ":")).encode(),
+        result["precision"],
+    )
+    if is_settled(result["precision"]):
+        _responses.put(key, cached)
+    return cached
+
+
+@app.get("/api/equinox/{year}")
+def api_equinox(year: int, request: Request):
+    now = datetime.now(timezone.utc)
+    settled = get_settled_precision()
+    # Conditional requests for settled values are answered from the model version alone
+    if if_none_match(request.headers.get("if-none-match"), equinox_etag(year, settled)):
+        return Response(status_code=304, headers=equinox_cache_headers(year, settled, now))
+
+    context = _year_context.get(now_ns())
+    body = context.equinox_bodies.get(year)
+    if body is not None:
+        precision = context.equinox_precisions[year]
+    else:
+        body, precision = _equinox_body(year)
+    return Response(
+        content=body, media_type=JSON_MEDIA_TYPE,
+        headers=equinox_cache_headers(year, precision, now),
+    )
+
+
+def _parse_utc(value: Optional[str]) -> datetime:
+    """ISO 8601 instant (naive = UTC) or now."""
+    if value is None:
+        return datetime.fromtimestamp(now_ns() / NS_PER_SECOND, tz=timezone.utc)
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid ISO 8601 instant: {value!r}")
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+def _utc_iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _theme_dict(theme) -> dict:
+    return {"top_color": theme.top_color, "bottom_color": theme.bottom_color,
+            "text_color": theme.text_color}
+
+
+@app.get("/api/theme")
+async def api_theme(lat: float, lon: float, t: Optional[str] = None):
+    """Sky theme for an observer at (lat, lon) degrees at t (ISO 8601, default now)."""
+    when = _parse_utc(t)
+    try:
+        band = location_theme.band_at(lat, lon, when)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "utc": _utc_iso(when),
+        "band": band,
+        "theme": _theme_dict(location_theme.BAND_THEMES[band]),
+    }
+
+
+@app.post("/api/themes")
+async def api_themes(request: Request):
+    """
+    Sky themes for a latitude × longitude grid at one instant.
+
+    Body: {"latitudes": [...], "longitudes": [...], "utc": optional ISO 8601}.
+    Answers a palette of themes and one row of palette indices per latitude.
+    """
+    try:
+        body = json.loads(await request.body())
+        latitudes = [float(v) for v in body["latitudes"]]
+        longitudes = [float(v) for v in body["longitudes"]]
+    except (ValueError, TypeError, KeyError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid grid request: {e}")
+    points = len(latitudes) * len(longitudes)
+    if points > MAX_THEME_GRID_POINTS:
+        raise HTTPException(
+            status_code=413, detail=f"Grid too large: {points} points (max {MAX_THEME_GRID_POINTS})"
+        )
+    when = _parse_utc(body.get("utc"))
+    try:
+        bands = await run_in_threadpool(location_theme.themes_for_grid, latitudes, longitudes, when)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {
+        "utc": _utc_iso(when),
+        "palette": [_theme_dict(theme) for theme in location_theme.BAND_THEMES],
+        "bands": bands,
+    }
+
+
+def _wants_binary(request: Request) -> bool:
+    return BINARY_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _prepare_forward(body: bytes, content_type: str):
+    values = parse_timestamps(body, content_type)
+    prepare_forward(values, _year_context)
+    return values
+
+
+def _prepare_reverse(body: bytes, content_type: str):
+    readings = parse_readings(body, content_type)
+    prepare_reverse(readings, _year_context)
+    return readings
+
+
+@app.post("/api/convert")
+async def api_convert(request: Request):
+    """
+    Convert UTC instants to (frame_year, dies, miliDies, mikroDies).
+
+    Body: JSON array of int64 ns / ISO 8601 strings, or binary int64 ns
+    (Content-Type: application/octet-stream). Send Accept:
+    application/octet-stream for int32 quadruples instead of JSON rows.
+    """
+    body = await request.body()
+    try:
+        values = await run_in_threadpool(
+            _prepare_forward, body, request.headers.get("content-type", "")
+        )
+    except ConversionError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    binary = _wants_binary(request)
+    return StreamingResponse(
+        stream_forward(values, _year_context, binary),
+        media_type=BINARY_MEDIA_TYPE if binary else JSON_MEDIA_TYPE,
+    )
+
+
+@app.post("/api/convert/reverse")
+async def api_convert_reverse(request: Request):
+    """
+    Convert (frame_year, dies, miliDies) to approximate UTC.
+
+    Body: JSON array of [frame_year, dies, miliDies] (or objects with those
+    keys), or binary int32 triples. Binary responses are int64 ns.
+    """
+    body = await request.body()
+    try:
+        readings = await run_in_threadpool(
+            _prepare_reverse, body, request.headers.get("content-type", "")
+        )
+    except ConversionError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    binary = _wants_binary(request)
+    return StreamingResponse(
+        stream_reverse(readings, _year_context, binary),
+        media_type=BINARY_MEDIA_TYPE if binary else JSON_MEDIA_TYPE,
+    )
+
+
+def _broadcaster(resolution: str) -> TickBroadcaster:
+    broadcaster = _broadcasters.get(resolution)
+    if broadcaster is None:
+        raise HTTPException(
+            status_code=422, detail=f"resolution must be one of {sorted(RESOLUTIONS)}"
+        )
+    return broadcaster
+
+
+@app.get("/api/stream")
+async def api_stream(request: Request, resolution: str = DEFAULT_RESOLUTION):
+    """Server-sent events: the current reading, then one event per tick boundary."""
+    broadcaster = _broadcaster(resolution)
+    subscription = broadcaster.subscribe()
+
+    async def events():
+        try:
+            yield broadcaster.make_tick(now_ns()).sse
+            while True:
+                tick = await subscription.get()
+                if tick is None:
+                    return
+                yield tick.sse
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/api/ws")
+async def api_ws(websocket: WebSocket, resolution: str = DEFAULT_RESOLUTION):
+    """WebSocket variant of /api/stream: one JSON text message per tick."""
+    broadcaster = _broadcasters.get(resolution)
+    if broadcaster is None:
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    subscription = broadcaster.subscribe()
+    try:
+        await websocket.send_text(broadcaster.make_tick(now_ns()).json)
+        while True:
+            tick = await subscription.get()
+            if tick is None:
+                await websocket.close(code=1013)  # too slow, try again later
+                return
+            await websocket.send_text(tick.json)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+# Static PWA shell last, so /api/* routes take precedence
+if STATIC_DIR.is_dir():
+    app.mount("/", StaticFiles(directory=STATIC_DIR, html=True), name="static")
+
+
+def start_shared_context() -> SharedContextPublisher:
+    """
+    Publish the equinox table for worker processes (supervisor side).
+
+    Refined equinoxes and year rollovers are republished; workers pick them
+    up through the seqlock counter.
+    """
+    publisher = SharedContextPublisher(
+        get_vernal_equinox_progressive,
+        table_years(datetime.now(timezone.utc).year),
+        model_version=get_model_version(),
+    )
+    publisher.publish()
+    subscribe_equinox_updates(publisher.update_year)
+    publisher.start_rollover_thread()
+    return publisher
+
+
+def main() -> None:
+    import uvicorn
+    workers = int(os.environ.get("UVICORN_WORKERS", "1"))
+    publisher = None
+    if workers > 1:
+        publisher = start_shared_context()
+        os.environ[SHARED_CONTEXT_ENV] = publisher.name
+        print(f"🗂  Shared year context {publisher.name} for {workers} workers")
+    try:
+        uvicorn.run(
+            "web.app:app",
+            host=os.environ.get("UVICORN_HOST", "127.0.0.1"),
+            port=int(os.environ.get("UVICORN_PORT", "8000")),
+            workers=workers,
+        )
+    finally:
+        if publisher is not None:
+            publisher.close()
+
+
+if __name__ == "__main__":
+    main()
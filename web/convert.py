@@ -0,0 +1,267 @@
+"""
+Batch conversion between UTC instants and astronomical readings.
+
+Input is either a JSON array or a compact little-endian binary body:
+- forward:  int64 nanoseconds since the Unix epoch (JSON items may also be
+  ISO 8601 strings)
+- reverse:  int32 triples (frame_year, dies, miliDies)
+
+Output is produced chunk by chunk so a 100k batch is never materialized as
+one response object. Conversion runs over each chunk with the year context
+bounds hoisted into locals; a context lookup only happens when a timestamp
+leaves the current astronomical year.
+"""
+from __future__ import annotations
+import json
+import sys
+from array import array
+from datetime import datetime
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from astronomical_watch.core.astro_time_core import datetime_to_ns, reading_at
+
+from .year_context import YearContextHolder, utc_iso_from_ns
+
+MAX_BATCH = 100_000
+CHUNK_SIZE = 4096
+# Astronomical years one forward batch may use; all of them are resolved before streaming
+MAX_FRAMES = 60
+
+BINARY_MEDIA_TYPE = "application/octet-stream"
+JSON_MEDIA_TYPE = "application/json"
+
+FORWARD_FIELDS = ("frame_year", "dies", "miliDies", "mikroDies")
+REVERSE_FIELDS = ("utc_ns", "utc_iso")
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class ConversionError(ValueError):
+    """Invalid batch; `status_code` is the HTTP status to answer with."""
+
+    def __init__(self, message: str, status_code: int = 422):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def is_binary(content_type: str) -> bool:
+    return (content_type or "").split(";")[0].strip() == BINARY_MEDIA_TYPE
+
+
+def _from_le_bytes(body: bytes, typecode: str) -> array:
+    values = array(typecode)
+    if len(body) % values.itemsize:
+        raise ConversionError(
+            f"Binary body length must be a multiple of {values.itemsize} bytes", 400
+        )
+    values.frombytes(body)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def _to_le_bytes(values: array) -> bytes:
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _check_size(count: int) -> None:
+    if count > MAX_BATCH:
+        raise ConversionError(f"Batch too large: {count} items (max {MAX_BATCH})", 413)
+
+
+def _load_json_array(body: bytes) -> list:
+    try:
+        items = json.loads(body)
+    except ValueError as e:
+        raise ConversionError(f"Invalid JSON: {e}", 400)
+    if not isinstance(items, list):
+        raise ConversionError("Expected a JSON array", 400)
+    _check_size(len(items))
+    return items
+
+
+def _parse_instant(item, index: int) -> int:
+    if isinstance(item, int) and not isinstance(item, bool):
+        return item
+    if isinstance(item, str):
+        try:
+            dt = datetime.fromisoformat(item.replace("Z", "+00:00"))
+        except ValueError:
+            raise ConversionError(f"Item {index}: invalid ISO 8601 timestamp {item!r}")
+        if dt.tzinfo is None:
+            raise ConversionError(f"Item {index}: timestamp must include a UTC offset")
+        return datetime_to_ns(dt)
+    raise ConversionError(f"Item {index}: expected int nanoseconds or ISO 8601 string")
+
+
+def parse_timestamps(body: bytes, content_type: str) -> Sequence[int]:
+    """Parse a forward-conversion request body into nanosecond timestamps."""
+    if is_binary(content_type):
+        values = _from_le_bytes(body, "q")
+        _check_size(len(values))
+        return values
+    return [_parse_instant(item, i) for i, item in enumerate(_load_json_array(body))]
+
+
+def _parse_triple(item, index: int) -> Tuple[int, int, int]:
+    if isinstance(item, dict):
+        try:
+            item = (item["frame_year"], item["dies"], item["miliDies"])
+        except KeyError as e:
+            raise ConversionError(f"Item {index}: missing {e.args[0]!r}")
+    if (
+        not isinstance(item, (list, tuple)) or len(item) != 3
+        or not all(isinstance(v, int) and not isinstance(v, bool) for v in item)
+    ):
+        raise ConversionError(f"Item {index}: expected [frame_year, dies, miliDies] integers")
+    return item[0], item[1], item[2]
+
+
+def parse_readings(body: bytes, content_type: str) -> List[Tuple[int, int, int]]:
+    """Parse a reverse-conversion request body into (frame_year, dies, miliDies)."""
+    if is_binary(content_type):
+        flat = _from_le_bytes(body, "i")
+        if len(flat) % 3:
+            raise ConversionError("Binary body must hold int32 triples", 400)
+        _check_size(len(flat) // 3)
+        readings = list(zip(flat[0::3], flat[1::3], flat[2::3]))
+    else:
+        readings = [_parse_triple(item, i) for i, item in enumerate(_load_json_array(body))]
+    for i, (_, dies, miliDies) in enumerate(readings):
+        if dies < 0 or not 0 <= miliDies < 1000:
+            raise ConversionError(f"Item {i}: dies must be >= 0 and miliDies in [0, 999]")
+    return readings
+
+
+def prepare_forward(values: Sequence[int], holder: YearContextHolder) -> None:
+    """Resolve every frame the batch uses so failures surface before streaming."""
+    frames = set()
+    start_ns = end_ns = 0
+    try:
+        for t in values:
+            if not start_ns <= t < end_ns:
+                context = holder.context_at(t)
+                start_ns, end_ns = context.equinox_ns, context.next_equinox_ns
+                frames.add(context.frame_year)
+                if len(frames) > MAX_FRAMES:
+                    raise ConversionError(
+                        f"Batch uses more than {MAX_FRAMES} astronomical years"
+                    )
+    except ConversionError:
+        raise
+    except Exception as e:
+        raise ConversionError(f"Timestamps outside the supported range: {e}")
+
+
+def prepare_reverse(readings: Sequence[Tuple[int, int, int]], holder: YearContextHolder) -> None:
+    """Resolve every frame year used by the batch and check dies against its length."""
+    try:
+        contexts = {
+            frame_year: holder.for_frame(frame_year) for frame_year in {r[0] for r in readings}
+        }
+    except Exception as e:
+        raise ConversionError(f"Frame year outside the supported range: {e}")
+    last_dies = {
+        frame_year: context.reading_at(context.next_equinox_ns - 1)[0]
+        for frame_year, context in contexts.items()
+    }
+    for i, (frame_year, dies, miliDies) in enumerate(readings):
+        last = last_dies[frame_year]
+        if dies > last or (
+            dies == last
+            and contexts[frame_year].approximate_utc_ns(dies, miliDies)
+            >= contexts[frame_year].next_equinox_ns
+        ):
+            raise ConversionError(
+                f"Item {i}: {dies}.{miliDies:03d} is past the end of frame year {frame_year} "
+                f"(last dies {last})"
+            )
+
+
+def convert_chunks(
+    values: Sequence[int], holder: YearContextHolder
+) -> Iterator[List[Tuple[int, int, int, int]]]:
+    """Yield (frame_year, dies, miliDies, mikroDies) rows in chunks of CHUNK_SIZE."""
+    start_ns = end_ns = 0
+    frame = (0,)
+    for start in range(0, len(values), CHUNK_SIZE):
+        rows = []
+        append = rows.append
+        for t in values[start:start + CHUNK_SIZE]:
+            if not start_ns <= t < end_ns:
+                context = holder.context_at(t)
+                start_ns, end_ns = context.equinox_ns, context.next_equinox_ns
+                frame = (context.frame_year,)
+            append(frame + reading_at(t, start_ns))
+        yield rows
+
+
+def reverse_chunks(
+    readings: Sequence[Tuple[int, int, int]], holder: YearContextHolder
+) -> Iterator[List[int]]:
+    """Yield UTC nanoseconds for (frame_year, dies, miliDies) in chunks."""
+    for start in range(0, len(readings), CHUNK_SIZE):
+        context = None
+        chunk = []
+        for frame_year, dies, miliDies in readings[start:start + CHUNK_SIZE]:
+            if context is None or context.frame_year != frame_year:
+                context = holder.for_frame(frame_year)
+            chunk.append(context.approximate_utc_ns(dies, miliDies))
+        yield chunk
+
+
+def encode_json_rows(fields: Sequence[str], chunks: Iterable[List[str]]) -> Iterator[bytes]:
+    """Stream {"fields": [...], "rows": [...]} from pre-rendered row strings."""
+    yield ('{"fields":' + json.dumps(list(fields)) + ',"rows":[').encode()
+    first = True
+    for rendered in chunks:
+        if not rendered:
+            continue
+        yield (("" if first else ",") + ",".join(rendered)).encode()
+        first = False
+    yield b"]}"
+
+
+def stream_forward(values: Sequence[int], holder: YearContextHolder, binary: bool) -> Iterator[bytes]:
+    """Response body chunks for /api/convert."""
+    chunks = convert_chunks(values, holder)
+    if binary:
+        for rows in chunks:
+            yield _to_le_bytes(array("i", [v for row in rows for v in row]))
+        return
+    yield from encode_json_rows(
+        FORWARD_FIELDS,
+        ([f"[{a},{b},{c},{d}]" for a, b, c, d in rows] for rows in chunks),
+    )
+
+
+def stream_reverse(
+    readings: Sequence[Tuple[int, int, int]], holder: YearContextHolder, binary: bool
+) -> Iterator[bytes]:
+    """Response body chunks for /api/convert/reverse."""
+    chunks = reverse_chunks(readings, holder)
+    if binary:
+        for values in chunks:
+            yield _to_le_bytes(array("q", values))
+        return
+    yield from encode_json_rows(
+        REVERSE_FIELDS,
+        ([f'[{ns},"{utc_iso_from_ns(ns)}"]' for ns in values] for values in chunks),
+    )
+
+
+__all__ = [
+    "ConversionError",
+    "MAX_BATCH",
+    "CHUNK_SIZE",
+    "parse_timestamps",
+    "parse_readings",
+    "prepare_forward",
+    "prepare_reverse",
+    "convert_chunks",
+    "reverse_chunks",
+    "stream_forward",
+    "stream_reverse",
+]
@@ -0,0 +1,109 @@
+"""
+Minimal HTTP load generator for the web API (stdlib only).
+
+Each worker thread keeps one persistent HTTP/1.1 connection and issues GET
+requests back to back for the given duration; throughput and latency
+percentiles are printed at the end.
+
+Usage:
+    python -m web.app &                        # or uvicorn web.app:app --workers N
+    python -m web.loadtest --path /api/now --concurrency 16 --duration 10
+"""
+from __future__ import annotations
+import argparse
+import http.client
+import threading
+import time
+from typing import List
+from urllib.parse import urlsplit
+
+
+def _worker(host: str, port: int, path: str, deadline: float,
+            latencies: List[float], errors: List[int]) -> None:
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    local: List[float] = []
+    failed = 0
+    while True:
+        start = time.perf_counter()
+        if start >= deadline:
+            break
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                failed += 1
+        except (OSError, http.client.HTTPException):
+            failed += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=5)
+            continue
+        local.append(time.perf_counter() - start)
+    conn.close()
+    latencies.extend(local)
+    errors.append(failed)
+
+
+def run_load_test(url: str, concurrency: int = 8, duration: float = 10.0) -> dict:
+    """
+    Hammer one URL and report throughput.
+
+    Returns:
+        Dictionary with requests, errors, rps and p50/p99 latency in ms
+    """
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    deadline = time.perf_counter() + duration
+    latencies: List[float] = []
+    errors: List[int] = []
+    threads = [
+        threading.Thread(
+            target=_worker,
+            args=(parts.hostname, parts.port or 80, path, deadline, latencies, errors),
+            daemon=True,
+        )
+        for _ in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the Astronomical Watch web API")
+    parser.add_argument("--host", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", default="/api/now")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    url = args.host.rstrip("/") + args.path
+    print(f"Load testing {url} with {args.concurrency} connections for {args.duration:.0f}s...")
+    result = run_load_test(url, args.concurrency, args.duration)
+    print(f"  requests: {result['requests']}  errors: {result['errors']}")
+    print(f"  throughput: {result['rps']:.0f} req/s")
+    print(f"  latency: p50 {result['p50_ms']:.2f} ms  p99 {result['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
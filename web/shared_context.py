@@ -0,0 +1,344 @@
+"""
+Shared-memory year context for multi-worker deployments.
+
+The supervisor process solves the equinox table once and publishes it,
+together with the current frame (the scalars of the current YearContext),
+in a `multiprocessing.shared_memory` segment. Workers attach at startup and
+build their YearContexts from the table, taking the current frame year from
+the published frame, so they never solve equinoxes or load VSOP87
+coefficients, and all of them use bit-identical equinox instants across a
+year rollover.
+
+Segment layout (little-endian):
+    0   4s  magic b"AWYC"
+    4   I   layout version
+    8   Q   seqlock counter (odd while the supervisor is writing)
+    16  body: model version (16s), first_year (i), count (I), frame_year (i),
+        padding (4x), equinox_ns, next_equinox_ns, first_noon_ns (3 x q),
+        then `count` entries of (equinox_ns q, uncertainty_s d, precision B)
+
+Readers copy the body between two reads of the counter and retry if it
+changed or was odd, so they never see a half-written table and never block
+the writer.
+"""
+from __future__ import annotations
+import os
+import struct
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+from astronomical_watch.core.astro_time_core import datetime_to_ns
+
+from .year_context import (
+    EquinoxSource,
+    YearContext,
+    build_frame_context,
+    build_year_context,
+    frame_year_at,
+)
+
+MAGIC = b"AWYC"
+LAYOUT_VERSION = 1
+
+# Environment variable carrying the segment name from supervisor to workers
+SHARED_CONTEXT_ENV = "ASTRON_SHARED_CONTEXT"
+
+# Years either side of the current year in the published table
+TABLE_RADIUS = 25
+
+_PREAMBLE = struct.Struct("<4sIQ")
+_SEQ_OFFSET = 8
+_BODY_HEADER = struct.Struct("<16siIi4xqqq")
+_ENTRY = struct.Struct("<qdB")
+_BODY_OFFSET = _PREAMBLE.size
+
+PRECISION_CODES = {"internet": 0, "analytic": 1, "approx": 2}
+PRECISION_NAMES = {code: name for name, code in PRECISION_CODES.items()}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Readers spin this many times on a write in progress before sleeping briefly
+_SPIN_LIMIT = 100
+# A write still in progress after this long means the supervisor died mid-write
+_READ_TIMEOUT_S = 0.005
+
+
+class SharedContextError(RuntimeError):
+    """Segment missing, foreign or incompatible."""
+
+
+def _datetime_from_ns(t_ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=t_ns // 1000)
+
+
+def segment_size(count: int) -> int:
+    return _BODY_OFFSET + _BODY_HEADER.size + count * _ENTRY.size
+
+
+class SharedTable:
+    """Decoded, immutable copy of one published table version."""
+
+    __slots__ = ("seq", "model_version", "first_year", "entries", "frame")
+
+    def __init__(self, seq: int, body: bytes):
+        (model_version, first_year, count, frame_year,
+         equinox_ns, next_equinox_ns, first_noon_ns) = _BODY_HEADER.unpack_from(body)
+        self.seq = seq
+        self.model_version = model_version.rstrip(b"\0").decode()
+        self.first_year = first_year
+        self.frame = (frame_year, equinox_ns, next_equinox_ns, first_noon_ns)
+        self.entries: Dict[int, Tuple[int, float, str]] = {}
+        offset = _BODY_HEADER.size
+        for i in range(count):
+            ns, uncertainty, code = _ENTRY.unpack_from(body, offset)
+            self.entries[first_year + i] = (ns, uncertainty, PRECISION_NAMES.get(code, "approx"))
+            offset += _ENTRY.size
+
+    def result(self, year: int) -> Optional[Dict]:
+        """Equinox result dictionary (service format) for a year in the table."""
+        entry = self.entries.get(year)
+        if entry is None:
+            return None
+        ns, uncertainty, precision = entry
+        return {
+            "datetime": _datetime_from_ns(ns),
+            "precision": precision,
+            "uncertainty_s": uncertainty,
+            "cached": True,
+        }
+
+
+class SharedContextPublisher:
+    """
+    Supervisor side: owns the segment and is its only writer.
+
+    Args:
+        equinox_source: Function returning the service result dict for a year
+        years: Inclusive (first, last) year range of the table
+        model_version: Identifier stored for workers (e.g. get_model_version())
+        name: Segment name (default: generated)
+    """
+
+    def __init__(
+        self,
+        equinox_source: EquinoxSource,
+        years: Tuple[int, int],
+        model_version: str = "",
+        name: Optional[str] = None
+    ):
+        self.equinox_source = equinox_source
+        self.first_year, last_year = years
+        self.count = last_year - self.first_year + 1
+        self.model_version = model_version
+        self._results: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+        self._rollover_thread: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=segment_size(self.count))
+        _PREAMBLE.pack_into(self.shm.buf, 0, MAGIC, LAYOUT_VERSION, 0)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def _seq(self) -> int:
+        return struct.unpack_from("<Q", self.shm.buf, _SEQ_OFFSET)[0]
+
+    def publish(self, now_ns: Optional[int] = None) -> int:
+        """Solve (or re-read) every year and write the table. Returns the new version."""
+        results = {
+            year: self.equinox_source(year)
+            for year in range(self.first_year, self.first_year + self.count)
+        }
+        with self._lock:
+            self._results = results
+            return self._write(now_ns)
+
+    def update_year(self, year: int, result: Dict) -> Optional[int]:
+        """Replace one year's entry (e.g. after a background refinement)."""
+        if not self.first_year <= year < self.first_year + self.count:
+            return None
+        with self._lock:
+            self._results[year] = result
+            return self._write()
+
+    def _write(self, now_ns: Optional[int] = None) -> int:
+        t_ns = time.time_ns() if now_ns is None else now_ns
+        frame_year = frame_year_at(t_ns, self._results.__getitem__)
+        context = build_frame_context(frame_year, self._results.__getitem__)
+
+        body = bytearray(_BODY_HEADER.size + self.count * _ENTRY.size)
+        _BODY_HEADER.pack_into(
+            body, 0, self.model_version.encode()[:16], self.first_year, self.count,
+            context.frame_year, context.equinox_ns, context.next_equinox_ns, context.first_noon_ns
+        )
+        offset = _BODY_HEADER.size
+        for i in range(self.count):
+            result = self._results[self.first_year + i]
+            _ENTRY.pack_into(
+                body, offset, datetime_to_ns(result["datetime"]), float(result["uncertainty_s"]),
+                PRECISION_CODES.get(result["precision"], PRECISION_CODES["approx"])
+            )
+            offset += _ENTRY.size
+
+        buf = self.shm.buf
+        seq = self._seq()
+        struct.pack_into("<Q", buf, _SEQ_OFFSET, seq + 1)  # odd: write in progress
+        buf[_BODY_OFFSET:_BODY_OFFSET + len(body)] = body
+        struct.pack_into("<Q", buf, _SEQ_OFFSET, seq + 2)
+        return seq + 2
+
+    def current_frame_end_ns(self) -> int:
+        with self._lock:
+            return SharedTable(self._seq(), bytes(self.shm.buf[_BODY_OFFSET:])).frame[2]
+
+    def start_rollover_thread(self) -> None:
+        """Republish the current frame at every equinox until close()."""
+        def run():
+            while not self._closed.is_set():
+                delay = (self.current_frame_end_ns() - time.time_ns()) / 1e9
+                if self._closed.wait(max(0.0, min(delay, 3600.0))):
+                    return
+                if time.time_ns() >= self.current_frame_end_ns():
+                    with self._lock:
+                        self._write()
+
+        self._rollover_thread = threading.Thread(
+            target=run, daemon=True, name="Shared-Context-Rollover"
+        )
+        self._rollover_thread.start()
+
+    def close(self, unlink: bool = True) -> None:
+        self._closed.set()
+        self.shm.close()
+        if unlink:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedContextReader:
+    """
+    Worker side: attaches to the supervisor's segment and decodes tables.
+
+    The decoded table is cached per version, so steady-state lookups only
+    read the 8-byte counter.
+    """
+
+    def __init__(self, name: str, fallback_source: Optional[EquinoxSource] = None):
+        self.shm = _attach(name)
+        magic, layout, _ = _PREAMBLE.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC or layout != LAYOUT_VERSION:
+            self.shm.close()
+            raise SharedContextError(f"Segment {name!r} is not a year context (layout {layout})")
+        self.fallback_source = fallback_source
+        self._table: Optional[SharedTable] = None
+        self.retries = 0
+
+    def seq(self) -> int:
+        return struct.unpack_from("<Q", self.shm.buf, _SEQ_OFFSET)[0]
+
+    def table(self) -> SharedTable:
+        """Consistent copy of the current table (seqlock read)."""
+        cached = self._table
+        spins = 0
+        deadline = None
+        while True:
+            before = self.seq()
+            if cached is not None and cached.seq == before:
+                return cached
+            if before & 1 == 0:
+                body = bytes(self.shm.buf[_BODY_OFFSET:])
+                if self.seq() == before:
+                    if before == 0:
+                        raise SharedContextError("Shared year context not published yet")
+                    table = SharedTable(before, body)
+                    self._table = table
+                    return table
+            self.retries += 1
+            spins += 1
+            if spins > _SPIN_LIMIT:
+                if deadline is None:
+                    deadline = time.monotonic() + _READ_TIMEOUT_S
+                elif time.monotonic() > deadline:
+                    raise SharedContextError(
+                        f"Segment {self.shm.name!r}: write in progress never completed"
+                    )
+                time.sleep(0.0001)
+
+    def equinox_source(self, year: int) -> Dict:
+        """Equinox result for a year: shared table first, then the fallback source."""
+        result = self.table().result(year)
+        if result is not None:
+            return result
+        if self.fallback_source is None:
+            raise SharedContextError(f"Year {year} outside the shared equinox table")
+        return self.fallback_source(year)
+
+    def year_context(self, t_ns: int) -> YearContext:
+        """Context containing t_ns, using the published frame when it covers t_ns."""
+        frame_year, equinox_ns, next_equinox_ns, _ = self.table().frame
+        if equinox_ns <= t_ns < next_equinox_ns:
+            return build_frame_context(frame_year, self.equinox_source)
+        return build_year_context(t_ns, self.equinox_source)
+
+    def status(self) -> Dict:
+        table = self.table()
+        return {
+            "segment": self.shm.name,
+            "seq": table.seq,
+            "model_version": table.model_version,
+            "years": [table.first_year, table.first_year + len(table.entries) - 1],
+            "frame_year": table.frame[0],
+            "retries": self.retries,
+        }
+
+    def close(self) -> None:
+        self.shm.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    shm = shared_memory.SharedMemory(name=name)
+    # Before 3.13 attaching registers the segment with this process's resource
+    # tracker, which would unlink it when the worker exits; the supervisor owns it.
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def table_years(center_year: int, radius: int = TABLE_RADIUS) -> Tuple[int, int]:
+    return center_year - radius, center_year + radius
+
+
+def attach_from_env(fallback_source: Optional[EquinoxSource] = None) -> Optional[SharedContextReader]:
+    """Attach to the segment named in ASTRON_SHARED_CONTEXT, if any."""
+    name = os.environ.get(SHARED_CONTEXT_ENV)
+    if not name:
+        return None
+    try:
+        return SharedContextReader(name, fallback_source)
+    except (FileNotFoundError, SharedContextError) as e:
+        print(f"⚠️  Shared year context {name!r} unavailable: {e}")
+        return None
+
+
+__all__ = [
+    "SHARED_CONTEXT_ENV",
+    "SharedContextError",
+    "SharedContextPublisher",
+    "SharedContextReader",
+    "SharedTable",
+    "attach_from_env",
+    "table_years",
+]
@@ -0,0 +1,57 @@
+// Astronomical Watch PWA client: follows the /api/stream tick events (one per
+// miliDies) and falls back to polling /api/now where EventSource is missing.
+"use strict";
+
+const MILIDIES_MS = 86400;
+const timestampEl = document.getElementById("timestamp");
+const detailsEl = document.getElementById("details");
+const statusEl = document.getElementById("status");
+
+let last = null;       // last /api/now payload
+let fetchedAt = 0;     // performance.now() when it arrived
+
+function pad3(n) {
+  return String(n).padStart(3, "0");
+}
+
+function render() {
+  if (last) {
+    const elapsed = performance.now() - fetchedAt;
+    const mili = (last.miliDies + Math.floor(elapsed / MILIDIES_MS)) % 1000;
+    timestampEl.textContent = `${last.frame_year}eq:${pad3(last.day_index)}.${pad3(mili)}`;
+  }
+  requestAnimationFrame(render);
+}
+
+function update(reading) {
+  last = reading;
+  fetchedAt = performance.now();
+  detailsEl.textContent = `UTC ${last.utc_iso} · equinox ${last.equinox_utc}`;
+  statusEl.textContent = "live";
+}
+
+async function refresh() {
+  try {
+    const response = await fetch("/api/now", { cache: "no-store" });
+    update(await response.json());
+  } catch (err) {
+    statusEl.textContent = "offline – showing last known time";
+  }
+}
+
+if ("EventSource" in window) {
+  const stream = new EventSource("/api/stream");
+  stream.addEventListener("tick", (event) => update(JSON.parse(event.data)));
+  // EventSource reconnects by itself; just report the gap
+  stream.onerror = () => {
+    statusEl.textContent = "reconnecting…";
+  };
+} else {
+  refresh();
+  setInterval(refresh, MILIDIES_MS);
+}
+requestAnimationFrame(render);
+
+if ("serviceWorker" in navigator) {
+  navigator.serviceWorker.register("service-worker.js");
+}
@@ -0,0 +1,167 @@
+"""
+Live tick stream: one producer, many subscribers.
+
+A TickBroadcaster computes each reading once per boundary (every miliDies
+or mikroDies, aligned to the reference noon) and pushes the same
+pre-encoded Tick to every subscriber's bounded queue. A subscriber whose
+queue is full is dropped instead of slowing the producer or buffering
+without limit. The producer runs only while someone is subscribed; if it
+fails, every subscriber's stream is ended instead of left waiting.
+"""
+from __future__ import annotations
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set
+
+from fastapi.concurrency import run_in_threadpool
+
+from astronomical_watch.core.astro_time_core import MIKRODIES_NS, MILIDIES_NS, next_boundary_ns
+
+from .year_context import YearContextHolder
+
+# Tick period per stream resolution (ns)
+RESOLUTIONS: Dict[str, int] = {
+    "miliDies": MILIDIES_NS,    # 86.4 s
+    "mikroDies": MIKRODIES_NS,  # 86.4 ms
+}
+DEFAULT_RESOLUTION = "miliDies"
+
+# Ticks buffered per subscriber before it is considered too slow and dropped
+SUBSCRIBER_QUEUE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class Tick:
+    """One reading, encoded once for all transports."""
+    seq: int
+    t_ns: int
+    json: str
+    sse: bytes
+
+
+class Subscription:
+    """A subscriber's bounded queue; get() returns None once the stream ended."""
+
+    def __init__(self, maxsize: int):
+        self.queue: "asyncio.Queue[Optional[Tick]]" = asyncio.Queue(maxsize)
+        self.dropped = False
+
+    async def get(self) -> Optional[Tick]:
+        return await self.queue.get()
+
+    def _offer(self, tick: Tick) -> bool:
+        try:
+            self.queue.put_nowait(tick)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _close(self) -> None:
+        # Make room for the end-of-stream marker
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class TickBroadcaster:
+    """
+    Single-producer fan-out of readings to subscribers.
+
+    Args:
+        holder: Year context source for the readings
+        clock_ns: Function returning the current UTC time in ns
+        period_ns: Tick period (see RESOLUTIONS)
+        queue_size: Per-subscriber queue bound
+    """
+
+    def __init__(
+        self,
+        holder: YearContextHolder,
+        clock_ns: Callable[[], int],
+        period_ns: int = RESOLUTIONS[DEFAULT_RESOLUTION],
+        queue_size: int = SUBSCRIBER_QUEUE_SIZE
+    ):
+        self.holder = holder
+        self.clock_ns = clock_ns
+        self.period_ns = period_ns
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._seq = 0
+        self.ticks_produced = 0
+        self.dropped_total = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def make_tick(self, t_ns: int) -> Tick:
+        """Encode the reading at t_ns."""
+        self._seq += 1
+        body = self.holder.render_now(t_ns)
+        sse = b"id: %d\nevent: tick\ndata: %s\n\n" % (self._seq, body)
+        return Tick(seq=self._seq, t_ns=t_ns, json=body.decode(), sse=sse)
+
+    def subscribe(self) -> Subscription:
+        """Register a subscriber and make sure the producer runs on this event loop."""
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._produce())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def broadcast(self, tick: Tick) -> None:
+        """Offer a tick to every subscriber, dropping those that fell behind."""
+        for subscription in list(self._subscribers):
+            if not subscription._offer(tick):
+                subscription.dropped = True
+                subscription._close()
+                self._subscribers.discard(subscription)
+                self.dropped_total += 1
+
+    def _end_stream(self) -> None:
+        for subscription in list(self._subscribers):
+            subscription._close()
+        self._subscribers.clear()
+
+    async def _produce(self) -> None:
+        try:
+            while self._subscribers:
+                boundary = next_boundary_ns(self.clock_ns(), self.period_ns)
+                if not self.holder.covers(boundary):
+                    # A new year's context may need equinox solves; keep them off the loop
+                    await run_in_threadpool(self.holder.get, boundary)
+                delay = (boundary - self.clock_ns()) / 1e9
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self.broadcast(self.make_tick(boundary))
+                self.ticks_produced += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️  Tick stream stopped: {e}")
+            self._end_stream()
+
+    def status(self) -> dict:
+        return {
+            "period_ms": self.period_ns / 1e6,
+            "subscribers": self.subscriber_count,
+            "ticks_produced": self.ticks_produced,
+            "dropped_total": self.dropped_total,
+        }
+
+
+__all__ = [
+    "RESOLUTIONS",
+    "DEFAULT_RESOLUTION",
+    "Subscription",
+    "Tick",
+    "TickBroadcaster",
+]
@@ -0,0 +1,322 @@
+"""
+In-memory year context for the web API hot paths.
+
+A YearContext holds everything /api/now needs for the current astronomical
+year as integers (nanoseconds since the Unix epoch) plus pre-serialized JSON
+fragments, so a request is a handful of integer operations and one string
+join - no equinox solve, no datetime arithmetic and no disk I/O. The context
+is immutable; a new one is built and swapped in when the year rolls over or
+the equinox service refines one of its equinoxes.
+"""
+from __future__ import annotations
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from astronomical_watch.core.astro_time_core import (
+    DAY_NS,
+    MILIDES_PER_DAY,
+    MILIDIES_NS,
+    NOON_NS,
+    NS_PER_SECOND,
+    datetime_to_ns,
+    first_noon_ns,
+    reading_at,
+)
+
+# Frame contexts kept for batch conversion of arbitrary years
+FRAME_CACHE_SIZE = 64
+
+# Explains the proposed YYYYeq:DDD.mmm timestamp in every /api/now response
+NOW_NOTE = (
+    "timestamp_proposed = YYYYeq:DDD.mmm (frame year, dies, miliDies); "
+    "dies counts mean noons at 168°58'30\"W since the vernal equinox"
+)
+
+# Function returning the equinox result dictionary for a year
+EquinoxSource = Callable[[int], Dict]
+
+
+def _iso_z(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+def utc_iso_from_ns(t_ns: int) -> str:
+    """ISO 8601 UTC string with millisecond precision and a Z suffix."""
+    seconds, rem = divmod(t_ns, NS_PER_SECOND)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{rem // 1_000_000:03d}Z"
+
+
+@dataclass(frozen=True)
+class YearContext:
+    """
+    Precomputed state for one astronomical year (current equinox to next).
+
+    Matches AstroYear.reading(): dies is 0 from the equinox to the first mean
+    noon after it and increments at every noon; miliDies counts from the last
+    noon regardless of the equinox.
+    """
+    frame_year: int
+    equinox_ns: int
+    next_equinox_ns: int
+    first_noon_ns: int
+    precision: str
+    uncertainty_s: float
+    # Pre-serialized JSON fragments
+    now_suffix: str = field(repr=False)
+    equinox_bodies: Dict[int, bytes] = field(repr=False)
+    equinox_precisions: Dict[int, str] = field(repr=False)
+
+    def contains(self, t_ns: int) -> bool:
+        return self.equinox_ns <= t_ns < self.next_equinox_ns
+
+    def reading_at(self, t_ns: int):
+        """(dies, miliDies, mikroDies) at a UTC instant in this year."""
+        return reading_at(t_ns, self.equinox_ns)
+
+    def approximate_utc_ns(self, dies: int, miliDies: int) -> int:
+        """
+        UTC (ns) for a dies/miliDies pair in this year.
+
+        Integer form of AstroYear.approximate_utc_from_day_miliDies(): dies 0
+        is measured from the equinox itself, later dies from their noon.
+        """
+        if dies < 0:
+            raise ValueError("dies must be >= 0")
+        if not 0 <= miliDies < MILIDES_PER_DAY:
+            raise ValueError("miliDies out of range")
+        if dies == 0:
+            return self.equinox_ns + miliDies * MILIDIES_NS
+        return self.first_noon_ns + (dies - 1) * DAY_NS + miliDies * MILIDIES_NS
+
+    def now_body(self, t_ns: int, longitude_deg: Optional[float] = None,
+                 include_longitude: bool = False) -> str:
+        """JSON body for /api/now at t_ns."""
+        dies, miliDies, mikroDies = self.reading_at(t_ns)
+        extra = ""
+        if include_longitude:
+            extra = f',"solar_longitude_deg":{json.dumps(longitude_deg)}'
+        return (
+            f'{{"utc_iso":"{utc_iso_from_ns(t_ns)}","day_index":{dies},'
+            f'"miliDies":{miliDies},"mikroDies":{mikroDies},'
+            f'"timestamp_proposed":"{self.frame_year}eq:{dies:03d}.{miliDies:03d}"'
+            f'{extra}{self.now_suffix}'
+        )
+
+
+class NowRenderer:
+    """
+    Renders /api/now bodies from a per-miliDies template.
+
+    Within one miliDies only utc_iso and mikroDies change (dies changes at
+    noon, which is a miliDies boundary, and a new year brings a new context),
+    so everything else is formatted once per miliDies and the ISO date/time
+    prefix once per second. State is swapped as whole tuples, so concurrent
+    renders at worst rebuild a template.
+    """
+
+    def __init__(self):
+        self._template = None  # (context, miliDies index, middle, stamp)
+        self._second = None    # (unix second, "YYYY-MM-DDTHH:MM:SS")
+        self.template_builds = 0
+
+    def render(self, context: YearContext, t_ns: int, longitude_deg: Optional[float] = None,
+               include_longitude: bool = False) -> bytes:
+        mili_index, into_mili = divmod(t_ns - NOON_NS, MILIDIES_NS)
+        template = self._template
+        if template is None or template[0] is not context or template[1] != mili_index:
+            dies, miliDies, _ = context.reading_at(t_ns)
+            template = (
+                context,
+                mili_index,
+                f'","day_index":{dies},"miliDies":{miliDies},"mikroDies":',
+                f',"timestamp_proposed":"{context.frame_year}eq:{dies:03d}.{miliDies:03d}"',
+            )
+            self._template = template
+            self.template_builds += 1
+
+        seconds, rem = divmod(t_ns, NS_PER_SECOND)
+        second = self._second
+        if second is None or second[0] != seconds:
+            second = (seconds, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)))
+            self._second = second
+
+        extra = ""
+        if include_longitude:
+            extra = f',"solar_longitude_deg":{json.dumps(longitude_deg)}'
+        return (
+            f'{{"utc_iso":"{second[1]}.{rem // 1_000_000:03d}Z{template[2]}'
+            f'{into_mili * 1000 // MILIDIES_NS}{template[3]}{extra}{context.now_suffix}'
+        ).encode()
+
+
+def build_frame_context(frame_year: int, equinox_source: EquinoxSource) -> YearContext:
+    """Build the context for the astronomical year starting at frame_year's equinox."""
+    results = {y: equinox_source(y) for y in (frame_year - 1, frame_year, frame_year + 1)}
+
+    eq = results[frame_year]["datetime"]
+    equinox_ns = datetime_to_ns(eq)
+
+    equinox_bodies = {
+        y: json.dumps({
+            "year": y,
+            "equinox_utc": _iso_z(r["datetime"]),
+            "precision": r["precision"],
+            "uncertainty_s": r["uncertainty_s"],
+        }, separators=(",", ":")).encode()
+        for y, r in results.items()
+    }
+    now_suffix = (
+        f',"frame_year":{frame_year},'
+        f'"equinox_utc":"{_iso_z(eq)}",'
+        f'"note":{json.dumps(NOW_NOTE, ensure_ascii=False)}}}'
+    )
+    return YearContext(
+        frame_year=frame_year,
+        equinox_ns=equinox_ns,
+        next_equinox_ns=datetime_to_ns(results[frame_year + 1]["datetime"]),
+        first_noon_ns=first_noon_ns(equinox_ns),
+        precision=results[frame_year]["precision"],
+        uncertainty_s=results[frame_year]["uncertainty_s"],
+        now_suffix=now_suffix,
+        equinox_bodies=equinox_bodies,
+        equinox_precisions={y: r["precision"] for y, r in results.items()},
+    )
+
+
+def frame_year_at(t_ns: int, equinox_source: EquinoxSource) -> int:
+    """Astronomical frame year (year of the last vernal equinox) at t_ns."""
+    year = time.gmtime(t_ns // NS_PER_SECOND).tm_year
+    if datetime_to_ns(equinox_source(year)["datetime"]) <= t_ns:
+        return year
+    return year - 1
+
+
+def build_year_context(t_ns: int, equinox_source: EquinoxSource) -> YearContext:
+    """Build the context for the astronomical year containing t_ns."""
+    return build_frame_context(frame_year_at(t_ns, equinox_source), equinox_source)
+
+
+class YearContextHolder:
+    """
+    Lock-free reader access to the current YearContext.
+
+    Readers take one reference; the context is rebuilt under a lock only when
+    the requested instant falls outside it or invalidate() was called.
+
+    Args:
+        equinox_source: Function returning the equinox result dict for a year
+        generation: Optional function returning a version of the source data;
+            when it changes, all contexts are rebuilt (shared-memory tables)
+        builder: Optional function building the current context for an
+            instant (default: build_year_context with equinox_source)
+    """
+
+    def __init__(self, equinox_source: EquinoxSource,
+                 generation: Optional[Callable[[], int]] = None,
+                 builder: Optional[Callable[[int], YearContext]] = None):
+        self._source = equinox_source
+        self._builder = builder
+        self._generation_fn = generation
+        self._generation = generation() if generation is not None else None
+        self._context: Optional[YearContext] = None
+        self._frames: "OrderedDict[int, YearContext]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._now_renderer = NowRenderer()
+        self.rebuilds = 0
+
+    def _check_generation(self) -> None:
+        generation = self._generation_fn()
+        if generation != self._generation:
+            with self._lock:
+                self._generation = generation
+                self._context = None
+                self._frames.clear()
+
+    def get(self, t_ns: int) -> YearContext:
+        if self._generation_fn is not None:
+            self._check_generation()
+        context = self._context
+        if context is not None and context.contains(t_ns):
+            return context
+        with self._lock:
+            context = self._context
+            if context is None or not context.contains(t_ns):
+                if self._builder is not None:
+                    context = self._builder(t_ns)
+                else:
+                    context = build_year_context(t_ns, self._source)
+                self._context = context
+                self.rebuilds += 1
+            return context
+
+    def covers(self, t_ns: int) -> bool:
+        """True if the current context is built and contains t_ns (get() will not rebuild)."""
+        context = self._context
+        return context is not None and context.contains(t_ns)
+
+    def render_now(self, t_ns: int, longitude_deg: Optional[float] = None,
+                   include_longitude: bool = False) -> bytes:
+        """Encoded /api/now body at t_ns (same content as YearContext.now_body)."""
+        return self._now_renderer.render(self.get(t_ns), t_ns, longitude_deg, include_longitude)
+
+    def for_frame(self, frame_year: int) -> YearContext:
+        """Context for an arbitrary frame year (LRU cached, for batch conversion)."""
+        if self._generation_fn is not None:
+            self._check_generation()
+        context = self._context
+        if context is not None and context.frame_year == frame_year:
+            return context
+        with self._lock:
+            context = self._frames.get(frame_year)
+            if context is not None:
+                self._frames.move_to_end(frame_year)
+                return context
+        # Built outside the lock: it may solve equinoxes for uncached years
+        context = build_frame_context(frame_year, self._source)
+        with self._lock:
+            self._frames[frame_year] = context
+            while len(self._frames) > FRAME_CACHE_SIZE:
+                self._frames.popitem(last=False)
+        return context
+
+    def context_at(self, t_ns: int) -> YearContext:
+        """Context containing an arbitrary instant."""
+        if self._generation_fn is not None:
+            self._check_generation()
+        context = self._context
+        if context is not None and context.contains(t_ns):
+            return context
+        year = time.gmtime(t_ns // NS_PER_SECOND).tm_year
+        context = self.for_frame(year)
+        if t_ns < context.equinox_ns:
+            context = self.for_frame(year - 1)
+        return context
+
+    def invalidate(self, year: Optional[int] = None) -> None:
+        """Drop contexts (that use `year`) so the next request rebuilds them."""
+        with self._lock:
+            for frame_year, frame in list(self._frames.items()):
+                if year is None or year in frame.equinox_bodies:
+                    del self._frames[frame_year]
+        context = self._context
+        if context is None:
+            return
+        if year is None or year in context.equinox_bodies:
+            self._context = None
+
+
+__all__ = [
+    "NowRenderer",
+    "YearContext",
+    "YearContextHolder",
+    "build_year_context",
+    "build_frame_context",
+    "frame_year_at",
+    "utc_iso_from_ns",
+    "NOW_NOTE",
+]